@@ -0,0 +1,157 @@
+"""
+Benchmark du client de l'API (`fast_api_xtrem.client`).
+
+Démarre le serveur dans un sous-processus (base SQLite temporaire,
+limitation de débit désactivée) puis compare :
+- « par appel » : une requête par fonction de module (`requests.get`,
+  à défaut `httpx.get`), comme le faisait le frontend : nouvelle
+  connexion TCP à chaque appel ;
+- « ApiClient » : client synchrone, pool de connexions conservées ;
+- « AsyncApiClient » : client asynchrone (opérations groupées).
+
+Scénarios : lectures de `/users/me` (token fourni) et création de
+`BULK_USERS` utilisateurs.
+
+Usage : python -m benchmarks.bench_client [nombre_requêtes]
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from importlib.util import find_spec
+from pathlib import Path
+
+import httpx
+
+from benchmarks.bench_server import _free_port, _wait_ready
+from benchmarks.common import print_header
+from fast_api_xtrem.client.async_client import AsyncApiClient
+from fast_api_xtrem.client.base import ClientConfig
+from fast_api_xtrem.client.sync_client import ApiClient
+
+DEFAULT_REQUESTS = 300
+BULK_USERS = 100
+PASSWORD = "motdepasse1"
+
+if find_spec("requests") is not None:
+    import requests as per_call
+
+    PER_CALL_LABEL = "par appel (requests)"
+else:
+    per_call = httpx
+    PER_CALL_LABEL = "par appel (httpx, requests absent)"
+
+
+def _start(port: int, directory: Path) -> subprocess.Popen:
+    """Démarre le serveur sur `port`."""
+    env = dict(os.environ)
+    env["FAST_API_XTREM__DATABASE__DATABASE_URL"] = (
+        f"sqlite:///{directory / 'bench.db'}"
+    )
+    env["FAST_API_XTREM__LOGGER__LOG_LEVEL"] = "WARNING"
+    env["FAST_API_XTREM__RATE_LIMIT__ENABLED"] = "false"
+    env["FAST_API_XTREM__NETWORK__PORT"] = str(port)
+    return subprocess.Popen(
+        [sys.executable, "-m", "fast_api_xtrem.main"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _users(prefix: str):
+    return [
+        {
+            "nom": f"{prefix}{i}",
+            "email": f"{prefix}{i}@ex.com",
+            "pswd": PASSWORD,
+        }
+        for i in range(BULK_USERS)
+    ]
+
+
+def _report(label: str, seconds: float, count: int) -> None:
+    print(
+        f"{label:<46} {seconds * 1000:9.0f} ms   "
+        f"{count / seconds:8.0f} req/s"
+    )
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Exécute le benchmark et affiche les résultats."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REQUESTS
+    with tempfile.TemporaryDirectory() as name:
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        process = _start(port, Path(name))
+        try:
+            if not _wait_ready(base_url, process):
+                print("Serveur non démarré")
+                return
+            _run(base_url, count)
+        finally:
+            process.terminate()
+            process.wait(10)
+
+
+def _run(base_url: str, count: int) -> None:
+    config = ClientConfig(base_url=base_url)
+    api = ApiClient(config)
+    api.create_user("bench", "bench@ex.com", PASSWORD)
+    token = api.login("bench", PASSWORD)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    print_header(
+        "Client de l'API",
+        [
+            f"{count} lectures de /users/me",
+            f"création de {BULK_USERS} utilisateurs",
+        ],
+    )
+
+    def per_call_reads():
+        for _ in range(count):
+            per_call.get(f"{base_url}/users/me", headers=headers)
+
+    def client_reads():
+        for _ in range(count):
+            api.get_me()
+
+    _report(f"lectures {PER_CALL_LABEL}", _timed(per_call_reads), count)
+    _report("lectures ApiClient", _timed(client_reads), count)
+
+    def per_call_creates():
+        for user in _users("a"):
+            per_call.post(f"{base_url}/users", json=user)
+
+    async def async_creates():
+        async with AsyncApiClient(config) as client:
+            await client.create_users(_users("c"))
+
+    _report(
+        f"créations {PER_CALL_LABEL}", _timed(per_call_creates), BULK_USERS
+    )
+    _report(
+        "créations ApiClient.create_users",
+        _timed(lambda: api.create_users(_users("b"))),
+        BULK_USERS,
+    )
+    _report(
+        "créations AsyncApiClient.create_users",
+        _timed(lambda: asyncio.run(async_creates())),
+        BULK_USERS,
+    )
+    api.close()
+
+
+if __name__ == "__main__":
+    main()
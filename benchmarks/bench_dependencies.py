@@ -0,0 +1,169 @@
+"""
+Benchmark du coût des dépendances par requête.
+
+Compare, sur une route de type `/users/me` :
+- « avant » : un `get_logger` propre au module lisant `app.state`, un
+  `get_db` enveloppant `DBManager.get_db` et un décodage manuel du token ;
+- « après » : les dépendances partagées de `routes.dependencies`
+  (services résolus une fois, utilisateur courant mis en cache par requête).
+
+La base est remplacée par une session factice afin d'isoler le coût
+de la résolution des dépendances.
+
+Usage : python -m benchmarks.bench_dependencies
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from fastapi import Depends, FastAPI, Request
+from fastapi.security import OAuth2PasswordBearer
+
+from benchmarks.common import call_asgi, measure_async, print_header
+from fast_api_xtrem.app.config import (
+    AppConfig,
+    CacheConfig,
+    SingleFlightConfig,
+)
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.cache.single_flight import SingleFlight
+from fast_api_xtrem.cache.user_cache import UserCache
+from fast_api_xtrem.routes.dependencies import get_current_user, get_logger
+from fast_api_xtrem.routes.security import create_access_token, decode_token
+
+ITERATIONS = 5000
+
+
+class _FakeQuery:
+    """Requête factice renvoyant toujours le même utilisateur."""
+
+    def __init__(self, user):
+        self.user = user
+
+    def filter_by(self, **_):
+        return self
+
+    def first(self):
+        return self.user
+
+
+class _FakeSession:
+    """Session factice (aucun accès disque)."""
+
+    def __init__(self, user):
+        self.user = user
+
+    def query(self, _model):
+        return _FakeQuery(self.user)
+
+    def execute(self, _statement):
+        row = (1, self.user.nom, self.user.email, "")
+        return _FakeQuery(row)
+
+    def release(self):
+        """Rien à rendre au pool."""
+
+    def close(self):
+        """Rien à fermer."""
+
+
+class _FakeDBManager:
+    """DBManager factice fournissant des sessions en mémoire."""
+
+    def __init__(self, user):
+        self.user = user
+
+    @contextmanager
+    def session_scope(self, tenant=None):
+        db = _FakeSession(self.user)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def get_db(self):
+        with self.session_scope() as db:
+            yield db
+
+
+class _NullLogger:
+    """Logger silencieux."""
+
+    def __getattr__(self, _name):
+        return lambda *args, **kwargs: None
+
+
+def _services():
+    user = SimpleNamespace(nom="alice", email="alice@example.com")
+    # Cache de taille nulle : chaque requête lit la session factice
+    user_cache = UserCache(CacheConfig(user_cache_size=0), MetricsRegistry())
+    return SimpleNamespace(
+        config=AppConfig(),
+        logger=_NullLogger(),
+        db_manager=_FakeDBManager(user),
+        user_cache=user_cache,
+        user_cache_for=lambda tenant: user_cache,
+        single_flight=SingleFlight(SingleFlightConfig(), MetricsRegistry()),
+    )
+
+
+def build_legacy_app() -> FastAPI:
+    """Application reproduisant l'ancien câblage des dépendances."""
+    app = FastAPI()
+    oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+
+    def legacy_get_db(request: Request):
+        yield from request.app.state.services.db_manager.get_db()
+
+    def legacy_get_logger(request: Request):
+        return request.app.state.logger
+
+    @app.get("/users/me")
+    async def me(
+        token: str = Depends(oauth2_scheme),
+        db=Depends(legacy_get_db),
+        logger=Depends(legacy_get_logger),
+    ):
+        payload = decode_token(token, logger)
+        user = db.query(None).filter_by(nom=payload["nom"]).first()
+        return {"nom": user.nom, "email": user.email}
+
+    app.state.services = _services()
+    app.state.logger = app.state.services.logger
+    return app
+
+
+def build_shared_app() -> FastAPI:
+    """Application utilisant les dépendances partagées."""
+    app = FastAPI()
+
+    @app.get("/users/me")
+    async def me(user=Depends(get_current_user), logger=Depends(get_logger)):
+        logger.info("me")
+        return {"nom": user.nom, "email": user.email}
+
+    app.state.services = _services()
+    return app
+
+
+def main() -> None:
+    """Exécute le benchmark et affiche les résultats."""
+    token = create_access_token({"nom": "alice"})
+    headers = {"Authorization": f"Bearer {token}"}
+    print_header(
+        "Dépendances par requête (/users/me, base factice)",
+        [f"{ITERATIONS} requêtes ASGI directes par variante"],
+    )
+    for label, app in (
+        ("avant (dépendances par module)", build_legacy_app()),
+        ("après (routes.dependencies)", build_shared_app()),
+    ):
+        measure_async(
+            label,
+            lambda app=app: call_asgi(app, "GET", "/users/me", headers),
+            ITERATIONS,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark de l'index binaire des logs.
+
+Journal synthétique de 500 000 messages sur 24 h (1 000 utilisateurs,
+10 % de connexions échouées), présent à la fois sous forme d'archive
+texte compressée (rotation loguru) et d'index binaire. Mesure :
+- le coût d'indexation d'un message (`LogIndexSink`) ;
+- la recherche « connexions échouées de user42 depuis une heure » :
+  décompression et parcours de l'archive, puis `query_index`.
+
+Usage : python -m benchmarks.bench_log_index [nombre_messages]
+"""
+
+import sys
+import tempfile
+import time
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from benchmarks.common import measure, print_header
+from fast_api_xtrem.logger.log_index import LogIndexSink, query_index
+
+DEFAULT_MESSAGES = 500_000
+PERIOD_SECONDS = 86_400
+USERS = 1_000
+ITERATIONS = 5
+
+
+def _message(timestamp: float, failed: bool, user: str):
+    """Message loguru minimal (seul `record` est lu par le sink)."""
+    return SimpleNamespace(
+        record={
+            "time": datetime.fromtimestamp(timestamp, timezone.utc),
+            "level": SimpleNamespace(no=40 if failed else 25),
+            "extra": {
+                "event": "login_failed" if failed else "login_succeeded",
+                "user": user,
+            },
+        }
+    )
+
+
+def _build(directory: Path, count: int, end: float):
+    """Écrit l'archive texte et l'index ; retourne l'archive et le sink."""
+    sink = LogIndexSink(directory / "index", segment_records=65536)
+    archive = directory / "fast_api.2026-01-01.log.zip"
+    lines = []
+    messages = []
+    for i in range(count):
+        timestamp = end - PERIOD_SECONDS + i * PERIOD_SECONDS / count
+        failed = i % 10 == 0
+        user = f"user{i % USERS}"
+        level = "ERROR" if failed else "SUCCESS"
+        text = (
+            "Mot de passe incorrect" if failed else "Utilisateur authentifié"
+        )
+        stamp = datetime.fromtimestamp(timestamp, timezone.utc)
+        lines.append(
+            f"{stamp.isoformat()} | {level:<8} | users:login - "
+            f"{text} pour utilisateur {user}\n"
+        )
+        messages.append(_message(timestamp, failed, user))
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as file:
+        file.writestr("fast_api.log", "".join(lines))
+    return archive, sink, messages
+
+
+def _grep_archive(archive: Path, since: float, user: str) -> int:
+    """Recherche par décompression et parcours du texte."""
+    needle = f"Mot de passe incorrect pour utilisateur {user}\n"
+    found = 0
+    with zipfile.ZipFile(archive) as file:
+        with file.open("fast_api.log") as log:
+            for raw in log:
+                line = raw.decode("utf-8")
+                if not line.endswith(needle):
+                    continue
+                stamp = datetime.fromisoformat(line.split(" | ", 1)[0])
+                if stamp.timestamp() >= since:
+                    found += 1
+    return found
+
+
+def main() -> None:
+    """Exécute le benchmark et affiche les résultats."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MESSAGES
+    end = time.time()
+    since = end - 3600
+    with tempfile.TemporaryDirectory() as name:
+        directory = Path(name)
+        archive, sink, messages = _build(directory, count, end)
+
+        start = time.perf_counter()
+        for message in messages:
+            sink(message)
+        per_message = (time.perf_counter() - start) / count * 1e6
+        sink.close()
+
+        index_dir = directory / "index"
+        index_size = sum(p.stat().st_size for p in index_dir.rglob("*"))
+        expected = _grep_archive(archive, since, "user42")
+        result = query_index(
+            index_dir, since, end, event="login_failed", user="user42"
+        )
+        assert len(result["records"]) == expected, "résultats différents"
+
+        print_header(
+            "Index binaire des logs",
+            [
+                f"{count} messages sur 24 h, {USERS} utilisateurs",
+                f"archive {archive.stat().st_size / 1e6:.1f} Mo, "
+                f"index {index_size / 1e6:.1f} Mo",
+                f"indexation : {per_message:.2f} µs par message",
+            ],
+        )
+        grep = measure(
+            "archive texte (décompression)",
+            lambda: _grep_archive(archive, since, "user42"),
+            ITERATIONS,
+        )
+        index = measure(
+            "index binaire (dichotomie)",
+            lambda: query_index(
+                index_dir, since, end, event="login_failed", user="user42"
+            ),
+            ITERATIONS * 20,
+        )
+        print(f"  gain : x{grep['median_us'] / index['median_us']:.0f}")
+
+
+if __name__ == "__main__":
+    main()
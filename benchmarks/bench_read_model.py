@@ -0,0 +1,112 @@
+"""
+Benchmark du modèle de lecture des utilisateurs.
+
+Compare, sur la liste des utilisateurs actifs (20 000 par défaut, base
+SQLite temporaire) :
+- « ORM » : objets `User` complets, suivis par la session (carte
+  d'identité, instrumentation des attributs) ;
+- « projection » : colonnes sélectionnées (Core) et restituées en
+  `UserSummary` (`get_active_users`).
+
+Mesure la mémoire retenue par ligne (tracemalloc) et la durée de
+construction du corps de `GET /users` (lecture, dictionnaires, JSON).
+
+Usage : python -m benchmarks.bench_read_model [nombre_utilisateurs]
+"""
+
+import gc
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from starlette.responses import JSONResponse
+
+from benchmarks.common import measure, print_header
+from fast_api_xtrem.db.base import Base
+from fast_api_xtrem.db.models import role  # noqa: F401
+from fast_api_xtrem.db.models.user import User
+from fast_api_xtrem.db.utils.queries import get_active_users
+
+DEFAULT_USERS = 20_000
+ITERATIONS = 10
+
+
+def _populate(engine, count: int) -> None:
+    """Insère `count` utilisateurs."""
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO users (nom, email, pswd) "
+                "VALUES (:nom, :email, :pswd)"
+            ),
+            [
+                {
+                    "nom": f"user{i}",
+                    "email": f"user{i}@example.com",
+                    "pswd": "0" * 64,
+                }
+                for i in range(count)
+            ],
+        )
+
+
+def _orm_users(db: Session):
+    """Lecture précédente : objets ORM complets."""
+    return db.query(User).filter(User.deleted_at.is_(None)).all()
+
+
+def _retained_bytes(engine, loader) -> int:
+    """Mémoire retenue par le résultat (et la session qui le suit)."""
+    gc.collect()
+    tracemalloc.start()
+    with Session(engine) as db:
+        before = tracemalloc.get_traced_memory()[0]
+        users = loader(db)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+        del users
+    tracemalloc.stop()
+    return retained
+
+
+def _listing_body(engine, loader) -> bytes:
+    """Corps de `GET /users` construit à partir du chargeur."""
+    with Session(engine) as db:
+        users = loader(db)
+        data = [{"nom": u.nom, "email": u.email} for u in users]
+    return JSONResponse({"message": "Succès", "data": data}).body
+
+
+def main() -> None:
+    """Exécute le benchmark et affiche les résultats."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_USERS
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'bench.db'}")
+        _populate(engine, count)
+        variants = (("ORM", _orm_users), ("projection", get_active_users))
+
+        print_header(
+            "Modèle de lecture (GET /users)",
+            [f"{count} utilisateurs, {ITERATIONS} itérations"],
+        )
+        for label, loader in variants:
+            retained = _retained_bytes(engine, loader)
+            print(f"{label:<40} {retained / count:9.0f} octets par ligne")
+        timings = {}
+        for label, loader in variants:
+            timings[label] = measure(
+                f"{label} (corps de réponse)",
+                lambda loader=loader: _listing_body(engine, loader),
+                ITERATIONS,
+            )
+        gain = timings["ORM"]["median_us"] / timings["projection"]["median_us"]
+        print(f"  débit de la liste : x{gain:.2f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
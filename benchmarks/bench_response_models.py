@@ -0,0 +1,100 @@
+"""
+Benchmark de la sérialisation des réponses typées.
+
+Compare, pour un profil (`/users/me`) et une liste de 1 000 utilisateurs
+(`GET /users`), trois façons de répondre :
+- « avant » : `response_model=dict` et `JSONResponse` (json de la
+  bibliothèque standard) ;
+- « modèle validé » : `response_model=UserList`/`UserOut` et données
+  renvoyées telles quelles, validées et encodées par FastAPI ;
+- « chemin rapide » : même modèle déclaré (schéma OpenAPI), données de
+  confiance sérialisées par `TrustedJSONResponse` sans validation.
+
+Usage : python -m benchmarks.bench_response_models
+"""
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from benchmarks.common import call_asgi, measure_async, print_header
+from fast_api_xtrem.db.models.user import UserList, UserOut
+from fast_api_xtrem.routes.db.users import TrustedJSONResponse
+
+ITERATIONS = 2000
+LIST_SIZE = 1000
+
+PROFILE = {"nom": "alice", "email": "alice@example.com"}
+LISTING = {
+    "message": "Succès",
+    "data": [
+        {"nom": f"user{i}", "email": f"user{i}@example.com"}
+        for i in range(LIST_SIZE)
+    ],
+}
+
+
+def _build_app() -> FastAPI:
+    """Application exposant les trois variantes de chaque route."""
+    app = FastAPI()
+
+    @app.get("/before/me", response_model=dict)
+    async def before_me():
+        return JSONResponse(PROFILE)
+
+    @app.get("/before/users", response_model=dict)
+    async def before_users():
+        return JSONResponse(LISTING)
+
+    @app.get("/validated/me", response_model=UserOut)
+    async def validated_me():
+        return PROFILE
+
+    @app.get("/validated/users", response_model=UserList)
+    async def validated_users():
+        return LISTING
+
+    @app.get("/fast/me", response_model=UserOut)
+    async def fast_me():
+        return TrustedJSONResponse(PROFILE)
+
+    @app.get("/fast/users", response_model=UserList)
+    async def fast_users():
+        return TrustedJSONResponse(LISTING)
+
+    return app
+
+
+def main() -> None:
+    """Exécute le benchmark et affiche les résultats."""
+    app = _build_app()
+    for route in ("me", "users"):
+        bodies = {
+            variant: asyncio.run(call_asgi(app, "GET", f"/{variant}/{route}"))
+            for variant in ("before", "validated", "fast")
+        }
+        assert len(set(bodies.values())) == 1, "réponses différentes"
+
+    print_header(
+        "Réponses typées",
+        [
+            f"{ITERATIONS} requêtes par variante",
+            f"liste de {LIST_SIZE} utilisateurs",
+        ],
+    )
+    for route, iterations in (("me", ITERATIONS), ("users", ITERATIONS // 10)):
+        for label, variant in (
+            ("avant", "before"),
+            ("modèle validé", "validated"),
+            ("chemin rapide", "fast"),
+        ):
+            measure_async(
+                f"/{route} {label}",
+                lambda path=f"/{variant}/{route}": call_asgi(app, "GET", path),
+                iterations,
+            )
+
+
+if __name__ == "__main__":
+    main()
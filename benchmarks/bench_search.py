@@ -0,0 +1,114 @@
+"""
+Benchmark de la recherche des utilisateurs.
+
+Remplit une base SQLite temporaire (1 000 000 d'utilisateurs par défaut,
+noms générés à partir de syllabes), construit l'index FTS5 puis compare,
+pour plusieurs motifs, la recherche indexée (`search_users`) à un parcours
+`LIKE '%motif%'` de la table.
+
+Le motif `gmail` correspond à un utilisateur sur cinq : c'est le pire cas
+de l'index (toutes les correspondances sont classées), alors que le
+parcours s'arrête dès la première page remplie.
+
+Usage : python -m benchmarks.bench_search [nombre_utilisateurs]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from benchmarks.common import measure, print_header
+from fast_api_xtrem.db.base import Base
+from fast_api_xtrem.db.models import role, user  # noqa: F401
+from fast_api_xtrem.db.utils.search import install_search_index, search_users
+
+DEFAULT_USERS = 1_000_000
+ITERATIONS = 50
+PAGE_SIZE = 20
+QUERIES = ("lorabita", "424242", "gmail", "lo")
+SYLLABLES = tuple(c + v for c in "bcdfglmnprstvz" for v in "aeiou")
+DOMAINS = ("gmail.com", "orange.fr", "free.fr", "proton.me", "corp.io")
+_QUIET = SimpleNamespace(info=print, warning=print)
+
+
+def _populate(engine, count: int) -> None:
+    """Insère `count` utilisateurs par lots, avant création de l'index."""
+    batch = 50_000
+    rng = random.Random(42)
+
+    def name() -> str:
+        return "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4)))
+
+    with engine.begin() as connection:
+        for start in range(0, count, batch):
+            rows = [
+                {
+                    "nom": f"{name()}{i}",
+                    "email": f"{name()}.{name()}@{DOMAINS[i % 5]}",
+                    "pswd": "x" * 64,
+                }
+                for i in range(start, min(start + batch, count))
+            ]
+            connection.execute(
+                text(
+                    "INSERT INTO users (nom, email, pswd) "
+                    "VALUES (:nom, :email, :pswd)"
+                ),
+                rows,
+            )
+
+
+def _scan(db: Session, query: str):
+    """Recherche de référence : parcours complet avec LIKE."""
+    return db.execute(
+        text(
+            "SELECT nom, email FROM users "
+            "WHERE nom LIKE :p OR email LIKE :p LIMIT :limit"
+        ),
+        {"p": f"%{query}%", "limit": PAGE_SIZE},
+    ).all()
+
+
+def main() -> None:
+    """Exécute le benchmark et affiche les résultats."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_USERS
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        start = time.perf_counter()
+        _populate(engine, count)
+        inserted = time.perf_counter() - start
+        start = time.perf_counter()
+        install_search_index(engine, _QUIET)
+        indexed = time.perf_counter() - start
+        print_header(
+            f"Recherche d'utilisateurs ({count} lignes, page de {PAGE_SIZE})",
+            [
+                f"insertion {inserted:.1f} s, construction de l'index "
+                f"{indexed:.1f} s",
+                f"{ITERATIONS} requêtes par motif",
+            ],
+        )
+        with Session(engine) as db:
+            for query in QUERIES:
+                measure(
+                    f"index  q={query!r}",
+                    lambda q=query: search_users(db, q, PAGE_SIZE),
+                    ITERATIONS,
+                )
+                measure(
+                    f"LIKE   q={query!r}",
+                    lambda q=query: _scan(db, q),
+                    ITERATIONS,
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+Benchmark des réglages du serveur ASGI (`NetworkConfig`).
+
+Chaque variante démarre le serveur dans un sous-processus
+(`python -m fast_api_xtrem.main`, base SQLite temporaire), réglé par les
+variables `FAST_API_XTREM__NETWORK__*`, puis envoie des requêtes
+concurrentes à `/` avec httpx. Affiche le débit, les latences médiane et
+p99 et le nombre d'échecs (503 compris) :
+- boucle d'événements et analyseur HTTP (asyncio/uvloop, h11/httptools) ;
+- connexions conservées (keep-alive) ou non, et file d'acceptation ;
+- limite de concurrence ;
+- recyclage des workers après un nombre de requêtes (avec gigue) ;
+- hypercorn en HTTP/1.1 et en HTTP/2 (TLS, certificat auto-signé).
+
+Les variantes dont une dépendance optionnelle manque sont ignorées.
+
+Usage : python -m benchmarks.bench_server [nombre_requêtes]
+"""
+
+import asyncio
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import httpx
+
+from benchmarks.common import print_header
+
+DEFAULT_REQUESTS = 3000
+CONCURRENCY = 32
+STARTUP_TIMEOUT = 30.0
+
+
+class Variant(NamedTuple):
+    """Réglages du serveur et du client pour une mesure."""
+
+    label: str
+    network: Dict[str, str]
+    requires: Tuple[str, ...] = ()
+    keep_alive: bool = True
+    http2: bool = False
+
+
+VARIANTS = (
+    Variant("uvicorn asyncio + h11", {"loop": "asyncio", "http": "h11"}),
+    Variant(
+        "uvicorn asyncio + httptools",
+        {"loop": "asyncio", "http": "httptools"},
+        ("httptools",),
+    ),
+    Variant(
+        "uvicorn uvloop + httptools",
+        {"loop": "uvloop", "http": "httptools"},
+        ("uvloop", "httptools"),
+    ),
+    Variant(
+        "sans keep-alive (client)",
+        {"loop": "asyncio", "http": "h11"},
+        keep_alive=False,
+    ),
+    Variant(
+        "sans keep-alive, backlog 8",
+        {"loop": "asyncio", "http": "h11", "backlog": "8"},
+        keep_alive=False,
+    ),
+    Variant(
+        "limit_concurrency 8",
+        {"loop": "asyncio", "http": "h11", "limit_concurrency": "8"},
+    ),
+    Variant(
+        "2 workers",
+        {"loop": "asyncio", "http": "h11", "workers": "2"},
+    ),
+    Variant(
+        "2 workers, recyclage 500 ± 100",
+        {
+            "loop": "asyncio",
+            "http": "h11",
+            "workers": "2",
+            "max_requests_per_worker": "500",
+            "max_requests_jitter": "100",
+        },
+    ),
+    Variant("hypercorn HTTP/1.1", {"server": "hypercorn"}, ("hypercorn",)),
+    Variant(
+        "hypercorn HTTP/2 (TLS)",
+        {"server": "hypercorn"},
+        ("hypercorn", "h2"),
+        http2=True,
+    ),
+)
+
+
+def _free_port() -> int:
+    """Réserve un port libre sur l'interface locale."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _self_signed(directory: Path) -> Optional[Tuple[str, str]]:
+    """Génère un certificat auto-signé (openssl), ou None sans openssl."""
+    if shutil.which("openssl") is None:
+        return None
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=127.0.0.1",
+            "-keyout",
+            str(key),
+            "-out",
+            str(cert),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return str(cert), str(key)
+
+
+def _start(variant: Variant, port: int, directory: Path) -> subprocess.Popen:
+    """Démarre le serveur configuré par la variante."""
+    env = dict(os.environ)
+    env["FAST_API_XTREM__DATABASE__DATABASE_URL"] = (
+        f"sqlite:///{directory / 'bench.db'}"
+    )
+    env["FAST_API_XTREM__LOGGER__LOG_LEVEL"] = "WARNING"
+    network = {"port": str(port), **variant.network}
+    for name, value in network.items():
+        env[f"FAST_API_XTREM__NETWORK__{name.upper()}"] = value
+    return subprocess.Popen(
+        [sys.executable, "-m", "fast_api_xtrem.main"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _wait_ready(base_url: str, process: subprocess.Popen) -> bool:
+    """Attend que le serveur réponde à la sonde liveness."""
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline and process.poll() is None:
+        try:
+            response = httpx.get(f"{base_url}/health/live", verify=False)
+            if response.status_code == 200:
+                return True
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    return False
+
+
+async def _load(
+    base_url: str, variant: Variant, count: int
+) -> Tuple[float, List[float], int]:
+    """
+    Envoie `count` requêtes avec `CONCURRENCY` clients simultanés.
+
+    Returns:
+        Tuple[float, List[float], int]: Durée totale (s), latences (s)
+        et nombre d'échecs.
+    """
+    limits = httpx.Limits(
+        max_connections=CONCURRENCY,
+        max_keepalive_connections=CONCURRENCY if variant.keep_alive else 0,
+    )
+    latencies: List[float] = []
+    failures = 0
+    remaining = count
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, http2=variant.http2, verify=False
+    ) as client:
+
+        async def worker() -> None:
+            nonlocal remaining, failures
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                try:
+                    response = await client.get("/")
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                latencies.append(time.perf_counter() - start)
+                failures += not ok
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+        return time.perf_counter() - start, latencies, failures
+
+
+def _run(variant: Variant, count: int, directory: Path) -> None:
+    """Mesure une variante et affiche son résultat."""
+    missing = [name for name in variant.requires if find_spec(name) is None]
+    if missing:
+        print(f"{variant.label:<34} ignorée ({', '.join(missing)} absent)")
+        return
+    if variant.http2:
+        certificate = _self_signed(directory)
+        if certificate is None:
+            print(f"{variant.label:<34} ignorée (openssl absent)")
+            return
+        variant = variant._replace(
+            network={
+                **variant.network,
+                "ssl_certfile": certificate[0],
+                "ssl_keyfile": certificate[1],
+            }
+        )
+    port = _free_port()
+    scheme = "https" if variant.http2 else "http"
+    base_url = f"{scheme}://127.0.0.1:{port}"
+    process = _start(variant, port, directory)
+    try:
+        if not _wait_ready(base_url, process):
+            print(f"{variant.label:<34} échec du démarrage")
+            return
+        elapsed, latencies, failures = asyncio.run(
+            _load(base_url, variant, count)
+        )
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    print(
+        f"{variant.label:<34} {count / elapsed:8.0f} req/s"
+        f"   médiane {statistics.median(latencies) * 1e3:6.2f} ms"
+        f"   p99 {p99 * 1e3:7.2f} ms   échecs {failures}"
+    )
+
+
+def main() -> None:
+    """Exécute le benchmark et affiche les résultats."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REQUESTS
+    print_header(
+        "Réglages du serveur ASGI (GET /)",
+        [f"{count} requêtes par variante, {CONCURRENCY} clients simultanés"],
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for variant in VARIANTS:
+            _run(variant, count, Path(directory))
+
+
+if __name__ == "__main__":
+    main()
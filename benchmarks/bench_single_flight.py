@@ -0,0 +1,116 @@
+"""
+Benchmark du regroupement des lectures concurrentes (single-flight).
+
+Simule un pic de `GET /users` : des rafales de requêtes simultanées
+lisent la liste des utilisateurs (10 000 par défaut, base SQLite
+temporaire) et sérialisent la réponse, dans un thread comme la route.
+Compare la durée d'une rafale sans regroupement (une lecture par
+requête) et avec (`SingleFlight`), ainsi que le nombre de lectures.
+
+Usage : python -m benchmarks.bench_single_flight [nombre_utilisateurs]
+"""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from starlette.responses import JSONResponse
+
+from benchmarks.common import measure_async, print_header
+from fast_api_xtrem.app.config import SingleFlightConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.cache.single_flight import SingleFlight
+from fast_api_xtrem.db.base import Base
+from fast_api_xtrem.db.models import role, user  # noqa: F401
+from fast_api_xtrem.db.utils.queries import get_active_users
+
+DEFAULT_USERS = 10_000
+BURST = 50
+ITERATIONS = 5
+
+
+def _populate(engine, count: int) -> None:
+    """Insère `count` utilisateurs."""
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO users (nom, email, pswd) "
+                "VALUES (:nom, :email, :pswd)"
+            ),
+            [
+                {
+                    "nom": f"user{i}",
+                    "email": f"user{i}@example.com",
+                    "pswd": "",
+                }
+                for i in range(count)
+            ],
+        )
+
+
+def main() -> None:
+    """Exécute le benchmark et affiche les résultats."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_USERS
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(
+            f"sqlite:///{Path(directory) / 'bench.db'}",
+            connect_args={"check_same_thread": False},
+            pool_size=BURST,
+        )
+        _populate(engine, count)
+
+        def load() -> bytes:
+            with Session(engine) as db:
+                users = get_active_users(db)
+                data = [{"nom": u.nom, "email": u.email} for u in users]
+            return JSONResponse({"message": "Succès", "data": data}).body
+
+        print_header(
+            "Lectures concurrentes identiques (GET /users)",
+            [
+                f"{count} utilisateurs, rafales de {BURST} requêtes",
+                f"{ITERATIONS} rafales par variante",
+            ],
+        )
+        for enabled in (False, True):
+            flights = SingleFlight(
+                SingleFlightConfig(enabled=enabled), MetricsRegistry()
+            )
+
+            async def burst(flights=flights):
+                await asyncio.gather(
+                    *(
+                        flights.run(
+                            "users_list",
+                            None,
+                            lambda: asyncio.to_thread(load),
+                        )
+                        for _ in range(BURST)
+                    )
+                )
+
+            label = "avec regroupement" if enabled else "sans regroupement"
+            measure_async(f"{label} (par rafale)", burst, ITERATIONS)
+            if enabled:
+                metrics = flights.metrics
+                executed = metrics.get(
+                    "single_flight_requests_total",
+                    group="users_list",
+                    result="executed",
+                )
+                ratio = metrics.get(
+                    "single_flight_coalescing_ratio", group="users_list"
+                )
+                print(
+                    f"  lectures : {executed:.0f} pour "
+                    f"{BURST * ITERATIONS} requêtes (taux {ratio:.1%})"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
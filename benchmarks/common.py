@@ -0,0 +1,135 @@
+"""
+Outils communs aux benchmarks de l'application FastAPI XTREM.
+
+Les requêtes sont envoyées directement à l'application ASGI, sans serveur
+ni client HTTP, afin de ne mesurer que le coût côté application.
+Chaque benchmark s'exécute avec `python -m benchmarks.<module>`.
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+
+async def call_asgi(
+    app,
+    method: str,
+    path: str,
+    headers: Optional[Dict[str, str]] = None,
+    body: bytes = b"",
+    query: str = "",
+) -> Tuple[int, bytes]:
+    """
+    Exécute une requête HTTP directement sur une application ASGI.
+
+    Args:
+        app: Application ASGI.
+        method (str): Méthode HTTP.
+        path (str): Chemin de la requête.
+        headers (Optional[Dict[str, str]]): En-têtes additionnels.
+        body (bytes): Corps de la requête.
+        query (str): Chaîne de requête (sans `?`).
+
+    Returns:
+        Tuple[int, bytes]: Code de statut et corps de la réponse.
+    """
+    raw_headers = [
+        (key.lower().encode("latin-1"), value.encode("latin-1"))
+        for key, value in (headers or {}).items()
+    ]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    received = False
+    status_code = 0
+    chunks = []
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.sleep(3600)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status_code, b"".join(chunks)
+
+
+def measure(
+    label: str, func: Callable[[], object], iterations: int
+) -> Dict[str, float]:
+    """
+    Chronomètre une fonction synchrone et affiche un résumé.
+
+    Args:
+        label (str): Libellé affiché.
+        func (Callable): Fonction à mesurer.
+        iterations (int): Nombre d'appels.
+
+    Returns:
+        Dict[str, float]: Moyenne et médiane en microsecondes.
+    """
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1e6)
+    result = {
+        "mean_us": statistics.fmean(samples),
+        "median_us": statistics.median(samples),
+    }
+    print(
+        f"{label:<40} moyenne {result['mean_us']:9.1f} µs"
+        f"   médiane {result['median_us']:9.1f} µs"
+    )
+    return result
+
+
+def measure_async(
+    label: str, factory: Callable[[], object], iterations: int
+) -> Dict[str, float]:
+    """
+    Chronomètre une coroutine, recréée à chaque itération par `factory`.
+
+    Args:
+        label (str): Libellé affiché.
+        factory (Callable): Fabrique de coroutine.
+        iterations (int): Nombre d'appels.
+
+    Returns:
+        Dict[str, float]: Moyenne et médiane en microsecondes.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return measure(
+            label, lambda: loop.run_until_complete(factory()), iterations
+        )
+    finally:
+        loop.close()
+
+
+def print_header(title: str, notes: Iterable[str] = ()) -> None:
+    """Affiche l'en-tête d'un benchmark."""
+    print(f"\n=== {title} ===")
+    for note in notes:
+        print(f"  {note}")
@@ -1,13 +1,31 @@
 """Module principal de l'application FastAPI."""
 
+import asyncio
+import signal
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Optional
 
 from fastapi import FastAPI
 
 from fast_api_xtrem.app.config import AppConfig
+from fast_api_xtrem.app.config_loader import ConfigError
 from fast_api_xtrem.app.services import ApplicationServices
+from fast_api_xtrem.middleware.admission import AdmissionMiddleware
+from fast_api_xtrem.middleware.idempotency import IdempotencyMiddleware
+from fast_api_xtrem.middleware.profiling import (
+    ProfilingExecutor,
+    ProfilingMiddleware,
+)
+from fast_api_xtrem.middleware.query_stats import QueryStatsMiddleware
+from fast_api_xtrem.middleware.rate_limit import RateLimitMiddleware
+from fast_api_xtrem.middleware.request_tracker import (
+    RequestTrackingMiddleware,
+)
+from fast_api_xtrem.middleware.response_cache import ResponseCacheMiddleware
+from fast_api_xtrem.routes.app.admin import router_admin
 from fast_api_xtrem.routes.app.favicon import router_favicon
+from fast_api_xtrem.routes.app.health import router_health
+from fast_api_xtrem.routes.app.metrics import router_metrics
 from fast_api_xtrem.routes.app.root import router_root
 from fast_api_xtrem.routes.db.users import router_users
 
@@ -44,8 +62,28 @@ class Application:
         # Inclusion des routes
         fastapi_app.include_router(router_root)
         fastapi_app.include_router(router_favicon)
+        fastapi_app.include_router(router_health)
+        fastapi_app.include_router(router_metrics)
+        fastapi_app.include_router(router_admin)
         fastapi_app.include_router(router_users)
 
+        # Contrôle d'admission par groupe de routes (503 en cas de
+        # saturation) ; placé au plus près des routes, les réponses en
+        # cache, rejouées ou limitées n'occupent pas de place
+        fastapi_app.add_middleware(AdmissionMiddleware)
+        # Limitation de débit des connexions, avant toute dépendance
+        fastapi_app.add_middleware(RateLimitMiddleware)
+        # Rejeu des écritures déjà exécutées (en-tête Idempotency-Key)
+        fastapi_app.add_middleware(IdempotencyMiddleware)
+        # Réponses GET en cache, servies avant toute dépendance
+        fastapi_app.add_middleware(ResponseCacheMiddleware)
+        # Statistiques SQL par requête (en-têtes X-DB-*)
+        fastapi_app.add_middleware(QueryStatsMiddleware)
+        # Profilage à la demande (test booléen lorsqu'il est inactif)
+        fastapi_app.add_middleware(ProfilingMiddleware)
+        # Suivi des requêtes en cours pour le drain (middleware externe)
+        fastapi_app.add_middleware(RequestTrackingMiddleware)
+
         return fastapi_app
 
     @asynccontextmanager
@@ -53,9 +91,47 @@ class Application:
         self, fastapi_app: FastAPI
     ) -> AsyncGenerator[None, None]:
         """Contexte de vie de l'application (démarrage/arrêt)."""
+        # Appels `asyncio.to_thread` des requêtes profilées échantillonnés
+        asyncio.get_running_loop().set_default_executor(ProfilingExecutor())
         self.services = ApplicationServices(self.config)
         self.services.initialize()
         fastapi_app.state.services = self.services
         fastapi_app.state.logger = self.services.logger
+        self.services.start_tasks()
+        reload_on_sighup = self._install_reload_handler()
         yield
+        if reload_on_sighup:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+        await self.services.stop_tasks()
+        await self.services.drain()
         self.services.cleanup()
+
+    def _install_reload_handler(self) -> bool:
+        """
+        Installe le rechargement à chaud de la configuration sur SIGHUP.
+
+        Returns:
+            bool: True si le gestionnaire a pu être installé (plateforme
+            POSIX et boucle d'événements dans le thread principal).
+        """
+        if not hasattr(signal, "SIGHUP"):
+            return False
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGHUP, self._schedule_reload)
+        except (NotImplementedError, RuntimeError, ValueError):
+            return False
+        return True
+
+    def _schedule_reload(self) -> None:
+        """Lance le rechargement hors de la boucle d'événements."""
+
+        async def reload() -> None:
+            try:
+                await asyncio.to_thread(self.services.reload_config)
+            except ConfigError as e:
+                self.services.logger.error(
+                    f"Rechargement refusé, configuration conservée : {e}"
+                )
+
+        asyncio.get_running_loop().create_task(reload())
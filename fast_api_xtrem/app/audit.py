@@ -0,0 +1,348 @@
+"""
+Journal d'audit à écriture différée.
+
+Les routes enregistrent leurs événements (connexions, modifications et
+suppressions de profil) par `AuditLog.record`, qui se contente de les
+placer dans une file bornée. Un thread dédié les insère par lots dans la
+table `audit_events`, dès que `batch_size` événements sont en attente ou
+que le plus ancien attend depuis `flush_interval_seconds` : une requête ne
+paie jamais d'écriture en base pour l'audit. Les événements de toutes les
+organisations sont écrits dans la base principale, avec leur organisation
+(colonne `tenant`).
+
+Contre-pression : lorsque la file est pleine (base lente ou
+indisponible), l'événement est abandonné et compté, sans attente :
+`record` est appelé depuis la boucle d'événements. Un lot dont
+l'écriture échoue est conservé et réessayé ; en attendant, le thread ne
+consomme plus la file, qui se remplit donc jusqu'à sa capacité (un
+`flush` ou `close` avance le nouvel essai).
+"""
+
+import json
+import queue
+import threading
+import time
+from typing import List, Optional
+
+from sqlalchemy import insert, select
+
+from fast_api_xtrem.app.config import AuditConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.db.models.audit import AuditEvent
+from fast_api_xtrem.db.models.user import utc_now
+
+# Marqueurs de contrôle du thread d'écriture
+_FLUSH = object()
+_STOP = object()
+# Événements lus par utilisateur recherché (`recent_actors`) : les
+# utilisateurs les plus actifs occupent plusieurs événements
+RECENT_SCAN_FACTOR = 10
+
+
+class AuditLog:
+    """File d'événements d'audit, persistés par lots."""
+
+    def __init__(
+        self, config: AuditConfig, db_manager, metrics: MetricsRegistry, logger
+    ) -> None:
+        """
+        Args:
+            config (AuditConfig): Configuration de l'audit.
+            db_manager (DBManager): Gestionnaire de base de données.
+            metrics (MetricsRegistry): Registre des métriques.
+            logger (LoggerManager): Gestionnaire de logs.
+        """
+        self.config = config
+        self.db_manager = db_manager
+        self.metrics = metrics
+        self.logger = logger
+        self.capacity = config.queue_size
+        self._queue: queue.Queue = queue.Queue(config.queue_size)
+        self._thread: Optional[threading.Thread] = None
+        # Réveil du thread en attente d'un nouvel essai, et arrêt demandé
+        self._wake = threading.Event()
+        self._closing = False
+
+    def start(self) -> None:
+        """Démarre le thread d'écriture."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="audit-writer", daemon=True
+            )
+            self._thread.start()
+
+    @property
+    def depth(self) -> int:
+        """Nombre d'événements en attente d'écriture."""
+        return self._queue.unfinished_tasks
+
+    def record(
+        self,
+        event_type: str,
+        actor: Optional[str] = None,
+        subject: Optional[str] = None,
+        tenant: Optional[str] = None,
+        **details,
+    ) -> bool:
+        """
+        Enregistre un événement d'audit (sans accès à la base).
+
+        Args:
+            event_type (str): Type d'événement.
+            actor (Optional[str]): Utilisateur à l'origine de l'événement.
+            subject (Optional[str]): Utilisateur concerné.
+            tenant (Optional[str]): Organisation de l'événement (None pour
+                la base principale).
+            **details: Détails complémentaires (sérialisés en JSON).
+
+        Returns:
+            bool: False si l'événement a été abandonné (file pleine ou
+            audit désactivé).
+        """
+        if not self.config.enabled:
+            return False
+        event = {
+            "created_at": utc_now(),
+            "event_type": event_type,
+            "actor": actor,
+            "subject": subject,
+            "details": json.dumps(details) if details else None,
+            "tenant": tenant,
+        }
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.metrics.increment("audit_events_dropped_total")
+            return False
+        self.metrics.increment("audit_events_total", event_type=event_type)
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Force l'écriture des événements en attente et l'attend.
+
+        Args:
+            timeout (float): Délai maximal d'attente (secondes).
+
+        Returns:
+            bool: True si tous les événements ont été écrits.
+        """
+        if self._thread is None:
+            return self.depth == 0
+        deadline = time.monotonic() + timeout
+        self._wake.set()
+        try:
+            self._queue.put(_FLUSH, timeout=timeout)
+        except queue.Full:
+            return False
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 5.0) -> bool:
+        """
+        Écrit les événements en attente puis arrête le thread.
+
+        Args:
+            timeout (float): Délai maximal d'attente (secondes).
+
+        Returns:
+            bool: True si tous les événements ont été écrits.
+        """
+        if self._thread is None:
+            return self.depth == 0
+        flushed = self.flush(timeout)
+        self._closing = True
+        self._wake.set()
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            # Écriture toujours en échec : le thread abandonne le lot
+            flushed = False
+        self._thread.join(timeout)
+        self._thread = None
+        return flushed
+
+    def recent_actors(self, db, event_type: str, limit: int) -> List[str]:
+        """
+        Retourne les auteurs distincts des derniers événements d'un type
+        donné, dans la base principale (hors organisations).
+
+        Args:
+            db (Session): Session SQLAlchemy.
+            event_type (str): Type d'événement (`login_succeeded`…).
+            limit (int): Nombre maximal d'utilisateurs.
+
+        Returns:
+            List[str]: Noms, du plus récent au plus ancien.
+        """
+        # Parcours borné de l'index (event_type, id), du plus récent
+        statement = (
+            select(AuditEvent.actor)
+            .where(
+                AuditEvent.event_type == event_type,
+                AuditEvent.actor.is_not(None),
+                AuditEvent.tenant.is_(None),
+            )
+            .order_by(AuditEvent.id.desc())
+            .limit(limit * RECENT_SCAN_FACTOR)
+        )
+        actors = dict.fromkeys(db.execute(statement).scalars())
+        return list(actors)[:limit]
+
+    def query(
+        self,
+        db,
+        limit: int,
+        before_id: Optional[int] = None,
+        event_type: Optional[str] = None,
+        subject: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Lit les événements, du plus récent au plus ancien, par pagination
+        sur l'identifiant (keyset) : le coût d'une page ne dépend pas de
+        sa position.
+
+        Args:
+            db (Session): Session SQLAlchemy.
+            limit (int): Nombre maximal d'événements.
+            before_id (Optional[int]): Identifiant à partir duquel lire
+                (exclu), fourni par la page précédente.
+            event_type (Optional[str]): Filtre sur le type.
+            subject (Optional[str]): Filtre sur l'utilisateur concerné.
+            tenant (Optional[str]): Filtre sur l'organisation.
+
+        Returns:
+            List[dict]: Événements.
+        """
+        statement = select(AuditEvent).order_by(AuditEvent.id.desc())
+        if before_id is not None:
+            statement = statement.where(AuditEvent.id < before_id)
+        if event_type:
+            statement = statement.where(AuditEvent.event_type == event_type)
+        if subject:
+            statement = statement.where(AuditEvent.subject == subject)
+        if tenant:
+            statement = statement.where(AuditEvent.tenant == tenant)
+        rows = db.execute(statement.limit(limit)).scalars().all()
+        return [
+            {
+                "id": row.id,
+                "created_at": row.created_at.isoformat(),
+                "event_type": row.event_type,
+                "actor": row.actor,
+                "subject": row.subject,
+                "details": json.loads(row.details) if row.details else None,
+                "tenant": row.tenant,
+            }
+            for row in rows
+        ]
+
+    def _run(self) -> None:
+        """Boucle du thread d'écriture."""
+        pending: List[dict] = []
+        deadline: Optional[float] = None
+        retrying = False
+        while True:
+            if retrying:
+                # Lot en échec : la file n'est pas consommée avant le
+                # nouvel essai, pour que `record` en ressente la limite
+                self._wake.wait(max(deadline - time.monotonic(), 0.0))
+                self._wake.clear()
+                if self._write(pending):
+                    self._done(len(pending))
+                    pending, deadline, retrying = [], None, False
+                elif self._closing:
+                    self.metrics.increment(
+                        "audit_events_dropped_total", len(pending)
+                    )
+                    self._done(len(pending))
+                    return
+                else:
+                    deadline = (
+                        time.monotonic() + self.config.flush_interval_seconds
+                    )
+                continue
+
+            timeout = (
+                None
+                if deadline is None
+                else max(deadline - time.monotonic(), 0.0)
+            )
+            try:
+                items = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                items = []
+            # Regroupe les événements déjà en file
+            while len(pending) + len(items) < self.config.batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            force = stop = False
+            markers = 0
+            for item in items:
+                if item is _FLUSH or item is _STOP:
+                    markers += 1
+                    force = True
+                    stop = stop or item is _STOP
+                else:
+                    pending.append(item)
+            if pending and deadline is None:
+                deadline = (
+                    time.monotonic() + self.config.flush_interval_seconds
+                )
+
+            due = pending and (
+                force
+                or len(pending) >= self.config.batch_size
+                or time.monotonic() >= deadline
+            )
+            if due:
+                written = self._write(pending)
+                if written or stop:
+                    if not written:
+                        self.metrics.increment(
+                            "audit_events_dropped_total", len(pending)
+                        )
+                    self._done(len(pending))
+                    pending, deadline = [], None
+                else:
+                    # Nouvel essai après un intervalle
+                    retrying = True
+                    deadline = (
+                        time.monotonic() + self.config.flush_interval_seconds
+                    )
+            self._done(markers)
+            if stop:
+                return
+
+    def _done(self, count: int) -> None:
+        """Marque `count` éléments de la file comme traités."""
+        for _ in range(count):
+            self._queue.task_done()
+
+    def _write(self, events: List[dict]) -> bool:
+        """Insère un lot d'événements en une transaction."""
+        engine = self.db_manager.engine
+        if engine is None:
+            return False
+        start = time.perf_counter()
+        try:
+            with engine.begin() as connection:
+                connection.execute(insert(AuditEvent), events)
+        except Exception as e:  # pylint: disable=broad-except
+            self.metrics.increment("audit_flush_errors_total")
+            self.logger.error(f"Audit : écriture du lot impossible ({e})")
+            return False
+        self.metrics.increment("audit_batches_total")
+        self.metrics.increment(
+            "audit_flush_seconds_total", time.perf_counter() - start
+        )
+        return True
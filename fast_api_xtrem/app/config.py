@@ -3,9 +3,22 @@ Module de configuration statique de l'application FastAPI XTREM.
 
 Ce module définit la classe `AppConfig`, qui regroupe toutes les options
 de configuration de l'application : FastAPI, base de données et logs.
+Les valeurs par défaut peuvent être surchargées par un fichier TOML et des
+variables d'environnement (voir `config_loader`).
 """
 
 from dataclasses import dataclass, field
+from typing import Optional
+
+LOG_LEVELS = (
+    "TRACE",
+    "DEBUG",
+    "INFO",
+    "SUCCESS",
+    "WARNING",
+    "ERROR",
+    "CRITICAL",
+)
 
 
 @dataclass
@@ -13,14 +26,59 @@ class DatabaseConfig:
     """Configuration de la base de données pour l'application."""
 
     database_url: str = "sqlite:///./fast_api_xtrem/db/app_data.db"
+    # Taille du pool : limite réelle du nombre de requêtes concurrentes
+    # accédant à la base, les connexions étant rendues dès le commit
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    # Instrumentation : seuil de requête lente et détection des N+1
+    slow_query_ms: float = 100.0
+    repeated_statement_threshold: int = 5
+    # Multi-organisation : une base par organisation (fichier SQLite, ou
+    # schéma sur les autres serveurs), désignée par la revendication
+    # `tenant_claim` du token, à défaut par l'en-tête `tenant_header` ;
+    # sans organisation, la base principale est utilisée
+    tenancy_enabled: bool = False
+    tenant_header: str = "X-Tenant"
+    tenant_claim: str = "tenant"
+    # Organisations connues : toute autre est refusée (404), aucune base
+    # n'est créée pour un nom arbitraire reçu d'un client
+    tenants: tuple = ()
+    # Moteurs d'organisation ouverts simultanément (éviction LRU)
+    max_open_tenants: int = 16
 
 
 @dataclass
 class NetworkConfig:
-    """Configuration réseau pour l'application (hôte et port)."""
+    """
+    Configuration réseau et serveur ASGI de l'application (voir
+    `launcher.py`).
+    """
 
     host: str = "127.0.0.1"
     port: int = 8000
+    # Serveur : "uvicorn" (HTTP/1.1) ou "hypercorn" (HTTP/2, optionnel)
+    server: str = "uvicorn"
+    # Boucle d'événements ("auto", "asyncio", "uvloop") et analyseur
+    # HTTP de uvicorn ("auto", "h11", "httptools") ; "auto" retient
+    # uvloop et httptools lorsqu'ils sont installés
+    loop: str = "auto"
+    http: str = "auto"
+    workers: int = 1
+    # Durée de conservation d'une connexion inactive
+    keep_alive_seconds: int = 5
+    # File des connexions en attente d'acceptation (noyau)
+    backlog: int = 2048
+    # Connexions et requêtes simultanées au-delà desquelles uvicorn
+    # répond 503 (0 = illimité)
+    limit_concurrency: int = 0
+    # Recyclage d'un worker après ce nombre de requêtes, plus un tirage
+    # dans [0, max_requests_jitter] propre à chaque worker (0 = jamais)
+    max_requests_per_worker: int = 0
+    max_requests_jitter: int = 0
+    # Certificat TLS : requis par les navigateurs pour HTTP/2
+    ssl_certfile: str = ""
+    ssl_keyfile: str = ""
 
 
 @dataclass
@@ -34,6 +92,239 @@ class LoggerConfig:
     log_retention: str = "1 week"
     log_compression: str = "zip"
     log_encoding: str = "utf-8"
+    # Taille de la file d'écriture du fichier de log (0 = écriture directe)
+    log_queue_size: int = 0
+    # Index binaire des logs (horodatage, niveau, événement, utilisateur),
+    # interrogeable par GET /admin/logs/index ; enregistrements par segment
+    log_index_enabled: bool = False
+    log_index_segment_records: int = 65536
+
+
+@dataclass
+class RateLimitConfig:
+    """Configuration de la limitation de débit des routes de connexion
+    (fenêtre glissante par adresse IP et par nom d'utilisateur)."""
+
+    enabled: bool = True
+    window_seconds: float = 60.0
+    max_attempts_per_ip: int = 30
+    max_attempts_per_user: int = 10
+    max_tracked_keys: int = 100_000
+    # "memory" (propre au worker) ou "sqlite" (partagé entre workers)
+    backend: str = "memory"
+    shared_store_path: str = "rate_limit.db"
+    protected_paths: tuple = ("/users/login", "/users/token")
+    # Taille maximale du corps des routes protégées (au-delà : 413)
+    max_body_bytes: int = 16 * 1024
+
+
+@dataclass
+class HealthConfig:
+    """Configuration des sondes de santé (readiness)."""
+
+    # Durée de mise en cache du résultat de la sonde readiness
+    readiness_cache_seconds: float = 2.0
+    # Seuils au-delà desquels l'application n'est plus prête
+    max_pool_saturation: float = 0.95
+    max_log_backlog_ratio: float = 0.8
+
+
+@dataclass
+class ShutdownConfig:
+    """Configuration de l'arrêt progressif (drain) de l'application."""
+
+    # Délai maximal d'attente des requêtes en cours
+    drain_timeout_seconds: float = 30.0
+    # Délai maximal d'écriture des logs en attente
+    log_flush_timeout_seconds: float = 5.0
+
+
+@dataclass
+class ProfilingConfig:
+    """Configuration du profilage à la demande des requêtes."""
+
+    enabled: bool = False
+    # En-tête déclenchant le profilage s'il porte `header_token`
+    header_name: str = "X-Profile"
+    header_token: str = ""
+    # Fraction des requêtes profilées aléatoirement (0 = aucune)
+    sample_rate: float = 0.0
+    interval_ms: float = 1.0
+
+
+@dataclass
+class CacheConfig:
+    """Configuration du cache des projections utilisateur."""
+
+    user_cache_size: int = 10_000
+    user_cache_ttl_seconds: float = 30.0
+    # Mise en cache des noms inconnus (0 = désactivée)
+    negative_ttl_seconds: float = 0.0
+    # Second niveau partagé entre workers : "" (aucun) ou "sqlite"
+    shared_backend: str = ""
+    shared_store_path: str = "user_cache.db"
+    shared_ttl_seconds: float = 300.0
+
+
+@dataclass
+class StatsConfig:
+    """Configuration des statistiques agrégées sur les utilisateurs."""
+
+    # Intervalle de réconciliation des compteurs avec la base
+    reconcile_interval_seconds: float = 300.0
+    # Nombre de jours d'inscriptions restitués
+    signup_days: int = 30
+
+
+@dataclass
+class PurgeConfig:
+    """Configuration de la purge des utilisateurs supprimés logiquement."""
+
+    enabled: bool = True
+    interval_seconds: float = 60.0
+    # Délai de conservation des utilisateurs supprimés avant effacement
+    retention_seconds: float = 0.0
+    # Débit : lots de `batch_size` lignes, espacés de `batch_pause_seconds`
+    batch_size: int = 500
+    batch_pause_seconds: float = 0.1
+    max_batches_per_run: int = 20
+    # Requêtes en cours au-delà desquelles la purge est différée
+    quiet_max_in_flight: int = 2
+
+
+@dataclass
+class AuditConfig:
+    """Configuration du journal d'audit à écriture différée."""
+
+    enabled: bool = True
+    # Capacité de la file d'événements en attente d'écriture
+    queue_size: int = 10_000
+    # Écriture par lots : dès `batch_size` événements ou après
+    # `flush_interval_seconds` pour le plus ancien
+    batch_size: int = 200
+    flush_interval_seconds: float = 1.0
+    # Délai d'écriture des événements en attente à l'arrêt
+    flush_timeout_seconds: float = 5.0
+
+
+@dataclass
+class SchedulerConfig:
+    """
+    Configuration de l'ordonnanceur des tâches de maintenance.
+
+    Un intervalle nul ou négatif désactive la tâche correspondante.
+    """
+
+    enabled: bool = True
+    # Perturbation aléatoire des intervalles (fraction, ±)
+    jitter_ratio: float = 0.1
+    # Verrou d'élection du worker exécutant les tâches partagées
+    # (relatif au répertoire des données)
+    lock_file: str = "scheduler.lock"
+    # Rechargement des projections utilisateur les plus utilisées
+    cache_refresh_interval_seconds: float = 20.0
+    cache_refresh_max_keys: int = 1000
+    # Purge des entrées expirées (cache partagé, compteurs de débit)
+    expired_cleanup_interval_seconds: float = 300.0
+    # Maintenance SQLite
+    sqlite_optimize_interval_seconds: float = 3600.0
+    sqlite_checkpoint_interval_seconds: float = 300.0
+    sqlite_vacuum_interval_seconds: float = 0.0
+    # Suppression des archives de logs et profils anciens
+    log_prune_interval_seconds: float = 3600.0
+    log_archive_max_age_days: float = 30.0
+
+
+@dataclass
+class WarmupConfig:
+    """
+    Configuration du préchauffage au démarrage : l'application n'est
+    déclarée prête qu'une fois celui-ci terminé.
+    """
+
+    enabled: bool = True
+    # En tâche de fond : le serveur répond (liveness) pendant le
+    # préchauffage ; sinon, celui-ci retarde la fin du démarrage
+    background: bool = False
+    # Connexions ouvertes d'avance (bornées par pool_size)
+    min_connections: int = 2
+    # Projections préchargées : derniers utilisateurs connectés
+    hot_users: int = 500
+    # Entrées lues par index pour charger ses pages en cache
+    index_touch_rows: int = 10_000
+
+
+@dataclass
+class IdempotencyConfig:
+    """Configuration des clés d'idempotence des routes d'écriture."""
+
+    enabled: bool = True
+    header_name: str = "Idempotency-Key"
+    # Routes concernées : "MÉTHODE chemin", `*` remplaçant un segment
+    routes: tuple = ("POST /users", "PUT /users/*", "DELETE /users/*")
+    # Réponses conservées : nombre, durée et taille maximale
+    max_entries: int = 10_000
+    ttl_seconds: float = 3600.0
+    max_body_bytes: int = 64 * 1024
+    max_key_length: int = 255
+    # Taille maximale du corps des requêtes avec clé (au-delà : 413)
+    max_request_bytes: int = 1024 * 1024
+    # Attente d'une exécution concurrente de la même requête
+    wait_timeout_seconds: float = 10.0
+
+
+@dataclass
+class SingleFlightConfig:
+    """Configuration du regroupement des lectures concurrentes."""
+
+    enabled: bool = True
+
+
+@dataclass
+class ResponseCacheConfig:
+    """Configuration du cache des réponses des routes GET."""
+
+    enabled: bool = True
+    # Durée de vie d'une réponse : borne aussi l'incohérence entre
+    # workers, l'invalidation étant propre à chacun
+    ttl_seconds: float = 5.0
+    # Mémoire occupée par l'ensemble des réponses, et par réponse
+    max_bytes: int = 16 * 1024 * 1024
+    max_entry_bytes: int = 1024 * 1024
+
+
+@dataclass
+class AdmissionConfig:
+    """
+    Configuration du contrôle d'admission : requêtes simultanées et file
+    d'attente bornées par groupe de routes, propres au worker.
+    """
+
+    enabled: bool = True
+    # Groupes : "nom:requêtes simultanées:requêtes en attente"
+    groups: tuple = ("auth:4:16", "heavy:4:32", "default:64:256")
+    # Routes des groupes : "groupe=MÉTHODE chemin" (voir IdempotencyConfig) ;
+    # les autres routes relèvent du groupe "default"
+    routes: tuple = (
+        "auth=POST /users/login",
+        "auth=POST /users/token",
+        "heavy=GET /users",
+        "heavy=GET /users/search",
+        "heavy=GET /users/stats",
+    )
+    # Routes jamais mises en attente (sondes, métriques)
+    exempt_routes: tuple = ("GET /health", "GET /health/*", "GET /metrics")
+    # Attente maximale d'une place avant rejet (503)
+    queue_timeout_seconds: float = 2.0
+    retry_after_seconds: int = 1
+
+
+@dataclass
+class AdminConfig:
+    """Configuration des routes d'administration."""
+
+    # Jeton attendu dans l'en-tête X-Admin-Token (vide = routes fermées)
+    api_token: str = ""
 
 
 @dataclass
@@ -47,6 +338,29 @@ class AppConfig:
     database_config: DatabaseConfig = field(default_factory=DatabaseConfig)
     network_config: NetworkConfig = field(default_factory=NetworkConfig)
     logger_config: LoggerConfig = field(default_factory=LoggerConfig)
+    rate_limit_config: RateLimitConfig = field(default_factory=RateLimitConfig)
+    health_config: HealthConfig = field(default_factory=HealthConfig)
+    shutdown_config: ShutdownConfig = field(default_factory=ShutdownConfig)
+    profiling_config: ProfilingConfig = field(default_factory=ProfilingConfig)
+    admin_config: AdminConfig = field(default_factory=AdminConfig)
+    cache_config: CacheConfig = field(default_factory=CacheConfig)
+    stats_config: StatsConfig = field(default_factory=StatsConfig)
+    purge_config: PurgeConfig = field(default_factory=PurgeConfig)
+    audit_config: AuditConfig = field(default_factory=AuditConfig)
+    scheduler_config: SchedulerConfig = field(default_factory=SchedulerConfig)
+    warmup_config: WarmupConfig = field(default_factory=WarmupConfig)
+    idempotency_config: IdempotencyConfig = field(
+        default_factory=IdempotencyConfig
+    )
+    single_flight_config: SingleFlightConfig = field(
+        default_factory=SingleFlightConfig
+    )
+    response_cache_config: ResponseCacheConfig = field(
+        default_factory=ResponseCacheConfig
+    )
+    admission_config: AdmissionConfig = field(default_factory=AdmissionConfig)
+    # Fichier TOML d'origine, relu lors d'un rechargement à chaud
+    config_file: Optional[str] = None
 
     def __post_init__(self) -> None:
         """Validation simple de la configuration."""
@@ -56,3 +370,55 @@ class AppConfig:
             raise ValueError("Le titre de l'application est requis.")
         if not isinstance(self.network_config.port, int):
             raise ValueError("Le port doit être un entier.")
+        if self.network_config.server not in ("uvicorn", "hypercorn"):
+            raise ValueError("Le serveur doit être 'uvicorn' ou 'hypercorn'.")
+        if self.network_config.loop not in ("auto", "asyncio", "uvloop"):
+            raise ValueError(
+                "La boucle doit être 'auto', 'asyncio' ou 'uvloop'."
+            )
+        if self.network_config.http not in ("auto", "h11", "httptools"):
+            raise ValueError(
+                "L'analyseur HTTP doit être 'auto', 'h11' ou 'httptools'."
+            )
+        if self.database_config.max_open_tenants < 1:
+            raise ValueError(
+                "Le nombre de bases d'organisation ouvertes doit être positif."
+            )
+        if self.logger_config.log_index_segment_records <= 0:
+            raise ValueError(
+                "La taille des segments de l'index doit être positive."
+            )
+        if self.network_config.workers < 1:
+            raise ValueError("Le nombre de workers doit être positif.")
+        if self.rate_limit_config.backend not in ("memory", "sqlite"):
+            raise ValueError(
+                "Le backend de limitation doit être 'memory' ou 'sqlite'."
+            )
+        if self.cache_config.shared_backend not in ("", "sqlite"):
+            raise ValueError(
+                "Le cache partagé doit être '' (aucun) ou 'sqlite'."
+            )
+        if self.purge_config.batch_size <= 0:
+            raise ValueError("La taille des lots de purge doit être positive.")
+        if self.audit_config.batch_size <= 0:
+            raise ValueError("La taille des lots d'audit doit être positive.")
+        if not 0.0 <= self.scheduler_config.jitter_ratio < 1.0:
+            raise ValueError("Le jitter doit être compris entre 0 et 1.")
+        if (
+            self.rate_limit_config.max_body_bytes <= 0
+            or self.idempotency_config.max_request_bytes <= 0
+        ):
+            raise ValueError(
+                "La taille maximale des corps doit être positive."
+            )
+        if self.rate_limit_config.window_seconds <= 0:
+            raise ValueError("La fenêtre de limitation doit être positive.")
+        if self.logger_config.log_level.upper() not in LOG_LEVELS:
+            raise ValueError(
+                "Le niveau de log doit être l'un de : "
+                f"{', '.join(LOG_LEVELS)}."
+            )
+        if not 0.0 <= self.profiling_config.sample_rate <= 1.0:
+            raise ValueError(
+                "Le taux de profilage doit être compris entre 0 et 1."
+            )
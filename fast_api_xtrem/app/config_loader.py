@@ -0,0 +1,304 @@
+"""
+Chargement et rechargement de la configuration de l'application.
+
+La configuration `AppConfig` est construite, par ordre de priorité
+croissante, à partir :
+1. des valeurs par défaut des dataclasses de `config.py` ;
+2. d'un fichier TOML (argument `path` ou variable `FAST_API_XTREM_CONFIG`),
+   dont chaque table correspond à une section (`[database]`,
+   `[rate_limit]`…) et les clés de premier niveau aux champs d'`AppConfig` ;
+3. des variables d'environnement `FAST_API_XTREM__<SECTION>__<CHAMP>`
+   (ou `FAST_API_XTREM__<CHAMP>` pour les champs de premier niveau).
+
+Chaque valeur est convertie et validée selon le type du champ ; une clé
+inconnue ou une valeur invalide lève `ConfigError`.
+
+Seuls les réglages listés dans `RELOADABLE` peuvent être modifiés à chaud
+(voir `ApplicationServices.reload_config`) ; les autres nécessitent un
+redémarrage.
+"""
+
+import dataclasses
+import os
+import tomllib
+from typing import Any, Dict, Mapping, Optional
+
+from fast_api_xtrem.app.config import AppConfig
+
+ENV_PREFIX = "FAST_API_XTREM__"
+ENV_CONFIG_FILE = "FAST_API_XTREM_CONFIG"
+SECTION_SUFFIX = "_config"
+
+# Réglages modifiables à chaud, par section
+RELOADABLE: Dict[str, frozenset] = {
+    "logger": frozenset({"log_level"}),
+    "rate_limit": frozenset(
+        {
+            "enabled",
+            "window_seconds",
+            "max_attempts_per_ip",
+            "max_attempts_per_user",
+            "max_body_bytes",
+        }
+    ),
+    "profiling": frozenset(
+        {"enabled", "header_token", "sample_rate", "interval_ms"}
+    ),
+    "health": frozenset(
+        {
+            "readiness_cache_seconds",
+            "max_pool_saturation",
+            "max_log_backlog_ratio",
+        }
+    ),
+    "shutdown": frozenset(
+        {"drain_timeout_seconds", "log_flush_timeout_seconds"}
+    ),
+    "database": frozenset(
+        {
+            "slow_query_ms",
+            "repeated_statement_threshold",
+            "max_open_tenants",
+            "tenants",
+        }
+    ),
+    "stats": frozenset({"reconcile_interval_seconds", "signup_days"}),
+    "purge": frozenset(
+        {
+            "enabled",
+            "interval_seconds",
+            "retention_seconds",
+            "batch_size",
+            "batch_pause_seconds",
+            "max_batches_per_run",
+            "quiet_max_in_flight",
+        }
+    ),
+    "audit": frozenset(
+        {
+            "enabled",
+            "batch_size",
+            "flush_interval_seconds",
+            "flush_timeout_seconds",
+        }
+    ),
+    "cache": frozenset(
+        {
+            "user_cache_size",
+            "user_cache_ttl_seconds",
+            "negative_ttl_seconds",
+            "shared_ttl_seconds",
+        }
+    ),
+    "idempotency": frozenset(
+        {
+            "enabled",
+            "max_entries",
+            "ttl_seconds",
+            "max_body_bytes",
+            "max_request_bytes",
+            "wait_timeout_seconds",
+        }
+    ),
+    "single_flight": frozenset({"enabled"}),
+    "response_cache": frozenset(
+        {"enabled", "ttl_seconds", "max_bytes", "max_entry_bytes"}
+    ),
+    "admission": frozenset(
+        {"enabled", "queue_timeout_seconds", "retry_after_seconds"}
+    ),
+    "scheduler": frozenset(
+        {
+            "jitter_ratio",
+            "cache_refresh_interval_seconds",
+            "cache_refresh_max_keys",
+            "expired_cleanup_interval_seconds",
+            "sqlite_optimize_interval_seconds",
+            "sqlite_checkpoint_interval_seconds",
+            "sqlite_vacuum_interval_seconds",
+            "log_prune_interval_seconds",
+            "log_archive_max_age_days",
+        }
+    ),
+}
+
+_TRUE = ("1", "true", "yes", "on")
+_FALSE = ("0", "false", "no", "off")
+
+
+class ConfigError(ValueError):
+    """Erreur de chargement ou de validation de la configuration."""
+
+
+def _sections() -> Dict[str, dataclasses.Field]:
+    """Retourne les champs d'`AppConfig` qui sont des sous-configurations."""
+    return {
+        f.name[: -len(SECTION_SUFFIX)]: f
+        for f in dataclasses.fields(AppConfig)
+        if f.name.endswith(SECTION_SUFFIX)
+    }
+
+
+def _coerce(value: Any, target: type, name: str) -> Any:
+    """
+    Convertit une valeur (chaîne d'environnement ou valeur TOML)
+    vers le type du champ.
+
+    Raises:
+        ConfigError: Si la valeur n'est pas convertible.
+    """
+    if isinstance(value, str) and target is not str:
+        text = value.strip()
+        if target is bool:
+            if text.lower() in _TRUE:
+                return True
+            if text.lower() in _FALSE:
+                return False
+            raise ConfigError(f"{name} : booléen attendu, reçu {value!r}")
+        if target is tuple:
+            return tuple(item.strip() for item in text.split(",") if item)
+        try:
+            return target(text)
+        except ValueError as e:
+            raise ConfigError(
+                f"{name} : {target.__name__} attendu, reçu {value!r}"
+            ) from e
+    if (
+        target is float
+        and isinstance(value, int)
+        and not isinstance(value, bool)
+    ):
+        return float(value)
+    if target is tuple and isinstance(value, list):
+        return tuple(value)
+    if not isinstance(value, target) or (
+        target is int and isinstance(value, bool)
+    ):
+        raise ConfigError(
+            f"{name} : {target.__name__} attendu, reçu {value!r}"
+        )
+    return value
+
+
+def _apply(instance: Any, values: Mapping[str, Any], where: str) -> Any:
+    """Retourne une copie de la dataclass avec les valeurs converties."""
+    fields = {f.name: f for f in dataclasses.fields(instance)}
+    changes = {}
+    for key, value in values.items():
+        if key not in fields:
+            raise ConfigError(f"Clé de configuration inconnue : {where}{key}")
+        changes[key] = _coerce(value, fields[key].type, f"{where}{key}")
+    return dataclasses.replace(instance, **changes)
+
+
+def _read_toml(path: str) -> Dict[str, Any]:
+    """Lit un fichier TOML de configuration."""
+    try:
+        with open(path, "rb") as file:
+            return tomllib.load(file)
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        raise ConfigError(f"Fichier de configuration illisible : {e}") from e
+
+
+def _read_env(environ: Mapping[str, str]) -> Dict[str, Any]:
+    """Regroupe les variables d'environnement par section."""
+    values: Dict[str, Any] = {}
+    for name, value in environ.items():
+        if not name.startswith(ENV_PREFIX):
+            continue
+        parts = name.removeprefix(ENV_PREFIX).lower().split("__")
+        if len(parts) == 1:
+            values[parts[0]] = value
+        elif len(parts) == 2:
+            values.setdefault(parts[0], {})[parts[1]] = value
+        else:
+            raise ConfigError(f"Variable de configuration invalide : {name}")
+    return values
+
+
+def _merge(config: AppConfig, values: Mapping[str, Any]) -> AppConfig:
+    """Fusionne des valeurs (TOML ou environnement) dans la configuration."""
+    sections = _sections()
+    top_level, changes = {}, {}
+    for key, value in values.items():
+        if key in sections:
+            if not isinstance(value, Mapping):
+                raise ConfigError(f"La section {key} doit être une table")
+            field_name = sections[key].name
+            changes[field_name] = _apply(
+                getattr(config, field_name), value, f"{key}."
+            )
+        else:
+            top_level[key] = value
+    for key in top_level:
+        if key.endswith(SECTION_SUFFIX) or key == "config_file":
+            raise ConfigError(f"Clé de configuration inconnue : {key}")
+    config = dataclasses.replace(config, **changes)
+    return _apply(config, top_level, "")
+
+
+def load_config(
+    path: Optional[str] = None, environ: Optional[Mapping[str, str]] = None
+) -> AppConfig:
+    """
+    Construit la configuration de l'application.
+
+    Args:
+        path (Optional[str]): Fichier TOML ; à défaut, la variable
+            `FAST_API_XTREM_CONFIG` est consultée.
+        environ (Optional[Mapping[str, str]]): Environnement
+            (`os.environ` par défaut).
+
+    Returns:
+        AppConfig: Configuration validée.
+
+    Raises:
+        ConfigError: Si une source est invalide.
+    """
+    environ = os.environ if environ is None else environ
+    path = path or environ.get(ENV_CONFIG_FILE) or None
+    try:
+        config = AppConfig()
+        if path:
+            config = _merge(config, _read_toml(path))
+        config = _merge(config, _read_env(environ))
+    except ValueError as e:
+        # Les erreurs de __post_init__ sont aussi des ValueError
+        if isinstance(e, ConfigError):
+            raise
+        raise ConfigError(str(e)) from e
+    config.config_file = path
+    return config
+
+
+def reloadable_changes(old: AppConfig, new: AppConfig) -> Dict[str, Any]:
+    """
+    Sépare, entre deux configurations, les réglages modifiables à chaud
+    de ceux nécessitant un redémarrage.
+
+    Args:
+        old (AppConfig): Configuration en vigueur.
+        new (AppConfig): Configuration rechargée.
+
+    Returns:
+        Dict[str, Any]: `sections` (section → nouvel objet, réglages à
+        chaud appliqués) et `ignored` (réglages nécessitant un
+        redémarrage).
+    """
+    sections, ignored = {}, []
+    for short_name, field in _sections().items():
+        current = getattr(old, field.name)
+        updated = getattr(new, field.name)
+        changes = {}
+        for item in dataclasses.fields(current):
+            before = getattr(current, item.name)
+            after = getattr(updated, item.name)
+            if before == after:
+                continue
+            if item.name in RELOADABLE.get(short_name, ()):
+                changes[item.name] = after
+            else:
+                ignored.append(f"{short_name}.{item.name}")
+        if changes:
+            sections[field.name] = dataclasses.replace(current, **changes)
+    return {"sections": sections, "ignored": ignored}
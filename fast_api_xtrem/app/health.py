@@ -0,0 +1,135 @@
+"""
+Module des sondes de santé de l'application FastAPI XTREM.
+
+La classe `HealthChecker` évalue la disponibilité (readiness) de
+l'application : accès à la base de données, saturation du pool de
+connexions et pression sur le sink de logs. Le résultat est mis en cache
+pendant un court intervalle, de sorte que des sondes fréquentes ne coûtent
+presque rien. Pendant le préchauffage et l'arrêt progressif (drain),
+l'application est immédiatement déclarée non prête.
+"""
+
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import text
+
+from fast_api_xtrem.app.config import HealthConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.db.db_manager import DBManager
+from fast_api_xtrem.logger.logger_manager import LoggerManager
+
+
+class HealthChecker:
+    """Évalue et met en cache l'état de disponibilité de l'application."""
+
+    def __init__(
+        self,
+        config: HealthConfig,
+        db_manager: DBManager,
+        logger: LoggerManager,
+        metrics: MetricsRegistry,
+    ) -> None:
+        """
+        Args:
+            config (HealthConfig): Configuration des sondes.
+            db_manager (DBManager): Gestionnaire de base de données.
+            logger (LoggerManager): Gestionnaire de logs.
+            metrics (MetricsRegistry): Registre des métriques.
+        """
+        self.config = config
+        self.db_manager = db_manager
+        self.logger = logger
+        self.metrics = metrics
+        self.draining = False
+        self.warming = False
+        self._lock = threading.Lock()
+        self._cached: Optional[dict] = None
+        self._expires_at = 0.0
+
+    def mark_draining(self) -> None:
+        """Déclare l'application non prête (arrêt en cours)."""
+        self.draining = True
+        self.metrics.set_gauge("health_ready", 0)
+
+    def mark_warming(self) -> None:
+        """Déclare l'application non prête (préchauffage en cours)."""
+        self.warming = True
+        self.metrics.set_gauge("health_ready", 0)
+
+    def mark_warm(self) -> None:
+        """Termine le préchauffage : les vérifications sont réévaluées."""
+        self.warming = False
+        self._expires_at = 0.0
+
+    def readiness(self) -> dict:
+        """
+        Retourne l'état de disponibilité, depuis le cache si possible.
+
+        Returns:
+            dict: `ready` (bool) et détail de chaque vérification.
+        """
+        if self.draining:
+            return {"ready": False, "checks": {"draining": True}}
+        if self.warming:
+            return {"ready": False, "checks": {"warmup": True}}
+        now = time.monotonic()
+        cached = self._cached
+        if cached is not None and now < self._expires_at:
+            return cached
+        with self._lock:
+            if self._cached is not None and now < self._expires_at:
+                return self._cached
+            result = self._evaluate()
+            self._cached = result
+            self._expires_at = (
+                time.monotonic() + self.config.readiness_cache_seconds
+            )
+        self.metrics.set_gauge("health_ready", int(result["ready"]))
+        return result
+
+    def _evaluate(self) -> dict:
+        """Exécute l'ensemble des vérifications."""
+        pool = self._check_pool()
+        # Pool saturé : la requête de test attendrait une connexion
+        database = (
+            self._check_database()
+            if pool["ok"]
+            else {"ok": False, "error": "pool de connexions saturé"}
+        )
+        checks = {
+            "database": database,
+            "pool": pool,
+            "logs": self._check_logs(),
+        }
+        ready = all(check["ok"] for check in checks.values())
+        return {"ready": ready, "checks": checks}
+
+    def _check_database(self) -> dict:
+        """Vérifie l'accès à la base par une requête triviale."""
+        if self.db_manager.engine is None:
+            return {"ok": False, "error": "base non connectée"}
+        start = time.perf_counter()
+        try:
+            with self.db_manager.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.error(f"Sonde readiness : base inaccessible ({e})")
+            return {"ok": False, "error": str(e)}
+        latency_ms = (time.perf_counter() - start) * 1000
+        return {"ok": True, "latency_ms": round(latency_ms, 3)}
+
+    def _check_pool(self) -> dict:
+        """Vérifie que le pool de connexions n'est pas saturé."""
+        status = self.db_manager.pool_status()
+        status["ok"] = status["saturation"] < self.config.max_pool_saturation
+        return status
+
+    def _check_logs(self) -> dict:
+        """Vérifie que la file d'écriture des logs n'est pas engorgée."""
+        backlog = self.logger.backlog()
+        capacity = backlog["capacity"]
+        ratio = backlog["depth"] / capacity if capacity else 0.0
+        backlog["ok"] = ratio < self.config.max_log_backlog_ratio
+        return backlog
@@ -0,0 +1,192 @@
+"""
+Lancement du serveur ASGI de l'application FastAPI XTREM.
+
+Le serveur est choisi et réglé par `NetworkConfig` :
+- uvicorn (HTTP/1.1) : boucle d'événements et analyseur HTTP (uvloop et
+  httptools, dépendances optionnelles), keep-alive, file d'acceptation,
+  limite de concurrence, nombre de workers ;
+- hypercorn (HTTP/1.1 et HTTP/2, dépendance optionnelle) : HTTP/2 est
+  négocié par ALPN avec TLS, ou directement (h2c) sans TLS.
+
+Avec `max_requests_per_worker`, chaque worker s'arrête après un nombre de
+requêtes tiré entre `max_requests_per_worker` et cette valeur augmentée
+de `max_requests_jitter`, et le superviseur le remplace : la mémoire
+accumulée (fragmentation, caches) est bornée sans que tous les workers
+redémarrent en même temps.
+
+Les workers importent l'application depuis `fast_api_xtrem.asgi`.
+"""
+
+import random
+from importlib.util import find_spec
+from typing import Any, Dict, Optional
+
+import uvicorn
+from uvicorn.supervisors import ChangeReload, Multiprocess
+
+from fast_api_xtrem.app.config import AppConfig, NetworkConfig
+
+try:
+    from hypercorn.config import Config as HypercornConfig
+    from hypercorn.run import run as run_hypercorn
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    HypercornConfig = run_hypercorn = None
+
+ASGI_APP = "fast_api_xtrem.asgi:app"
+
+
+def worker_request_limit(
+    network: NetworkConfig, rng: random.Random = random
+) -> Optional[int]:
+    """
+    Tire le nombre de requêtes servies par un worker avant recyclage.
+
+    Args:
+        network (NetworkConfig): Configuration réseau.
+        rng (random.Random): Générateur aléatoire (remplaçable en test).
+
+    Returns:
+        Optional[int]: Limite du worker, ou None s'il n'est pas recyclé.
+    """
+    if network.max_requests_per_worker <= 0:
+        return None
+    jitter = max(network.max_requests_jitter, 0)
+    return network.max_requests_per_worker + rng.randint(0, jitter)
+
+
+def _require(package: str, setting: str) -> None:
+    """
+    Vérifie qu'une dépendance optionnelle est installée.
+
+    Raises:
+        RuntimeError: Si le paquet est absent.
+    """
+    if find_spec(package) is None:
+        raise RuntimeError(
+            f"{setting} requiert le paquet {package} (pip install {package})"
+        )
+
+
+class WorkerConfig(uvicorn.Config):
+    """
+    Configuration uvicorn tirant sa limite de requêtes au chargement,
+    c'est-à-dire dans chaque worker.
+    """
+
+    def __init__(self, *args, network: NetworkConfig, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.network = network
+
+    def load(self) -> None:
+        super().load()
+        self.limit_max_requests = worker_request_limit(self.network)
+
+
+def uvicorn_options(config: AppConfig) -> Dict[str, Any]:
+    """
+    Traduit la configuration en options uvicorn.
+
+    Args:
+        config (AppConfig): Configuration de l'application.
+
+    Returns:
+        Dict[str, Any]: Arguments de `uvicorn.Config`.
+
+    Raises:
+        RuntimeError: Si uvloop ou httptools est demandé sans être installé.
+    """
+    network = config.network_config
+    if network.loop == "uvloop":
+        _require("uvloop", "network.loop = 'uvloop'")
+    if network.http == "httptools":
+        _require("httptools", "network.http = 'httptools'")
+    return {
+        "host": network.host,
+        "port": network.port,
+        "loop": network.loop,
+        "http": network.http,
+        "workers": network.workers,
+        "reload": config.reload,
+        "timeout_keep_alive": network.keep_alive_seconds,
+        "backlog": network.backlog,
+        "limit_concurrency": network.limit_concurrency or None,
+        "ssl_certfile": network.ssl_certfile or None,
+        "ssl_keyfile": network.ssl_keyfile or None,
+    }
+
+
+def _serve_uvicorn(config: AppConfig) -> None:
+    """
+    Démarre uvicorn, avec un superviseur si plusieurs workers ou si les
+    workers sont recyclés (`max_requests_per_worker`) : même seul, un
+    worker arrivé à sa limite doit être relancé.
+    """
+    server_config = WorkerConfig(
+        ASGI_APP, network=config.network_config, **uvicorn_options(config)
+    )
+    server = uvicorn.Server(server_config)
+    if server_config.should_reload:
+        sock = server_config.bind_socket()
+        ChangeReload(server_config, target=server.run, sockets=[sock]).run()
+    elif (
+        server_config.workers > 1
+        or config.network_config.max_requests_per_worker > 0
+    ):
+        # Les workers arrêtés (recyclage) sont relancés par le superviseur
+        sock = server_config.bind_socket()
+        Multiprocess(server_config, target=server.run, sockets=[sock]).run()
+    else:
+        server.run()
+
+
+def hypercorn_config(network: NetworkConfig):
+    """
+    Traduit la configuration réseau en configuration hypercorn.
+
+    Args:
+        network (NetworkConfig): Configuration réseau.
+
+    Returns:
+        hypercorn.config.Config: Configuration du serveur.
+
+    Raises:
+        RuntimeError: Si hypercorn (ou uvloop demandé) n'est pas installé.
+    """
+    if HypercornConfig is None:
+        raise RuntimeError(
+            "network.server = 'hypercorn' requiert le paquet hypercorn "
+            "(pip install hypercorn)"
+        )
+    if network.loop == "uvloop":
+        _require("uvloop", "network.loop = 'uvloop'")
+    server_config = HypercornConfig()
+    server_config.application_path = ASGI_APP
+    server_config.bind = [f"{network.host}:{network.port}"]
+    server_config.workers = network.workers
+    use_uvloop = network.loop == "uvloop" or (
+        network.loop == "auto" and find_spec("uvloop") is not None
+    )
+    server_config.worker_class = "uvloop" if use_uvloop else "asyncio"
+    server_config.keep_alive_timeout = network.keep_alive_seconds
+    server_config.backlog = network.backlog
+    if network.max_requests_per_worker > 0:
+        server_config.max_requests = network.max_requests_per_worker
+        server_config.max_requests_jitter = network.max_requests_jitter
+    if network.ssl_certfile:
+        server_config.certfile = network.ssl_certfile
+        server_config.keyfile = network.ssl_keyfile or None
+    return server_config
+
+
+def serve(config: AppConfig) -> None:
+    """
+    Démarre le serveur ASGI choisi par `network_config.server`.
+
+    Args:
+        config (AppConfig): Configuration de l'application ; les workers
+            la relisent depuis les mêmes sources (`load_config`).
+    """
+    if config.network_config.server == "hypercorn":
+        run_hypercorn(hypercorn_config(config.network_config))
+    else:
+        _serve_uvicorn(config)
@@ -0,0 +1,105 @@
+"""
+Module de métriques internes de l'application FastAPI XTREM.
+
+Ce module définit la classe `MetricsRegistry`, un registre minimal et
+thread-safe de compteurs et de jauges étiquetés. Les services de
+l'application y publient leurs mesures, exposées ensuite au format texte
+Prometheus par la route `/metrics`.
+"""
+
+import threading
+from typing import Dict, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    """Construit une clé hachable et ordonnée à partir des étiquettes."""
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(key: LabelKey) -> str:
+    """Formate les étiquettes au format Prometheus."""
+    if not key:
+        return ""
+    inner = ",".join(f'{name}="{value}"' for name, value in key)
+    return "{" + inner + "}"
+
+
+class MetricsRegistry:
+    """
+    Registre de métriques de l'application.
+
+    Les compteurs sont monotones (`increment`), les jauges reflètent une
+    valeur instantanée (`set_gauge`).
+    """
+
+    def __init__(self) -> None:
+        """Initialise un registre vide."""
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+
+    def increment(self, name: str, value: float = 1.0, **labels) -> None:
+        """
+        Incrémente un compteur.
+
+        Args:
+            name (str): Nom de la métrique.
+            value (float): Valeur à ajouter (1 par défaut).
+            **labels: Étiquettes de la série.
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """
+        Fixe la valeur d'une jauge.
+
+        Args:
+            name (str): Nom de la métrique.
+            value (float): Valeur courante.
+            **labels: Étiquettes de la série.
+        """
+        key = _label_key(labels)
+        with self._lock:
+            self._gauges.setdefault(name, {})[key] = float(value)
+
+    def get(self, name: str, **labels) -> float:
+        """
+        Retourne la valeur d'un compteur ou d'une jauge (0 si absente).
+
+        Args:
+            name (str): Nom de la métrique.
+            **labels: Étiquettes de la série.
+
+        Returns:
+            float: Valeur courante.
+        """
+        key = _label_key(labels)
+        with self._lock:
+            for store in (self._counters, self._gauges):
+                if name in store and key in store[name]:
+                    return store[name][key]
+        return 0.0
+
+    def render_prometheus(self) -> str:
+        """
+        Sérialise le registre au format texte Prometheus.
+
+        Returns:
+            str: Exposition des métriques.
+        """
+        lines = []
+        with self._lock:
+            for kind, store in (
+                ("counter", self._counters),
+                ("gauge", self._gauges),
+            ):
+                for name in sorted(store):
+                    lines.append(f"# TYPE {name} {kind}")
+                    for key, value in store[name].items():
+                        lines.append(f"{name}{_format_labels(key)} {value}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,241 @@
+"""
+Ordonnanceur des tâches de maintenance de l'application FastAPI XTREM.
+
+`Scheduler` exécute périodiquement des fonctions synchrones, hors de la
+boucle d'événements (`asyncio.to_thread`), du démarrage de l'application
+jusqu'à son arrêt :
+- chaque intervalle est perturbé aléatoirement (`jitter_ratio`) afin que
+  les workers ne lancent pas tous la même tâche au même instant ;
+- les tâches portant sur des ressources partagées (base, fichiers de
+  logs…) ne s'exécutent que sur le worker « leader », désigné par un
+  verrou de fichier (`LeaderLock`) ; un autre worker reprend le rôle si
+  le leader s'arrête ;
+- la durée et l'issue de chaque exécution sont publiées dans les
+  métriques ;
+- l'arrêt annule les attentes en cours (une exécution déjà lancée dans
+  un thread se termine, mais n'est plus attendue).
+
+Un intervalle nul ou négatif suspend la tâche, la configuration étant
+relue avant chaque attente.
+"""
+
+import asyncio
+import os
+import random
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from fast_api_xtrem.app.config import SchedulerConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - plateformes sans fcntl
+    fcntl = None
+
+# Intervalle de réexamen d'une tâche suspendue (secondes)
+SUSPENDED_POLL_SECONDS = 30.0
+
+
+class LeaderLock:
+    """
+    Verrou exclusif non bloquant sur un fichier, partagé par les workers
+    d'une même machine. Sans `fcntl`, le processus est toujours leader.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Args:
+            path (Path): Fichier de verrou.
+        """
+        self.path = path
+        self._fd: Optional[int] = None
+
+    @property
+    def held(self) -> bool:
+        """Indique si le verrou est détenu par ce processus."""
+        return self._fd is not None or fcntl is None
+
+    def try_acquire(self) -> bool:
+        """
+        Tente d'acquérir le verrou, sans attendre.
+
+        Returns:
+            bool: True si le verrou est détenu.
+        """
+        if self.held:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        """Libère le verrou s'il est détenu."""
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+class Job:
+    """Tâche périodique enregistrée auprès de l'ordonnanceur."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], object],
+        interval: Callable[[], float],
+        leader_only: bool,
+    ) -> None:
+        """
+        Args:
+            name (str): Nom de la tâche (logs et métriques).
+            func (Callable[[], object]): Fonction synchrone à exécuter.
+            interval (Callable[[], float]): Intervalle en secondes, relu
+                avant chaque attente (configuration rechargeable).
+            leader_only (bool): Exécution réservée au worker leader.
+        """
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.leader_only = leader_only
+        self.last_duration: Optional[float] = None
+        self.last_status: Optional[str] = None
+
+
+class Scheduler:
+    """Ordonnanceur asyncio des tâches périodiques."""
+
+    def __init__(
+        self,
+        config: SchedulerConfig,
+        metrics: MetricsRegistry,
+        logger,
+        lock_path: Path,
+    ) -> None:
+        """
+        Args:
+            config (SchedulerConfig): Configuration de l'ordonnanceur.
+            metrics (MetricsRegistry): Registre des métriques.
+            logger (LoggerManager): Gestionnaire de logs.
+            lock_path (Path): Fichier du verrou d'élection du leader.
+        """
+        self.config = config
+        self.metrics = metrics
+        self.logger = logger
+        self.leader = LeaderLock(lock_path)
+        self.jobs: Dict[str, Job] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], object],
+        interval: Callable[[], float],
+        leader_only: bool = False,
+    ) -> None:
+        """
+        Enregistre une tâche périodique (avant `start`).
+
+        Args:
+            name (str): Nom unique de la tâche.
+            func (Callable[[], object]): Fonction synchrone à exécuter.
+            interval (Callable[[], float]): Intervalle en secondes.
+            leader_only (bool): Exécution réservée au worker leader.
+        """
+        self.jobs[name] = Job(name, func, interval, leader_only)
+
+    def start(self) -> None:
+        """Démarre les tâches dans la boucle d'événements courante."""
+        if not self.config.enabled or self._tasks:
+            return
+        self._refresh_leadership()
+        loop = asyncio.get_running_loop()
+        for job in self.jobs.values():
+            self._tasks[job.name] = loop.create_task(
+                self._loop(job), name=f"job:{job.name}"
+            )
+
+    async def stop(self) -> None:
+        """Annule les tâches, attend leur fin et libère le verrou."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.leader.release()
+        self.metrics.set_gauge("scheduler_leader", 0)
+
+    def status(self) -> dict:
+        """Retourne l'état des tâches (dernière durée et issue)."""
+        return {
+            "leader": self.leader.held,
+            "jobs": {
+                job.name: {
+                    "leader_only": job.leader_only,
+                    "last_duration_seconds": job.last_duration,
+                    "last_status": job.last_status,
+                }
+                for job in self.jobs.values()
+            },
+        }
+
+    def _refresh_leadership(self) -> bool:
+        """Tente de devenir leader et publie le résultat."""
+        leader = self.leader.try_acquire()
+        self.metrics.set_gauge("scheduler_leader", int(leader))
+        return leader
+
+    def _delay(self, interval: float) -> float:
+        """Intervalle perturbé de ±`jitter_ratio`."""
+        jitter = self.config.jitter_ratio
+        return interval * (1 + random.uniform(-jitter, jitter))
+
+    async def _loop(self, job: Job) -> None:
+        """Boucle d'exécution d'une tâche."""
+        while True:
+            interval = job.interval()
+            if interval <= 0:
+                await asyncio.sleep(SUSPENDED_POLL_SECONDS)
+                continue
+            await asyncio.sleep(self._delay(interval))
+            if job.leader_only and not self._refresh_leadership():
+                self.metrics.increment(
+                    "scheduler_job_runs_total", job=job.name, status="skipped"
+                )
+                continue
+            await self.run_job(job)
+
+    async def run_job(self, job: Job) -> None:
+        """
+        Exécute une tâche dans un thread et publie sa durée.
+
+        Args:
+            job (Job): Tâche à exécuter.
+        """
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(job.func)
+            job.last_status = "ok"
+        except Exception as e:  # pylint: disable=broad-except
+            job.last_status = "error"
+            self.logger.error(f"Tâche {job.name} en échec : {e}")
+        job.last_duration = time.perf_counter() - start
+        self.metrics.increment(
+            "scheduler_job_runs_total", job=job.name, status=job.last_status
+        )
+        self.metrics.increment(
+            "scheduler_job_seconds_total", job.last_duration, job=job.name
+        )
+        self.metrics.set_gauge(
+            "scheduler_job_last_seconds", job.last_duration, job=job.name
+        )
@@ -3,8 +3,9 @@ Module contenant la classe ApplicationServices qui gère le cycle de vie des
 services de l'application FastAPI XTREM.
 
 La classe `ApplicationServices` centralise l'accès aux différents services
-de l'application, comme le gestionnaire de base de données
-et le gestionnaire de logs.
+de l'application, comme le gestionnaire de base de données,
+le gestionnaire de logs, le registre de métriques, le limiteur de débit et
+le cache des utilisateurs.
 Elle fournit des méthodes pour initialiser et nettoyer ces services de
 manière centralisée.
 
@@ -12,9 +13,41 @@ Elle est utilisée pour connecter la base de données, gérer l'état des servic
 et assurer un démarrage et un arrêt propres de l'application.
 """
 
+import asyncio
+import dataclasses
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+from fast_api_xtrem.app.audit import AuditLog
 from fast_api_xtrem.app.config import AppConfig
+from fast_api_xtrem.app.config_loader import load_config, reloadable_changes
+from fast_api_xtrem.app.health import HealthChecker
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.app.scheduler import Scheduler
+from fast_api_xtrem.app.user_stats import UserStats
+from fast_api_xtrem.app.warmup import warm_up
+from fast_api_xtrem.cache.single_flight import SingleFlight
+from fast_api_xtrem.cache.user_cache import UserCache
 from fast_api_xtrem.db.db_manager import DBManager
+from fast_api_xtrem.db.purge import SoftDeletePurger
+from fast_api_xtrem.db.utils.maintenance import (
+    checkpoint_wal,
+    optimize_database,
+    vacuum_database,
+)
+from fast_api_xtrem.db.utils.queries import get_user_projections
 from fast_api_xtrem.logger.logger_manager import LoggerManager
+from fast_api_xtrem.middleware.admission import AdmissionController
+from fast_api_xtrem.middleware.idempotency import IdempotencyStore
+from fast_api_xtrem.middleware.profiling import RequestProfiler
+from fast_api_xtrem.middleware.rate_limit import RateLimiter
+from fast_api_xtrem.middleware.request_tracker import RequestTracker
+from fast_api_xtrem.middleware.response_cache import ResponseCache
+
+# Répertoire des fichiers de données partagés (base, compteurs…)
+DATA_DIR = Path(__file__).resolve().parent.parent / "database"
 
 
 class ApplicationServices:
@@ -34,14 +67,247 @@ class ApplicationServices:
         self.config = config
         # Instancier le logger en amont pour l'ensemble des services
         self.logger = LoggerManager(self.config.logger_config)
+        self.metrics = MetricsRegistry()
         # Créer l'instance de DBManager en passant le logger
         self.db_manager = DBManager(
             config=self.config.database_config,
             logger_config=self.config.logger_config,
             logger=self.logger,
+            metrics=self.metrics,
+        )
+        self.rate_limiter = RateLimiter(
+            self.config.rate_limit_config,
+            metrics=self.metrics,
+            storage_dir=DATA_DIR,
+        )
+        self.user_cache = UserCache(
+            self.config.cache_config,
+            metrics=self.metrics,
+            storage_dir=DATA_DIR,
+        )
+        # Caches des organisations (voir `user_cache_for`)
+        self._tenant_caches: "OrderedDict[str, UserCache]" = OrderedDict()
+        self.single_flight = SingleFlight(
+            self.config.single_flight_config, metrics=self.metrics
+        )
+        self.response_cache = ResponseCache(
+            self.config.response_cache_config, metrics=self.metrics
+        )
+        self.idempotency = IdempotencyStore(
+            self.config.idempotency_config, metrics=self.metrics
+        )
+        self.admission = AdmissionController(
+            self.config.admission_config, metrics=self.metrics
+        )
+        self.user_stats = UserStats(self.config.stats_config, self.metrics)
+        # Statistiques des organisations (voir `user_stats_for`)
+        self._tenant_stats: Dict[str, UserStats] = {}
+        self.requests = RequestTracker(self.metrics)
+        self.audit = AuditLog(
+            self.config.audit_config,
+            db_manager=self.db_manager,
+            metrics=self.metrics,
+            logger=self.logger,
+        )
+        self.purger = SoftDeletePurger(
+            self.config.purge_config,
+            db_manager=self.db_manager,
+            requests=self.requests,
+            metrics=self.metrics,
+            logger=self.logger,
         )
+        self.profiler = RequestProfiler(
+            self.config.profiling_config,
+            metrics=self.metrics,
+            logs_dir=self.logger.logs_dir,
+        )
+        self.health = HealthChecker(
+            self.config.health_config,
+            db_manager=self.db_manager,
+            logger=self.logger,
+            metrics=self.metrics,
+        )
+        self.scheduler = Scheduler(
+            self.config.scheduler_config,
+            metrics=self.metrics,
+            logger=self.logger,
+            lock_path=DATA_DIR / self.config.scheduler_config.lock_file,
+        )
+        self._register_jobs()
+        self._warmup_task = None
         self._initialized = False
 
+    def _register_jobs(self) -> None:
+        """
+        Enregistre les tâches de maintenance auprès de l'ordonnanceur.
+
+        Les tâches propres au worker (cache local, compteurs en mémoire)
+        s'exécutent partout ; celles qui portent sur des ressources
+        partagées (base, fichiers) sur le seul worker leader. Toutes
+        couvrent la base principale et celles des organisations.
+        """
+
+        def interval(name: str):
+            return lambda: getattr(self.config.scheduler_config, name)
+
+        add = self.scheduler.add_job
+        add(
+            "user_stats_reconcile",
+            self._reconcile_stats,
+            lambda: self.config.stats_config.reconcile_interval_seconds,
+        )
+        add(
+            "user_cache_refresh",
+            self._refresh_user_cache,
+            interval("cache_refresh_interval_seconds"),
+        )
+        add(
+            "users_purge",
+            self.purger.run,
+            lambda: self.config.purge_config.interval_seconds,
+            leader_only=True,
+        )
+        add(
+            "expired_cleanup",
+            self._purge_expired,
+            interval("expired_cleanup_interval_seconds"),
+            leader_only=True,
+        )
+        add(
+            "sqlite_optimize",
+            lambda: self._maintain(optimize_database),
+            interval("sqlite_optimize_interval_seconds"),
+            leader_only=True,
+        )
+        add(
+            "sqlite_checkpoint",
+            lambda: self._maintain(checkpoint_wal),
+            interval("sqlite_checkpoint_interval_seconds"),
+            leader_only=True,
+        )
+        add(
+            "sqlite_vacuum",
+            lambda: self._maintain(vacuum_database),
+            interval("sqlite_vacuum_interval_seconds"),
+            leader_only=True,
+        )
+        add(
+            "log_prune",
+            lambda: self.logger.prune_archives(
+                self.config.scheduler_config.log_archive_max_age_days * 86400
+            ),
+            interval("log_prune_interval_seconds"),
+            leader_only=True,
+        )
+
+    def _maintain(self, operation) -> int:
+        """
+        Applique une opération de maintenance (`optimize_database`…) à
+        la base principale puis à celle de chaque organisation.
+
+        Returns:
+            int: Nombre de bases traitées.
+        """
+        return sum(
+            bool(operation(engine, self.logger))
+            for _tenant, engine in self.db_manager.engines()
+        )
+
+    def _reconcile_stats(self) -> int:
+        """
+        Réconcilie les statistiques de la base principale et des
+        organisations déjà consultées.
+
+        Returns:
+            int: Nombre de statistiques réconciliées.
+        """
+        stats = [self.user_stats, *list(self._tenant_stats.values())]
+        return sum(s.reconcile(self.db_manager, self.logger) for s in stats)
+
+    def user_stats_for(self, tenant: Optional[str]) -> UserStats:
+        """
+        Retourne les statistiques des utilisateurs d'une organisation.
+
+        Les statistiques d'une organisation sont créées à sa première
+        consultation, non réconciliées (`reconciled_at` à None) ; leur
+        nombre est borné par la liste des organisations déclarées.
+
+        Args:
+            tenant (Optional[str]): Organisation (statistiques de la base
+                principale si None).
+        """
+        if tenant is None:
+            return self.user_stats
+        stats = self._tenant_stats.get(tenant)
+        if stats is None:
+            stats = self._tenant_stats.setdefault(
+                tenant,
+                UserStats(self.config.stats_config, self.metrics, tenant),
+            )
+        return stats
+
+    def _caches(self) -> list:
+        """Cache principal et caches des organisations ouverts."""
+        return [
+            (None, self.user_cache),
+            *list(self._tenant_caches.items()),
+        ]
+
+    def _refresh_user_cache(self) -> int:
+        """
+        Recharge les projections utilisateur les plus utilisées, dans
+        chaque cache ouvert.
+        """
+        max_keys = self.config.scheduler_config.cache_refresh_max_keys
+        refreshed = 0
+        for tenant, cache in self._caches():
+
+            def load(noms, tenant=tenant):
+                with self.db_manager.session_scope(tenant) as db:
+                    return get_user_projections(db, noms)
+
+            refreshed += cache.refresh(load, max_keys)
+        return refreshed
+
+    def user_cache_for(self, tenant: Optional[str]) -> UserCache:
+        """
+        Retourne le cache des utilisateurs d'une organisation.
+
+        Chaque organisation a son propre cache (et son propre fichier
+        partagé sous `tenants/<organisation>/`) : un même nom d'utilisateur
+        peut exister dans plusieurs bases. Le nombre de caches est borné
+        par `max_open_tenants` (éviction LRU).
+
+        Args:
+            tenant (Optional[str]): Organisation (cache principal si None).
+        """
+        if tenant is None:
+            return self.user_cache
+        cache = self._tenant_caches.get(tenant)
+        if cache is not None:
+            self._tenant_caches.move_to_end(tenant)
+            return cache
+        cache = UserCache(
+            self.config.cache_config,
+            metrics=self.metrics,
+            storage_dir=DATA_DIR / "tenants" / tenant,
+        )
+        self._tenant_caches[tenant] = cache
+        limit = max(self.config.database_config.max_open_tenants, 1)
+        while len(self._tenant_caches) > limit:
+            # Pas de fermeture explicite : une requête en cours peut encore
+            # l'utiliser ; le fichier partagé est libéré avec l'objet
+            self._tenant_caches.popitem(last=False)
+        return cache
+
+    def _purge_expired(self) -> int:
+        """Supprime les entrées expirées des stockages partagés."""
+        removed = sum(cache.purge_expired() for _, cache in self._caches())
+        removed += self.rate_limiter.purge_stale()
+        if removed:
+            self.logger.debug(f"{removed} entrée(s) expirée(s) supprimée(s)")
+        return removed
+
     def initialize(self) -> None:
         """
         Initialise et démarre tous les services.
@@ -72,9 +338,150 @@ class ApplicationServices:
         tables = self.db_manager.check_tables()
         self.logger.info(f"Tables dans la BD au démarrage : {tables}")
 
+        # Compteurs des statistiques initialisés depuis la base
+        self.user_stats.reconcile(self.db_manager, self.logger)
+        self.audit.start()
+
+        # Préchauffage : readiness refusée jusqu'à son terme
+        warmup_config = self.config.warmup_config
+        if warmup_config.enabled:
+            self.health.mark_warming()
+            if not warmup_config.background:
+                self.warmup()
+
         self._initialized = True
         self.logger.info("✅ Tous les services ont été initialisés")
 
+    def warmup(self) -> dict:
+        """
+        Préchauffe connexions, caches et index (voir `warm_up`), puis
+        déclare l'application prête.
+
+        Returns:
+            dict: Résultat et durée de chaque étape.
+        """
+        start = time.perf_counter()
+        report = warm_up(self)
+        self.health.mark_warm()
+        self.logger.info(
+            f"🔥 Préchauffage terminé en "
+            f"{time.perf_counter() - start:.3f} s : {report}"
+        )
+        return report
+
+    def start_tasks(self) -> None:
+        """Démarre les tâches de fond (boucle d'événements requise)."""
+        if self.health.warming and self.config.warmup_config.background:
+            self._warmup_task = asyncio.get_running_loop().create_task(
+                asyncio.to_thread(self.warmup), name="warmup"
+            )
+        self.scheduler.start()
+
+    async def stop_tasks(self) -> None:
+        """Arrête les tâches de fond."""
+        # Le préchauffage utilise la base : il se termine avant l'arrêt
+        if self._warmup_task is not None:
+            await asyncio.gather(self._warmup_task, return_exceptions=True)
+            self._warmup_task = None
+        await self.scheduler.stop()
+
+    def reload_config(self) -> dict:
+        """
+        Recharge la configuration (fichier TOML d'origine et environnement)
+        et applique à chaud les réglages modifiables.
+
+        Chaque service reçoit sa nouvelle section par une simple
+        réaffectation de référence : une requête en cours conserve la
+        section qu'elle a déjà lue, les suivantes voient la nouvelle.
+        Les réglages nécessitant un redémarrage sont ignorés et signalés.
+
+        Returns:
+            dict: Sections appliquées et réglages ignorés.
+
+        Raises:
+            ConfigError: Si la nouvelle configuration est invalide
+                (la configuration en vigueur est alors conservée).
+        """
+        new_config = load_config(self.config.config_file)
+        changes = reloadable_changes(self.config, new_config)
+        sections = changes["sections"]
+        if sections:
+            self._apply_config(dataclasses.replace(self.config, **sections))
+        for name in changes["ignored"]:
+            self.logger.warning(
+                f"Rechargement : {name} nécessite un redémarrage, ignoré"
+            )
+        applied = sorted(sections)
+        self.metrics.increment("config_reloads_total")
+        self.logger.info(
+            f"🔄 Configuration rechargée : {', '.join(applied) or 'inchangée'}"
+        )
+        return {"applied": applied, "ignored": changes["ignored"]}
+
+    def _apply_config(self, config: AppConfig) -> None:
+        """Distribue une nouvelle configuration aux services."""
+        self.config = config
+        self.logger.set_level(config.logger_config.log_level)
+        self.db_manager.config = config.database_config
+        self.rate_limiter.config = config.rate_limit_config
+        self.profiler.config = config.profiling_config
+        self.health.config = config.health_config
+        self.user_cache.configure(config.cache_config)
+        for cache in self._tenant_caches.values():
+            cache.configure(config.cache_config)
+        self.idempotency.configure(config.idempotency_config)
+        self.single_flight.config = config.single_flight_config
+        self.response_cache.config = config.response_cache_config
+        self.admission.config = config.admission_config
+        self.user_stats.config = config.stats_config
+        for stats in self._tenant_stats.values():
+            stats.config = config.stats_config
+        self.purger.config = config.purge_config
+        self.audit.config = config.audit_config
+        self.scheduler.config = config.scheduler_config
+
+    def begin_drain(self) -> None:
+        """
+        Entame l'arrêt progressif : la sonde readiness renvoie désormais
+        « non prêt » afin que le répartiteur de charge cesse d'envoyer
+        du trafic, et les nouvelles requêtes sont refusées (503).
+        """
+        self.health.mark_draining()
+        self.requests.stop_accepting()
+        self.logger.info("⏳ Arrêt progressif : application non prête")
+
+    async def drain(self) -> int:
+        """
+        Arrêt progressif : attend la fin des requêtes en cours dans la
+        limite de `drain_timeout_seconds`, puis vide les files de logs.
+
+        Doit être appelé avant `cleanup`, qui libère le moteur de base
+        de données.
+
+        Returns:
+            int: Nombre de requêtes abandonnées à l'échéance.
+        """
+        shutdown_config = self.config.shutdown_config
+        self.begin_drain()
+        deadline = time.monotonic() + shutdown_config.drain_timeout_seconds
+        while self.requests.active and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+        dropped = self.requests.active
+        self.metrics.set_gauge("shutdown_dropped_requests", dropped)
+        if dropped:
+            self.logger.warning(
+                f"Arrêt progressif : {dropped} requête(s) abandonnée(s)"
+            )
+        else:
+            self.logger.info("✅ Toutes les requêtes en cours sont terminées")
+
+        if not self.logger.flush(shutdown_config.log_flush_timeout_seconds):
+            self.logger.warning(
+                "Arrêt progressif : logs non entièrement écrits"
+            )
+        return dropped
+
     def cleanup(self) -> None:
         """
         Nettoie et ferme tous les services.
@@ -89,9 +496,22 @@ class ApplicationServices:
         if not self._initialized:
             return
 
+        # Événements d'audit en attente écrits avant la déconnexion
+        if not self.audit.close(
+            self.config.audit_config.flush_timeout_seconds
+        ):
+            self.logger.warning("Arrêt : événements d'audit non écrits")
+
         # Déconnexion propre de la base
         self.db_manager.disconnect()
         self.logger.info("🔌 Déconnexion de la base de données effectuée")
 
+        self.rate_limiter.close()
+        self.user_cache.close()
+        for cache in self._tenant_caches.values():
+            cache.close()
+        self._tenant_caches.clear()
+
         self.logger.info("🛑 Tous les services ont été arrêtés")
+        self.logger.flush()
         self._initialized = False
@@ -0,0 +1,183 @@
+"""
+Statistiques agrégées sur les utilisateurs.
+
+La classe `UserStats` maintient en mémoire le nombre total d'utilisateurs,
+les inscriptions par jour et la répartition par rôle. Les routes
+d'écriture la mettent à jour incrémentalement, de sorte que la lecture ne
+dépend pas de la taille de la table. Une réconciliation périodique
+recalcule les agrégats en base pour corriger toute dérive (écritures
+d'un autre worker, modifications manuelles…). En mode multi-organisation,
+chaque organisation a ses propres compteurs, publiés avec l'étiquette
+`tenant`.
+"""
+
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import func, select
+
+from fast_api_xtrem.app.config import StatsConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.db.models.role import Role
+from fast_api_xtrem.db.models.user import User, utc_now
+
+# Libellé des utilisateurs sans rôle
+NO_ROLE = "aucun"
+
+
+class UserStats:
+    """Compteurs incrémentaux des utilisateurs, réconciliés en base."""
+
+    def __init__(
+        self,
+        config: StatsConfig,
+        metrics: MetricsRegistry,
+        tenant: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            config (StatsConfig): Configuration des statistiques.
+            metrics (MetricsRegistry): Registre des métriques.
+            tenant (Optional[str]): Organisation comptée (base principale
+                si None).
+        """
+        self.config = config
+        self.metrics = metrics
+        self.tenant = tenant
+        self._labels = {"tenant": tenant} if tenant else {}
+        self.reconciled_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+        self._total = 0
+        self._per_day: Counter = Counter()
+        self._per_role: Counter = Counter()
+        self._role_names: Dict[int, str] = {}
+        # Incrémenté à chaque écriture : une réconciliation concurrente
+        # d'une écriture est abandonnée plutôt que d'écraser celle-ci
+        self._version = 0
+
+    def record_created(
+        self, created_at: Optional[datetime], role_id: Optional[int]
+    ) -> None:
+        """
+        Comptabilise un utilisateur créé.
+
+        Args:
+            created_at (Optional[datetime]): Date d'inscription.
+            role_id (Optional[int]): Rôle de l'utilisateur.
+        """
+        self._record(created_at, role_id, 1)
+
+    def record_deleted(
+        self, created_at: Optional[datetime], role_id: Optional[int]
+    ) -> None:
+        """
+        Décompte un utilisateur supprimé.
+
+        Args:
+            created_at (Optional[datetime]): Date d'inscription.
+            role_id (Optional[int]): Rôle de l'utilisateur.
+        """
+        self._record(created_at, role_id, -1)
+
+    def _record(
+        self, created_at: Optional[datetime], role_id: Optional[int], delta
+    ) -> None:
+        """Applique une variation aux compteurs."""
+        with self._lock:
+            self._version += 1
+            self._total += delta
+            self._per_role[role_id] += delta
+            if created_at is not None:
+                self._per_day[created_at.date().isoformat()] += delta
+            total = self._total
+        self.metrics.set_gauge("users_total", total, **self._labels)
+
+    def snapshot(self) -> dict:
+        """
+        Retourne les statistiques courantes, sans accès à la base.
+
+        Returns:
+            dict: Total, inscriptions des `signup_days` derniers jours
+            et répartition par rôle.
+        """
+        today = utc_now().date()
+        days = [
+            (today - timedelta(days=offset)).isoformat()
+            for offset in range(self.config.signup_days - 1, -1, -1)
+        ]
+        with self._lock:
+            per_role = {
+                self._role_name(role_id): count
+                for role_id, count in self._per_role.items()
+                if count
+            }
+            return {
+                "total": self._total,
+                "signups_per_day": {day: self._per_day[day] for day in days},
+                "users_per_role": per_role,
+                "reconciled_at": (
+                    self.reconciled_at.isoformat()
+                    if self.reconciled_at
+                    else None
+                ),
+            }
+
+    def _role_name(self, role_id: Optional[int]) -> str:
+        """Libellé d'un rôle (verrou pris)."""
+        if role_id is None:
+            return NO_ROLE
+        return self._role_names.get(role_id, str(role_id))
+
+    def reconcile(self, db_manager, logger) -> bool:
+        """
+        Recalcule les agrégats de la base de l'organisation et remplace
+        les compteurs.
+
+        Args:
+            db_manager (DBManager): Gestionnaire de base de données.
+            logger (LoggerManager): Gestionnaire de logs.
+
+        Returns:
+            bool: False si une écriture concurrente a invalidé le calcul
+            (il sera refait à la prochaine réconciliation).
+        """
+        version = self._version
+        active = User.deleted_at.is_(None)
+        with db_manager.session_scope(self.tenant) as db:
+            total = db.execute(
+                select(func.count(User.id)).where(active)
+            ).scalar_one()
+            day = func.date(User.created_at)
+            per_day = db.execute(
+                select(day, func.count(User.id))
+                .where(active, User.created_at.is_not(None))
+                .group_by(day)
+            ).all()
+            per_role = db.execute(
+                select(User.role_id, func.count(User.id))
+                .where(active)
+                .group_by(User.role_id)
+            ).all()
+            roles = db.execute(select(Role.id, Role.libelle)).all()
+
+        with self._lock:
+            if version != self._version:
+                return False
+            # La première réconciliation initialise les compteurs
+            drift = abs(total - self._total) if self.reconciled_at else 0
+            self._total = total
+            self._per_day = Counter({str(d): count for d, count in per_day})
+            self._per_role = Counter(dict(per_role))
+            self._role_names = dict(roles)
+            self.reconciled_at = utc_now()
+        if drift:
+            self.metrics.increment(
+                "user_stats_drift_total", drift, **self._labels
+            )
+            logger.warning(
+                f"Statistiques utilisateurs : dérive de {drift} corrigée"
+            )
+        self.metrics.set_gauge("users_total", total, **self._labels)
+        return True
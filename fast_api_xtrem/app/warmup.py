@@ -0,0 +1,117 @@
+"""
+Préchauffage de l'application FastAPI XTREM au démarrage.
+
+Après un déploiement, les premières requêtes paient l'ouverture des
+connexions du pool, l'initialisation JWT, le chargement des pages de la
+base en cache et la lecture des utilisateurs. `warm_up` exécute ces
+opérations d'avance :
+1. ouverture simultanée de `min_connections` connexions, rendues au pool ;
+2. création et validation d'un token JWT ;
+3. préchargement, dans le cache des utilisateurs, des derniers
+   utilisateurs connectés (journal d'audit) ;
+4. lecture des premières entrées de chaque index et de l'index de
+   recherche, qui charge leurs pages dans le cache de la base.
+
+Chaque étape est chronométrée (`warmup_seconds{step}`) ; une étape en
+échec est journalisée sans interrompre les suivantes ni le démarrage.
+"""
+
+import time
+
+from sqlalchemy import func, select
+
+from fast_api_xtrem.db.base import Base
+from fast_api_xtrem.db.utils.queries import get_user_projections
+from fast_api_xtrem.db.utils.search import MIN_TRIGRAM_LENGTH, search_users
+from fast_api_xtrem.routes.security import create_access_token, decode_token
+
+
+def _open_connections(services) -> int:
+    """Ouvre d'avance les connexions du pool."""
+    db_manager = services.db_manager
+    count = min(
+        services.config.warmup_config.min_connections,
+        db_manager.config.pool_size,
+    )
+    connections = []
+    try:
+        for _ in range(count):
+            connection = db_manager.engine.connect()
+            connections.append(connection)
+            connection.execute(select(1))
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+
+def _prime_security(_services) -> bool:
+    """Initialise l'encodage et la validation JWT."""
+    decode_token(create_access_token({"sub": "warmup"}))
+    return True
+
+
+def _preload_users(services) -> int:
+    """Charge en cache les projections des derniers utilisateurs connectés."""
+    limit = services.config.warmup_config.hot_users
+    if limit <= 0:
+        return 0
+    with services.db_manager.session_scope() as db:
+        noms = services.audit.recent_actors(db, "login_succeeded", limit)
+        projections = get_user_projections(db, noms)
+    return services.user_cache.preload(projections.values())
+
+
+def _touch_indexes(services) -> int:
+    """Lit les premières entrées de chaque index (clé primaire comprise)."""
+    rows = services.config.warmup_config.index_touch_rows
+    touched = 0
+    with services.db_manager.session_scope() as db:
+        for table in Base.metadata.sorted_tables:
+            columns = list(table.primary_key.columns)
+            columns += [next(iter(index.columns)) for index in table.indexes]
+            for column in columns:
+                # Tri sur la colonne indexée : parcours de l'index seul
+                entries = (
+                    select(column)
+                    .where(column.is_not(None))
+                    .order_by(column)
+                    .limit(rows)
+                    .subquery()
+                )
+                db.execute(select(func.count()).select_from(entries))
+                touched += 1
+        search_users(db, "a" * MIN_TRIGRAM_LENGTH, limit=1)
+    return touched
+
+
+STEPS = (
+    ("connections", _open_connections),
+    ("security", _prime_security),
+    ("users", _preload_users),
+    ("indexes", _touch_indexes),
+)
+
+
+def warm_up(services) -> dict:
+    """
+    Exécute les étapes de préchauffage.
+
+    Args:
+        services (ApplicationServices): Services initialisés.
+
+    Returns:
+        dict: Résultat et durée (secondes) de chaque étape.
+    """
+    report = {}
+    for name, step in STEPS:
+        start = time.perf_counter()
+        try:
+            result = step(services)
+        except Exception as e:  # pylint: disable=broad-except
+            services.logger.warning(f"Préchauffage : étape {name} : {e}")
+            result = None
+        duration = time.perf_counter() - start
+        services.metrics.set_gauge("warmup_seconds", duration, step=name)
+        report[name] = {"result": result, "seconds": round(duration, 4)}
+    return report
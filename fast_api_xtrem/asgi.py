@@ -0,0 +1,10 @@
+"""
+Application ASGI importée par les workers du serveur (`launcher.py`).
+
+La configuration est relue dans chaque worker depuis les mêmes sources
+que le processus de lancement (`load_config`).
+"""
+
+from fast_api_xtrem.main import create_app
+
+app = create_app().fast_api
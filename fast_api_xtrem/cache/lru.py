@@ -0,0 +1,122 @@
+"""
+Cache LRU en mémoire avec expiration (TTL).
+
+La classe `TTLCache` borne à la fois le nombre d'entrées (éviction de la
+moins récemment utilisée) et leur durée de vie. Elle est thread-safe et
+sert de premier niveau aux caches de l'application.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# Valeur sentinelle distinguant « absent » d'une valeur None en cache
+MISSING = object()
+
+
+class TTLCache:
+    """Cache LRU borné dont les entrées expirent après `ttl` secondes."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            max_size (int): Nombre maximal d'entrées.
+            ttl (float): Durée de vie par défaut d'une entrée (secondes).
+            clock (Callable[[], float]): Horloge (remplaçable en test).
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.evictions = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Retourne la valeur associée à la clé, ou `MISSING`.
+
+        Args:
+            key (Hashable): Clé recherchée.
+
+        Returns:
+            Any: Valeur en cache, ou `MISSING` si absente ou expirée.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """
+        Enregistre une valeur.
+
+        Args:
+            key (Hashable): Clé.
+            value (Any): Valeur.
+            ttl (Optional[float]): Durée de vie spécifique (secondes).
+        """
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def delete(self, key: Hashable) -> None:
+        """Supprime une entrée si elle existe."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def resize(self, max_size: int) -> None:
+        """
+        Modifie la capacité du cache, en évinçant si nécessaire.
+
+        Args:
+            max_size (int): Nouvelle capacité.
+        """
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def recent_keys(self, limit: int) -> list:
+        """
+        Retourne les clés les plus récemment utilisées.
+
+        Args:
+            limit (int): Nombre maximal de clés.
+
+        Returns:
+            list: Clés, de la plus récente à la plus ancienne.
+        """
+        with self._lock:
+            keys = []
+            for key in reversed(self._entries):
+                if len(keys) >= limit:
+                    break
+                keys.append(key)
+            return keys
+
+    def _evict(self) -> None:
+        """Évince les entrées les moins récemment utilisées (verrou pris)."""
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
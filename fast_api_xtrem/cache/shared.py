@@ -0,0 +1,136 @@
+"""
+Second niveau de cache partagé entre les workers.
+
+`SharedCache` définit l'interface minimale (clé/valeur texte avec
+expiration) d'un cache partagé de type Redis ou Memcached.
+`SQLiteSharedCache` en fournit une implémentation locale, sur un fichier
+SQLite commun aux workers d'une même machine.
+
+Chaque clé porte une version, incrémentée à chaque invalidation (la clé
+est alors conservée sans valeur pendant `ttl` secondes). Un worker qui
+charge une valeur relève la version avant de lire la base, et ne
+l'écrit que si elle n'a pas changé : une valeur lue avant une écriture
+validée par un autre worker n'est jamais republiée après son
+invalidation.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+
+class SharedCache:
+    """Interface d'un cache clé/valeur partagé entre processus."""
+
+    def get(self, key: str) -> Tuple[Optional[str], int]:
+        """
+        Retourne la valeur non expirée associée à la clé (ou None) et la
+        version de la clé (0 si elle est inconnue).
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: str, ttl: float, version: int) -> bool:
+        """
+        Enregistre une valeur pour `ttl` secondes, si la version de la
+        clé est toujours `version`.
+
+        Returns:
+            bool: True si la valeur a été enregistrée.
+        """
+        raise NotImplementedError
+
+    def invalidate(self, key: str, ttl: float) -> None:
+        """Supprime la valeur d'une clé et incrémente sa version."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Libère les ressources du cache."""
+
+
+class SQLiteSharedCache(SharedCache):
+    """Cache partagé local, stocké dans un fichier SQLite en mode WAL."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path (str): Chemin du fichier SQLite partagé.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS shared_cache ("
+            "key TEXT PRIMARY KEY, value TEXT, "
+            "expires_at REAL NOT NULL, version INTEGER NOT NULL DEFAULT 0)"
+        )
+
+    def get(self, key: str) -> Tuple[Optional[str], int]:
+        """
+        Retourne la valeur non expirée associée à la clé (ou None) et la
+        version de la clé (0 si elle est inconnue).
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at, version FROM shared_cache "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None, 0
+        value, expires_at, version = row
+        return (value if expires_at > time.time() else None), version
+
+    def set(self, key: str, value: str, ttl: float, version: int) -> bool:
+        """
+        Enregistre une valeur pour `ttl` secondes, si la version de la
+        clé est toujours `version`.
+
+        Returns:
+            bool: True si la valeur a été enregistrée.
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO shared_cache (key, value, expires_at, version) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                "value = excluded.value, expires_at = excluded.expires_at "
+                "WHERE shared_cache.version = excluded.version",
+                (key, value, time.time() + ttl, version),
+            )
+        return cursor.rowcount > 0
+
+    def invalidate(self, key: str, ttl: float) -> None:
+        """
+        Supprime la valeur d'une clé et incrémente sa version ; la clé
+        est conservée `ttl` secondes, durée maximale d'un chargement
+        concurrent à invalider.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO shared_cache (key, value, expires_at, version) "
+                "VALUES (?, NULL, ?, 1) ON CONFLICT (key) DO UPDATE SET "
+                "value = NULL, expires_at = excluded.expires_at, "
+                "version = shared_cache.version + 1",
+                (key, time.time() + ttl),
+            )
+
+    def purge_expired(self) -> int:
+        """
+        Supprime les entrées expirées.
+
+        Returns:
+            int: Nombre d'entrées supprimées.
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM shared_cache WHERE expires_at <= ?",
+                (time.time(),),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Ferme la connexion SQLite."""
+        self._connection.close()
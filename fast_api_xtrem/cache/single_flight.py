@@ -0,0 +1,110 @@
+"""
+Regroupement des lectures concurrentes identiques (« single-flight »).
+
+Lors d'un pic de trafic, de nombreuses requêtes identiques (`GET /users`,
+`/users/me` d'un même utilisateur) arrivent pendant qu'une première est
+encore en cours. `SingleFlight` n'exécute qu'une fois le travail associé
+à une clé : les appelants arrivés entre-temps attendent et reçoivent le
+même résultat (typiquement le corps de réponse déjà sérialisé), ou la
+même exception.
+
+Seuls les travaux qui rendent la main à la boucle d'événements pendant
+leur exécution (lecture en base dans un thread) peuvent être partagés.
+Le taux de regroupement de chaque groupe est publié dans les métriques
+(`single_flight_coalescing_ratio{group}`).
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+from fast_api_xtrem.app.config import SingleFlightConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Exécutions en cours, indexées par clé de lecture."""
+
+    def __init__(
+        self, config: SingleFlightConfig, metrics: MetricsRegistry
+    ) -> None:
+        """
+        Args:
+            config (SingleFlightConfig): Configuration du regroupement.
+            metrics (MetricsRegistry): Registre des métriques.
+        """
+        self.config = config
+        self.metrics = metrics
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        # Par groupe : [exécutions, appels partagés]
+        self._counts: Dict[str, list] = {}
+
+    async def run(
+        self, group: str, key: Hashable, func: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Exécute `func`, ou attend l'exécution en cours pour la même clé.
+
+        Args:
+            group (str): Famille de lectures (métriques).
+            key (Hashable): Clé identifiant la lecture.
+            func (Callable[[], Awaitable[T]]): Fabrique de la coroutine
+                à exécuter.
+
+        Returns:
+            T: Résultat de l'exécution, partagé entre les appelants.
+        """
+        if not self.config.enabled:
+            return await func()
+        while True:
+            future = self._calls.get((group, key))
+            if future is None:
+                break
+            self._record(group, shared=True)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Exécutant annulé (client déconnecté) : nouvel essai,
+                # sauf si c'est cet appelant qui est annulé
+                if not future.cancelled():
+                    raise
+        return await self._lead(group, key, func)
+
+    async def _lead(
+        self, group: str, key: Hashable, func: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Exécute le travail et publie son issue aux appelants en attente."""
+        future = asyncio.get_running_loop().create_future()
+        self._calls[(group, key)] = future
+        self._record(group, shared=False)
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Exception consommée par l'appelant : pas d'avertissement
+            # « never retrieved » sans appelant en attente
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[(group, key)]
+
+    def _record(self, group: str, shared: bool) -> None:
+        """Comptabilise un appel et publie le taux de regroupement."""
+        counts = self._counts.setdefault(group, [0, 0])
+        counts[shared] += 1
+        result = "shared" if shared else "executed"
+        self.metrics.increment(
+            "single_flight_requests_total", group=group, result=result
+        )
+        self.metrics.set_gauge(
+            "single_flight_coalescing_ratio",
+            counts[1] / (counts[0] + counts[1]),
+            group=group,
+        )
@@ -0,0 +1,293 @@
+"""
+Cache à deux niveaux des projections utilisateur.
+
+Les routes d'authentification (`/users/login`, `/users/token`) et la
+résolution de l'utilisateur courant ne lisent qu'une projection
+(id, nom, email, empreinte du mot de passe). `UserCache` la conserve :
+1. dans un cache LRU en mémoire, propre au worker, à durée de vie courte ;
+2. optionnellement dans un cache partagé entre workers (`SharedCache`).
+
+Les écritures (création, modification, suppression) invalident les deux
+niveaux. Un autre worker peut toutefois servir sa copie locale jusqu'à
+expiration : `user_cache_ttl_seconds` borne cette fenêtre d'incohérence.
+Les entrées du second niveau sont versionnées : une projection lue avant
+l'invalidation d'un autre worker n'y est pas republiée.
+
+Les défauts de cache concurrents sur une même clé sont regroupés : un
+seul appelant interroge la base, les autres attendent son résultat.
+"""
+
+import json
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional
+
+from fast_api_xtrem.app.config import CacheConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.cache.lru import MISSING, TTLCache
+from fast_api_xtrem.cache.shared import SharedCache, SQLiteSharedCache
+from fast_api_xtrem.db.models.user import UserProjection
+
+SHARED_PREFIX = "user:"
+
+
+class UserCache:
+    """Cache des projections utilisateur, indexé par nom."""
+
+    def __init__(
+        self,
+        config: CacheConfig,
+        metrics: MetricsRegistry,
+        shared: Optional[SharedCache] = None,
+        storage_dir: Optional[Path] = None,
+    ) -> None:
+        """
+        Args:
+            config (CacheConfig): Configuration du cache.
+            metrics (MetricsRegistry): Registre des métriques.
+            shared (Optional[SharedCache]): Second niveau imposé (tests).
+            storage_dir (Optional[Path]): Répertoire du fichier partagé
+                lorsque `shared_store_path` est relatif.
+        """
+        self.config = config
+        self.metrics = metrics
+        self.local = TTLCache(
+            config.user_cache_size, config.user_cache_ttl_seconds
+        )
+        self.shared = shared or self._create_shared(config, storage_dir)
+        self._locks: Dict[str, list] = {}
+        self._locks_guard = threading.Lock()
+        # Incrémenté à chaque invalidation : un chargement commencé avant
+        # une écriture ne doit pas réinsérer une valeur périmée
+        self._epoch = 0
+
+    @staticmethod
+    def _create_shared(
+        config: CacheConfig, storage_dir: Optional[Path]
+    ) -> Optional[SharedCache]:
+        """Crée le second niveau correspondant au backend configuré."""
+        if config.shared_backend != "sqlite":
+            return None
+        path = Path(config.shared_store_path)
+        if not path.is_absolute() and storage_dir is not None:
+            storage_dir.mkdir(parents=True, exist_ok=True)
+            path = storage_dir / path
+        return SQLiteSharedCache(str(path))
+
+    def configure(self, config: CacheConfig) -> None:
+        """
+        Applique une nouvelle configuration (rechargement à chaud).
+
+        Args:
+            config (CacheConfig): Nouvelle configuration.
+        """
+        self.config = config
+        self.local.ttl = config.user_cache_ttl_seconds
+        self.local.resize(config.user_cache_size)
+
+    def get(
+        self, nom: str, loader: Callable[[], Optional[UserProjection]]
+    ) -> Optional[UserProjection]:
+        """
+        Retourne la projection de l'utilisateur, en la chargeant au besoin.
+
+        Args:
+            nom (str): Nom de l'utilisateur.
+            loader (Callable[[], Optional[UserProjection]]): Lecture en
+                base, appelée en cas de défaut sur les deux niveaux.
+
+        Returns:
+            Optional[UserProjection]: Projection, ou None si
+            l'utilisateur n'existe pas.
+        """
+        value = self.local.get(nom)
+        if value is not MISSING:
+            self.metrics.increment("user_cache_requests_total", result="hit")
+            return value
+        with self._key_lock(nom):
+            # Un appelant concurrent a pu charger la clé entre-temps
+            value = self.local.get(nom)
+            if value is not MISSING:
+                self.metrics.increment(
+                    "user_cache_requests_total", result="hit"
+                )
+                return value
+            epoch = self._epoch
+            # Version relevée avant la lecture en base
+            value, version = self._get_shared(nom)
+            if value is not MISSING:
+                self.metrics.increment(
+                    "user_cache_requests_total", result="shared_hit"
+                )
+            else:
+                self.metrics.increment(
+                    "user_cache_requests_total", result="miss"
+                )
+                value = loader()
+                if epoch == self._epoch:
+                    self._set_shared(nom, value, version)
+            if epoch == self._epoch:
+                self._set_local(nom, value)
+            return value
+
+    def get_local(self, nom: str):
+        """
+        Retourne la projection présente dans le niveau local, sans
+        chargement.
+
+        Args:
+            nom (str): Nom de l'utilisateur.
+
+        Returns:
+            Projection (ou None pour un utilisateur inexistant mis en
+            cache), ou `MISSING` en cas de défaut.
+        """
+        value = self.local.get(nom)
+        if value is not MISSING:
+            self.metrics.increment("user_cache_requests_total", result="hit")
+        return value
+
+    def refresh(
+        self,
+        loader: Callable[[Iterable[str]], Mapping[str, UserProjection]],
+        limit: int,
+    ) -> int:
+        """
+        Recharge en une requête les projections les plus utilisées du
+        niveau local, avant leur expiration : les utilisateurs actifs ne
+        subissent pas de défaut de cache.
+
+        Args:
+            loader (Callable[[Iterable[str]], Mapping[str, UserProjection]]):
+                Lecture groupée en base (projections indexées par nom).
+            limit (int): Nombre maximal de projections rechargées.
+
+        Returns:
+            int: Nombre de projections rechargées.
+        """
+        noms: List[str] = self.local.recent_keys(limit)
+        if not noms:
+            return 0
+        epoch = self._epoch
+        versions = {nom: self._get_shared(nom)[1] for nom in noms}
+        values = loader(noms)
+        # Une écriture survenue pendant la lecture l'a rendue périmée
+        if epoch != self._epoch:
+            return 0
+        for nom in noms:
+            value = values.get(nom)
+            if value is None:
+                self.local.delete(nom)
+                continue
+            self._set_local(nom, value)
+            self._set_shared(nom, value, versions[nom])
+        self.metrics.increment("user_cache_refreshed_total", len(values))
+        return len(values)
+
+    def preload(self, values: Iterable[UserProjection]) -> int:
+        """
+        Insère des projections dans le niveau local (préchauffage).
+
+        Args:
+            values (Iterable[UserProjection]): Projections lues en base.
+
+        Returns:
+            int: Nombre de projections insérées.
+        """
+        count = 0
+        for value in values:
+            self._set_local(value.nom, value)
+            count += 1
+        return count
+
+    def purge_expired(self) -> int:
+        """
+        Supprime les entrées expirées du second niveau.
+
+        Returns:
+            int: Nombre d'entrées supprimées.
+        """
+        if isinstance(self.shared, SQLiteSharedCache):
+            return self.shared.purge_expired()
+        return 0
+
+    def invalidate(self, *noms: str) -> None:
+        """
+        Invalide les projections des utilisateurs donnés, sur les deux
+        niveaux. À appeler après toute écriture validée.
+
+        Args:
+            *noms (str): Noms des utilisateurs modifiés.
+        """
+        self._epoch += 1
+        for nom in noms:
+            self.local.delete(nom)
+            if self.shared is not None:
+                self.shared.invalidate(
+                    SHARED_PREFIX + nom, self.config.shared_ttl_seconds
+                )
+            self.metrics.increment("user_cache_invalidations_total")
+
+    def clear(self) -> None:
+        """Vide le niveau local."""
+        self._epoch += 1
+        self.local.clear()
+
+    def close(self) -> None:
+        """Ferme le second niveau."""
+        if self.shared is not None:
+            self.shared.close()
+
+    def _set_local(self, nom: str, value: Optional[UserProjection]) -> None:
+        """Enregistre une valeur dans le niveau local."""
+        if value is not None:
+            self.local.set(nom, value)
+        elif self.config.negative_ttl_seconds > 0:
+            self.local.set(nom, None, ttl=self.config.negative_ttl_seconds)
+
+    def _get_shared(self, nom: str) -> tuple:
+        """
+        Lit une projection dans le second niveau.
+
+        Returns:
+            tuple: Projection (ou `MISSING`) et version de l'entrée.
+        """
+        if self.shared is None:
+            return MISSING, 0
+        raw, version = self.shared.get(SHARED_PREFIX + nom)
+        if raw is None:
+            return MISSING, version
+        return UserProjection(*json.loads(raw)), version
+
+    def _set_shared(
+        self, nom: str, value: Optional[UserProjection], version: int
+    ) -> None:
+        """
+        Enregistre une projection existante dans le second niveau, si
+        l'entrée n'a pas été invalidée depuis la lecture de `version`.
+        """
+        if self.shared is not None and value is not None:
+            stored = self.shared.set(
+                SHARED_PREFIX + nom,
+                json.dumps(list(value)),
+                self.config.shared_ttl_seconds,
+                version,
+            )
+            if not stored:
+                self.metrics.increment("user_cache_stale_writes_total")
+
+    @contextmanager
+    def _key_lock(self, key: str):
+        """Verrou propre à une clé, libéré lorsqu'il n'est plus attendu."""
+        with self._locks_guard:
+            entry = self._locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._locks_guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._locks[key]
@@ -0,0 +1,241 @@
+"""
+Client asynchrone de l'API FastAPI XTREM.
+
+Même interface que `ApiClient`, en coroutines : à utiliser depuis un
+service asyncio. Le renouvellement du token est regroupé (une seule
+requête `/users/token` pour toutes les coroutines qui l'attendent) et les
+opérations groupées envoient au plus `bulk_concurrency` requêtes
+simultanées sur le pool de connexions partagé.
+
+Exemple :
+    async with AsyncApiClient() as api:
+        await api.login("alice", "motdepasse1")
+        results = await api.create_users(users)
+"""
+
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import httpx
+
+from fast_api_xtrem.client.base import (
+    BULK_ERRORS,
+    ApiError,
+    Call,
+    ClientBase,
+    ClientConfig,
+    Endpoints,
+    parse_response,
+    request_headers,
+)
+
+
+class AsyncApiClient(ClientBase):
+    """Client asynchrone, avec pool de connexions, token et reprises."""
+
+    def __init__(
+        self,
+        config: Optional[ClientConfig] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """
+        Args:
+            config (Optional[ClientConfig]): Configuration du client.
+            transport (Optional[httpx.AsyncBaseTransport]): Transport
+                httpx imposé (tests, application ASGI en mémoire).
+        """
+        super().__init__(config)
+        self._token_lock = asyncio.Lock()
+        self._http = httpx.AsyncClient(
+            base_url=self.config.base_url,
+            timeout=self.config.timeout_seconds,
+            limits=self.config.limits(),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Ferme les connexions du pool."""
+        await self._http.aclose()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        auth: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Envoie une requête (voir `ApiClient.request`).
+
+        Raises:
+            ApiError: Si l'API répond par une erreur.
+            httpx.TransportError: Si l'API reste injoignable.
+        """
+        renewed = False
+        headers = request_headers(self.config, method, headers=headers)
+        while True:
+            if auth:
+                headers["Authorization"] = f"Bearer {await self.token()}"
+            response = await self._send(method, path, headers, kwargs)
+            if self._must_renew(response, auth, renewed):
+                renewed = True
+                continue
+            return parse_response(response)
+
+    async def _send(
+        self, method: str, path: str, headers: dict, kwargs: dict
+    ) -> httpx.Response:
+        """Envoie une requête, renouvelée selon `RetryPolicy`."""
+        attempt = 0
+        while True:
+            try:
+                response = await self._http.request(
+                    method, path, headers=headers, **kwargs
+                )
+            except httpx.TransportError as exc:
+                if not self.retry.should_retry(attempt, error=exc):
+                    raise
+                await asyncio.sleep(self.retry.delay(attempt))
+            else:
+                if not self.retry.should_retry(attempt, response):
+                    return response
+                await asyncio.sleep(self.retry.delay(attempt, response))
+            attempt += 1
+
+    async def _call(self, call: Call) -> Any:
+        """Exécute un appel décrit par `Endpoints`."""
+        try:
+            body = await self.request(
+                call.method, call.path, auth=call.auth, **call.kwargs
+            )
+        except ApiError as exc:
+            return call.recover(exc)
+        return call.resolve(body)
+
+    # Authentification
+
+    async def fetch_token(self, nom: str, pswd: str) -> str:
+        """
+        Obtient un token (`/users/token`) et mémorise les identifiants
+        pour le renouveler.
+        """
+        credentials = {"username": nom, "password": pswd}
+        token = await self._call(Endpoints.token(credentials))
+        return self._remember_token(credentials, token)
+
+    login = fetch_token
+
+    async def token(self) -> str:
+        """
+        Token courant, renouvelé s'il expire dans moins de
+        `token_refresh_margin_seconds`.
+
+        Raises:
+            ApiError: Si aucun identifiant n'a été fourni (`login`).
+        """
+        token = self.tokens.get()
+        if token is not None:
+            return token
+        async with self._token_lock:
+            # Renouvelé par la coroutine qui détenait le verrou
+            token = self.tokens.get()
+            if token is not None:
+                return token
+            credentials = self._stored_credentials()
+            return await self.fetch_token(
+                credentials["username"], credentials["password"]
+            )
+
+    async def authenticate(self, nom: str, pswd: str) -> bool:
+        """Vérifie des identifiants (`/users/login`)."""
+        return await self._call(Endpoints.authenticate(nom, pswd))
+
+    async def is_token_valid(self, token: Optional[str] = None) -> bool:
+        """Indique si un token (par défaut le token courant) est valide."""
+        token = token or self.tokens.get()
+        if not token:
+            return False
+        return await self._call(Endpoints.is_token_valid(token))
+
+    # Utilisateurs
+
+    async def get_me(self) -> Dict[str, str]:
+        """Profil de l'utilisateur connecté."""
+        return await self._call(Endpoints.get_me())
+
+    async def list_users(self) -> List[Dict[str, str]]:
+        """Liste des utilisateurs (vide si aucun)."""
+        return await self._call(Endpoints.list_users())
+
+    async def search_users(
+        self, q: str, limit: int = 20, offset: int = 0
+    ) -> Dict[str, Any]:
+        """Recherche par nom ou email (résultats et page suivante)."""
+        return await self._call(Endpoints.search_users(q, limit, offset))
+
+    async def create_user(
+        self, nom: str, email: str, pswd: str
+    ) -> Dict[str, str]:
+        """Crée un utilisateur."""
+        return await self._call(Endpoints.create_user(nom, email, pswd))
+
+    async def update_user(
+        self, nom: str, new_nom: str, email: str, pswd: str
+    ) -> Dict[str, str]:
+        """Modifie un utilisateur."""
+        call = Endpoints.update_user(nom, new_nom, email, pswd)
+        return await self._call(call)
+
+    async def delete_user(self, nom: str) -> None:
+        """Supprime un utilisateur."""
+        await self._call(Endpoints.delete_user(nom))
+
+    # Opérations groupées
+
+    async def create_users(
+        self, users: Iterable[Dict[str, str]]
+    ) -> List[Union[Dict[str, str], Exception]]:
+        """
+        Crée plusieurs utilisateurs (`nom`, `email`, `pswd`), au plus
+        `bulk_concurrency` à la fois.
+
+        Returns:
+            List: Pour chaque utilisateur, dans l'ordre, l'utilisateur
+            créé ou l'erreur rencontrée (`ApiError`, ou
+            `httpx.TransportError` si l'API est restée injoignable).
+        """
+        return await self._bulk(
+            lambda user: self.create_user(
+                user["nom"], user["email"], user["pswd"]
+            ),
+            users,
+        )
+
+    async def delete_users(
+        self, noms: Iterable[str]
+    ) -> List[Optional[Exception]]:
+        """Supprime plusieurs utilisateurs (voir `create_users`)."""
+        return await self._bulk(self.delete_user, noms)
+
+    async def _bulk(self, func, items: Iterable) -> list:
+        """
+        Applique `func` à chaque élément, concurrence bornée ; l'échec
+        d'un élément (`BULK_ERRORS`) n'interrompt pas les autres.
+        """
+        semaphore = asyncio.Semaphore(max(self.config.bulk_concurrency, 1))
+
+        async def call(item):
+            async with semaphore:
+                try:
+                    return await func(item)
+                except BULK_ERRORS as exc:
+                    return exc
+
+        return await asyncio.gather(*(call(item) for item in items))
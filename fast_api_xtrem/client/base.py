@@ -0,0 +1,378 @@
+"""
+Éléments communs aux clients de l'API FastAPI XTREM.
+
+Les clients synchrone (`ApiClient`) et asynchrone (`AsyncApiClient`)
+partagent :
+- `ClientConfig` : adresse de l'API, pool de connexions, délais,
+  nouvelles tentatives et concurrence des opérations groupées ;
+- `TokenCache` : token JWT de `/users/token`, réutilisé jusqu'à
+  `token_refresh_margin_seconds` avant son expiration ;
+- `RetryPolicy` : nouvelles tentatives avec attente exponentielle
+  aléatoire (ou `Retry-After`) sur erreur réseau, 429 et 502 à 504 ;
+- `ApiError` : erreur HTTP renvoyée par l'API ;
+- `ClientBase` : état et logique des clients indépendants des entrées et
+  sorties (token, renouvellement, erreurs des opérations groupées) ;
+- `Endpoints` : description des routes (`Call`) et lecture de leur
+  réponse, que chaque client se contente d'exécuter par `_call`.
+
+Les requêtes d'écriture portent une clé `Idempotency-Key`, identique
+d'une tentative à l'autre : rejouer une création après une coupure
+réseau renvoie la réponse de la première exécution au lieu d'un conflit.
+
+Ce paquet ne dépend que de httpx : il peut être utilisé sans les
+dépendances du serveur.
+"""
+
+import base64
+import json
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, Optional
+
+import httpx
+
+# Statuts pour lesquels une nouvelle tentative est pertinente
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+@dataclass
+class ClientConfig:
+    """Configuration des clients de l'API."""
+
+    base_url: str = "http://127.0.0.1:8000"
+    timeout_seconds: float = 10.0
+    # Pool de connexions partagé par toutes les requêtes du client
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    # Nouvelles tentatives : attente aléatoire dans
+    # [0, min(max_backoff, backoff * 2^tentative)]
+    max_retries: int = 3
+    backoff_seconds: float = 0.2
+    max_backoff_seconds: float = 5.0
+    # Renouvellement du token avant son expiration
+    token_refresh_margin_seconds: float = 60.0
+    # Organisation (en-tête X-Tenant) si le serveur est multi-organisation
+    tenant: Optional[str] = None
+    tenant_header: str = "X-Tenant"
+    idempotency_header: str = "Idempotency-Key"
+    # Requêtes simultanées des opérations groupées
+    bulk_concurrency: int = 8
+
+    def limits(self) -> httpx.Limits:
+        """Limites du pool de connexions httpx."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+        )
+
+
+class ApiError(RuntimeError):
+    """Erreur HTTP renvoyée par l'API."""
+
+    def __init__(self, status_code: int, detail: Any) -> None:
+        super().__init__(f"{status_code} : {detail}")
+        self.status_code = status_code
+        self.detail = detail
+
+
+# Erreurs d'un élément d'opération groupée, renvoyées au lieu d'être
+# levées : réponse en erreur, ou API injoignable après les reprises
+BULK_ERRORS = (ApiError, httpx.TransportError)
+
+
+def token_expiry(token: str) -> float:
+    """
+    Date d'expiration (`exp`) d'un token JWT, lue sans vérification de
+    signature (le serveur reste seul juge de sa validité).
+
+    Returns:
+        float: Timestamp POSIX, 0 si le token est illisible.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return 0.0
+
+
+class TokenCache:
+    """Token d'accès courant et identifiants permettant de le renouveler."""
+
+    def __init__(
+        self, margin_seconds: float, clock: Callable[[], float] = time.time
+    ) -> None:
+        """
+        Args:
+            margin_seconds (float): Renouvellement anticipé (secondes).
+            clock (Callable[[], float]): Horloge (remplaçable en test).
+        """
+        self.margin_seconds = margin_seconds
+        self._clock = clock
+        self.credentials: Optional[Dict[str, str]] = None
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+
+    def get(self) -> Optional[str]:
+        """Token encore valide au-delà de la marge, sinon None."""
+        if self._token and self._expires_at - self.margin_seconds > (
+            self._clock()
+        ):
+            return self._token
+        return None
+
+    def set(self, token: str) -> None:
+        """Enregistre un nouveau token."""
+        self._token = token
+        self._expires_at = token_expiry(token)
+
+    def invalidate(self) -> None:
+        """Oublie le token (refusé par le serveur)."""
+        self._token = None
+        self._expires_at = 0.0
+
+
+class RetryPolicy:
+    """Décision et délai des nouvelles tentatives."""
+
+    def __init__(
+        self, config: ClientConfig, rng: Optional[random.Random] = None
+    ) -> None:
+        self.config = config
+        self._rng = rng or random.Random()
+
+    def should_retry(
+        self,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        """
+        Indique si la tentative `attempt` (à partir de 0) doit être
+        renouvelée, après une réponse ou une erreur réseau.
+        """
+        if attempt >= self.config.max_retries:
+            return False
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+        return response is not None and response.status_code in RETRY_STATUSES
+
+    def delay(
+        self, attempt: int, response: Optional[httpx.Response] = None
+    ) -> float:
+        """Attente avant la tentative suivante (secondes)."""
+        retry_after = response.headers.get("retry-after") if response else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.config.max_backoff_seconds)
+            except ValueError:
+                pass
+        ceiling = min(
+            self.config.max_backoff_seconds,
+            self.config.backoff_seconds * 2**attempt,
+        )
+        return self._rng.uniform(0, ceiling)
+
+
+def request_headers(
+    config: ClientConfig,
+    method: str,
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, str]:
+    """
+    En-têtes d'une requête : organisation et clé d'idempotence
+    (écritures), fixés une fois pour toutes les tentatives.
+    """
+    result = dict(headers or {})
+    if config.tenant:
+        result[config.tenant_header] = config.tenant
+    if method.upper() in WRITE_METHODS:
+        result.setdefault(config.idempotency_header, uuid.uuid4().hex)
+    return result
+
+
+def parse_response(response: httpx.Response) -> Any:
+    """
+    Corps JSON d'une réponse réussie.
+
+    Raises:
+        ApiError: Si le statut est une erreur (>= 400).
+    """
+    if response.status_code >= 400:
+        try:
+            detail = response.json().get("detail", response.text)
+        except (ValueError, AttributeError):
+            detail = response.text
+        raise ApiError(response.status_code, detail)
+    if not response.content:
+        return None
+    return response.json()
+
+
+class Call(NamedTuple):
+    """
+    Appel d'une route : requête à envoyer et lecture de sa réponse.
+
+    Attributs :
+        method (str) : Méthode HTTP.
+        path (str) : Chemin de la route.
+        kwargs (dict) : Arguments de la requête httpx (json, data…).
+        auth (bool) : Requête authentifiée par le token courant.
+        result (Callable[[Any], Any]) : Valeur retournée, tirée du corps.
+        fallback_statuses (FrozenSet[int]) : Statuts d'erreur pour
+            lesquels `fallback` est retourné au lieu de lever `ApiError`.
+        fallback (Any) : Valeur retournée pour ces statuts.
+    """
+
+    method: str
+    path: str
+    kwargs: dict
+    auth: bool = False
+    result: Callable[[Any], Any] = lambda body: body
+    fallback_statuses: FrozenSet[int] = frozenset()
+    fallback: Any = None
+
+    def resolve(self, body: Any) -> Any:
+        """Valeur de l'appel, à partir du corps JSON de la réponse."""
+        return self.result(body)
+
+    def recover(self, error: ApiError) -> Any:
+        """
+        Valeur de l'appel en erreur.
+
+        Raises:
+            ApiError: Si le statut n'est pas dans `fallback_statuses`.
+        """
+        if error.status_code in self.fallback_statuses:
+            return self.fallback
+        raise error
+
+
+def _data(body: Any) -> Any:
+    return body["data"]
+
+
+class Endpoints:
+    """Routes de l'API utilisées par les clients."""
+
+    @staticmethod
+    def token(credentials: Dict[str, str]) -> Call:
+        """Obtention d'un token (`/users/token`)."""
+        return Call(
+            "POST",
+            "/users/token",
+            {"data": credentials},
+            result=lambda body: body["access_token"],
+        )
+
+    @staticmethod
+    def authenticate(nom: str, pswd: str) -> Call:
+        """Vérification d'identifiants (False si refusés)."""
+        return Call(
+            "POST",
+            "/users/login",
+            {"json": {"nom": nom, "pswd": pswd}},
+            result=lambda body: True,
+            fallback_statuses=frozenset({401, 404}),
+            fallback=False,
+        )
+
+    @staticmethod
+    def is_token_valid(token: str) -> Call:
+        """Validité d'un token."""
+        return Call(
+            "GET",
+            "/users/is_connected",
+            {"headers": {"Authorization": f"Bearer {token}"}},
+            result=bool,
+        )
+
+    @staticmethod
+    def get_me() -> Call:
+        """Profil de l'utilisateur connecté."""
+        return Call("GET", "/users/me", {}, auth=True)
+
+    @staticmethod
+    def list_users() -> Call:
+        """Liste des utilisateurs (vide si aucun)."""
+        return Call(
+            "GET",
+            "/users",
+            {},
+            result=_data,
+            fallback_statuses=frozenset({404}),
+            fallback=[],
+        )
+
+    @staticmethod
+    def search_users(q: str, limit: int, offset: int) -> Call:
+        """Recherche par nom ou email."""
+        params = {"q": q, "limit": limit, "offset": offset}
+        return Call("GET", "/users/search", {"params": params}, result=_data)
+
+    @staticmethod
+    def create_user(nom: str, email: str, pswd: str) -> Call:
+        """Création d'un utilisateur."""
+        body = {"nom": nom, "email": email, "pswd": pswd}
+        return Call("POST", "/users", {"json": body}, result=_data)
+
+    @staticmethod
+    def update_user(nom: str, new_nom: str, email: str, pswd: str) -> Call:
+        """Modification d'un utilisateur."""
+        body = {"nom": new_nom, "email": email, "pswd": pswd}
+        return Call("PUT", f"/users/{nom}", {"json": body}, result=_data)
+
+    @staticmethod
+    def delete_user(nom: str) -> Call:
+        """Suppression d'un utilisateur."""
+        return Call("DELETE", f"/users/{nom}", {}, result=lambda body: None)
+
+
+class ClientBase:
+    """
+    État et logique communs aux clients synchrone et asynchrone ; seuls
+    l'envoi des requêtes et l'attente entre tentatives leur sont propres.
+    """
+
+    def __init__(self, config: Optional[ClientConfig] = None) -> None:
+        """
+        Args:
+            config (Optional[ClientConfig]): Configuration du client.
+        """
+        self.config = config or ClientConfig()
+        self.tokens = TokenCache(self.config.token_refresh_margin_seconds)
+        self.retry = RetryPolicy(self.config)
+
+    def _must_renew(
+        self, response: httpx.Response, auth: bool, renewed: bool
+    ) -> bool:
+        """
+        Indique si une requête authentifiée refusée (401) doit être
+        renvoyée avec un nouveau token (une seule fois), et oublie alors
+        le token courant.
+        """
+        if response.status_code == 401 and auth and not renewed:
+            self.tokens.invalidate()
+            return True
+        return False
+
+    def _remember_token(self, credentials: Dict[str, str], token: str) -> str:
+        """Mémorise un token et les identifiants qui le renouvellent."""
+        self.tokens.credentials = credentials
+        self.tokens.set(token)
+        return token
+
+    def _stored_credentials(self) -> Dict[str, str]:
+        """
+        Identifiants mémorisés par `login`.
+
+        Raises:
+            ApiError: Si aucun identifiant n'a été fourni.
+        """
+        credentials = self.tokens.credentials
+        if credentials is None:
+            raise ApiError(401, "Identifiants requis : appeler login()")
+        return credentials
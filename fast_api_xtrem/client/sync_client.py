@@ -0,0 +1,241 @@
+"""
+Client synchrone de l'API FastAPI XTREM.
+
+Un `ApiClient` conserve un pool de connexions httpx : à créer une fois
+(au niveau du module, par exemple) et à partager, le client étant
+utilisable depuis plusieurs threads. Les opérations groupées
+(`create_users`, `delete_users`) envoient leurs requêtes en parallèle
+dans un pool de `bulk_concurrency` threads.
+
+Exemple :
+    with ApiClient(ClientConfig(base_url="http://127.0.0.1:8000")) as api:
+        api.login("alice", "motdepasse1")
+        print(api.get_me())
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import httpx
+
+from fast_api_xtrem.client.base import (
+    BULK_ERRORS,
+    ApiError,
+    Call,
+    ClientBase,
+    ClientConfig,
+    Endpoints,
+    parse_response,
+    request_headers,
+)
+
+
+class ApiClient(ClientBase):
+    """Client synchrone, avec pool de connexions, token et reprises."""
+
+    def __init__(
+        self,
+        config: Optional[ClientConfig] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+    ) -> None:
+        """
+        Args:
+            config (Optional[ClientConfig]): Configuration du client.
+            transport (Optional[httpx.BaseTransport]): Transport httpx
+                imposé (tests, application ASGI en mémoire).
+        """
+        super().__init__(config)
+        self._token_lock = threading.Lock()
+        self._http = httpx.Client(
+            base_url=self.config.base_url,
+            timeout=self.config.timeout_seconds,
+            limits=self.config.limits(),
+            transport=transport,
+        )
+
+    def __enter__(self) -> "ApiClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Ferme les connexions du pool."""
+        self._http.close()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        auth: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Envoie une requête, avec nouvelles tentatives et, si `auth`,
+        le token courant (renouvelé une fois s'il est refusé).
+
+        Returns:
+            Any: Corps JSON de la réponse.
+
+        Raises:
+            ApiError: Si l'API répond par une erreur.
+            httpx.TransportError: Si l'API reste injoignable.
+        """
+        renewed = False
+        headers = request_headers(self.config, method, headers=headers)
+        while True:
+            if auth:
+                headers["Authorization"] = f"Bearer {self.token()}"
+            response = self._send(method, path, headers, kwargs)
+            if self._must_renew(response, auth, renewed):
+                renewed = True
+                continue
+            return parse_response(response)
+
+    def _send(
+        self, method: str, path: str, headers: dict, kwargs: dict
+    ) -> httpx.Response:
+        """Envoie une requête, renouvelée selon `RetryPolicy`."""
+        attempt = 0
+        while True:
+            try:
+                response = self._http.request(
+                    method, path, headers=headers, **kwargs
+                )
+            except httpx.TransportError as exc:
+                if not self.retry.should_retry(attempt, error=exc):
+                    raise
+                time.sleep(self.retry.delay(attempt))
+            else:
+                if not self.retry.should_retry(attempt, response):
+                    return response
+                time.sleep(self.retry.delay(attempt, response))
+            attempt += 1
+
+    def _call(self, call: Call) -> Any:
+        """Exécute un appel décrit par `Endpoints`."""
+        try:
+            body = self.request(
+                call.method, call.path, auth=call.auth, **call.kwargs
+            )
+        except ApiError as exc:
+            return call.recover(exc)
+        return call.resolve(body)
+
+    # Authentification
+
+    def fetch_token(self, nom: str, pswd: str) -> str:
+        """
+        Obtient un token (`/users/token`) et mémorise les identifiants
+        pour le renouveler.
+        """
+        credentials = {"username": nom, "password": pswd}
+        token = self._call(Endpoints.token(credentials))
+        return self._remember_token(credentials, token)
+
+    login = fetch_token
+
+    def token(self) -> str:
+        """
+        Token courant, renouvelé s'il expire dans moins de
+        `token_refresh_margin_seconds`.
+
+        Raises:
+            ApiError: Si aucun identifiant n'a été fourni (`login`).
+        """
+        token = self.tokens.get()
+        if token is not None:
+            return token
+        with self._token_lock:
+            # Un autre thread a pu le renouveler entre-temps
+            token = self.tokens.get()
+            if token is not None:
+                return token
+            credentials = self._stored_credentials()
+            return self.fetch_token(
+                credentials["username"], credentials["password"]
+            )
+
+    def authenticate(self, nom: str, pswd: str) -> bool:
+        """Vérifie des identifiants (`/users/login`)."""
+        return self._call(Endpoints.authenticate(nom, pswd))
+
+    def is_token_valid(self, token: Optional[str] = None) -> bool:
+        """Indique si un token (par défaut le token courant) est valide."""
+        token = token or self.tokens.get()
+        if not token:
+            return False
+        return self._call(Endpoints.is_token_valid(token))
+
+    # Utilisateurs
+
+    def get_me(self) -> Dict[str, str]:
+        """Profil de l'utilisateur connecté."""
+        return self._call(Endpoints.get_me())
+
+    def list_users(self) -> List[Dict[str, str]]:
+        """Liste des utilisateurs (vide si aucun)."""
+        return self._call(Endpoints.list_users())
+
+    def search_users(
+        self, q: str, limit: int = 20, offset: int = 0
+    ) -> Dict[str, Any]:
+        """Recherche par nom ou email (résultats et page suivante)."""
+        return self._call(Endpoints.search_users(q, limit, offset))
+
+    def create_user(self, nom: str, email: str, pswd: str) -> Dict[str, str]:
+        """Crée un utilisateur."""
+        return self._call(Endpoints.create_user(nom, email, pswd))
+
+    def update_user(
+        self, nom: str, new_nom: str, email: str, pswd: str
+    ) -> Dict[str, str]:
+        """Modifie un utilisateur."""
+        return self._call(Endpoints.update_user(nom, new_nom, email, pswd))
+
+    def delete_user(self, nom: str) -> None:
+        """Supprime un utilisateur."""
+        self._call(Endpoints.delete_user(nom))
+
+    # Opérations groupées
+
+    def create_users(
+        self, users: Iterable[Dict[str, str]]
+    ) -> List[Union[Dict[str, str], Exception]]:
+        """
+        Crée plusieurs utilisateurs (`nom`, `email`, `pswd`) en parallèle.
+
+        Returns:
+            List: Pour chaque utilisateur, dans l'ordre, l'utilisateur
+            créé ou l'erreur rencontrée (`ApiError`, ou
+            `httpx.TransportError` si l'API est restée injoignable).
+        """
+        return self._bulk(
+            lambda user: self.create_user(
+                user["nom"], user["email"], user["pswd"]
+            ),
+            users,
+        )
+
+    def delete_users(self, noms: Iterable[str]) -> List[Optional[Exception]]:
+        """Supprime plusieurs utilisateurs (voir `create_users`)."""
+        return self._bulk(self.delete_user, noms)
+
+    def _bulk(self, func, items: Iterable) -> list:
+        """
+        Applique `func` à chaque élément dans un pool de threads ; l'échec
+        d'un élément (`BULK_ERRORS`) n'interrompt pas les autres.
+        """
+
+        def call(item):
+            try:
+                return func(item)
+            except BULK_ERRORS as exc:
+                return exc
+
+        workers = max(self.config.bulk_concurrency, 1)
+        with ThreadPoolExecutor(workers, "api-client-bulk") as executor:
+            return list(executor.map(call, items))
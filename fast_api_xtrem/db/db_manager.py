@@ -5,16 +5,39 @@ Ce module contient la classe DBManager, responsable de la connexion à la base
 de données, de la création des tables, de la gestion des sessions SQLAlchemy
 et de la vérification des structures existantes.
 
+En mode multi-organisation (`DatabaseConfig.tenancy_enabled`), chaque
+organisation dispose de sa propre base : un fichier SQLite
+(`database/tenants/<organisation>.db`), ou un schéma sur les autres
+serveurs. Seules les organisations déclarées (`DatabaseConfig.tenants`)
+ont une base. Les moteurs sont créés au premier accès et leur nombre est
+borné (éviction du moins récemment utilisé). La base principale reste
+celle des requêtes sans organisation et du journal d'audit ; purge,
+statistiques et maintenance parcourent aussi les bases des organisations
+(`engines`).
+
 Il définit également une exception personnalisée pour les erreurs de connexion.
 """
 
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Optional
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateSchema
 
 from fast_api_xtrem.app.config import DatabaseConfig, LoggerConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
 from fast_api_xtrem.db.base import Base
+from fast_api_xtrem.db.instrumentation import instrument_engine
+from fast_api_xtrem.db.lazy_session import LazySession
+from fast_api_xtrem.db.tenancy import check_tenant
+from fast_api_xtrem.db.utils.schema import upgrade_schema
+from fast_api_xtrem.db.utils.search import install_search_index
 from fast_api_xtrem.db.utils.utils import seed_default_roles
 from fast_api_xtrem.logger.logger_manager import LoggerManager
 
@@ -26,6 +49,18 @@ class DBConnectionError(RuntimeError):
     """
 
 
+def _enable_wal(dbapi_connection, _connection_record) -> None:
+    """
+    Active le journal WAL (SQLite) : les lectures ne bloquent plus les
+    écritures, et le journal est reporté par la tâche `sqlite_checkpoint`.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+    finally:
+        cursor.close()
+
+
 class DBManager:
     """
     Classe responsable de la gestion de la base de données.
@@ -36,7 +71,11 @@ class DBManager:
     """
 
     def __init__(
-        self, config: DatabaseConfig, logger_config: LoggerConfig, logger=None
+        self,
+        config: DatabaseConfig,
+        logger_config: LoggerConfig,
+        logger=None,
+        metrics: MetricsRegistry = None,
     ):
         """
         Initialise le gestionnaire de base de données.
@@ -45,12 +84,23 @@ class DBManager:
             config (AppConfig) : Configuration de l'application contenant
                                 l'URL de la base de données.
             logger: Instance du gestionnaire de logs.
+            metrics (MetricsRegistry) : Registre des métriques du pool.
         """
         self.config = config
         self.database_url = config.database_url
         self.engine = None
         self.session_local = None
         self.logger = logger or LoggerManager(logger_config)
+        self.metrics = metrics or MetricsRegistry()
+        self._pool_lock = threading.Lock()
+        self._checked_out = 0
+        # Organisation → (moteur, fabrique de sessions), ordre d'utilisation
+        self._tenants: "OrderedDict[str, tuple]" = OrderedDict()
+        self._tenants_lock = threading.Lock()
+        # Verrous d'ouverture par organisation : la création d'une base
+        # ne bloque pas l'accès aux bases déjà ouvertes
+        self._opening: dict = {}
+        self._database_dir = self._get_package_root() / "database"
         self._check_db_file()
 
     @staticmethod
@@ -87,15 +137,39 @@ class DBManager:
                     f"Le fichier de base de données sera créé: {db_file}"
                 )
 
-    def _create_tables(self):
+    def _create_tables(self, engine: Engine):
         """Crée les tables dans la base de données si elles n'existent pas."""
         self.logger.info("Création des tables")
         for table_name in Base.metadata.tables.keys():
             self.logger.info(f"Création de la table: {table_name}")
-        Base.metadata.create_all(bind=self.engine)
+        Base.metadata.create_all(bind=engine)
+        upgrade_schema(engine, self.logger)
+        install_search_index(engine, self.logger)
         self.logger.success("✅ Tables crées")
         # Alimentation des rôles par défaut [[4]]
-        seed_default_roles(self.engine, self.logger)
+        seed_default_roles(engine, self.logger)
+
+    def _create_engine(self, url: str, **options) -> Engine:
+        """Crée un moteur instrumenté, réglé par la configuration du pool."""
+        connect_args = (
+            {"check_same_thread": False} if url.startswith("sqlite") else {}
+        )
+        engine = create_engine(
+            url,
+            connect_args=connect_args,
+            pool_pre_ping=True,  # Vérifie la validité des connexions [[5]]
+            pool_size=self.config.pool_size,
+            max_overflow=self.config.max_overflow,
+            pool_timeout=self.config.pool_timeout,
+            **options,
+        )
+        if url.startswith("sqlite"):
+            event.listen(engine, "connect", _enable_wal)
+        self._instrument_pool(engine)
+        instrument_engine(
+            engine, lambda: self.config, self.logger, self.metrics
+        )
+        return engine
 
     def connect(self):
         """Connexion avec vérifications supplémentaires."""
@@ -104,21 +178,195 @@ class DBManager:
             return False  # Évite les connexions multiples [[9]]
 
         try:
-            self.engine = create_engine(
-                self.database_url,
-                connect_args={"check_same_thread": False},
-                pool_pre_ping=True,  # Vérifie la validité des connexions [[5]]
+            self.engine = self._create_engine(self.database_url)
+            self._create_tables(self.engine)
+            # Les objets restent lisibles après commit sans nouvelle requête
+            self.session_local = sessionmaker(
+                bind=self.engine, expire_on_commit=False
             )
-            self._create_tables()
-            self.session_local = sessionmaker(bind=self.engine)
+            self.metrics.set_gauge("db_pool_capacity", self._pool_capacity())
             self.logger.success("✅ Connexion réussie")
             return True
         except Exception as e:
             self.logger.error(f"Échec de connexion : {str(e)}")
             raise DBConnectionError from e
 
+    def _open_tenant(self, tenant: str) -> tuple:
+        """
+        Crée le moteur d'une organisation et ses tables (premier accès).
+
+        Returns:
+            tuple: Moteur et fabrique de sessions.
+        """
+        if self.database_url.startswith("sqlite"):
+            tenants_dir = self._database_dir / "tenants"
+            tenants_dir.mkdir(parents=True, exist_ok=True)
+            db_file = tenants_dir / f"{tenant}.db"
+            engine = self._create_engine(f"sqlite:///{db_file.absolute()}")
+        else:
+            # Même serveur, schéma propre à l'organisation
+            engine = self._create_engine(
+                self.database_url,
+                execution_options={"schema_translate_map": {None: tenant}},
+            )
+            with engine.begin() as connection:
+                connection.execute(CreateSchema(tenant, if_not_exists=True))
+        try:
+            self._create_tables(engine)
+        except Exception:
+            engine.dispose()
+            raise
+        self.logger.info(f"🏢 Base de l'organisation {tenant} ouverte")
+        return engine, sessionmaker(bind=engine, expire_on_commit=False)
+
+    def open_tenant(self, tenant: str) -> tuple:
+        """
+        Retourne le moteur et la fabrique de sessions d'une organisation,
+        en ouvrant sa base si besoin et en fermant la moins récemment
+        utilisée au-delà de `max_open_tenants`.
+
+        La première ouverture (création des tables) est lente : à appeler
+        hors de la boucle d'événements.
+
+        Raises:
+            InvalidTenantError: Si l'organisation est invalide ou n'est
+                pas déclarée dans `tenants`.
+        """
+        check_tenant(tenant, self.config.tenants)
+        with self._tenants_lock:
+            entry = self._tenants.get(tenant)
+            if entry is not None:
+                self._tenants.move_to_end(tenant)
+                return entry
+            opening = self._opening.setdefault(tenant, threading.Lock())
+        # Un seul moteur par organisation, sans bloquer les autres
+        with opening:
+            with self._tenants_lock:
+                entry = self._tenants.get(tenant)
+            if entry is not None:
+                return entry
+            try:
+                entry = self._open_tenant(tenant)
+            finally:
+                # Verrou retiré même en cas d'échec d'ouverture
+                with self._tenants_lock:
+                    self._opening.pop(tenant, None)
+            with self._tenants_lock:
+                evicted = []
+                previous = self._tenants.get(tenant)
+                if previous is not None:
+                    # Rouverte entre-temps après une éviction
+                    evicted.append((tenant, entry))
+                    entry = previous
+                self._tenants[tenant] = entry
+                limit = max(self.config.max_open_tenants, 1)
+                while len(self._tenants) > limit:
+                    evicted.append(self._tenants.popitem(last=False))
+                open_tenants = len(self._tenants)
+        for name, (engine, _) in evicted:
+            # Les connexions empruntées restent valides jusqu'à leur retour
+            engine.dispose()
+            self.metrics.increment("db_tenant_evictions_total")
+            self.logger.info(f"Base de l'organisation {name} fermée (LRU)")
+        self.metrics.set_gauge("db_open_tenants", open_tenants)
+        self.metrics.set_gauge("db_pool_capacity", self._pool_capacity())
+        return entry
+
+    def open_tenants(self) -> list:
+        """Retourne les organisations dont la base est ouverte."""
+        with self._tenants_lock:
+            return list(self._tenants)
+
+    def existing_tenants(self) -> list:
+        """
+        Retourne les organisations déclarées dont la base existe (fichier
+        SQLite déjà créé ; sur les autres serveurs, toutes), pour les
+        tâches de fond.
+        """
+        if not self.config.tenancy_enabled:
+            return []
+        if not self.database_url.startswith("sqlite"):
+            return list(self.config.tenants)
+        tenants_dir = self._database_dir / "tenants"
+        return [
+            tenant
+            for tenant in self.config.tenants
+            if (tenants_dir / f"{tenant}.db").exists()
+        ]
+
+    def engines(self):
+        """
+        Parcourt les moteurs de la base principale puis de chaque
+        organisation existante (ouverte au besoin, voir `open_tenant`).
+
+        Yields:
+            tuple: Organisation (None pour la base principale) et moteur.
+        """
+        yield None, self.engine
+        for tenant in self.existing_tenants():
+            yield tenant, self.open_tenant(tenant)[0]
+
+    def _pool_capacity(self) -> int:
+        """
+        Capacité cumulée des pools de connexions ouverts, sur le même
+        périmètre que `db_pool_checked_out` (base principale et
+        organisations).
+        """
+        with self._tenants_lock:
+            engines = 1 + len(self._tenants)
+        return (self.config.pool_size + self.config.max_overflow) * engines
+
+    def _instrument_pool(self, engine: Engine):
+        """
+        Publie l'occupation du pool de connexions dans les métriques :
+        connexions empruntées, emprunts cumulés et durée de détention.
+        """
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(_dbapi_connection, connection_record, _proxy):
+            connection_record.info["checkout_at"] = time.perf_counter()
+            with self._pool_lock:
+                self._checked_out += 1
+                in_use = self._checked_out
+            self.metrics.set_gauge("db_pool_checked_out", in_use)
+            self.metrics.increment("db_pool_checkouts_total")
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(_dbapi_connection, connection_record):
+            started = connection_record.info.pop("checkout_at", None)
+            with self._pool_lock:
+                self._checked_out = max(self._checked_out - 1, 0)
+                in_use = self._checked_out
+            self.metrics.set_gauge("db_pool_checked_out", in_use)
+            if started is not None:
+                self.metrics.increment(
+                    "db_connection_held_seconds_total",
+                    time.perf_counter() - started,
+                )
+
+    def pool_status(self) -> dict:
+        """
+        Retourne l'occupation courante du pool de connexions.
+
+        Returns:
+            dict : Connexions empruntées, capacité et taux d'occupation.
+        """
+        capacity = self._pool_capacity()
+        with self._pool_lock:
+            in_use = self._checked_out
+        return {
+            "checked_out": in_use,
+            "capacity": capacity,
+            "saturation": in_use / capacity if capacity else 0.0,
+        }
+
     def disconnect(self):
         """Ferme proprement la connexion à la base de données."""
+        with self._tenants_lock:
+            tenants = list(self._tenants.values())
+            self._tenants.clear()
+        for engine, _ in tenants:
+            engine.dispose()
         if self.engine:
             self.engine.dispose()
             self.logger.info("🔌 Déconnexion de la base de données effectuée")
@@ -127,13 +375,27 @@ class DBManager:
                 "Tentative de déconnexion sans connexion active"
             )
 
-    def get_db(self):
-        """Fournit une session SQLAlchemy."""
+    @contextmanager
+    def session_scope(self, tenant: Optional[str] = None):
+        """
+        Contexte fournissant une session SQLAlchemy paresseuse, annulée en
+        cas d'erreur et toujours fermée en sortie.
+
+        Aucune connexion n'est empruntée tant que la session n'est pas
+        utilisée (voir `LazySession`).
+
+        Args:
+            tenant (Optional[str]): Organisation dont la base est utilisée
+                (base principale si None).
+        """
         if not self.session_local:
             self.logger.error("Session non initialisée")
             raise DBConnectionError("Base de données non connectée")
 
-        db = self.session_local()
+        factory = self.session_local
+        if tenant is not None:
+            factory = self.open_tenant(tenant)[1]
+        db = LazySession(factory)
         try:
             yield db
         except Exception as e:
@@ -143,6 +405,11 @@ class DBManager:
         finally:
             db.close()  # Fermeture explicite [[6]]
 
+    def get_db(self):
+        """Fournit une session SQLAlchemy."""
+        with self.session_scope() as db:
+            yield db
+
     def check_tables(self):
         """
         Vérifie les tables existantes dans la base de données.
@@ -0,0 +1,155 @@
+"""
+Instrumentation des requêtes SQL de l'application FastAPI XTREM.
+
+Des écouteurs `before/after_cursor_execute` posés sur le moteur mesurent
+chaque requête. Les mesures sont agrégées dans un `QueryStats` propre à la
+requête HTTP courante (variable de contexte), ce qui permet :
+- de publier le nombre de requêtes et le temps passé en base par requête ;
+- de journaliser les requêtes lentes avec leur plan d'exécution (jamais
+  leurs paramètres, qui peuvent contenir empreintes de mots de passe et
+  adresses email) ;
+- de signaler les instructions répétées N fois dans une même requête
+  HTTP (symptôme typique d'un N+1).
+"""
+
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from fast_api_xtrem.app.config import DatabaseConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+
+# Instructions pour lesquelles un plan d'exécution a un sens
+EXPLAINABLE = ("SELECT", "UPDATE", "DELETE", "INSERT", "WITH")
+
+
+class QueryStats:
+    """Statistiques SQL d'une requête HTTP."""
+
+    __slots__ = ("count", "total_time", "statements", "warned")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_time = 0.0
+        self.statements: Counter = Counter()
+        self.warned: set = set()
+
+    @property
+    def total_ms(self) -> float:
+        """Temps total passé en base, en millisecondes."""
+        return self.total_time * 1000
+
+
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def instrument_engine(
+    engine: Engine,
+    get_config: Callable[[], DatabaseConfig],
+    logger,
+    metrics: MetricsRegistry,
+) -> None:
+    """
+    Pose les écouteurs de mesure des requêtes sur le moteur.
+
+    Args:
+        engine (Engine): Moteur SQLAlchemy.
+        get_config (Callable[[], DatabaseConfig]): Accès à la configuration
+            courante (seuils modifiables à chaud).
+        logger: Gestionnaire de logs.
+        metrics (MetricsRegistry): Registre des métriques.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_execute(conn, _cursor, _statement, _params, _context, _many):
+        conn.info.setdefault("query_started_at", []).append(
+            time.perf_counter()
+        )
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_execute(conn, _cursor, statement, params, _context, _many):
+        started = conn.info["query_started_at"].pop()
+        elapsed = time.perf_counter() - started
+        config = get_config()
+        metrics.increment("db_queries_total")
+        metrics.increment("db_query_seconds_total", elapsed)
+
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.total_time += elapsed
+            stats.statements[statement] += 1
+            repeats = stats.statements[statement]
+            if (
+                repeats >= config.repeated_statement_threshold
+                and statement not in stats.warned
+            ):
+                stats.warned.add(statement)
+                metrics.increment("db_repeated_statements_total")
+                logger.warning(
+                    f"Requête répétée {repeats} fois dans la même requête "
+                    f"HTTP (N+1 probable) : {statement}"
+                )
+
+        if elapsed * 1000 >= config.slow_query_ms:
+            metrics.increment("db_slow_queries_total")
+            plan = explain(conn, statement, params)
+            logger.warning(
+                f"Requête lente ({elapsed * 1000:.1f} ms) : {statement} "
+                f"| paramètres : {_describe_params(params)} | plan : {plan}"
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def on_error(context):
+        # Instruction en échec : after_cursor_execute n'est pas appelé
+        conn = context.connection
+        if conn is not None and conn.info.get("query_started_at"):
+            conn.info["query_started_at"].pop()
+
+
+def _describe_params(params) -> str:
+    """Décrit les paramètres d'une instruction sans leurs valeurs."""
+    if not params:
+        return "aucun"
+    if isinstance(params, (list, tuple)) and isinstance(
+        params[0], (dict, list, tuple)
+    ):
+        return f"{len(params)} lots masqués"
+    return f"{len(params)} masqués"
+
+
+def explain(conn, statement: str, params) -> str:
+    """
+    Retourne le plan d'exécution d'une instruction (SQLite :
+    `EXPLAIN QUERY PLAN`, autres dialectes : `EXPLAIN`).
+
+    Le plan est obtenu sur un curseur DBAPI distinct, sans passer par
+    le moteur, pour ne pas déclencher de nouveau l'instrumentation.
+
+    Args:
+        conn: Connexion SQLAlchemy.
+        statement (str): Instruction SQL.
+        params: Paramètres de l'instruction.
+
+    Returns:
+        str: Plan d'exécution, ou la raison de son absence.
+    """
+    if not statement.lstrip().upper().startswith(EXPLAINABLE):
+        return "non applicable"
+    prefix = (
+        "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    )
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(prefix + statement, params or ())
+        return " / ".join(str(row[-1]) for row in cursor.fetchall())
+    except Exception as e:  # pylint: disable=broad-except
+        return f"indisponible ({e})"
+    finally:
+        cursor.close()
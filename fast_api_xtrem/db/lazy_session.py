@@ -0,0 +1,76 @@
+"""
+Session SQLAlchemy paresseuse pour l'application FastAPI XTREM.
+
+La classe `LazySession` se substitue à une `Session` : la session réelle
+n'est créée qu'au premier usage, et la connexion est rendue au pool dès
+la validation (`commit`) ou sur demande explicite (`release`), plutôt qu'à
+la fin de la requête. Une requête qui ne touche pas la base n'occupe
+ainsi aucune connexion, et le temps passé à hacher un mot de passe ou à
+sérialiser la réponse ne monopolise pas le pool.
+"""
+
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+
+class LazySession:
+    """
+    Proxy de `Session` ouvrant la session au premier accès.
+
+    Les objets chargés restent lisibles après `commit` ou `release` :
+    la fabrique de sessions est configurée avec `expire_on_commit=False`,
+    et la fermeture ne fait que les détacher de la session.
+    """
+
+    __slots__ = ("_factory", "_session")
+
+    def __init__(self, factory: Callable[[], Session]) -> None:
+        """
+        Args:
+            factory (Callable[[], Session]): Fabrique de sessions.
+        """
+        self._factory = factory
+        self._session: Optional[Session] = None
+
+    @property
+    def started(self) -> bool:
+        """Indique si la session réelle a été créée."""
+        return self._session is not None
+
+    def _get(self) -> Session:
+        """Retourne la session réelle, en la créant si besoin."""
+        if self._session is None:
+            self._session = self._factory()
+        return self._session
+
+    def __getattr__(self, name: str):
+        return getattr(self._get(), name)
+
+    def commit(self) -> None:
+        """Valide la transaction puis rend la connexion au pool."""
+        if self._session is None:
+            return
+        self._session.commit()
+        self._session.close()
+
+    def rollback(self) -> None:
+        """Annule la transaction en cours, s'il y en a une."""
+        if self._session is not None:
+            self._session.rollback()
+
+    def release(self) -> None:
+        """
+        Rend la connexion au pool après une lecture.
+
+        Les objets chargés sont détachés : à n'appeler que lorsqu'aucune
+        modification ne doit plus être suivie par la session.
+        """
+        if self._session is not None:
+            self._session.close()
+
+    def close(self) -> None:
+        """Ferme la session réelle si elle a été créée."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
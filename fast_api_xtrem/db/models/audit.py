@@ -0,0 +1,43 @@
+"""
+Modèle de la table 'audit_events' pour la base de données.
+
+Chaque ligne trace un événement de sécurité (connexion, modification ou
+suppression de profil). La table n'est alimentée que par lots, par le
+journal d'audit (`fast_api_xtrem.app.audit`), dans la base principale
+quelle que soit l'organisation de l'événement (colonne `tenant`).
+"""
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from fast_api_xtrem.db.base import Base
+
+
+# pylint: disable=too-few-public-methods
+class AuditEvent(Base):
+    """
+    Représente un événement d'audit.
+
+    Attributs :
+        id (int) : Identifiant croissant, clé de la pagination.
+        created_at (datetime) : Date de l'événement (UTC).
+        event_type (str) : Type d'événement (ex. : "login_failed").
+        actor (str) : Utilisateur à l'origine de l'événement.
+        subject (str) : Utilisateur concerné.
+        details (str) : Détails complémentaires, en JSON.
+        tenant (str) : Organisation de l'événement (None pour la base
+            principale).
+    """
+
+    __tablename__ = "audit_events"
+    __table_args__ = (
+        Index("ix_audit_events_type_id", "event_type", "id"),
+        Index("ix_audit_events_subject_id", "subject", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    created_at = Column(DateTime, nullable=False)
+    event_type = Column(String(50), nullable=False)
+    actor = Column(String(50), nullable=True)
+    subject = Column(String(50), nullable=True)
+    details = Column(Text, nullable=True)
+    tenant = Column(String(63), nullable=True)
@@ -2,16 +2,25 @@
 Modèle de la table 'users' pour la base de données.
 
 Ce module définit la structure de la table utilisateur,
-incluant l'identifiant, le nom, l'email et le mot de passe.
+incluant l'identifiant, le nom, l'email, le mot de passe, le rôle, la
+date d'inscription et la date de suppression logique.
 """
 
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional
+
 from pydantic import BaseModel, constr, EmailStr
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
 
 from fast_api_xtrem.db.base import Base
 
 
+def utc_now() -> datetime:
+    """Retourne la date courante en UTC, sans fuseau (stockage SQLite)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 # pylint: disable=too-few-public-methods
 class User(Base):
     """
@@ -22,6 +31,11 @@ class User(Base):
         nom (str) : Nom complet de l'utilisateur.
         email (str) : Adresse email de l'utilisateur.
         pswd (str) : Mot de passe de l'utilisateur (non chiffré ici).
+        role_id (int) : Rôle de l'utilisateur (facultatif).
+        created_at (datetime) : Date d'inscription (UTC).
+        deleted_at (datetime) : Date de suppression logique (UTC) ; un
+            utilisateur supprimé est ignoré par toutes les requêtes et
+            effacé plus tard par la purge.
     """
 
     __tablename__ = "users"
@@ -30,6 +44,32 @@ class User(Base):
     nom = Column(String(50), nullable=False)
     email = Column(String(100), nullable=False)
     pswd = Column(String(100), nullable=False)
+    # Colonnes facultatives : ajoutées aux bases existantes au démarrage
+    role_id = Column(Integer, ForeignKey("roles.id"), nullable=True)
+    created_at = Column(DateTime, nullable=True, default=utc_now)
+    deleted_at = Column(DateTime, nullable=True, index=True)
+
+
+class UserProjection(NamedTuple):
+    """
+    Projection en lecture seule d'un utilisateur, suffisante pour
+    l'authentification et l'affichage du profil.
+    """
+
+    id: int
+    nom: str
+    email: str
+    pswd: str
+
+
+class UserSummary(NamedTuple):
+    """
+    Projection en lecture seule d'un utilisateur pour les listes : un
+    tuple de deux champs, sans suivi par la session ni instrumentation.
+    """
+
+    nom: str
+    email: str
 
 
 # Pydantic Models for request validation
@@ -48,3 +88,72 @@ class UserUpdate(BaseModel):
     nom: constr(min_length=1, max_length=50)
     email: EmailStr
     pswd: constr(min_length=8)  # added pswd
+
+
+# Modèles de réponse : ils décrivent les réponses dans le schéma OpenAPI.
+# Les routes renvoient des données issues de la base, déjà conformes :
+# elles sont sérialisées directement, sans validation par ces modèles.
+class UserOut(BaseModel):
+    """Profil public d'un utilisateur."""
+
+    nom: str
+    email: str
+
+
+class UserList(BaseModel):
+    """Liste des utilisateurs actifs."""
+
+    message: str
+    data: List[UserOut]
+
+
+class UserMessage(BaseModel):
+    """Résultat d'une écriture, avec le profil de l'utilisateur."""
+
+    message: str
+    data: UserOut
+
+
+class UserSearchPage(BaseModel):
+    """Page de résultats d'une recherche d'utilisateurs."""
+
+    results: List[UserOut]
+    limit: int
+    offset: int
+    has_more: bool
+
+
+class UserSearchOut(BaseModel):
+    """Résultat de la recherche d'utilisateurs."""
+
+    message: str
+    data: UserSearchPage
+
+
+class UserStatsData(BaseModel):
+    """Statistiques agrégées des utilisateurs."""
+
+    total: int
+    signups_per_day: Dict[str, int]
+    users_per_role: Dict[str, int]
+    reconciled_at: Optional[str]
+
+
+class UserStatsOut(BaseModel):
+    """Statistiques des utilisateurs."""
+
+    message: str
+    data: UserStatsData
+
+
+class MessageOut(BaseModel):
+    """Message de résultat."""
+
+    message: str
+
+
+class TokenOut(BaseModel):
+    """Token d'accès JWT (OAuth2)."""
+
+    access_token: str
+    token_type: str = "bearer"
@@ -0,0 +1,124 @@
+"""
+Purge des utilisateurs supprimés logiquement.
+
+`delete_user` ne fait que renseigner `deleted_at` : une écriture brève,
+qui ne monopolise pas le verrou d'écriture SQLite. `SoftDeletePurger`
+efface ensuite définitivement ces lignes par lots bornés, espacés d'une
+pause, et seulement lorsque l'application est peu sollicitée : un grand
+nettoyage ne concurrence ainsi pas le trafic de connexion. Chaque passe
+traite la base principale puis celle de chaque organisation.
+"""
+
+import time
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy import delete, select
+
+from fast_api_xtrem.app.config import PurgeConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.db.models.user import User, utc_now
+
+
+class SoftDeletePurger:
+    """Effacement définitif, par lots, des utilisateurs supprimés."""
+
+    def __init__(
+        self,
+        config: PurgeConfig,
+        db_manager,
+        requests,
+        metrics: MetricsRegistry,
+        logger,
+    ) -> None:
+        """
+        Args:
+            config (PurgeConfig): Configuration de la purge.
+            db_manager (DBManager): Gestionnaire de base de données.
+            requests (RequestTracker): Suivi des requêtes en cours, qui
+                détermine si l'application est au repos.
+            metrics (MetricsRegistry): Registre des métriques.
+            logger (LoggerManager): Gestionnaire de logs.
+        """
+        self.config = config
+        self.db_manager = db_manager
+        self.requests = requests
+        self.metrics = metrics
+        self.logger = logger
+
+    def is_quiet(self) -> bool:
+        """Indique si l'application est assez peu sollicitée."""
+        return self.requests.active <= self.config.quiet_max_in_flight
+
+    def purge_batch(self, tenant: Optional[str] = None) -> int:
+        """
+        Efface un lot d'utilisateurs supprimés depuis plus de
+        `retention_seconds`, dans une transaction courte.
+
+        Args:
+            tenant (Optional[str]): Organisation (base principale si None).
+
+        Returns:
+            int: Nombre de lignes effacées.
+        """
+        config = self.config
+        cutoff = utc_now() - timedelta(seconds=config.retention_seconds)
+        batch = (
+            select(User.id)
+            .where(User.deleted_at.is_not(None), User.deleted_at <= cutoff)
+            .order_by(User.deleted_at)
+            .limit(config.batch_size)
+        )
+        with self.db_manager.session_scope(tenant) as db:
+            result = db.execute(
+                delete(User)
+                .where(User.id.in_(batch.scalar_subquery()))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        return result.rowcount
+
+    def run(self) -> int:
+        """
+        Exécute une passe de purge sur chaque base : au plus
+        `max_batches_per_run` lots par base, interrompue dès que
+        l'application n'est plus au repos.
+
+        Returns:
+            int: Nombre total de lignes effacées.
+        """
+        if not self.config.enabled:
+            return 0
+        purged = 0
+        tenants = [None, *self.db_manager.existing_tenants()]
+        for tenant in tenants:
+            count, quiet = self._purge_database(tenant)
+            purged += count
+            if not quiet:
+                break
+        if purged:
+            self.logger.info(f"Purge : {purged} utilisateur(s) effacé(s)")
+        return purged
+
+    def _purge_database(self, tenant: Optional[str]) -> tuple:
+        """
+        Purge une base jusqu'à ce qu'il ne reste rien à effacer.
+
+        Returns:
+            tuple: Lignes effacées, et False si la passe a été
+            interrompue faute de repos.
+        """
+        config = self.config
+        purged = 0
+        for index in range(config.max_batches_per_run):
+            if not self.is_quiet():
+                self.metrics.increment("users_purge_deferred_total")
+                return purged, False
+            if index:
+                time.sleep(config.batch_pause_seconds)
+            count = self.purge_batch(tenant)
+            purged += count
+            self.metrics.increment("users_purged_total", count)
+            if count < config.batch_size:
+                break
+        return purged, True
@@ -0,0 +1,59 @@
+"""
+Noms d'organisation (tenant) de l'application FastAPI XTREM.
+
+Chaque organisation dispose de sa propre base (voir `DBManager`). Son nom
+sert à construire un chemin de fichier ou un nom de schéma : il est donc
+restreint aux minuscules, chiffres, `-` et `_`. Seules les organisations
+déclarées (`DatabaseConfig.tenants`) sont acceptées.
+"""
+
+import re
+
+TENANT_PATTERN = re.compile(r"[a-z0-9][a-z0-9_-]{0,62}")
+
+
+class InvalidTenantError(ValueError):
+    """Nom d'organisation invalide."""
+
+
+class UnknownTenantError(InvalidTenantError):
+    """Organisation non déclarée dans la configuration."""
+
+
+def validate_tenant(name: str) -> str:
+    """
+    Vérifie un nom d'organisation.
+
+    Args:
+        name (str): Nom reçu (revendication du token ou en-tête).
+
+    Returns:
+        str: Le nom, inchangé.
+
+    Raises:
+        InvalidTenantError: Si le nom ne respecte pas `TENANT_PATTERN`.
+    """
+    if not isinstance(name, str) or not TENANT_PATTERN.fullmatch(name):
+        raise InvalidTenantError(f"Organisation invalide : {name!r}")
+    return name
+
+
+def check_tenant(name: str, known) -> str:
+    """
+    Vérifie qu'une organisation est valide et déclarée.
+
+    Args:
+        name (str): Nom reçu.
+        known: Organisations déclarées (`DatabaseConfig.tenants`).
+
+    Returns:
+        str: Le nom, inchangé.
+
+    Raises:
+        InvalidTenantError: Si le nom est invalide.
+        UnknownTenantError: Si l'organisation n'est pas déclarée.
+    """
+    validate_tenant(name)
+    if name not in known:
+        raise UnknownTenantError(f"Organisation inconnue : {name!r}")
+    return name
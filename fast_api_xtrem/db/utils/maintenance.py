@@ -0,0 +1,56 @@
+"""
+Opérations de maintenance de la base SQLite.
+
+- `optimize_database` : `PRAGMA optimize`, qui met à jour les statistiques
+  du planificateur pour les index qui en ont besoin ;
+- `checkpoint_wal` : reporte le journal WAL dans la base et le tronque ;
+- `vacuum_database` : reconstruit le fichier pour rendre au système
+  l'espace libéré par les suppressions (opération longue et bloquante).
+
+Sur un autre moteur, ces opérations sont sans effet : PostgreSQL assure
+la sienne par autovacuum.
+"""
+
+from sqlalchemy import text
+
+
+def _run_sqlite(engine, statement: str, logger) -> bool:
+    """Exécute une instruction de maintenance hors transaction."""
+    if engine is None or engine.dialect.name != "sqlite":
+        return False
+    with engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as connection:
+        connection.execute(text(statement))
+    logger.debug(f"Maintenance SQLite : {statement}")
+    return True
+
+
+def optimize_database(engine, logger) -> bool:
+    """
+    Met à jour les statistiques du planificateur (`PRAGMA optimize`).
+
+    Returns:
+        bool: True si l'opération a été exécutée.
+    """
+    return _run_sqlite(engine, "PRAGMA optimize", logger)
+
+
+def checkpoint_wal(engine, logger) -> bool:
+    """
+    Reporte le journal WAL dans la base puis le tronque.
+
+    Returns:
+        bool: True si l'opération a été exécutée.
+    """
+    return _run_sqlite(engine, "PRAGMA wal_checkpoint(TRUNCATE)", logger)
+
+
+def vacuum_database(engine, logger) -> bool:
+    """
+    Reconstruit le fichier de base (`VACUUM`).
+
+    Returns:
+        bool: True si l'opération a été exécutée.
+    """
+    return _run_sqlite(engine, "VACUUM", logger)
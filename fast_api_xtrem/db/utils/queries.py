@@ -0,0 +1,123 @@
+"""
+Requêtes utilitaires sur les utilisateurs.
+
+Regroupe les accès en lecture partagés entre les routes
+et les dépendances FastAPI. Les lectures sélectionnent les seules colonnes
+utiles (SQLAlchemy Core) et les restituent sous forme de projections
+(tuples nommés) : les objets ORM `User` sont réservés aux écritures.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from fast_api_xtrem.db.models.user import (
+    User,
+    UserProjection,
+    UserSummary,
+)
+
+
+def get_user_by_name(db: Session, nom: str) -> Optional[User]:
+    """
+    Récupère un utilisateur actif (non supprimé) par son nom, en vue de
+    sa modification.
+
+    Args:
+        db (Session): Session SQLAlchemy.
+        nom (str): Nom de l'utilisateur.
+
+    Returns:
+        Optional[User]: L'utilisateur s'il existe, sinon None.
+    """
+    return (
+        db.query(User)
+        .filter(User.nom == nom, User.deleted_at.is_(None))
+        .first()
+    )
+
+
+def user_exists(db: Session, nom: str) -> bool:
+    """
+    Indique si un utilisateur actif porte ce nom.
+
+    Args:
+        db (Session): Session SQLAlchemy.
+        nom (str): Nom de l'utilisateur.
+
+    Returns:
+        bool: True si le nom est pris.
+    """
+    row = db.execute(
+        select(User.id)
+        .where(User.nom == nom, User.deleted_at.is_(None))
+        .limit(1)
+    ).first()
+    return row is not None
+
+
+def get_user_projection(db: Session, nom: str) -> Optional[UserProjection]:
+    """
+    Récupère la projection d'un utilisateur actif par son nom, sans
+    instancier d'objet ORM.
+
+    Args:
+        db (Session): Session SQLAlchemy.
+        nom (str): Nom de l'utilisateur.
+
+    Returns:
+        Optional[UserProjection]: La projection si l'utilisateur existe,
+        sinon None.
+    """
+    row = db.execute(
+        select(User.id, User.nom, User.email, User.pswd)
+        .where(User.nom == nom, User.deleted_at.is_(None))
+        .limit(1)
+    ).first()
+    return UserProjection(*row) if row is not None else None
+
+
+def get_active_users(db: Session) -> List[UserSummary]:
+    """
+    Récupère l'ensemble des utilisateurs actifs (non supprimés), par
+    ordre d'inscription, sans instancier d'objet ORM.
+
+    Args:
+        db (Session): Session SQLAlchemy.
+
+    Returns:
+        List[UserSummary]: Les projections des utilisateurs actifs.
+    """
+    rows = db.execute(
+        select(User.nom, User.email)
+        .where(User.deleted_at.is_(None))
+        .order_by(User.id)
+    )
+    return [UserSummary(nom, email) for nom, email in rows]
+
+
+def get_user_projections(
+    db: Session, noms: Iterable[str]
+) -> Dict[str, UserProjection]:
+    """
+    Récupère en une requête les projections de plusieurs utilisateurs
+    actifs.
+
+    Args:
+        db (Session): Session SQLAlchemy.
+        noms (Iterable[str]): Noms des utilisateurs.
+
+    Returns:
+        Dict[str, UserProjection]: Projections indexées par nom (les
+        utilisateurs inexistants sont absents).
+    """
+    noms = list(noms)
+    if not noms:
+        return {}
+    rows = db.execute(
+        select(User.id, User.nom, User.email, User.pswd).where(
+            User.nom.in_(noms), User.deleted_at.is_(None)
+        )
+    ).all()
+    return {row.nom: UserProjection(*row) for row in rows}
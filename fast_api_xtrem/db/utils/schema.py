@@ -0,0 +1,50 @@
+"""
+Mise à niveau du schéma des bases existantes.
+
+`create_all` ne crée que les tables absentes : une colonne ou un index
+ajouté à un modèle n'apparaît pas dans une base déjà créée.
+`upgrade_schema` ajoute les colonnes facultatives (nullables) manquantes
+par `ALTER TABLE` puis les index manquants, ce qui suffit aux évolutions
+additives du schéma.
+"""
+
+from sqlalchemy import inspect, text
+
+from fast_api_xtrem.db.base import Base
+
+
+def upgrade_schema(engine, logger) -> list:
+    """
+    Ajoute aux tables existantes les colonnes nullables et les index
+    déclarés par les modèles mais absents de la base.
+
+    Args:
+        engine: Moteur SQLAlchemy.
+        logger: Gestionnaire de logs.
+
+    Returns:
+        list: Colonnes ajoutées, sous la forme `table.colonne`.
+    """
+    inspector = inspect(engine)
+    added = []
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {table.name} "
+                        f"ADD COLUMN {column.name} {column_type}"
+                    )
+                )
+                added.append(f"{table.name}.{column.name}")
+            for index in table.indexes:
+                index.create(bind=connection, checkfirst=True)
+    for name in added:
+        logger.info(f"Colonne ajoutée au schéma : {name}")
+    return added
@@ -0,0 +1,216 @@
+"""
+Recherche plein texte des utilisateurs par nom ou email.
+
+Sous SQLite, une table virtuelle FTS5 `users_fts` (tokenizer trigram,
+recherche de sous-chaînes) indexe les colonnes `nom` et `email` de la
+table `users` ; des triggers la maintiennent synchronisée à chaque
+écriture. Sous PostgreSQL, l'extension `pg_trgm` et des index GIN jouent
+le même rôle. Les autres bases, et SQLite sans tokenizer trigram
+(versions antérieures à 3.34), se replient sur un parcours `LIKE`.
+
+Les utilisateurs supprimés logiquement (`deleted_at`) sont retirés de
+l'index par les triggers dès leur suppression.
+
+Les résultats sont classés par pertinence (une correspondance sur le nom
+pèse plus qu'une correspondance sur l'email) et paginés. Sous SQLite, le
+calcul du score (bm25) coûte par correspondance : un motif trop fréquent
+(`MAX_RANKED_MATCHES`) est paginé sans classement.
+"""
+
+import weakref
+from typing import List, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+# Longueur minimale d'un motif trigram ; en deçà, recherche par préfixe
+MIN_TRIGRAM_LENGTH = 3
+# Poids bm25 des colonnes (nom, email)
+NAME_WEIGHT, EMAIL_WEIGHT = 10.0, 1.0
+# Au-delà de ce nombre de correspondances, le motif est peu discriminant :
+# les résultats sont paginés dans l'ordre de la clé, sans calcul de score
+MAX_RANKED_MATCHES = 1000
+
+# Moteurs SQLite dont la version ne permet pas l'index FTS5 trigram
+_WITHOUT_FTS: "weakref.WeakSet" = weakref.WeakSet()
+
+_SQLITE_DDL = (
+    # Seuls les utilisateurs actifs sont indexés : une ligne absente de
+    # l'index ne doit jamais faire l'objet d'un 'delete'
+    "CREATE TRIGGER IF NOT EXISTS users_fts_ai AFTER INSERT ON users "
+    "WHEN new.deleted_at IS NULL "
+    "BEGIN INSERT INTO users_fts (rowid, nom, email) "
+    "VALUES (new.id, new.nom, new.email); END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_ad AFTER DELETE ON users "
+    "WHEN old.deleted_at IS NULL "
+    "BEGIN INSERT INTO users_fts (users_fts, rowid, nom, email) "
+    "VALUES ('delete', old.id, old.nom, old.email); END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_au "
+    "AFTER UPDATE OF nom, email, deleted_at ON users "
+    "BEGIN INSERT INTO users_fts (users_fts, rowid, nom, email) "
+    "SELECT 'delete', old.id, old.nom, old.email "
+    "WHERE old.deleted_at IS NULL; "
+    "INSERT INTO users_fts (rowid, nom, email) "
+    "SELECT new.id, new.nom, new.email WHERE new.deleted_at IS NULL; END",
+)
+
+_POSTGRES_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS users_nom_trgm "
+    "ON users USING gin (nom gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS users_email_trgm "
+    "ON users USING gin (email gin_trgm_ops)",
+)
+
+
+def install_search_index(engine, logger) -> None:
+    """
+    Crée l'index de recherche et ses triggers s'ils n'existent pas.
+
+    Lors de la création de la table FTS5, l'index est reconstruit à partir
+    des utilisateurs existants. Si SQLite ne fournit pas FTS5 ou le
+    tokenizer trigram, l'erreur est journalisée et la recherche se replie
+    sur `LIKE` pour ce moteur.
+
+    Args:
+        engine: Moteur SQLAlchemy.
+        logger: Gestionnaire de logs.
+    """
+    dialect = engine.dialect.name
+    if dialect == "sqlite":
+        try:
+            _install_sqlite_index(engine, logger)
+        except OperationalError as e:
+            _WITHOUT_FTS.add(engine)
+            logger.warning(
+                "Index de recherche indisponible (SQLite "
+                f"{engine.dialect.dbapi.sqlite_version}), recherche par "
+                f"LIKE : {e.orig}"
+            )
+    elif dialect == "postgresql":
+        with engine.begin() as connection:
+            for statement in _POSTGRES_DDL:
+                connection.execute(text(statement))
+    else:
+        logger.warning(
+            f"Recherche des utilisateurs sans index pour le dialecte {dialect}"
+        )
+
+
+def _install_sqlite_index(engine, logger) -> None:
+    """Crée la table FTS5 `users_fts` et ses triggers (SQLite)."""
+    created = not inspect(engine).has_table("users_fts")
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5("
+                "nom, email, content='users', content_rowid='id', "
+                "tokenize='trigram')"
+            )
+        )
+        for statement in _SQLITE_DDL:
+            connection.execute(text(statement))
+        if created:
+            # Classement par défaut (colonne `rank`) : bm25 pondéré
+            connection.execute(
+                text(
+                    "INSERT INTO users_fts (users_fts, rank) VALUES "
+                    f"('rank', 'bm25({NAME_WEIGHT}, {EMAIL_WEIGHT})')"
+                )
+            )
+            connection.execute(
+                text("INSERT INTO users_fts (users_fts) VALUES ('rebuild')")
+            )
+            # La reconstruction indexe toutes les lignes de `users`
+            connection.execute(
+                text(
+                    "INSERT INTO users_fts (users_fts, rowid, nom, email) "
+                    "SELECT 'delete', id, nom, email FROM users "
+                    "WHERE deleted_at IS NOT NULL"
+                )
+            )
+            logger.info("Index de recherche des utilisateurs construit")
+
+
+def _like_pattern(query: str, prefix_only: bool) -> str:
+    """Construit un motif LIKE en échappant les jokers."""
+    escaped = (
+        query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )
+    return f"{escaped}%" if prefix_only else f"%{escaped}%"
+
+
+def _sqlite_fts_statement(db: Session, match: str):
+    """
+    Construit la requête FTS5, classée par score si le motif est assez
+    discriminant, sinon dans l'ordre de la clé.
+    """
+    matches = db.execute(
+        text(
+            "SELECT count(*) FROM (SELECT 1 FROM users_fts "
+            "WHERE users_fts MATCH :match LIMIT :cap)"
+        ),
+        {"match": match, "cap": MAX_RANKED_MATCHES + 1},
+    ).scalar_one()
+    order = "rank" if matches <= MAX_RANKED_MATCHES else "rowid"
+    # Classement sur l'index seul, jointure limitée à la page
+    return text(
+        "SELECT u.nom, u.email FROM ("
+        f"SELECT rowid, {order} AS score FROM users_fts "
+        "WHERE users_fts MATCH :match "
+        f"ORDER BY {order} LIMIT :limit OFFSET :offset"
+        ") AS hits JOIN users u ON u.id = hits.rowid "
+        "WHERE u.deleted_at IS NULL "
+        "ORDER BY hits.score, u.id"
+    )
+
+
+def search_users(
+    db: Session, query: str, limit: int, offset: int = 0
+) -> List[Tuple[str, str]]:
+    """
+    Recherche les utilisateurs dont le nom ou l'email contient `query`.
+
+    Args:
+        db (Session): Session SQLAlchemy.
+        query (str): Texte recherché.
+        limit (int): Nombre maximal de résultats.
+        offset (int): Nombre de résultats à sauter.
+
+    Returns:
+        List[Tuple[str, str]]: Couples (nom, email), du plus pertinent
+        au moins pertinent.
+    """
+    bind = db.get_bind()
+    dialect = bind.dialect.name
+    params = {"limit": limit, "offset": offset}
+    indexed = dialect == "sqlite" and bind not in _WITHOUT_FTS
+    if indexed and len(query) >= MIN_TRIGRAM_LENGTH:
+        # Expression entre guillemets : pas d'interprétation de la
+        # syntaxe FTS5 (opérateurs, colonnes…) fournie par l'utilisateur
+        params["match"] = '"' + query.replace('"', '""') + '"'
+        statement = _sqlite_fts_statement(db, params["match"])
+    elif dialect == "postgresql":
+        params["query"] = query
+        params["pattern"] = _like_pattern(query, prefix_only=False)
+        statement = text(
+            "SELECT nom, email FROM users "
+            "WHERE (nom ILIKE :pattern OR email ILIKE :pattern) "
+            "AND deleted_at IS NULL "
+            "ORDER BY greatest(similarity(nom, :query) * 10, "
+            "similarity(email, :query)) DESC, id "
+            "LIMIT :limit OFFSET :offset"
+        )
+    else:
+        # Motif trop court pour les trigrammes (préfixe) ou base sans
+        # index (sous-chaîne) : parcours de table dans l'ordre de la clé,
+        # interrompu dès la page remplie
+        params["pattern"] = _like_pattern(query, prefix_only=indexed)
+        statement = text(
+            "SELECT nom, email FROM users "
+            "WHERE (nom LIKE :pattern ESCAPE '\\' "
+            "OR email LIKE :pattern ESCAPE '\\') AND deleted_at IS NULL "
+            "ORDER BY id LIMIT :limit OFFSET :offset"
+        )
+    return [tuple(row) for row in db.execute(statement, params)]
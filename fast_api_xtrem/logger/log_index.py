@@ -0,0 +1,410 @@
+"""
+Index binaire des logs de l'application FastAPI XTREM.
+
+Les fichiers de log texte sont compressés à la rotation : retrouver
+« les connexions échouées de X depuis une heure » imposerait de les
+décompresser et de les parcourir. Lorsque `log_index_enabled` est actif,
+chaque message est aussi indexé sous forme d'un enregistrement de taille
+fixe (horodatage, niveau, type d'événement, utilisateur) :
+- `LogIndexSink` : sink loguru écrivant les enregistrements dans des
+  segments projetés en mémoire (mmap), sans appel système par message ;
+- `query_index` : recherche par intervalle de temps (recherche
+  dichotomique dans chaque segment), puis filtrage par niveau,
+  événement et utilisateur.
+
+Le type d'événement et l'utilisateur proviennent des champs `event` et
+`user` liés au message (`LoggerManager.error(..., event=..., user=...)`).
+Les types d'événement, fixés par le code, sont stockés une fois dans une
+table de symboles. Les noms d'utilisateur, eux, peuvent être choisis par
+un client (connexion échouée d'un nom inconnu) : seule leur empreinte de
+32 bits est indexée, de taille fixe, et la recherche compare l'empreinte
+du nom demandé. Le nom n'est donc restitué que lorsqu'il est recherché.
+
+Organisation sur disque (`logs/index/<pid>/`) : chaque processus écrit
+dans son propre répertoire, un fichier de symboles (`symbols.txt`, une
+chaîne par ligne, identifiant = numéro de ligne) et des segments
+`<horodatage du premier enregistrement>.idx` :
+- en-tête : signature, version, nombre d'enregistrements valides ;
+- enregistrements de 16 octets, triés par horodatage.
+
+`prune_segments` ne supprime jamais un segment incomplet d'un processus
+encore en vie (segment peut-être en cours d'écriture, dont la date de
+modification ne suit pas les écritures par mmap), et retire les
+répertoires vidés des processus terminés.
+"""
+
+import bisect
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+MAGIC = b"FXLI"
+VERSION = 2
+HEADER = struct.Struct("<4sHHQ")
+# Horodatage (µs), niveau, type d'événement, empreinte de l'utilisateur
+RECORD = struct.Struct("<qBxHI")
+TIMESTAMP = struct.Struct("<q")
+SEGMENT_SUFFIX = ".idx"
+SYMBOLS_FILE = "symbols.txt"
+
+# Niveaux standard de loguru (le niveau est indexé par son numéro)
+LEVEL_NAMES = {
+    5: "TRACE",
+    10: "DEBUG",
+    20: "INFO",
+    25: "SUCCESS",
+    30: "WARNING",
+    40: "ERROR",
+    50: "CRITICAL",
+}
+
+
+class IndexRecord(NamedTuple):
+    """
+    Enregistrement de l'index, symboles résolus (`user` n'est renseigné
+    que pour une recherche par utilisateur).
+    """
+
+    timestamp: float
+    level: str
+    event: Optional[str]
+    user: Optional[str]
+
+
+class _Symbols:
+    """Table des types d'événement d'un répertoire d'index (0 = absence)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.names: List[str] = [""]
+        self.ids: Dict[str, int] = {}
+        if path.exists():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                self.ids[line] = len(self.names)
+                self.names.append(line)
+
+    def name(self, symbol_id: int) -> Optional[str]:
+        if 0 < symbol_id < len(self.names):
+            return self.names[symbol_id]
+        return None
+
+    def intern(self, value: Optional[str], limit: int) -> int:
+        """Identifiant de la chaîne, ajoutée au fichier si nouvelle."""
+        if not value:
+            return 0
+        value = str(value).replace("\n", " ")
+        symbol_id = self.ids.get(value)
+        if symbol_id is None:
+            if len(self.names) > limit:
+                return 0
+            with self.path.open("a", encoding="utf-8") as file:
+                file.write(value + "\n")
+            symbol_id = self.ids[value] = len(self.names)
+            self.names.append(value)
+        return symbol_id
+
+
+def user_fingerprint(user: Optional[str]) -> int:
+    """Empreinte de 32 bits d'un nom d'utilisateur (0 = absence)."""
+    if not user:
+        return 0
+    digest = hashlib.blake2b(str(user).encode("utf-8"), digest_size=4)
+    return int.from_bytes(digest.digest(), "little") or 1
+
+
+class _Timestamps:
+    """Vue des horodatages d'un segment, pour `bisect`."""
+
+    def __init__(self, buffer, count: int) -> None:
+        self.buffer = buffer
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> int:
+        offset = HEADER.size + index * RECORD.size
+        return TIMESTAMP.unpack_from(self.buffer, offset)[0]
+
+
+def _segment_count(buffer) -> int:
+    """Nombre d'enregistrements valides d'un segment."""
+    magic, version, _, count = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        return 0
+    capacity = (len(buffer) - HEADER.size) // RECORD.size
+    return min(count, capacity)
+
+
+class LogIndexSink:
+    """
+    Sink loguru alimentant l'index binaire.
+
+    Le segment courant est préalloué et projeté en mémoire : indexer un
+    message revient à copier 16 octets puis à incrémenter le compteur de
+    l'en-tête, ce qui rend l'enregistrement visible des lecteurs.
+    """
+
+    def __init__(
+        self,
+        index_dir: Path,
+        segment_records: int,
+        max_symbols: int = 10_000,
+    ) -> None:
+        """
+        Args:
+            index_dir (Path): Répertoire racine de l'index.
+            segment_records (int): Capacité d'un segment.
+            max_symbols (int): Nombre maximal de types d'événement
+                distincts ; au-delà, les nouveaux ne sont pas indexés.
+        """
+        self.directory = Path(index_dir) / str(os.getpid())
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_records = segment_records
+        self.max_symbols = max_symbols
+        self.symbols = _Symbols(self.directory / SYMBOLS_FILE)
+        self.active_path: Optional[Path] = None
+        self._lock = threading.Lock()
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._count = 0
+        self._closed = False
+        self._last = self._last_timestamp()
+
+    def _last_timestamp(self) -> int:
+        """Dernier horodatage écrit par un processus de même pid."""
+        segments = sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+        if not segments:
+            return 0
+        with segments[-1].open("rb") as file:
+            data = file.read()
+        count = _segment_count(data) if len(data) >= HEADER.size else 0
+        if not count:
+            return int(segments[-1].stem)
+        return _Timestamps(data, count)[count - 1]
+
+    def __call__(self, message) -> None:
+        """Indexe un message (appelé par loguru)."""
+        record = message.record
+        extra = record["extra"]
+        timestamp = int(record["time"].timestamp() * 1_000_000)
+        with self._lock:
+            if self._closed:
+                return
+            # Ordre croissant garanti pour la recherche dichotomique
+            timestamp = max(timestamp, self._last)
+            self._last = timestamp
+            if self._map is None or self._count >= self.segment_records:
+                self._open_segment(timestamp)
+            RECORD.pack_into(
+                self._map,
+                HEADER.size + self._count * RECORD.size,
+                timestamp,
+                min(record["level"].no, 255),
+                self.symbols.intern(extra.get("event"), self.max_symbols),
+                user_fingerprint(extra.get("user")),
+            )
+            self._count += 1
+            HEADER.pack_into(self._map, 0, MAGIC, VERSION, 0, self._count)
+
+    def _open_segment(self, timestamp: int) -> None:
+        """Ferme le segment courant et en préalloue un nouveau."""
+        self._close_segment()
+        path = self.directory / f"{timestamp:020d}{SEGMENT_SUFFIX}"
+        while path.exists():
+            # Redémarrage sous le même pid : ne jamais écraser un segment
+            timestamp += 1
+            path = self.directory / f"{timestamp:020d}{SEGMENT_SUFFIX}"
+        size = HEADER.size + self.segment_records * RECORD.size
+        self._file = path.open("w+b")
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        HEADER.pack_into(self._map, 0, MAGIC, VERSION, 0, 0)
+        self._count = 0
+        self.active_path = path
+
+    def _close_segment(self) -> None:
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._file.close()
+        self._map = None
+        self._file = None
+        self.active_path = None
+
+    def close(self) -> None:
+        """Écrit le segment courant sur disque et le ferme."""
+        with self._lock:
+            self._closed = True
+            self._close_segment()
+
+
+def _scan_segment(
+    path: Path, since: int, until: int, level: int, event: int, user: int
+) -> List[tuple]:
+    """Enregistrements d'un segment dans [since, until], filtrés."""
+    with path.open("rb") as file:
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Fichier vide
+            return []
+    with buffer:
+        count = _segment_count(buffer)
+        timestamps = _Timestamps(buffer, count)
+        if not count or timestamps[0] > until or timestamps[count - 1] < since:
+            return []
+        start = HEADER.size + RECORD.size * bisect.bisect_left(
+            timestamps, since
+        )
+        end = HEADER.size + RECORD.size * bisect.bisect_right(
+            timestamps, until
+        )
+        data = buffer[start:end]
+    return [
+        record
+        for record in RECORD.iter_unpack(data)
+        if record[1] >= level
+        and (not event or record[2] == event)
+        and (not user or record[3] == user)
+    ]
+
+
+def query_index(
+    index_dir: Path,
+    since: float,
+    until: float,
+    level: int = 0,
+    event: Optional[str] = None,
+    user: Optional[str] = None,
+    limit: int = 100,
+) -> dict:
+    """
+    Recherche dans l'index, du plus récent au plus ancien.
+
+    Args:
+        index_dir (Path): Répertoire racine de l'index.
+        since (float): Début de l'intervalle (timestamp POSIX).
+        until (float): Fin de l'intervalle (timestamp POSIX).
+        level (int): Niveau minimal (numéro loguru).
+        event (Optional[str]): Type d'événement recherché.
+        user (Optional[str]): Utilisateur recherché.
+        limit (int): Nombre maximal d'enregistrements.
+
+    Returns:
+        dict: Enregistrements (`IndexRecord`) et indicateur de troncature.
+    """
+    since_us = int(since * 1_000_000)
+    until_us = int(until * 1_000_000)
+    user_id = user_fingerprint(user)
+    index_dir = Path(index_dir)
+    writers = index_dir.iterdir() if index_dir.is_dir() else ()
+    merged = []
+    for directory in sorted(p for p in writers if p.is_dir()):
+        symbols = _Symbols(directory / SYMBOLS_FILE)
+        event_id = symbols.ids.get(event, -1) if event else 0
+        if event_id < 0:
+            continue
+        records: List[tuple] = []
+        # Segments du plus récent au plus ancien, jusqu'à `limit` + 1
+        for path in sorted(directory.glob(f"*{SEGMENT_SUFFIX}"), reverse=True):
+            start = int(path.stem)
+            if start > until_us:
+                continue
+            records[:0] = _scan_segment(
+                path, since_us, until_us, level, event_id, user_id
+            )
+            # Les segments précédents sont antérieurs à `start`
+            if len(records) > limit or start < since_us:
+                break
+        merged.append(
+            [
+                IndexRecord(
+                    r[0] / 1_000_000,
+                    LEVEL_NAMES.get(r[1], str(r[1])),
+                    symbols.name(r[2]),
+                    user or None,
+                )
+                for r in reversed(records)
+            ]
+        )
+    results = list(
+        heapq.merge(*merged, key=lambda r: r.timestamp, reverse=True)
+    )
+    return {"records": results[:limit], "truncated": len(results) > limit}
+
+
+def _pid_alive(pid: int) -> bool:
+    """
+    Indique si un processus est (peut-être) en vie. Sans vérification
+    portable hors POSIX, il est supposé en vie.
+    """
+    if pid == os.getpid() or os.name != "posix":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _is_partial(path: Path) -> bool:
+    """Indique si un segment n'a pas atteint sa capacité."""
+    with path.open("rb") as file:
+        data = file.read(HEADER.size)
+    if len(data) < HEADER.size:
+        # En-tête pas encore écrit
+        return True
+    magic, version, _, count = HEADER.unpack(data)
+    if magic != MAGIC or version != VERSION:
+        return False
+    capacity = (path.stat().st_size - HEADER.size) // RECORD.size
+    return count < capacity
+
+
+def prune_segments(index_dir: Path, cutoff: float, keep=()) -> int:
+    """
+    Supprime les segments modifiés pour la dernière fois avant `cutoff`
+    (timestamp POSIX), hors segments en cours d'écriture : ceux de `keep`
+    et les segments incomplets d'un processus en vie. Le répertoire d'un
+    processus terminé est retiré, avec ses symboles, une fois vide.
+
+    Returns:
+        int: Nombre de segments supprimés.
+    """
+    index_dir = Path(index_dir)
+    if not index_dir.is_dir():
+        return 0
+    removed = 0
+    for directory in index_dir.iterdir():
+        if not directory.is_dir():
+            continue
+        alive = not directory.name.isdigit() or _pid_alive(int(directory.name))
+        remaining = 0
+        for path in directory.glob(f"*{SEGMENT_SUFFIX}"):
+            try:
+                if (
+                    path in keep
+                    or path.stat().st_mtime >= cutoff
+                    or (alive and _is_partial(path))
+                ):
+                    remaining += 1
+                    continue
+                path.unlink()
+                removed += 1
+            except OSError:
+                remaining += 1
+        if not alive and not remaining:
+            try:
+                (directory / SYMBOLS_FILE).unlink(missing_ok=True)
+                directory.rmdir()
+            except OSError:
+                continue
+    return removed
@@ -4,14 +4,115 @@ Module de gestion des logs pour l'application FastAPI XTREM.
 Ce module fournit une implémentation de gestionnaire de logs utilisant Loguru
 avec un pattern singleton. Il offre des méthodes statiques pour enregistrer
 différents niveaux de logs ainsi qu'un décorateur pour capturer les exceptions.
+
+Lorsque `log_queue_size` est positif, l'écriture du fichier de log passe par
+une file bornée (`QueuedSink`) vidée par un thread dédié : les requêtes ne
+subissent plus les entrées/sorties disque, et la profondeur de la file
+mesure la pression exercée sur le sink.
+
+Lorsque `log_index_enabled` est actif, chaque message est aussi indexé
+(`LogIndexSink`) ; les méthodes de log acceptent des champs liés au
+message (`event`, `user`) qui alimentent cet index.
 """
 
+import queue
 import sys
+import threading
+import time
 from pathlib import Path
+from typing import Optional
 
 from loguru import logger
 
 from fast_api_xtrem.app.config import LoggerConfig
+from fast_api_xtrem.logger.log_index import LogIndexSink, prune_segments
+
+# Marqueur des messages déjà formatés, réémis par le thread d'écriture
+QUEUED_EXTRA = "_queued"
+
+
+class QueuedSink:
+    """
+    Sink loguru non bloquant : les messages formatés sont placés dans une
+    file bornée, puis réémis vers le sink fichier par un thread dédié.
+
+    Lorsque la file est pleine, les messages sont abandonnés et comptés
+    plutôt que de bloquer l'appelant.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Args:
+            maxsize (int): Capacité de la file.
+        """
+        self.capacity = maxsize
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._thread = threading.Thread(
+            target=self._run, name="log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __call__(self, message) -> None:
+        """Reçoit un message formaté de loguru (thread appelant)."""
+        try:
+            self._queue.put_nowait((message.record["level"].name, message))
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        """Boucle du thread d'écriture."""
+        writer = logger.opt(raw=True).bind(**{QUEUED_EXTRA: True})
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                level, text = item
+                writer.log(level, str(text))
+            finally:
+                self._queue.task_done()
+
+    @property
+    def depth(self) -> int:
+        """Nombre de messages en attente d'écriture."""
+        return self._queue.qsize()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Attend l'écriture des messages en file.
+
+        Args:
+            timeout (float): Délai maximal d'attente (secondes).
+
+        Returns:
+            bool: True si la file a été entièrement vidée.
+        """
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Vide la file puis arrête le thread d'écriture."""
+        self.flush(timeout)
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+
+def _bind(fields: dict):
+    """
+    Logger loguru portant les champs fournis (`event`, `user`), lus
+    notamment par l'index binaire des logs.
+    """
+    return logger.bind(**fields) if fields else logger
 
 
 class LoggerManager:
@@ -24,6 +125,10 @@ class LoggerManager:
 
     _instance = None
     _logs_dir: Path = None
+    _queued_sink: Optional[QueuedSink] = None
+    _index_sink: Optional[LogIndexSink] = None
+    _level_no: int = 0
+    _log_file_name: str = ""
 
     def __new__(cls, config: LoggerConfig) -> "LoggerManager":
         """Implémente le pattern singleton."""
@@ -40,6 +145,8 @@ class LoggerManager:
 
         Utile pour les tests ou la réinitialisation manuelle.
         """
+        if cls._instance is not None:
+            cls._instance.shutdown()
         cls._instance = None
 
     def _initialize(self, config: LoggerConfig) -> None:
@@ -57,23 +164,52 @@ class LoggerManager:
             self._logs_dir.mkdir(parents=True, exist_ok=True)
 
             log_path = self._logs_dir / config.log_file_name
+            self._log_file_name = config.log_file_name
 
             # Suppression des handlers précédents
             logger.remove()
 
+            # Niveau appliqué par filtre : modifiable à chaud (set_level)
+            self._level_no = logger.level(config.log_level.upper()).no
+
+            def accepts(record) -> bool:
+                return record["level"].no >= self._level_no and not record[
+                    "extra"
+                ].get(QUEUED_EXTRA, False)
+
             # Log vers la console (coloré)
-            logger.add(sys.stderr, level=config.log_level)
+            logger.add(sys.stderr, level=0, filter=accepts)
+
+            file_options = {
+                "rotation": config.log_rotation,
+                "retention": config.log_retention,
+                "compression": config.log_compression,
+                "level": 0,
+                "filter": accepts,
+                "encoding": config.log_encoding,
+                "colorize": False,
+            }
+            if config.log_queue_size > 0:
+                # Formatage dans l'appelant, écriture dans le thread dédié
+                self._queued_sink = QueuedSink(config.log_queue_size)
+                logger.add(
+                    self._queued_sink, level=0, colorize=False, filter=accepts
+                )
+                file_options["filter"] = lambda r: r["extra"].get(
+                    QUEUED_EXTRA, False
+                )
 
             # Log vers le fichier (non coloré)
-            logger.add(
-                str(log_path),
-                rotation=config.log_rotation,
-                retention=config.log_retention,
-                compression=config.log_compression,
-                level=config.log_level,
-                encoding=config.log_encoding,
-                colorize=False,
-            )
+            logger.add(str(log_path), **file_options)
+
+            if config.log_index_enabled:
+                self._index_sink = LogIndexSink(
+                    self._logs_dir / "index", config.log_index_segment_records
+                )
+                # Seul l'enregistrement est lu : formatage minimal
+                logger.add(
+                    self._index_sink, level=0, format="", filter=accepts
+                )
 
             logger.info("Logger initialized with config from AppConfig.")
         except Exception as e:
@@ -90,30 +226,129 @@ class LoggerManager:
         """
         return self._logs_dir
 
+    @property
+    def index_dir(self) -> Optional[Path]:
+        """
+        Retourne le répertoire de l'index binaire des logs.
+
+        Returns:
+            Optional[Path] : Répertoire de l'index, None s'il est désactivé.
+        """
+        if self._index_sink is None:
+            return None
+        return self._logs_dir / "index"
+
+    def prune_archives(self, max_age_seconds: float) -> int:
+        """
+        Supprime les archives de logs (fichiers issus de la rotation), les
+        profils et les segments de l'index plus anciens que
+        `max_age_seconds`.
+
+        Le fichier de log et le segment d'index courants ne sont jamais
+        supprimés.
+
+        Args:
+            max_age_seconds (float): Âge maximal conservé.
+
+        Returns:
+            int: Nombre de fichiers supprimés.
+        """
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for directory in (self._logs_dir, self._logs_dir / "profiles"):
+            if not directory.is_dir():
+                continue
+            for path in directory.iterdir():
+                if not path.is_file() or path.name == self._log_file_name:
+                    continue
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                        removed += 1
+                except OSError:
+                    continue
+        active = getattr(self._index_sink, "active_path", None)
+        removed += prune_segments(
+            self._logs_dir / "index", cutoff, keep={active}
+        )
+        return removed
+
+    def set_level(self, level: str) -> None:
+        """
+        Modifie à chaud le niveau minimal des logs.
+
+        Args:
+            level (str): Nouveau niveau (ex. "DEBUG").
+
+        Raises:
+            ValueError: Si le niveau est inconnu de loguru.
+        """
+        self._level_no = logger.level(level.upper()).no
+
+    def backlog(self) -> dict:
+        """
+        Retourne l'état de la file d'écriture du fichier de log.
+
+        Returns:
+            dict : Profondeur, capacité et messages abandonnés
+            (tous nuls en écriture directe).
+        """
+        sink = self._queued_sink
+        if sink is None:
+            return {"depth": 0, "capacity": 0, "dropped": 0}
+        return {
+            "depth": sink.depth,
+            "capacity": sink.capacity,
+            "dropped": sink.dropped,
+        }
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Attend l'écriture des messages en attente.
+
+        Args:
+            timeout (float): Délai maximal d'attente (secondes).
+
+        Returns:
+            bool: True si tous les messages ont été écrits.
+        """
+        if self._queued_sink is None:
+            return True
+        return self._queued_sink.flush(timeout)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Vide la file d'écriture et arrête son thread."""
+        if self._queued_sink is not None:
+            self._queued_sink.stop(timeout)
+            self._queued_sink = None
+        if self._index_sink is not None:
+            self._index_sink.close()
+            self._index_sink = None
+
     @staticmethod
-    def info(message: str) -> None:
-        """Log un message d'information."""
-        logger.info(message)
+    def info(message: str, **fields) -> None:
+        """Log un message d'information (champs liés : voir `_bind`)."""
+        _bind(fields).info(message)
 
     @staticmethod
-    def error(message: str) -> None:
-        """Log un message d'erreur."""
-        logger.error(message)
+    def error(message: str, **fields) -> None:
+        """Log un message d'erreur (champs liés : voir `_bind`)."""
+        _bind(fields).error(message)
 
     @staticmethod
-    def success(message: str) -> None:
-        """Log un message de succès."""
-        logger.success(message)
+    def success(message: str, **fields) -> None:
+        """Log un message de succès (champs liés : voir `_bind`)."""
+        _bind(fields).success(message)
 
     @staticmethod
-    def debug(message: str) -> None:
-        """Log un message de debug."""
-        logger.debug(message)
+    def debug(message: str, **fields) -> None:
+        """Log un message de debug (champs liés : voir `_bind`)."""
+        _bind(fields).debug(message)
 
     @staticmethod
-    def warning(message: str) -> None:
-        """Log un message d'avertissement."""
-        logger.warning(message)
+    def warning(message: str, **fields) -> None:
+        """Log un message d'avertissement (champs liés : voir `_bind`)."""
+        _bind(fields).warning(message)
 
     @staticmethod
     def catch(*args, **kwargs) -> callable:
@@ -5,16 +5,15 @@ Ce fichier contient la fonction factory pour créer l'application,
 ainsi que le point d'entrée pour exécuter l'application.
 
 Il initialise les configurations nécessaires
-et lance l'application via Uvicorn.
+et lance le serveur ASGI choisi par `NetworkConfig` (voir `launcher.py`).
 """
 
 import os
 import sys
 
-from uvicorn import run
-
 from fast_api_xtrem.app.application import Application
-from fast_api_xtrem.app.config import AppConfig
+from fast_api_xtrem.app.config_loader import load_config
+from fast_api_xtrem.app.launcher import serve
 
 # Add the project root to the Python path
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -25,18 +24,18 @@ def create_app() -> Application:
     """
     Fonction factory pour créer l'application.
 
+    La configuration est lue depuis le fichier TOML désigné par
+    FAST_API_XTREM_CONFIG et les variables FAST_API_XTREM__*.
+
     Returns:
         Application: Instance de l'application.
     """
-    config = AppConfig()
+    config = load_config()
 
     return Application(config)
 
 
 # Point d'entrée principal
 if __name__ == "__main__":
-    app = create_app()
-    # Lancement de l'application via Uvicorn
-    host = app.config.network_config.host
-    port = app.config.network_config.port
-    run(app.fast_api, host=host, port=port)
+    # Lancement du serveur : les workers importent `fast_api_xtrem.asgi`
+    serve(load_config())
@@ -0,0 +1,245 @@
+"""
+Contrôle d'admission des requêtes de l'application FastAPI XTREM.
+
+Une rafale de connexions (vérification coûteuse du mot de passe) ou de
+listes d'utilisateurs peut occuper tous les threads et le pool de
+connexions, au point que les routes légères n'obtiennent plus de
+réponse. Les routes sont donc réparties en groupes (`AdmissionConfig`) :
+- `AdmissionController` : service limitant, par groupe, le nombre de
+  requêtes simultanées ; les requêtes en excès attendent dans une file
+  bornée, puis sont rejetées si aucune place ne se libère à temps ;
+- `AdmissionMiddleware` : middleware ASGI rejetant les requêtes non
+  admises (HTTP 503 avec `Retry-After`) sans les exécuter.
+
+Les limites sont propres au worker.
+"""
+
+import asyncio
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from starlette.responses import JSONResponse
+
+from fast_api_xtrem.app.config import AdmissionConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.middleware.routes import route_matches
+
+DEFAULT_GROUP = "default"
+
+
+class _Group:
+    """Requêtes en cours et en attente d'un groupe de routes."""
+
+    __slots__ = ("name", "limit", "queue_size", "active", "waiters")
+
+    def __init__(self, name: str, limit: int, queue_size: int) -> None:
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.active = 0
+        self.waiters: deque = deque()
+
+
+def _parse_groups(specs: tuple) -> Dict[str, _Group]:
+    """
+    Construit les groupes décrits par "nom:simultanées:en attente".
+
+    Raises:
+        ValueError: Si une description est invalide.
+    """
+    groups = {}
+    for spec in specs:
+        try:
+            name, limit, queue_size = spec.split(":")
+            group = _Group(name.strip(), int(limit), int(queue_size))
+        except ValueError as e:
+            raise ValueError(f"Groupe d'admission invalide : {spec!r}") from e
+        if not group.name or group.limit < 1 or group.queue_size < 0:
+            raise ValueError(f"Groupe d'admission invalide : {spec!r}")
+        groups[group.name] = group
+    return groups
+
+
+class AdmissionController:
+    """Limites de concurrence et files d'attente, par groupe de routes."""
+
+    def __init__(
+        self, config: AdmissionConfig, metrics: MetricsRegistry
+    ) -> None:
+        """
+        Args:
+            config (AdmissionConfig): Configuration de l'admission.
+            metrics (MetricsRegistry): Registre des métriques.
+
+        Raises:
+            ValueError: Si un groupe ou une route est mal décrit.
+        """
+        self.config = config
+        self.metrics = metrics
+        self.groups = _parse_groups(config.groups)
+        self._routes: List[Tuple[str, _Group]] = []
+        for spec in config.routes:
+            name, _, route = spec.partition("=")
+            if name not in self.groups or not route:
+                raise ValueError(f"Route d'admission invalide : {spec!r}")
+            self._routes.append((route, self.groups[name]))
+        for group in self.groups.values():
+            self._publish(group)
+
+    def group_for(self, method: str, path: str) -> Optional[_Group]:
+        """
+        Retourne le groupe de la route, ou None si elle n'est pas limitée
+        (route exemptée, ou absence de groupe "default").
+
+        Args:
+            method (str): Méthode HTTP.
+            path (str): Chemin de la requête.
+        """
+        if any(
+            route_matches(route, method, path)
+            for route in self.config.exempt_routes
+        ):
+            return None
+        for route, group in self._routes:
+            if route_matches(route, method, path):
+                return group
+        return self.groups.get(DEFAULT_GROUP)
+
+    async def acquire(self, group: _Group) -> bool:
+        """
+        Réserve une place dans le groupe, en attendant au plus
+        `queue_timeout_seconds` si toutes sont occupées.
+
+        Args:
+            group (_Group): Groupe de la route.
+
+        Returns:
+            bool: True si la requête est admise ; elle doit alors libérer
+            sa place (`release`).
+        """
+        if group.active < group.limit and not group.waiters:
+            group.active += 1
+            self._admit(group)
+            return True
+        if len(group.waiters) >= group.queue_size:
+            self._shed(group, "queue_full")
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        group.waiters.append(future)
+        self._publish(group)
+        try:
+            await asyncio.wait_for(future, self.config.queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            self._give_back(group, future)
+            self._shed(group, "timeout")
+            return False
+        except asyncio.CancelledError:
+            # Client déconnecté
+            self._give_back(group, future)
+            raise
+        self._admit(group)
+        return True
+
+    def _give_back(self, group: _Group, future: asyncio.Future) -> None:
+        """
+        Abandonne une attente : rend la place si elle venait d'être
+        transmise (`release` dans la même itération de la boucle que
+        l'expiration ou l'annulation), sinon quitte la file.
+        """
+        if future.done() and not future.cancelled():
+            self.release(group)
+        else:
+            self._discard(group, future)
+
+    def release(self, group: _Group) -> None:
+        """
+        Libère une place, transmise directement au premier en attente.
+
+        Args:
+            group (_Group): Groupe de la route.
+        """
+        while group.waiters:
+            future = group.waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                self._publish(group)
+                return
+        group.active -= 1
+        self._publish(group)
+
+    def _discard(self, group: _Group, future: asyncio.Future) -> None:
+        """Retire une attente abandonnée de la file."""
+        try:
+            group.waiters.remove(future)
+        except ValueError:
+            pass
+        self._publish(group)
+
+    def _admit(self, group: _Group) -> None:
+        """Comptabilise une requête admise."""
+        self.metrics.increment("admission_admitted_total", group=group.name)
+        self._publish(group)
+
+    def _shed(self, group: _Group, reason: str) -> None:
+        """Comptabilise une requête rejetée."""
+        self.metrics.increment(
+            "admission_shed_total", group=group.name, reason=reason
+        )
+
+    def _publish(self, group: _Group) -> None:
+        """Publie les requêtes en cours et la profondeur de file."""
+        self.metrics.set_gauge(
+            "admission_in_flight", group.active, group=group.name
+        )
+        self.metrics.set_gauge(
+            "admission_queue_depth", len(group.waiters), group=group.name
+        )
+
+
+class AdmissionMiddleware:
+    """
+    Middleware ASGI appliquant `AdmissionController` aux requêtes HTTP.
+
+    Le contrôleur est récupéré à l'exécution dans `app.state.services`,
+    celui-ci n'étant créé qu'au démarrage de l'application.
+    """
+
+    def __init__(self, app) -> None:
+        """
+        Args:
+            app: Application ASGI suivante dans la chaîne.
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        services = getattr(scope["app"].state, "services", None)
+        controller: Optional[AdmissionController] = getattr(
+            services, "admission", None
+        )
+        if controller is None or not controller.config.enabled:
+            await self.app(scope, receive, send)
+            return
+        group = controller.group_for(scope["method"], scope["path"])
+        if group is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await controller.acquire(group):
+            response = JSONResponse(
+                {"detail": "Erreur : serveur saturé, réessayez plus tard"},
+                status_code=503,
+                headers={
+                    "Retry-After": str(controller.config.retry_after_seconds)
+                },
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release(group)
@@ -0,0 +1,68 @@
+"""
+Lecture et rejeu du corps des requêtes dans les middlewares ASGI.
+
+Un middleware qui inspecte le corps (limitation de débit, idempotence)
+le lit intégralement, dans la limite d'une taille maximale, puis
+transmet à l'application un `receive` qui le rejoue.
+"""
+
+from starlette.responses import JSONResponse
+
+
+class BodyTooLargeError(Exception):
+    """Corps de requête dépassant la taille autorisée."""
+
+
+def too_large_response() -> JSONResponse:
+    """Réponse 413 au format des routes de l'application."""
+    return JSONResponse(
+        {"detail": "Erreur : corps de requête trop volumineux"},
+        status_code=413,
+    )
+
+
+async def read_body(receive, max_bytes: int, headers=None) -> bytes:
+    """
+    Lit l'intégralité du corps de la requête, sans dépasser `max_bytes`.
+
+    Args:
+        receive: Canal `receive` ASGI.
+        max_bytes (int): Taille maximale du corps (octets).
+        headers (Optional[dict]): En-têtes de la requête ; un
+            `Content-Length` excessif est refusé avant toute lecture.
+
+    Raises:
+        BodyTooLargeError: Si le corps dépasse `max_bytes` ; la lecture
+            s'arrête dès le dépassement.
+    """
+    declared = (headers or {}).get(b"content-length", b"")
+    if declared.isdigit() and int(declared) > max_bytes:
+        raise BodyTooLargeError()
+    chunks = []
+    size = 0
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > max_bytes:
+            raise BodyTooLargeError()
+        chunks.append(chunk)
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+def replay_body(body: bytes, receive):
+    """Construit un `receive` qui rejoue le corps déjà lu."""
+    sent = False
+
+    async def replay():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
@@ -0,0 +1,215 @@
+"""
+Stockage des compteurs à fenêtre glissante pour la limitation de débit.
+
+Chaque clé (adresse IP, nom d'utilisateur…) est représentée par un triplet
+compact `(index_de_fenêtre, compteur_courant, compteur_précédent)`.
+Le nombre de tentatives sur la dernière fenêtre est estimé en pondérant le
+compteur de la fenêtre précédente par la part de celle-ci encore couverte
+par la fenêtre glissante.
+
+Deux implémentations sont fournies :
+- `MemoryCounterStore` : dictionnaire borné en mémoire, propre au worker ;
+- `SQLiteCounterStore` : fichier SQLite partagé entre plusieurs workers.
+"""
+
+import math
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+CounterState = Tuple[int, int, int]
+
+
+class HitResult(NamedTuple):
+    """Résultat d'une tentative comptabilisée sur une clé."""
+
+    allowed: bool
+    retry_after: int
+    estimated: float
+
+
+def evaluate_hit(
+    state: Optional[CounterState], now: float, window: float, limit: int
+) -> Tuple[CounterState, HitResult]:
+    """
+    Applique une tentative à l'état d'une clé.
+
+    Une tentative refusée n'est pas comptabilisée, afin qu'un client
+    bloqué ne prolonge pas lui-même son blocage.
+
+    Args:
+        state (Optional[CounterState]): État courant de la clé.
+        now (float): Horodatage courant (secondes).
+        window (float): Durée de la fenêtre (secondes).
+        limit (int): Nombre maximal de tentatives par fenêtre.
+
+    Returns:
+        Tuple[CounterState, HitResult]: Nouvel état et décision.
+    """
+    index = int(now // window)
+    elapsed = now - index * window
+    current, previous = 0, 0
+    if state is not None:
+        last_index, last_current, last_previous = state
+        if last_index == index:
+            current, previous = last_current, last_previous
+        elif last_index == index - 1:
+            previous = last_current
+
+    weight = 1.0 - elapsed / window
+    estimated = previous * weight + current
+    if estimated + 1 <= limit:
+        new_state = (index, current + 1, previous)
+        return new_state, HitResult(True, 0, estimated + 1)
+
+    if current + 1 > limit:
+        # Attendre la fenêtre suivante, puis que l'actuelle s'estompe
+        fade = window * (1.0 - (limit - 1) / max(current, 1))
+        wait = (window - elapsed) + max(fade, 0.0)
+    else:
+        fade = window * (1.0 - (limit - current - 1) / previous)
+        wait = fade - elapsed
+    retry_after = max(1, math.ceil(wait))
+    return (index, current, previous), HitResult(False, retry_after, estimated)
+
+
+class CounterStore:
+    """Interface commune des stockages de compteurs."""
+
+    def hit(
+        self, key: str, now: float, window: float, limit: int
+    ) -> HitResult:
+        """
+        Comptabilise atomiquement une tentative sur une clé.
+
+        Args:
+            key (str): Clé du compteur.
+            now (float): Horodatage courant.
+            window (float): Durée de la fenêtre (secondes).
+            limit (int): Nombre maximal de tentatives par fenêtre.
+
+        Returns:
+            HitResult: Décision pour la tentative.
+        """
+        raise NotImplementedError
+
+    def purge_stale(self, now: float, window: float) -> int:
+        """
+        Supprime les compteurs dont les deux fenêtres sont révolues.
+
+        Args:
+            now (float): Horodatage courant.
+            window (float): Durée de la fenêtre (secondes).
+
+        Returns:
+            int: Nombre de compteurs supprimés.
+        """
+        return 0
+
+    def close(self) -> None:
+        """Libère les ressources du stockage."""
+
+
+class MemoryCounterStore(CounterStore):
+    """
+    Stockage en mémoire, borné en nombre de clés.
+
+    Les clés les moins récemment utilisées sont évincées au-delà de
+    `max_keys`, ce qui borne la mémoire face à un balayage d'adresses.
+    """
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        """
+        Initialise le stockage.
+
+        Args:
+            max_keys (int): Nombre maximal de clés conservées.
+        """
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._states: "OrderedDict[str, CounterState]" = OrderedDict()
+
+    def hit(
+        self, key: str, now: float, window: float, limit: int
+    ) -> HitResult:
+        """Comptabilise une tentative (voir `CounterStore.hit`)."""
+        with self._lock:
+            state, result = evaluate_hit(
+                self._states.get(key), now, window, limit
+            )
+            self._states[key] = state
+            self._states.move_to_end(key)
+            while len(self._states) > self.max_keys:
+                self._states.popitem(last=False)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+class SQLiteCounterStore(CounterStore):
+    """
+    Stockage partagé entre workers via un fichier SQLite.
+
+    Chaque tentative est évaluée dans une transaction `BEGIN IMMEDIATE`,
+    ce qui sérialise les mises à jour concurrentes des différents processus.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialise le stockage et crée la table si nécessaire.
+
+        Args:
+            path (str): Chemin du fichier SQLite partagé.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS rate_counters ("
+            "key TEXT PRIMARY KEY, window_index INTEGER NOT NULL, "
+            "current INTEGER NOT NULL, previous INTEGER NOT NULL)"
+        )
+
+    def hit(
+        self, key: str, now: float, window: float, limit: int
+    ) -> HitResult:
+        """Comptabilise une tentative (voir `CounterStore.hit`)."""
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                row = cursor.execute(
+                    "SELECT window_index, current, previous "
+                    "FROM rate_counters WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                state, result = evaluate_hit(row, now, window, limit)
+                cursor.execute(
+                    "INSERT OR REPLACE INTO rate_counters "
+                    "(key, window_index, current, previous) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, *state),
+                )
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+        return result
+
+    def purge_stale(self, now: float, window: float) -> int:
+        """Supprime les compteurs révolus (voir `CounterStore`)."""
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM rate_counters WHERE window_index < ?",
+                (int(now // window) - 1,),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Ferme la connexion SQLite."""
+        self._connection.close()
@@ -0,0 +1,350 @@
+"""
+Clés d'idempotence des routes d'écriture de l'application FastAPI XTREM.
+
+Un client qui renvoie une requête d'écriture (nouvel essai après une
+erreur réseau, réexécution d'un script Streamlit) avec le même en-tête
+`Idempotency-Key` reçoit la réponse de la première exécution :
+- `IdempotencyStore` : service conservant les réponses dans un cache
+  borné à durée de vie (`TTLCache`) et regroupant les doublons
+  concurrents (un seul exécute la requête, les autres attendent sa
+  réponse) ;
+- `IdempotencyMiddleware` : middleware ASGI appliquant ce service avant
+  toute résolution de dépendance, de sorte qu'un rejeu ne touche ni la
+  base ni le calcul d'empreinte du mot de passe.
+
+Une clé est propre à la route et au client (en-tête `Authorization`, ou
+adresse du client pour une écriture anonyme, et, en mode
+multi-organisation, en-tête d'organisation) ;
+réutilisée avec un autre corps, elle est refusée (422). Les erreurs
+serveur (5xx) ne sont pas conservées : la requête peut être rejouée.
+Le stockage est propre au worker.
+"""
+
+import asyncio
+import hashlib
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from starlette.responses import JSONResponse
+
+from fast_api_xtrem.app.config import IdempotencyConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.cache.lru import MISSING, TTLCache
+from fast_api_xtrem.middleware.body import (
+    BodyTooLargeError,
+    read_body,
+    replay_body,
+    too_large_response,
+)
+from fast_api_xtrem.middleware.routes import route_matches
+
+REPLAY_HEADER = (b"idempotent-replayed", b"true")
+
+
+class StoredResponse(NamedTuple):
+    """Réponse conservée pour une clé d'idempotence."""
+
+    fingerprint: str
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+
+
+class _InFlight:
+    """Exécution en cours d'une requête, attendue par ses doublons."""
+
+    __slots__ = ("fingerprint", "done")
+
+    def __init__(self, fingerprint: str) -> None:
+        self.fingerprint = fingerprint
+        self.done = asyncio.Event()
+
+
+class IdempotencyStore:
+    """Réponses conservées et exécutions en cours, par clé d'idempotence."""
+
+    def __init__(
+        self, config: IdempotencyConfig, metrics: MetricsRegistry
+    ) -> None:
+        """
+        Args:
+            config (IdempotencyConfig): Configuration de l'idempotence.
+            metrics (MetricsRegistry): Registre des métriques.
+        """
+        self.config = config
+        self.metrics = metrics
+        self.responses = TTLCache(config.max_entries, config.ttl_seconds)
+        self._in_flight: Dict[tuple, _InFlight] = {}
+
+    def configure(self, config: IdempotencyConfig) -> None:
+        """
+        Applique une nouvelle configuration (rechargement à chaud).
+
+        Args:
+            config (IdempotencyConfig): Nouvelle configuration.
+        """
+        self.config = config
+        self.responses.ttl = config.ttl_seconds
+        self.responses.resize(config.max_entries)
+
+    def matches(self, method: str, path: str) -> bool:
+        """
+        Indique si la route accepte une clé d'idempotence.
+
+        Les routes sont décrites par « MÉTHODE chemin » (voir
+        `route_matches`).
+
+        Args:
+            method (str): Méthode HTTP.
+            path (str): Chemin de la requête.
+
+        Returns:
+            bool: True si la route est concernée.
+        """
+        return any(
+            route_matches(route, method, path) for route in self.config.routes
+        )
+
+    @staticmethod
+    def request_key(
+        method: str, path: str, authorization: bytes, key: str
+    ) -> tuple:
+        """
+        Construit la clé de stockage : route, client et clé fournie.
+
+        Le jeton d'authentification n'est conservé que sous forme
+        d'empreinte.
+        """
+        client = hashlib.sha256(authorization).hexdigest()
+        return (method, path, client, key)
+
+    def lookup(self, request_key: tuple):
+        """
+        Retourne la réponse conservée, l'exécution en cours ou `MISSING`.
+        """
+        stored = self.responses.get(request_key)
+        if stored is not MISSING:
+            return stored
+        return self._in_flight.get(request_key, MISSING)
+
+    def begin(self, request_key: tuple, fingerprint: str) -> _InFlight:
+        """Enregistre l'exécution d'une requête."""
+        in_flight = _InFlight(fingerprint)
+        self._in_flight[request_key] = in_flight
+        return in_flight
+
+    def finish(
+        self,
+        request_key: tuple,
+        in_flight: _InFlight,
+        response: Optional[StoredResponse],
+    ) -> None:
+        """
+        Termine une exécution : conserve sa réponse si elle est
+        rejouable, puis réveille les doublons en attente.
+
+        Args:
+            request_key (tuple): Clé de stockage.
+            in_flight (_InFlight): Exécution terminée.
+            response (Optional[StoredResponse]): Réponse envoyée, ou None
+                si l'exécution a échoué.
+        """
+        if (
+            response is not None
+            and response.status < 500
+            and len(response.body) <= self.config.max_body_bytes
+        ):
+            self.responses.set(request_key, response)
+            self.metrics.increment("idempotency_responses_stored_total")
+        self._in_flight.pop(request_key, None)
+        in_flight.done.set()
+
+
+def _error(message: str, status_code: int, **headers) -> JSONResponse:
+    """Réponse d'erreur au format des routes de l'application."""
+    return JSONResponse(
+        {"detail": f"Erreur : {message}"},
+        status_code=status_code,
+        headers=headers or None,
+    )
+
+
+class IdempotencyMiddleware:
+    """
+    Middleware ASGI appliquant `IdempotencyStore` aux routes d'écriture.
+
+    Le service est récupéré à l'exécution dans `app.state.services`,
+    celui-ci n'étant créé qu'au démarrage de l'application.
+    """
+
+    def __init__(self, app) -> None:
+        """
+        Args:
+            app: Application ASGI suivante dans la chaîne.
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["method"] == "GET":
+            await self.app(scope, receive, send)
+            return
+
+        services = getattr(scope["app"].state, "services", None)
+        store: Optional[IdempotencyStore] = getattr(
+            services, "idempotency", None
+        )
+        if (
+            store is None
+            or not store.config.enabled
+            or not store.matches(scope["method"], scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        header_name = store.config.header_name.lower().encode("latin-1")
+        raw_key = headers.get(header_name)
+        if raw_key is None:
+            await self.app(scope, receive, send)
+            return
+        key = raw_key.decode("latin-1").strip()
+        if not key or len(key) > store.config.max_key_length:
+            response = _error("clé d'idempotence invalide", 400)
+            await response(scope, receive, send)
+            return
+
+        try:
+            body = await read_body(
+                receive, store.config.max_request_bytes, headers
+            )
+        except BodyTooLargeError:
+            await too_large_response()(scope, receive, send)
+            return
+        fingerprint = hashlib.sha256(body).hexdigest()
+        client = headers.get(b"authorization")
+        if client is None:
+            # Écriture anonyme : l'adresse du client distingue les appelants
+            address = scope["client"][0] if scope.get("client") else ""
+            client = b"client:" + address.encode("latin-1")
+        database_config = getattr(
+            getattr(services, "config", None), "database_config", None
+        )
+        if database_config is not None and database_config.tenancy_enabled:
+            tenant_header = database_config.tenant_header.lower()
+            client += b"\n" + headers.get(tenant_header.encode("latin-1"), b"")
+        request_key = store.request_key(
+            scope["method"], scope["path"], client, key
+        )
+        response = await self._replay_or_wait(store, request_key, fingerprint)
+        if response is not None:
+            await response(scope, receive, send)
+            return
+
+        await self._execute(
+            store,
+            request_key,
+            fingerprint,
+            scope,
+            replay_body(body, receive),
+            send,
+        )
+
+    @staticmethod
+    async def _replay_or_wait(
+        store: IdempotencyStore, request_key: tuple, fingerprint: str
+    ):
+        """
+        Rejoue la réponse conservée, après avoir attendu l'exécution d'un
+        doublon concurrent si nécessaire.
+
+        Returns:
+            Une application ASGI répondant à la requête, ou None si la
+            requête doit être exécutée.
+        """
+        waited = False
+        while True:
+            entry = store.lookup(request_key)
+            if entry is MISSING:
+                # Première exécution, ou exécution précédente en échec
+                return None
+            if entry.fingerprint != fingerprint:
+                store.metrics.increment(
+                    "idempotency_requests_total", result="conflict"
+                )
+                return _error(
+                    "clé d'idempotence déjà utilisée pour une autre requête",
+                    422,
+                )
+            if isinstance(entry, StoredResponse):
+                store.metrics.increment(
+                    "idempotency_requests_total",
+                    result="coalesced" if waited else "replayed",
+                )
+                return _StoredResponseApp(entry)
+            waited = True
+            try:
+                await asyncio.wait_for(
+                    entry.done.wait(), store.config.wait_timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                store.metrics.increment(
+                    "idempotency_requests_total", result="timeout"
+                )
+                return _error(
+                    "requête identique en cours, réessayez plus tard",
+                    409,
+                    **{"Retry-After": "1"},
+                )
+
+    async def _execute(
+        self,
+        store: IdempotencyStore,
+        request_key: tuple,
+        fingerprint: str,
+        scope,
+        receive,
+        send,
+    ) -> None:
+        """Exécute la requête en capturant sa réponse."""
+        store.metrics.increment(
+            "idempotency_requests_total", result="executed"
+        )
+        in_flight = store.begin(request_key, fingerprint)
+        start: dict = {}
+        chunks: List[bytes] = []
+
+        async def capture(message) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        response = None
+        try:
+            await self.app(scope, receive, capture)
+            if start:
+                response = StoredResponse(
+                    fingerprint,
+                    start["status"],
+                    list(start.get("headers", [])),
+                    b"".join(chunks),
+                )
+        finally:
+            store.finish(request_key, in_flight, response)
+
+
+class _StoredResponseApp:
+    """Application ASGI renvoyant une réponse conservée."""
+
+    def __init__(self, stored: StoredResponse) -> None:
+        self.stored = stored
+
+    async def __call__(self, scope, receive, send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.stored.status,
+                "headers": self.stored.headers + [REPLAY_HEADER],
+            }
+        )
+        await send({"type": "http.response.body", "body": self.stored.body})
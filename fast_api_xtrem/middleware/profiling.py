@@ -0,0 +1,379 @@
+"""
+Profilage à la demande des requêtes de l'application FastAPI XTREM.
+
+- `SamplingProfiler` : échantillonne, à intervalle fixe, les piles
+  d'appels de la requête (`sys._current_frames`) : celle de la boucle
+  d'événements lorsqu'elle exécute la tâche de la requête, et celles des
+  threads exécutant ses appels `asyncio.to_thread` (lectures en base,
+  attente du verrou SQLite…) ;
+- `ProfilingExecutor` : exécuteur par défaut de la boucle, qui rattache
+  ces appels à l'échantillonneur de la requête (variable de contexte) ;
+- `RequestProfiler` : service décidant quelles requêtes profiler (en-tête
+  secret, taux d'échantillonnage ou armement par l'endpoint d'admin) et
+  enregistrant les profils sous `logs_dir/profiles`, aux formats
+  speedscope (JSON) et « collapsed stacks » (flame graphs) ;
+- `ProfilingMiddleware` : middleware ASGI appliquant ce service.
+
+Lorsque le profilage est désactivé, le middleware se réduit à un test
+booléen par requête. Un seul profil est capturé à la fois. Ne sont pas
+capturés : le code exécuté dans d'autres tâches asyncio que celle de la
+requête (tâches qu'elle crée, comme une lecture regroupée), sauf leurs
+appels `asyncio.to_thread`, ni les threads d'exécution de Starlette
+(dépendances et routes synchrones).
+"""
+
+import asyncio
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from fast_api_xtrem.app.config import ProfilingConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+
+# Échantillonneur de la requête en cours (copié par `asyncio.to_thread`)
+ACTIVE_SAMPLER: ContextVar[Optional["SamplingProfiler"]] = ContextVar(
+    "active_sampler", default=None
+)
+
+
+class SamplingProfiler:
+    """Échantillonneur des piles d'appels d'une requête."""
+
+    def __init__(
+        self,
+        thread_id: int,
+        interval: float,
+        task: Optional[asyncio.Task] = None,
+    ) -> None:
+        """
+        Args:
+            thread_id (int): Identifiant du thread à échantillonner (celui
+                de la boucle d'événements).
+            interval (float): Intervalle d'échantillonnage (secondes).
+            task (Optional[asyncio.Task]): Tâche de la requête ; la pile
+                du thread n'est retenue que lorsqu'il l'exécute.
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.task = task
+        self._loop = task.get_loop() if task is not None else None
+        # Threads exécutant un appel `to_thread` de la requête
+        self._workers: Counter = Counter()
+        self._workers_lock = threading.Lock()
+        self.samples: Counter = Counter()
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="profiler", daemon=True
+        )
+        self._started_at = 0.0
+
+    def start(self) -> None:
+        """Démarre l'échantillonnage."""
+        self._started_at = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Arrête l'échantillonnage."""
+        self._stop.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self._started_at
+
+    def track(self, func, *args, **kwargs):
+        """Exécute `func` en échantillonnant le thread courant."""
+        ident = threading.get_ident()
+        with self._workers_lock:
+            self._workers[ident] += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._workers_lock:
+                self._workers[ident] -= 1
+                if not self._workers[ident]:
+                    del self._workers[ident]
+
+    def _threads(self) -> list:
+        """Threads à échantillonner à cet instant."""
+        with self._workers_lock:
+            threads = list(self._workers)
+        # La boucle n'est retenue que lorsqu'elle exécute la requête
+        if self.task is None or (
+            asyncio.current_task(self._loop) is self.task
+        ):
+            threads.append(self.thread_id)
+        return threads
+
+    def _run(self) -> None:
+        """Boucle d'échantillonnage."""
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()  # pylint: disable=W0212
+            for thread_id in self._threads():
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(
+                        (code.co_name, code.co_filename, frame.f_lineno)
+                    )
+                    frame = frame.f_back
+                if stack:
+                    self.samples[tuple(reversed(stack))] += 1
+
+    def to_collapsed(self) -> str:
+        """
+        Sérialise les échantillons au format « collapsed stacks »
+        (une pile par ligne, cadres séparés par `;`, suivie du nombre
+        d'échantillons), lisible par flamegraph.pl et speedscope.
+
+        Returns:
+            str: Contenu du fichier.
+        """
+        lines = []
+        for stack, count in self.samples.most_common():
+            frames = ";".join(
+                f"{name} ({Path(file).name}:{line})"
+                for name, file, line in stack
+            )
+            lines.append(f"{frames} {count}")
+        return "\n".join(lines) + "\n"
+
+    def to_speedscope(self, name: str) -> dict:
+        """
+        Sérialise les échantillons au format speedscope (profil « sampled »).
+
+        Args:
+            name (str): Nom du profil.
+
+        Returns:
+            dict: Document JSON speedscope.
+        """
+        frames, index = [], {}
+        samples, weights = [], []
+        for stack, count in self.samples.items():
+            indices = []
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    func, file, line = frame
+                    frames.append({"name": func, "file": file, "line": line})
+                indices.append(index[frame])
+            samples.append(indices)
+            weights.append(count * self.interval)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": "fast_api_xtrem",
+            "name": name,
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+
+class ProfilingExecutor(ThreadPoolExecutor):
+    """
+    Exécuteur par défaut de la boucle d'événements (`asyncio.to_thread`) :
+    un appel soumis pendant une requête profilée est échantillonné.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        # Appelé depuis la boucle, dans le contexte de la tâche appelante
+        sampler = ACTIVE_SAMPLER.get()
+        if sampler is None:
+            return super().submit(fn, *args, **kwargs)
+        return super().submit(sampler.track, fn, *args, **kwargs)
+
+
+class RequestProfiler:
+    """Service de sélection et d'enregistrement des profils de requêtes."""
+
+    def __init__(
+        self, config: ProfilingConfig, metrics: MetricsRegistry, logs_dir: Path
+    ) -> None:
+        """
+        Args:
+            config (ProfilingConfig): Configuration du profilage.
+            metrics (MetricsRegistry): Registre des métriques.
+            logs_dir (Path): Répertoire des logs (profils dans `profiles/`).
+        """
+        self.config = config
+        self.metrics = metrics
+        self.output_dir = logs_dir / "profiles"
+        self._armed = 0
+        self._armed_prefix = ""
+        self._busy = False
+
+    @property
+    def active(self) -> bool:
+        """Indique si un déclencheur de profilage est configuré ou armé."""
+        return self.config.enabled and (
+            bool(self.config.header_token)
+            or self.config.sample_rate > 0
+            or self._armed > 0
+        )
+
+    def arm(self, count: int, path_prefix: str = "") -> None:
+        """
+        Arme le profilage des `count` prochaines requêtes.
+
+        Args:
+            count (int): Nombre de requêtes à profiler.
+            path_prefix (str): Préfixe de chemin filtrant les requêtes.
+        """
+        self._armed = count
+        self._armed_prefix = path_prefix
+
+    def status(self) -> dict:
+        """Retourne l'état courant du profilage."""
+        return {
+            "enabled": self.config.enabled,
+            "armed": self._armed,
+            "path_prefix": self._armed_prefix,
+            "sample_rate": self.config.sample_rate,
+            "output_dir": str(self.output_dir),
+        }
+
+    def should_profile(self, path: str, header: Optional[str]) -> bool:
+        """
+        Décide si la requête doit être profilée, et réserve le profileur.
+
+        Args:
+            path (str): Chemin de la requête.
+            header (Optional[str]): Valeur de l'en-tête de déclenchement.
+
+        Returns:
+            bool: True si la requête doit être profilée.
+        """
+        if self._busy:
+            return False
+        token = self.config.header_token
+        selected = bool(token) and header == token
+        if not selected and self._armed > 0:
+            if path.startswith(self._armed_prefix):
+                self._armed -= 1
+                selected = True
+        if not selected and self.config.sample_rate > 0:
+            selected = random.random() < self.config.sample_rate
+        self._busy = selected
+        return selected
+
+    def start(self) -> SamplingProfiler:
+        """Démarre un échantillonneur sur la tâche et le thread courants."""
+        profiler = SamplingProfiler(
+            threading.get_ident(),
+            self.config.interval_ms / 1000,
+            asyncio.current_task(),
+        )
+        profiler.start()
+        return profiler
+
+    @staticmethod
+    def profile_id(method: str, path: str) -> str:
+        """
+        Construit l'identifiant (nom de fichier) d'un profil.
+
+        Args:
+            method (str): Méthode HTTP.
+            path (str): Chemin de la requête.
+
+        Returns:
+            str: Identifiant horodaté.
+        """
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        slug = path.strip("/").replace("/", "_") or "root"
+        return f"{stamp}_{method}_{slug}"
+
+    def finish(self, profiler: SamplingProfiler, profile_id: str, name: str):
+        """
+        Arrête l'échantillonneur et prépare l'écriture du profil.
+
+        Args:
+            profiler (SamplingProfiler): Échantillonneur à arrêter.
+            profile_id (str): Identifiant du profil.
+            name (str): Libellé du profil (méthode et chemin).
+
+        Returns:
+            Callable: Fonction d'écriture, à exécuter hors de la boucle
+            d'événements.
+        """
+        profiler.stop()
+        self._busy = False
+        self.metrics.increment("profiles_captured_total")
+
+        def write() -> None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            base = self.output_dir / profile_id
+            base.with_suffix(".collapsed").write_text(
+                profiler.to_collapsed(), encoding="utf-8"
+            )
+            base.with_suffix(".speedscope.json").write_text(
+                json.dumps(profiler.to_speedscope(name)),
+                encoding="utf-8",
+            )
+
+        return write
+
+
+class ProfilingMiddleware:
+    """Middleware ASGI profilant les requêtes sélectionnées."""
+
+    def __init__(self, app) -> None:
+        """
+        Args:
+            app: Application ASGI suivante dans la chaîne.
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        services = getattr(scope["app"].state, "services", None)
+        profiler: Optional[RequestProfiler] = getattr(
+            services, "profiler", None
+        )
+        if scope["type"] != "http" or profiler is None or not profiler.active:
+            await self.app(scope, receive, send)
+            return
+
+        header_name = profiler.config.header_name.lower().encode("latin-1")
+        header = dict(scope["headers"]).get(header_name)
+        if not profiler.should_profile(
+            scope["path"], header.decode("latin-1") if header else None
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = profiler.profile_id(scope["method"], scope["path"])
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", profile_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        sampler = profiler.start()
+        # Appels `asyncio.to_thread` de la requête rattachés au profil
+        token = ACTIVE_SAMPLER.set(sampler)
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            ACTIVE_SAMPLER.reset(token)
+            write = profiler.finish(
+                sampler, profile_id, f"{scope['method']} {scope['path']}"
+            )
+            await asyncio.to_thread(write)
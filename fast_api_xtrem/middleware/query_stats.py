@@ -0,0 +1,52 @@
+"""
+Middleware de mesure des requêtes SQL par requête HTTP.
+
+Chaque requête HTTP reçoit un `QueryStats` (variable de contexte) alimenté
+par l'instrumentation du moteur. À l'envoi de la réponse, le nombre de
+requêtes SQL et le temps passé en base sont ajoutés aux en-têtes
+`X-DB-Query-Count` et `X-DB-Time-Ms`, puis journalisés.
+"""
+
+from fast_api_xtrem.db.instrumentation import QueryStats, current_query_stats
+
+
+class QueryStatsMiddleware:
+    """Middleware ASGI publiant les statistiques SQL de chaque requête."""
+
+    def __init__(self, app) -> None:
+        """
+        Args:
+            app: Application ASGI suivante dans la chaîne.
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        services = getattr(scope["app"].state, "services", None)
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start" and stats.count:
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (b"x-db-query-count", str(stats.count).encode())
+                )
+                headers.append(
+                    (b"x-db-time-ms", f"{stats.total_ms:.3f}".encode())
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            current_query_stats.reset(token)
+            if stats.count and services is not None:
+                services.logger.debug(
+                    f"{scope['method']} {scope['path']} : {stats.count} "
+                    f"requête(s) SQL, {stats.total_ms:.3f} ms en base"
+                )
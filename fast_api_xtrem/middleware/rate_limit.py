@@ -0,0 +1,229 @@
+"""
+Limitation de débit des routes de connexion de l'application FastAPI XTREM.
+
+Les routes `/users/login` et `/users/token` déclenchent une vérification de
+mot de passe coûteuse. Ce module fournit :
+- `RateLimiter` : service appliquant des limites à fenêtre glissante par
+  adresse IP et par nom d'utilisateur ;
+- `RateLimitMiddleware` : middleware ASGI qui rejette les tentatives en
+  excès (HTTP 429 avec `Retry-After`) avant toute résolution de
+  dépendance, requête en base ou calcul d'empreinte ; un corps dépassant
+  `max_body_bytes` est refusé (HTTP 413) sans être lu en entier.
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs
+
+from starlette.responses import JSONResponse
+
+from fast_api_xtrem.app.config import RateLimitConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.middleware.body import (
+    BodyTooLargeError,
+    read_body,
+    replay_body,
+    too_large_response,
+)
+from fast_api_xtrem.middleware.counter_store import (
+    CounterStore,
+    HitResult,
+    MemoryCounterStore,
+    SQLiteCounterStore,
+)
+
+# Taille maximale de corps analysée pour extraire le nom d'utilisateur
+MAX_INSPECTED_BODY = 16 * 1024
+
+
+class RateLimiter:
+    """
+    Service de limitation des tentatives de connexion.
+
+    Une tentative est autorisée si elle respecte à la fois la limite de
+    l'adresse IP et celle du nom d'utilisateur visé.
+    """
+
+    def __init__(
+        self,
+        config: RateLimitConfig,
+        metrics: MetricsRegistry,
+        store: Optional[CounterStore] = None,
+        storage_dir: Optional[Path] = None,
+    ) -> None:
+        """
+        Initialise le limiteur.
+
+        Args:
+            config (RateLimitConfig): Configuration de la limitation.
+            metrics (MetricsRegistry): Registre des métriques.
+            store (Optional[CounterStore]): Stockage imposé (tests).
+            storage_dir (Optional[Path]): Répertoire du fichier partagé
+                lorsque `shared_store_path` est relatif.
+        """
+        self.config = config
+        self.metrics = metrics
+        self.store = store or self._create_store(config, storage_dir)
+
+    @staticmethod
+    def _create_store(
+        config: RateLimitConfig, storage_dir: Optional[Path]
+    ) -> CounterStore:
+        """Crée le stockage de compteurs correspondant au backend."""
+        if config.backend == "sqlite":
+            path = Path(config.shared_store_path)
+            if not path.is_absolute() and storage_dir is not None:
+                storage_dir.mkdir(parents=True, exist_ok=True)
+                path = storage_dir / path
+            return SQLiteCounterStore(str(path))
+        return MemoryCounterStore(max_keys=config.max_tracked_keys)
+
+    def check(
+        self, client_ip: str, username: Optional[str], path: str
+    ) -> HitResult:
+        """
+        Comptabilise une tentative et décide de son admission.
+
+        Args:
+            client_ip (str): Adresse IP du client.
+            username (Optional[str]): Nom d'utilisateur visé, si connu.
+            path (str): Route appelée (pour les métriques).
+
+        Returns:
+            HitResult: Décision ; `retry_after` est renseigné en cas de refus.
+        """
+        # Instantané : la configuration peut être remplacée à chaud
+        config = self.config
+        now = time.time()
+        window = config.window_seconds
+        result = self.store.hit(
+            f"ip:{client_ip}", now, window, config.max_attempts_per_ip
+        )
+        if not result.allowed:
+            self.metrics.increment(
+                "rate_limit_rejected_total", scope="ip", path=path
+            )
+            return result
+        if username:
+            result = self.store.hit(
+                f"user:{username}",
+                now,
+                window,
+                config.max_attempts_per_user,
+            )
+            if not result.allowed:
+                self.metrics.increment(
+                    "rate_limit_rejected_total", scope="user", path=path
+                )
+                return result
+        self.metrics.increment("rate_limit_allowed_total", path=path)
+        return result
+
+    def purge_stale(self) -> int:
+        """
+        Supprime les compteurs révolus du stockage partagé (le stockage
+        en mémoire est borné par éviction).
+
+        Returns:
+            int: Nombre de compteurs supprimés.
+        """
+        return self.store.purge_stale(time.time(), self.config.window_seconds)
+
+    def close(self) -> None:
+        """Ferme le stockage de compteurs."""
+        self.store.close()
+
+
+def extract_username(body: bytes, content_type: str) -> Optional[str]:
+    """
+    Extrait le nom d'utilisateur d'un corps JSON (`nom`) ou de formulaire
+    OAuth2 (`username`).
+
+    Args:
+        body (bytes): Corps brut de la requête.
+        content_type (str): En-tête Content-Type.
+
+    Returns:
+        Optional[str]: Nom d'utilisateur, ou None s'il est introuvable.
+    """
+    if not body or len(body) > MAX_INSPECTED_BODY:
+        return None
+    try:
+        if content_type.startswith("application/json"):
+            payload = json.loads(body)
+            username = payload.get("nom") if isinstance(payload, dict) else ""
+        else:
+            values = parse_qs(body.decode("utf-8"))
+            username = values.get("username", [""])[0]
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if not isinstance(username, str):
+        return None
+    return username.strip() or None
+
+
+class RateLimitMiddleware:
+    """
+    Middleware ASGI appliquant `RateLimiter` aux routes protégées.
+
+    Le limiteur est récupéré à l'exécution dans `app.state.services`,
+    celui-ci n'étant créé qu'au démarrage de l'application.
+    """
+
+    def __init__(self, app) -> None:
+        """
+        Args:
+            app: Application ASGI suivante dans la chaîne.
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        services = getattr(scope["app"].state, "services", None)
+        limiter: Optional[RateLimiter] = getattr(
+            services, "rate_limiter", None
+        )
+        path = scope["path"]
+        if (
+            limiter is None
+            or not limiter.config.enabled
+            or path not in limiter.config.protected_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        try:
+            body = await read_body(
+                receive, limiter.config.max_body_bytes, headers
+            )
+        except BodyTooLargeError:
+            await too_large_response()(scope, receive, send)
+            return
+        content_type = headers.get(b"content-type", b"").decode("latin-1")
+        client_ip = scope["client"][0] if scope.get("client") else "unknown"
+
+        # Le stockage partagé (SQLite) peut attendre son verrou : hors de
+        # la boucle d'événements
+        result = await asyncio.to_thread(
+            limiter.check,
+            client_ip,
+            extract_username(body, content_type),
+            path,
+        )
+        if not result.allowed:
+            response = JSONResponse(
+                {"detail": "Erreur : trop de tentatives, réessayez plus tard"},
+                status_code=429,
+                headers={"Retry-After": str(result.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, replay_body(body, receive), send)
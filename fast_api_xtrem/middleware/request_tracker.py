@@ -0,0 +1,83 @@
+"""
+Suivi des requêtes en cours pour l'arrêt progressif de l'application.
+
+- `RequestTracker` : service comptant les requêtes (et réponses en flux)
+  en cours, et refusant tout nouveau travail une fois le drain entamé ;
+- `RequestTrackingMiddleware` : middleware ASGI qui enregistre chaque
+  requête HTTP auprès du tracker, jusqu'à l'envoi complet de la réponse.
+"""
+
+from contextlib import contextmanager
+
+from starlette.responses import JSONResponse
+
+from fast_api_xtrem.app.metrics import MetricsRegistry
+
+# Sondes toujours servies, y compris pendant le drain
+EXEMPT_PREFIXES = ("/health",)
+
+
+class RequestTracker:
+    """Compteur des travaux en cours, utilisé pour le drain."""
+
+    def __init__(self, metrics: MetricsRegistry) -> None:
+        """
+        Args:
+            metrics (MetricsRegistry): Registre des métriques.
+        """
+        self.metrics = metrics
+        self.accepting = True
+        self.active = 0
+
+    @contextmanager
+    def track(self):
+        """
+        Contexte enregistrant un travail en cours (requête, export…).
+
+        Les travaux longs hors requête HTTP peuvent l'utiliser pour être
+        attendus lors de l'arrêt.
+        """
+        self.active += 1
+        self.metrics.set_gauge("requests_in_flight", self.active)
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self.metrics.set_gauge("requests_in_flight", self.active)
+
+    def stop_accepting(self) -> None:
+        """Refuse désormais tout nouveau travail."""
+        self.accepting = False
+
+
+class RequestTrackingMiddleware:
+    """Middleware ASGI enregistrant les requêtes auprès du tracker."""
+
+    def __init__(self, app) -> None:
+        """
+        Args:
+            app: Application ASGI suivante dans la chaîne.
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        services = getattr(scope["app"].state, "services", None)
+        tracker = getattr(services, "requests", None)
+        if scope["type"] != "http" or tracker is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not tracker.accepting and not scope["path"].startswith(
+            EXEMPT_PREFIXES
+        ):
+            tracker.metrics.increment("requests_rejected_draining_total")
+            response = JSONResponse(
+                {"detail": "Erreur : service en cours d'arrêt"},
+                status_code=503,
+                headers={"Retry-After": "1", "Connection": "close"},
+            )
+            await response(scope, receive, send)
+            return
+
+        with tracker.track():
+            await self.app(scope, receive, send)
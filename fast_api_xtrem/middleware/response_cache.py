@@ -0,0 +1,359 @@
+"""
+Cache des réponses des routes GET de l'application FastAPI XTREM.
+
+Les routes dont le résultat ne change qu'à l'écriture (`/`, `GET /users`,
+`/users/me`) sont déclarées avec le décorateur `cache_response` :
+- `ResponseCache` : service conservant les corps de réponse sérialisés,
+  par route, chaîne de requête normalisée, organisation (mode
+  multi-organisation) et, si la route en dépend, utilisateur
+  authentifié ; les entrées expirent après `ttl_seconds` et
+  la mémoire occupée est bornée (éviction LRU) ;
+- `ResponseCacheMiddleware` : middleware ASGI servant les réponses en
+  cache avant toute résolution de dépendance.
+
+Chaque entrée porte des étiquettes (`users:list`, `user:{nom}`…) ; les
+routes d'écriture invalident les étiquettes concernées (`users:*`
+invalide toutes les étiquettes de préfixe `users:`). L'invalidation est
+propre au worker : `ttl_seconds` borne la durée pendant laquelle un autre
+worker peut servir une réponse périmée.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import HTTPException
+
+from fast_api_xtrem.app.config import ResponseCacheConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.db.tenancy import InvalidTenantError
+from fast_api_xtrem.routes.security import decode_token
+from fast_api_xtrem.routes.tenancy import resolve_tenant
+
+POLICY_ATTRIBUTE = "__response_cache__"
+
+
+class CachePolicy(NamedTuple):
+    """Mise en cache d'une route : étiquettes et dépendance à l'appelant."""
+
+    tags: Tuple[str, ...]
+    per_user: bool
+
+
+def cache_response(*tags: str, per_user: bool = False) -> Callable:
+    """
+    Décorateur déclarant une route GET cachable (à placer sous le
+    décorateur de route).
+
+    Args:
+        *tags (str): Étiquettes d'invalidation ; `{subject}` est remplacé
+            par l'utilisateur authentifié.
+        per_user (bool): La réponse dépend de l'utilisateur authentifié
+            (token JWT) ; sans token valide, le cache n'est pas utilisé.
+
+    Returns:
+        Callable: Décorateur laissant la fonction inchangée.
+    """
+
+    def decorator(func):
+        setattr(func, POLICY_ATTRIBUTE, CachePolicy(tags, per_user))
+        return func
+
+    return decorator
+
+
+class _Entry(NamedTuple):
+    """Réponse conservée."""
+
+    expires_at: float
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    tags: Tuple[str, ...]
+    size: int
+
+
+class ResponseCache:
+    """Réponses sérialisées, indexées par requête et par étiquette."""
+
+    def __init__(
+        self,
+        config: ResponseCacheConfig,
+        metrics: MetricsRegistry,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            config (ResponseCacheConfig): Configuration du cache.
+            metrics (MetricsRegistry): Registre des métriques.
+            clock (Callable[[], float]): Horloge (remplaçable en test).
+        """
+        self.config = config
+        self.metrics = metrics
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, _Entry]" = OrderedDict()
+        self._tags: Dict[str, Set[tuple]] = {}
+        self._size = 0
+        # Incrémenté à chaque invalidation : une réponse calculée avant
+        # une écriture ne doit pas être conservée
+        self.epoch = 0
+
+    @property
+    def size(self) -> int:
+        """Mémoire occupée par les entrées (octets)."""
+        return self._size
+
+    def get(self, key: tuple) -> Optional[_Entry]:
+        """
+        Retourne la réponse non expirée associée à la clé, ou None.
+
+        Args:
+            key (tuple): Clé de la requête.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= self._clock():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(
+        self,
+        key: tuple,
+        status: int,
+        headers: List[Tuple[bytes, bytes]],
+        body: bytes,
+        tags: Tuple[str, ...],
+        epoch: int,
+    ) -> bool:
+        """
+        Conserve une réponse, sauf si une invalidation est survenue
+        depuis `epoch` ou si elle dépasse `max_entry_bytes`.
+
+        Returns:
+            bool: True si la réponse a été conservée.
+        """
+        size = len(body) + sum(len(k) + len(v) for k, v in headers)
+        if size > self.config.max_entry_bytes:
+            return False
+        entry = _Entry(
+            self._clock() + self.config.ttl_seconds,
+            status,
+            headers,
+            body,
+            tags,
+            size,
+        )
+        with self._lock:
+            if epoch != self.epoch:
+                return False
+            self._remove(key)
+            self._entries[key] = entry
+            self._size += size
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self._size > self.config.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+                self.metrics.increment("response_cache_evictions_total")
+            size = self._size
+        self.metrics.set_gauge("response_cache_bytes", size)
+        return True
+
+    def invalidate(self, *tags: str) -> int:
+        """
+        Supprime les réponses portant l'une des étiquettes ; une étiquette
+        terminée par `*` désigne toutes celles de même préfixe.
+
+        Args:
+            *tags (str): Étiquettes à invalider.
+
+        Returns:
+            int: Nombre de réponses supprimées.
+        """
+        removed = 0
+        with self._lock:
+            self.epoch += 1
+            for tag in tags:
+                if tag.endswith("*"):
+                    prefix = tag[:-1]
+                    matched = [t for t in self._tags if t.startswith(prefix)]
+                else:
+                    matched = [tag] if tag in self._tags else []
+                for name in matched:
+                    for key in list(self._tags.get(name, ())):
+                        self._remove(key)
+                        removed += 1
+            size = self._size
+        self.metrics.increment("response_cache_invalidations_total")
+        self.metrics.set_gauge("response_cache_bytes", size)
+        return removed
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            self.epoch += 1
+            self._entries.clear()
+            self._tags.clear()
+            self._size = 0
+        self.metrics.set_gauge("response_cache_bytes", 0)
+
+    def _remove(self, key: tuple) -> None:
+        """Supprime une entrée et ses étiquettes (verrou pris)."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._size -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+def normalize_query(query_string: bytes) -> str:
+    """Chaîne de requête aux paramètres triés (clé de cache)."""
+    if not query_string:
+        return ""
+    pairs = parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)
+    return urlencode(sorted(pairs))
+
+
+def _subject(headers: Dict[bytes, bytes]) -> Optional[str]:
+    """Utilisateur du token JWT de la requête, ou None s'il est invalide."""
+    authorization = headers.get(b"authorization", b"").decode("latin-1")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return decode_token(token).get("nom") or None
+    except HTTPException:
+        return None
+
+
+def _tenant(headers: Dict[bytes, bytes], config) -> Optional[str]:
+    """Organisation de la requête (voir `resolve_tenant`)."""
+    if not config.tenancy_enabled:
+        return None
+    header = config.tenant_header.lower().encode("latin-1")
+    return resolve_tenant(
+        headers.get(b"authorization", b"").decode("latin-1"),
+        headers.get(header, b"").decode("latin-1"),
+        config,
+    )
+
+
+class ResponseCacheMiddleware:
+    """
+    Middleware ASGI servant les routes déclarées par `cache_response`.
+
+    Le cache est récupéré à l'exécution dans `app.state.services`,
+    celui-ci n'étant créé qu'au démarrage de l'application.
+    """
+
+    def __init__(self, app) -> None:
+        """
+        Args:
+            app: Application ASGI suivante dans la chaîne.
+        """
+        self.app = app
+        self._policies: Optional[Dict[str, CachePolicy]] = None
+
+    def _policy(self, scope) -> Optional[CachePolicy]:
+        """Politique de la route appelée (table construite une fois)."""
+        if self._policies is None:
+            self._policies = {
+                route.path: getattr(route.endpoint, POLICY_ATTRIBUTE)
+                for route in scope["app"].routes
+                if hasattr(getattr(route, "endpoint", None), POLICY_ATTRIBUTE)
+                and "GET" in getattr(route, "methods", ())
+            }
+        return self._policies.get(scope["path"])
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        services = getattr(scope["app"].state, "services", None)
+        cache: Optional[ResponseCache] = getattr(
+            services, "response_cache", None
+        )
+        policy = self._policy(scope)
+        if cache is None or policy is None or not cache.config.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        headers = dict(scope["headers"])
+        subject = ""
+        if policy.per_user:
+            subject = _subject(headers)
+        try:
+            tenant = _tenant(headers, services.config.database_config)
+        except InvalidTenantError:
+            # Refusée par la route (400 ou 404)
+            subject = None
+        if subject is None:
+            cache.metrics.increment(
+                "response_cache_requests_total", path=path, result="bypass"
+            )
+            await self.app(scope, receive, send)
+            return
+        key = (
+            path,
+            normalize_query(scope.get("query_string", b"")),
+            subject,
+            tenant,
+        )
+
+        entry = cache.get(key)
+        if entry is not None:
+            cache.metrics.increment(
+                "response_cache_requests_total", path=path, result="hit"
+            )
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": entry.status,
+                    "headers": entry.headers + [(b"x-cache", b"hit")],
+                }
+            )
+            await send({"type": "http.response.body", "body": entry.body})
+            return
+
+        cache.metrics.increment(
+            "response_cache_requests_total", path=path, result="miss"
+        )
+        epoch = cache.epoch
+        start: dict = {}
+        chunks: List[bytes] = []
+
+        async def capture(message) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message)
+                message = {
+                    **message,
+                    "headers": list(message.get("headers", []))
+                    + [(b"x-cache", b"miss")],
+                }
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, receive, capture)
+        if start.get("status") == 200:
+            tags = tuple(tag.format(subject=subject) for tag in policy.tags)
+            cache.set(
+                key,
+                200,
+                list(start.get("headers", [])),
+                b"".join(chunks),
+                tags,
+                epoch,
+            )
@@ -0,0 +1,29 @@
+"""
+Description des routes dans la configuration des middlewares ASGI.
+
+Une route est décrite par « MÉTHODE chemin » (`POST /users`) ; la
+méthode `*` désigne toutes les méthodes et un `*` final remplace un
+segment de chemin (`PUT /users/*`).
+"""
+
+
+def route_matches(route: str, method: str, path: str) -> bool:
+    """
+    Indique si une requête correspond à la description d'une route.
+
+    Args:
+        route (str): Description « MÉTHODE chemin ».
+        method (str): Méthode HTTP de la requête.
+        path (str): Chemin de la requête.
+
+    Returns:
+        bool: True si la requête correspond.
+    """
+    route_method, _, pattern = route.partition(" ")
+    if route_method not in ("*", method):
+        return False
+    if pattern.endswith("/*"):
+        prefix = pattern[:-1]
+        segment = path.removeprefix(prefix)
+        return path.startswith(prefix) and bool(segment) and "/" not in segment
+    return path == pattern
@@ -0,0 +1,206 @@
+"""
+Routes d'administration de l'application FastAPI.
+
+Ces routes, protégées par le jeton d'administration, permettent de
+piloter à chaud les outils de diagnostic (profilage des requêtes), de
+recharger la configuration et de consulter le journal d'audit et l'index
+binaire des logs.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import BaseModel, conint
+
+from fast_api_xtrem.app.config_loader import ConfigError
+from fast_api_xtrem.logger.log_index import LEVEL_NAMES, query_index
+from fast_api_xtrem.routes.dependencies import get_services, require_admin
+
+router_admin = APIRouter(
+    prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)]
+)
+
+
+class ProfilingRequest(BaseModel):
+    """Demande d'armement du profilage."""
+
+    count: conint(ge=1, le=1000) = 1
+    path_prefix: str = ""
+
+
+@router_admin.get("/profiling")
+async def get_profiling(services=Depends(get_services)) -> dict:
+    """
+    Route GET retournant l'état du profilage des requêtes.
+
+    Returns:
+        dict: État courant (activation, requêtes armées, répertoire).
+    """
+    return services.profiler.status()
+
+
+@router_admin.post("/profiling")
+async def arm_profiling(
+    data: ProfilingRequest, services=Depends(get_services)
+) -> dict:
+    """
+    Route POST armant le profilage des prochaines requêtes.
+
+    Args:
+        data (ProfilingRequest): Nombre de requêtes et préfixe de chemin.
+
+    Returns:
+        dict: État du profilage après armement.
+    """
+    if not services.profiler.config.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Erreur : profilage désactivé dans la configuration",
+        )
+    services.profiler.arm(data.count, data.path_prefix)
+    services.logger.info(
+        f"Profilage armé pour {data.count} requête(s) "
+        f"({data.path_prefix or 'toutes routes'})"
+    )
+    return services.profiler.status()
+
+
+@router_admin.get("/scheduler")
+async def get_scheduler(services=Depends(get_services)) -> dict:
+    """
+    Route GET retournant l'état des tâches de maintenance.
+
+    Returns:
+        dict: Rôle de leader et dernière exécution de chaque tâche.
+    """
+    return services.scheduler.status()
+
+
+@router_admin.post("/config/reload")
+async def reload_config(services=Depends(get_services)) -> dict:
+    """
+    Route POST rechargeant la configuration (équivalent de SIGHUP).
+
+    Returns:
+        dict: Sections appliquées et réglages ignorés.
+    """
+    try:
+        return services.reload_config()
+    except ConfigError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Erreur : configuration invalide ({e})",
+        ) from e
+
+
+@router_admin.get("/audit")
+async def get_audit_events(
+    limit: int = Query(50, ge=1, le=500),
+    before_id: Optional[int] = Query(None, ge=1),
+    event_type: Optional[str] = None,
+    subject: Optional[str] = None,
+    tenant: Optional[str] = None,
+    services=Depends(get_services),
+) -> dict:
+    """
+    Route GET listant les événements d'audit, du plus récent au plus
+    ancien.
+
+    Le journal est lu dans la base principale, qui reçoit les événements
+    de toutes les organisations, et non dans celle de l'organisation de
+    la requête. La page suivante s'obtient en passant `next_before_id`
+    comme `before_id` (pagination par clé).
+
+    Args:
+        limit (int): Taille de la page.
+        before_id (Optional[int]): Curseur de la page précédente.
+        event_type (Optional[str]): Filtre sur le type d'événement.
+        subject (Optional[str]): Filtre sur l'utilisateur concerné.
+        tenant (Optional[str]): Filtre sur l'organisation.
+
+    Returns:
+        dict: Événements et curseur de la page suivante.
+    """
+
+    def read():
+        with services.db_manager.session_scope() as db:
+            return services.audit.query(
+                db, limit + 1, before_id, event_type, subject, tenant
+            )
+
+    events = await asyncio.to_thread(read)
+    has_more = len(events) > limit
+    events = events[:limit]
+    return {
+        "events": events,
+        "next_before_id": events[-1]["id"] if has_more else None,
+    }
+
+
+@router_admin.get("/logs/index")
+async def query_log_index(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    level: Optional[str] = None,
+    event: Optional[str] = None,
+    user: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    services=Depends(get_services),
+) -> dict:
+    """
+    Route GET interrogeant l'index binaire des logs, du plus récent au
+    plus ancien.
+
+    Args:
+        since (Optional[datetime]): Début de l'intervalle (défaut : une
+            heure avant `until`).
+        until (Optional[datetime]): Fin de l'intervalle (défaut : maintenant).
+        level (Optional[str]): Niveau minimal (ex. "ERROR").
+        event (Optional[str]): Type d'événement (ex. "login_failed").
+        user (Optional[str]): Utilisateur concerné.
+        limit (int): Nombre maximal d'enregistrements.
+
+    Returns:
+        dict: Enregistrements et indicateur de troncature.
+    """
+    index_dir = services.logger.index_dir
+    if index_dir is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Erreur : index des logs désactivé dans la configuration",
+        )
+    levels = {name: number for number, name in LEVEL_NAMES.items()}
+    if level is not None and level.upper() not in levels:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Erreur : niveau de log inconnu",
+        )
+    end = until.timestamp() if until else time.time()
+    start = since.timestamp() if since else end - 3600
+    result = await asyncio.to_thread(
+        query_index,
+        index_dir,
+        start,
+        end,
+        levels[level.upper()] if level else 0,
+        event,
+        user,
+        limit,
+    )
+    return {
+        "records": [
+            {
+                "timestamp": datetime.fromtimestamp(record.timestamp)
+                .astimezone()
+                .isoformat(),
+                "level": record.level,
+                "event": record.event,
+                "user": record.user,
+            }
+            for record in result["records"]
+        ],
+        "truncated": result["truncated"],
+    }
@@ -5,22 +5,11 @@ Ce module intercepte les requêtes vers /favicon.ico afin d'éviter
 des erreurs 404 dans les navigateurs web, en renvoyant un code 204.
 """
 
-from fastapi import APIRouter, Depends, Request
-
-router_favicon = APIRouter()
+from fastapi import APIRouter, Depends
 
+from fast_api_xtrem.routes.dependencies import get_logger
 
-def get_logger(request: Request):
-    """
-    Récupère l'instance du logger depuis l'état de l'application.
-
-    Args:
-        request (Request): La requête HTTP FastAPI.
-
-    Returns:
-        Logger: L'instance du logger.
-    """
-    return request.app.state.logger
+router_favicon = APIRouter()
 
 
 @router_favicon.get("/favicon.ico", status_code=204)
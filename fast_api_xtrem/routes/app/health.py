@@ -2,15 +2,21 @@
 Health check routes for the FastAPI application.
 
 This module contains endpoints related to service health monitoring
-and status reporting.
+and status reporting:
+- /health and /health/live: liveness, the process answers requests;
+- /health/ready: readiness, the application can serve traffic
+  (database, connection pool, log sink, not draining).
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
 
-router_health = APIRouter()
+from fast_api_xtrem.routes.dependencies import get_services
 
+router_health = APIRouter(prefix="/health", tags=["Health"])
 
-@router_health.get("/health")
+
+@router_health.get("")
 async def health() -> dict:
     """
     Health check endpoint
@@ -19,3 +25,36 @@ async def health() -> dict:
         dict: Simple status response indicating API health
     """
     return {"status": "ok"}
+
+
+@router_health.get("/live")
+async def live() -> dict:
+    """
+    Liveness probe: never touches dependencies.
+
+    Returns:
+        dict: Simple status response indicating the process is alive
+    """
+    return {"status": "ok"}
+
+
+@router_health.get("/ready")
+async def ready(services=Depends(get_services)) -> JSONResponse:
+    """
+    Readiness probe, served from a short-lived cache.
+
+    Returns:
+        JSONResponse: 200 when ready, 503 otherwise, with check details
+    """
+    result = services.health.readiness()
+    return JSONResponse(
+        {
+            "status": "ready" if result["ready"] else "not_ready",
+            "checks": result["checks"],
+        },
+        status_code=(
+            status.HTTP_200_OK
+            if result["ready"]
+            else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+    )
@@ -0,0 +1,29 @@
+"""
+Route d'exposition des métriques de l'application.
+
+Ce module publie le contenu du registre de métriques des services
+au format texte Prometheus, sur /metrics.
+"""
+
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+
+router_metrics = APIRouter()
+
+
+@router_metrics.get("/metrics", response_class=PlainTextResponse)
+async def metrics(request: Request) -> PlainTextResponse:
+    """
+    Route GET exposant les métriques au format Prometheus.
+
+    Args:
+        request (Request): La requête HTTP FastAPI.
+
+    Returns:
+        PlainTextResponse: Exposition texte des métriques.
+    """
+    registry = request.app.state.services.metrics
+    return PlainTextResponse(
+        registry.render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
@@ -5,25 +5,16 @@ Fournit un point d'entrée basique pour tester que l'API fonctionne
 et redirige vers la documentation.
 """
 
-from fastapi import APIRouter, Depends, Request
-
-router_root = APIRouter()
+from fastapi import APIRouter, Depends
 
+from fast_api_xtrem.middleware.response_cache import cache_response
+from fast_api_xtrem.routes.dependencies import get_logger
 
-def get_logger(request: Request):
-    """
-    Récupère le logger depuis l'état de l'application.
-
-    Args:
-        request (Request) : Requête HTTP entrante.
-
-    Returns:
-        Logger : L'instance du logger.
-    """
-    return request.app.state.logger
+router_root = APIRouter()
 
 
 @router_root.get("/", tags=["Root"])
+@cache_response()
 async def root(logger=Depends(get_logger)):
     """
     Route GET pour la racine de l'API.
@@ -5,47 +5,48 @@ Ce module définit les endpoints CRUD pour les utilisateurs,
 avec authentification JWT et gestion des dépendances.
 """
 
+import asyncio
 import hashlib
-from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
-
-import jwt
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import JSONResponse
-from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from jwt.exceptions import InvalidTokenError
-from sqlalchemy.orm import Session
-
-from fast_api_xtrem.db.models.user import User, UserCreate, \
-    UserLogin, UserUpdate
+from typing import Any, Optional, Tuple
 
-# Configuration JWT
-SECRET_KEY = (
-    "votre-cle-secrete"  # À remplacer par une variable d'environnement
-)
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, Response
+from fastapi.security import OAuth2PasswordRequestForm
+from pydantic_core import to_json
+from sqlalchemy.orm import Session
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+from fast_api_xtrem.app.audit import AuditLog
+from fast_api_xtrem.app.user_stats import UserStats
+from fast_api_xtrem.cache.lru import MISSING
+from fast_api_xtrem.cache.single_flight import SingleFlight
+from fast_api_xtrem.cache.user_cache import UserCache
+from fast_api_xtrem.db.models.user import MessageOut, TokenOut, User, \
+    UserCreate, UserList, UserLogin, UserMessage, UserOut, UserSearchOut, \
+    UserStatsOut, UserUpdate, utc_now
+from fast_api_xtrem.db.utils.queries import get_active_users, \
+    get_user_by_name, get_user_projection, user_exists
+from fast_api_xtrem.db.utils.search import search_users
+from fast_api_xtrem.middleware.response_cache import ResponseCache, \
+    cache_response
+from fast_api_xtrem.routes.dependencies import get_audit_log, get_db, \
+    get_logger, get_response_cache, get_services, get_single_flight, \
+    get_tenant, get_token_payload, get_user_cache, get_user_stats, \
+    oauth2_scheme, resolve_user
+from fast_api_xtrem.routes.security import create_access_token, \
+    decode_token
 
 router_users = APIRouter(prefix="/users", tags=["users"])
 
 
-def get_db(request: Request):
+class TrustedJSONResponse(JSONResponse):
     """
-    Dépendance pour récupérer la Session SQLAlchemy
-    via le DBManager présent dans fast_api.state.services.
+    Réponse JSON pour des données de confiance, construites à partir de
+    la base : sérialisées directement par pydantic-core, sans validation
+    par le modèle de réponse ni `jsonable_encoder`.
     """
-    db_manager = request.app.state.services.db_manager
-    yield from db_manager.get_db()
 
-
-def get_logger(request: Request):
-    """
-    Dépendance pour récupérer le logger
-    exposé dans fast_api.state.logger.
-    """
-    return request.app.state.logger
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
 
 
 def create_response(
@@ -66,7 +67,7 @@ def create_response(
     content = {"message": message}
     if data is not None:
         content["data"] = data
-    return JSONResponse(content=content, status_code=status_code)
+    return TrustedJSONResponse(content=content, status_code=status_code)
 
 
 def hash_password(password: str) -> str:
@@ -82,23 +83,43 @@ def hash_password(password: str) -> str:
     return hashlib.sha256(password.encode()).hexdigest()
 
 
-def get_user_by_name(db: Session, nom: str) -> Optional[User]:
+async def load_credentials(nom: str, db: Session, user_cache: UserCache):
     """
-    Récupère un utilisateur par son nom.
+    Lit la projection d'un utilisateur pour l'authentifier.
+
+    Le cache (verrou par clé, second niveau partagé) et la base sont
+    interrogés dans un thread, hors de la boucle d'événements ; la
+    connexion est rendue au pool avant la vérification du mot de passe.
 
     Args:
-        db (Session): Session SQLAlchemy.
         nom (str): Nom de l'utilisateur.
+        db (Session): Session de base de données.
+        user_cache (UserCache): Cache des projections utilisateur.
 
     Returns:
-        Optional[User]: L'utilisateur s'il existe, sinon None.
+        Optional[UserProjection]: Projection, ou None si inconnu.
     """
-    return db.query(User).filter_by(nom=nom).first()
+    user = user_cache.get_local(nom)
+    if user is not MISSING:
+        return user
+
+    def load():
+        try:
+            return user_cache.get(nom, lambda: get_user_projection(db, nom))
+        finally:
+            db.release()
 
+    return await asyncio.to_thread(load)
 
-@router_users.post("/login", response_model=dict)
+
+@router_users.post("/login", response_model=MessageOut)
 async def login(
-    data: UserLogin, db: Session = Depends(get_db), logger=Depends(get_logger)
+    data: UserLogin,
+    db: Session = Depends(get_db),
+    logger=Depends(get_logger),
+    user_cache: UserCache = Depends(get_user_cache),
+    audit: AuditLog = Depends(get_audit_log),
+    tenant: Optional[str] = Depends(get_tenant),
 ) -> JSONResponse:
     """
     Authentifie un utilisateur.
@@ -107,31 +128,56 @@ async def login(
         data (UserLogin): Identifiants de connexion.
         db (Session): Session de base de données.
         logger: Logger.
+        user_cache (UserCache): Cache des projections utilisateur.
+        audit (AuditLog): Journal d'audit.
+        tenant (Optional[str]): Organisation de la requête.
 
     Returns:
         JSONResponse: Réponse avec message de succès ou erreur.
     """
-    user = get_user_by_name(db, data.nom)
+    user = await load_credentials(data.nom, db, user_cache)
     if not user:
-        logger.error(f"Utilisateur {data.nom} non trouvé")
+        logger.error(
+            f"Utilisateur {data.nom} non trouvé",
+            event="login_failed",
+            user=data.nom,
+        )
+        audit.record(
+            "login_failed",
+            actor=data.nom,
+            tenant=tenant,
+            reason="unknown_user",
+        )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Erreur : utilisateur non trouvé",
         )
     if user.pswd == hash_password(data.pswd):
-        logger.success(f"Utilisateur {data.nom} authentifié")
+        logger.success(
+            f"Utilisateur {data.nom} authentifié",
+            event="login_succeeded",
+            user=data.nom,
+        )
+        audit.record("login_succeeded", actor=data.nom, tenant=tenant)
         return create_response(
             message="Succès : utilisateur authentifié",
             status_code=status.HTTP_200_OK,
         )
-    logger.error(f"Mot de passe incorrect pour utilisateur {data.nom}")
+    logger.error(
+        f"Mot de passe incorrect pour utilisateur {data.nom}",
+        event="login_failed",
+        user=data.nom,
+    )
+    audit.record(
+        "login_failed", actor=data.nom, tenant=tenant, reason="bad_password"
+    )
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Erreur : utilisateur ou mot de passe incorrect",
     )
 
 
-@router_users.post("/logout", response_model=dict)
+@router_users.post("/logout", response_model=MessageOut)
 async def logout(logger=Depends(get_logger)) -> JSONResponse:
     """
     Déconnecte un utilisateur (statique pour le moment).
@@ -150,10 +196,15 @@ async def logout(logger=Depends(get_logger)) -> JSONResponse:
 
 
 @router_users.post(
-    "", status_code=status.HTTP_201_CREATED, response_model=dict
+    "", status_code=status.HTTP_201_CREATED, response_model=UserMessage
 )
 async def add_user(
-    data: UserCreate, db: Session = Depends(get_db), logger=Depends(get_logger)
+    data: UserCreate,
+    db: Session = Depends(get_db),
+    logger=Depends(get_logger),
+    user_cache: UserCache = Depends(get_user_cache),
+    user_stats: UserStats = Depends(get_user_stats),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> JSONResponse:
     """
     Crée un nouvel utilisateur.
@@ -162,22 +213,44 @@ async def add_user(
         data (UserCreate): Données de l'utilisateur à créer.
         db (Session): Session de base de données.
         logger: Logger.
+        user_cache (UserCache): Cache des projections utilisateur.
+        user_stats (UserStats): Statistiques des utilisateurs.
+        response_cache (ResponseCache): Cache des réponses GET.
 
     Returns:
         JSONResponse: Résultat de la création.
     """
-    if get_user_by_name(db, data.nom):
-        logger.error(f"Nom d'utilisateur {data.nom} existant")
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Erreur : nom d'utilisateur déjà existant",
-        )
-    db_user = User(
-        nom=data.nom, email=data.email, pswd=hash_password(data.pswd)
+    # Hachage avant tout accès à la base : la connexion n'est empruntée
+    # que le temps des requêtes
+    pswd_hash = hash_password(data.pswd)
+
+    def write() -> User:
+        # Vérification, écriture et invalidation hors de la boucle :
+        # le cache partagé peut lui-même écrire dans SQLite
+        try:
+            if user_exists(db, data.nom):
+                logger.error(f"Nom d'utilisateur {data.nom} existant")
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Erreur : nom d'utilisateur déjà existant",
+                )
+            db_user = User(nom=data.nom, email=data.email, pswd=pswd_hash)
+            db.add(db_user)
+            db.commit()
+        finally:
+            db.release()
+        # Un nom auparavant inconnu a pu être mis en cache
+        user_cache.invalidate(data.nom)
+        return db_user
+
+    db_user = await asyncio.to_thread(write)
+    response_cache.invalidate("users:*", f"user:{data.nom}")
+    user_stats.record_created(db_user.created_at, db_user.role_id)
+    logger.success(
+        f"Utilisateur {data.nom}, {data.email} ajouté",
+        event="user_created",
+        user=data.nom,
     )
-    db.add(db_user)
-    db.commit()
-    logger.success(f"Utilisateur {data.nom}, {data.email} ajouté")
     return create_response(
         message="Succès : nouvel utilisateur enregistré",
         status_code=status.HTTP_201_CREATED,
@@ -185,42 +258,135 @@ async def add_user(
     )
 
 
-@router_users.get("", response_model=dict)
+@router_users.get("", response_model=UserList)
+@cache_response("users:list")
 async def get_all_users(
-    db: Session = Depends(get_db), logger=Depends(get_logger)
-) -> JSONResponse:
+    db: Session = Depends(get_db),
+    logger=Depends(get_logger),
+    flights: SingleFlight = Depends(get_single_flight),
+    tenant: Optional[str] = Depends(get_tenant),
+) -> Response:
     """
     Récupère la liste de tous les utilisateurs.
 
+    Les requêtes concurrentes partagent une même lecture en base et un
+    même corps de réponse sérialisé.
+
     Args:
         db (Session): Session de base de données.
         logger: Logger.
+        flights (SingleFlight): Regroupement des lectures concurrentes.
+        tenant (Optional[str]): Organisation de la requête.
 
     Returns:
-        JSONResponse: Liste des utilisateurs.
+        Response: Liste des utilisateurs.
     """
-    users = db.query(User).all()
-    if not users:
+
+    def load() -> Optional[bytes]:
+        users = get_active_users(db)
+        db.release()
+        if not users:
+            return None
+        user_list = [{"nom": u.nom, "email": u.email} for u in users]
+        return create_response(
+            message="Succès",
+            status_code=status.HTTP_200_OK,
+            data=user_list,
+        ).body
+
+    body = await flights.run(
+        "users_list", tenant, lambda: asyncio.to_thread(load)
+    )
+    if body is None:
         logger.error("Aucun utilisateur trouvé")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Erreur : aucun utilisateur trouvé",
         )
-    user_list = [{"nom": u.nom, "email": u.email} for u in users]
     logger.success("Tous les utilisateurs trouvés")
+    return Response(content=body, media_type="application/json")
+
+
+@router_users.get("/stats", response_model=UserStatsOut)
+async def get_users_stats(
+    user_stats: UserStats = Depends(get_user_stats),
+) -> JSONResponse:
+    """
+    Retourne les statistiques agrégées des utilisateurs (total,
+    inscriptions par jour, répartition par rôle).
+
+    Les valeurs proviennent de compteurs tenus à jour par les écritures :
+    la réponse ne dépend pas de la taille de la table.
+
+    Args:
+        user_stats (UserStats): Statistiques des utilisateurs.
+
+    Returns:
+        JSONResponse: Statistiques courantes.
+    """
     return create_response(
         message="Succès",
         status_code=status.HTTP_200_OK,
-        data=user_list,
+        data=user_stats.snapshot(),
     )
 
 
-@router_users.put("/{nom}", response_model=dict)
+@router_users.get("/search", response_model=UserSearchOut)
+async def search(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """
+    Recherche les utilisateurs par nom ou email (sous-chaîne).
+
+    Le comptage et la recherche s'exécutent dans un thread, hors de la
+    boucle d'événements.
+
+    Args:
+        q (str): Texte recherché.
+        limit (int): Taille de la page.
+        offset (int): Position de la page.
+        db (Session): Session de base de données.
+
+    Returns:
+        JSONResponse: Résultats classés par pertinence et indicateur
+        de page suivante.
+    """
+    query = q.strip()
+
+    def load() -> list:
+        # Un résultat de plus que demandé indique l'existence d'une suite
+        try:
+            return search_users(db, query, limit + 1, offset)
+        finally:
+            db.release()
+
+    rows = await asyncio.to_thread(load) if query else []
+    results = [{"nom": nom, "email": email} for nom, email in rows[:limit]]
+    return create_response(
+        message="Succès",
+        status_code=status.HTTP_200_OK,
+        data={
+            "results": results,
+            "limit": limit,
+            "offset": offset,
+            "has_more": len(rows) > limit,
+        },
+    )
+
+
+@router_users.put("/{nom}", response_model=UserMessage)
 async def update_user(
     nom: str,
     data: UserUpdate,
     db: Session = Depends(get_db),
     logger=Depends(get_logger),
+    user_cache: UserCache = Depends(get_user_cache),
+    audit: AuditLog = Depends(get_audit_log),
+    response_cache: ResponseCache = Depends(get_response_cache),
+    tenant: Optional[str] = Depends(get_tenant),
 ) -> JSONResponse:
     """
     Met à jour un utilisateur existant.
@@ -230,28 +396,55 @@ async def update_user(
         data (UserUpdate): Nouvelles données.
         db (Session): Session base de données.
         logger: Logger.
+        user_cache (UserCache): Cache des projections utilisateur.
+        audit (AuditLog): Journal d'audit.
+        response_cache (ResponseCache): Cache des réponses GET.
+        tenant (Optional[str]): Organisation de la requête.
 
     Returns:
         JSONResponse: Message de succès ou erreur.
     """
-    user = get_user_by_name(db, nom)
-    if not user:
-        logger.error("Aucun utilisateur trouvé")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Erreur : aucun utilisateur trouvé",
-        )
-    if data.nom != nom and get_user_by_name(db, data.nom):
-        logger.error(f"Nom d'utilisateur {data.nom} déjà utilisé")
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Erreur : nouveau nom déjà existant",
-        )
-    user.nom = data.nom
-    user.email = data.email
-    user.pswd = hash_password(data.pswd)
-    db.commit()
-    logger.success(f"Utilisateur {nom} mis à jour en {data.nom}")
+    pswd_hash = hash_password(data.pswd)
+
+    def write() -> Tuple[User, str]:
+        try:
+            user = get_user_by_name(db, nom)
+            if not user:
+                logger.error("Aucun utilisateur trouvé")
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Erreur : aucun utilisateur trouvé",
+                )
+            if data.nom != nom and user_exists(db, data.nom):
+                logger.error(f"Nom d'utilisateur {data.nom} déjà utilisé")
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Erreur : nouveau nom déjà existant",
+                )
+            previous_email = user.email
+            user.nom = data.nom
+            user.email = data.email
+            user.pswd = pswd_hash
+            db.commit()
+        finally:
+            db.release()
+        user_cache.invalidate(nom, data.nom)
+        return user, previous_email
+
+    user, previous_email = await asyncio.to_thread(write)
+    response_cache.invalidate("users:*", f"user:{nom}", f"user:{data.nom}")
+    audit.record(
+        "user_updated",
+        subject=nom,
+        tenant=tenant,
+        new_nom=data.nom,
+        email_changed=user.email != previous_email,
+    )
+    logger.success(
+        f"Utilisateur {nom} mis à jour en {data.nom}",
+        event="user_updated",
+        user=nom,
+    )
     return create_response(
         message="Succès : mise à jour réussie",
         status_code=status.HTTP_200_OK,
@@ -259,85 +452,76 @@ async def update_user(
     )
 
 
-@router_users.delete("/{nom}")
+@router_users.delete("/{nom}", response_model=MessageOut)
 async def delete_user(
-    nom: str, db: Session = Depends(get_db), logger=Depends(get_logger)
+    nom: str,
+    db: Session = Depends(get_db),
+    logger=Depends(get_logger),
+    user_cache: UserCache = Depends(get_user_cache),
+    user_stats: UserStats = Depends(get_user_stats),
+    audit: AuditLog = Depends(get_audit_log),
+    response_cache: ResponseCache = Depends(get_response_cache),
+    tenant: Optional[str] = Depends(get_tenant),
 ) -> JSONResponse:
     """
     Supprime un utilisateur existant.
-    """
-    user = get_user_by_name(db, nom)
-    if not user:
-        logger.error(f"Utilisateur {nom} non trouvé")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Erreur : utilisateur non trouvé",
-        )
 
-    db.delete(user)
-    db.commit()
+    La suppression est logique (`deleted_at`) : l'utilisateur disparaît
+    immédiatement de toutes les lectures, et la ligne est effacée plus
+    tard, par lots, par la purge en tâche de fond.
+    """
 
-    logger.success(f"Utilisateur {nom} supprimé")
+    def write() -> User:
+        try:
+            user = get_user_by_name(db, nom)
+            if not user:
+                logger.error(f"Utilisateur {nom} non trouvé")
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Erreur : utilisateur non trouvé",
+                )
+            user.deleted_at = utc_now()
+            db.commit()
+        finally:
+            db.release()
+        user_cache.invalidate(nom)
+        return user
+
+    user = await asyncio.to_thread(write)
+    response_cache.invalidate("users:*", f"user:{nom}")
+    user_stats.record_deleted(user.created_at, user.role_id)
+    audit.record("user_deleted", subject=nom, tenant=tenant)
+
+    logger.success(
+        f"Utilisateur {nom} supprimé", event="user_deleted", user=nom
+    )
     return create_response(
         message="Succès : utilisateur supprimé", status_code=status.HTTP_200_OK
     )
 
 
-def create_access_token(
-    data: dict, expires_delta: Optional[timedelta] = None
-) -> str:
-    """
-    Crée un token JWT d'accès.
-
-    Args:
-        data (dict): Données à encoder dans le token
-        expires_delta (Optional[timedelta]): Durée de validité du token
-
-    Returns:
-        str: Token JWT encodé
-    """
-    to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (
-        expires_delta or timedelta(minutes=15)
-    )
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-
-
-def decode_token(token: str, logger=Depends(get_logger)) -> dict:
-    """
-    Décode et valide un token JWT.
-
-    Args:
-        token (str): Token JWT à décoder
-        logger: Logger pour le suivi des erreurs
-
-    Returns:
-        dict: Payload décodé
-
-    Raises:
-        HTTPException: Si le token est invalide ou expiré
-    """
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except InvalidTokenError as exc:
-        logger.error("Token non valide")
-        raise HTTPException(status_code=401, detail="Token invalide") from exc
-
-
-@router_users.post("/token")
+@router_users.post("/token", response_model=TokenOut)
 async def login_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db),
     logger=Depends(get_logger),
+    user_cache: UserCache = Depends(get_user_cache),
+    audit: AuditLog = Depends(get_audit_log),
+    tenant: Optional[str] = Depends(get_tenant),
+    services=Depends(get_services),
 ):
     """Route d'authentification qui génère un token JWT"""
     # form_data contient .username et .password
-    user = get_user_by_name(db, form_data.username)
+    nom = form_data.username
+    user = await load_credentials(nom, db, user_cache)
 
     if not user:
-        logger.error("Utilisateur non trouvé")
+        logger.error(
+            "Utilisateur non trouvé", event="login_failed", user=nom
+        )
+        audit.record(
+            "login_failed", actor=nom, tenant=tenant, reason="unknown_user"
+        )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Utilisateur non trouvé",
@@ -346,42 +530,64 @@ async def login_token(
     hashed_input_pwd = hash_password(form_data.password)
 
     if hashed_input_pwd != user.pswd:
-        logger.error("Mot de passe incorrect")
+        logger.error(
+            "Mot de passe incorrect", event="login_failed", user=nom
+        )
+        audit.record(
+            "login_failed", actor=nom, tenant=tenant, reason="bad_password"
+        )
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Mot de passe incorrect",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token = create_access_token(
-        data={"nom": user.nom, "email": user.email}
+    audit.record(
+        "login_succeeded", actor=nom, tenant=tenant, method="token"
+    )
+    token_data = {"nom": user.nom, "email": user.email}
+    if tenant is not None:
+        # L'organisation est portée par le token : l'en-tête est ignoré
+        # pour les requêtes authentifiées
+        token_data[services.config.database_config.tenant_claim] = tenant
+    access_token = create_access_token(data=token_data)
+    return TrustedJSONResponse(
+        {"access_token": access_token, "token_type": "bearer"}
     )
-    return JSONResponse({"access_token": access_token, "token_type": "bearer"})
 
 
-@router_users.get("/me")
-async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
-):
+@router_users.get("/me", response_model=UserOut)
+@cache_response("user:{subject}", per_user=True)
+async def get_me(
+    payload: dict = Depends(get_token_payload),
+    db: Session = Depends(get_db),
+    user_cache: UserCache = Depends(get_user_cache),
+    flights: SingleFlight = Depends(get_single_flight),
+    tenant: Optional[str] = Depends(get_tenant),
+) -> Response:
     """
     Récupère les informations de l'utilisateur courant.
+
+    Les requêtes concurrentes d'un même utilisateur partagent une même
+    lecture et un même corps de réponse sérialisé.
     """
-    payload = decode_token(token)
-    user = get_user_by_name(db, payload["nom"])
+    nom = payload.get("nom", "")
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Utilisateur non trouvé",
-        )
+    async def respond() -> bytes:
+        user = await resolve_user(nom, db, user_cache, flights, tenant)
+        return TrustedJSONResponse({"nom": user.nom, "email": user.email}).body
 
-    return {"nom": user.nom, "email": user.email}
+    body = await flights.run("users_me", (tenant, nom), respond)
+    return Response(content=body, media_type="application/json")
 
 
-@router_users.get("/is_connected")
-async def get_connection_status(token: str = Depends(oauth2_scheme)):
+@router_users.get("/is_connected", response_model=bool)
+async def get_connection_status(
+    token: str = Depends(oauth2_scheme), logger=Depends(get_logger)
+):
+    """Indique si le token fourni est valide."""
     try:
-        decode_token(token)
+        decode_token(token, logger)
         return True
-    except Exception:
+    except HTTPException:
         return False
@@ -0,0 +1,303 @@
+"""
+Dépendances FastAPI partagées par l'ensemble des routes.
+
+Le conteneur `ApplicationServices` est créé une seule fois au démarrage et
+exposé dans `app.state.services` ; toutes les autres dépendances en
+dérivent. FastAPI met en cache chaque dépendance pour la durée d'une
+requête : la session SQLAlchemy et l'utilisateur courant ne sont donc
+résolus qu'une fois par requête, quel que soit le nombre de dépendances
+qui les demandent.
+
+Les dépendances sont déclarées `async` : FastAPI exécute les dépendances
+synchrones dans un pool de threads, ce qui coûte un aller-retour de thread
+par dépendance et par requête pour des opérations de quelques microsecondes.
+"""
+
+import asyncio
+import secrets
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, Request, status
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.orm import Session
+
+from fast_api_xtrem.app.audit import AuditLog
+from fast_api_xtrem.app.services import ApplicationServices
+from fast_api_xtrem.app.user_stats import UserStats
+from fast_api_xtrem.cache.lru import MISSING
+from fast_api_xtrem.cache.single_flight import SingleFlight
+from fast_api_xtrem.cache.user_cache import UserCache
+from fast_api_xtrem.db.models.user import UserProjection
+from fast_api_xtrem.db.tenancy import InvalidTenantError, UnknownTenantError
+from fast_api_xtrem.db.utils.queries import get_user_projection
+from fast_api_xtrem.logger.logger_manager import LoggerManager
+from fast_api_xtrem.middleware.response_cache import ResponseCache
+from fast_api_xtrem.routes.security import decode_token
+from fast_api_xtrem.routes.tenancy import resolve_tenant
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+
+
+async def get_services(request: Request) -> ApplicationServices:
+    """
+    Récupère le conteneur de services créé au démarrage.
+
+    Args:
+        request (Request): La requête HTTP FastAPI.
+
+    Returns:
+        ApplicationServices: Les services de l'application.
+    """
+    return request.app.state.services
+
+
+async def get_logger(
+    services: ApplicationServices = Depends(get_services),
+) -> LoggerManager:
+    """
+    Dépendance pour récupérer le logger des services.
+
+    Returns:
+        LoggerManager: L'instance du logger.
+    """
+    return services.logger
+
+
+async def get_tenant(
+    request: Request,
+    services: ApplicationServices = Depends(get_services),
+) -> Optional[str]:
+    """
+    Dépendance résolvant l'organisation de la requête (voir
+    `resolve_tenant`).
+
+    Returns:
+        Optional[str]: L'organisation, ou None pour la base principale.
+
+    Raises:
+        HTTPException: 400 si le nom d'organisation est invalide, 404 si
+            l'organisation n'est pas déclarée.
+    """
+    config = services.config.database_config
+    try:
+        return resolve_tenant(
+            request.headers.get("authorization"),
+            request.headers.get(config.tenant_header),
+            config,
+        )
+    except UnknownTenantError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Erreur : organisation inconnue",
+        ) from exc
+    except InvalidTenantError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Erreur : organisation invalide",
+        ) from exc
+
+
+async def get_user_cache(
+    tenant: Optional[str] = Depends(get_tenant),
+    services: ApplicationServices = Depends(get_services),
+) -> UserCache:
+    """
+    Dépendance pour récupérer le cache des projections utilisateur de
+    l'organisation de la requête.
+
+    Returns:
+        UserCache: Le cache des utilisateurs.
+    """
+    return services.user_cache_for(tenant)
+
+
+async def get_user_stats(
+    tenant: Optional[str] = Depends(get_tenant),
+    services: ApplicationServices = Depends(get_services),
+) -> UserStats:
+    """
+    Dépendance pour récupérer les statistiques des utilisateurs de
+    l'organisation de la requête.
+
+    Les statistiques d'une organisation sont initialisées depuis sa base
+    (dans un thread) à leur première utilisation.
+
+    Returns:
+        UserStats: Les compteurs agrégés des utilisateurs.
+    """
+    stats = services.user_stats_for(tenant)
+    if stats.reconciled_at is None:
+        await asyncio.to_thread(
+            stats.reconcile, services.db_manager, services.logger
+        )
+    return stats
+
+
+async def get_audit_log(
+    services: ApplicationServices = Depends(get_services),
+) -> AuditLog:
+    """
+    Dépendance pour récupérer le journal d'audit.
+
+    Returns:
+        AuditLog: Le journal d'audit à écriture différée.
+    """
+    return services.audit
+
+
+async def get_single_flight(
+    services: ApplicationServices = Depends(get_services),
+) -> SingleFlight:
+    """
+    Dépendance pour récupérer le regroupement des lectures concurrentes.
+
+    Returns:
+        SingleFlight: Les exécutions en cours, par clé de lecture.
+    """
+    return services.single_flight
+
+
+async def get_response_cache(
+    services: ApplicationServices = Depends(get_services),
+) -> ResponseCache:
+    """
+    Dépendance pour récupérer le cache des réponses GET.
+
+    Returns:
+        ResponseCache: Le cache des réponses, invalidé par étiquette.
+    """
+    return services.response_cache
+
+
+async def get_db(
+    tenant: Optional[str] = Depends(get_tenant),
+    services: ApplicationServices = Depends(get_services),
+):
+    """
+    Dépendance fournissant la Session SQLAlchemy de la requête, sur la
+    base de son organisation.
+
+    La base d'une organisation est ouverte dans un thread : sa première
+    ouverture crée le fichier et les tables.
+
+    Yields:
+        Session: Session ouverte par le DBManager.
+    """
+    if tenant is not None:
+        await asyncio.to_thread(services.db_manager.open_tenant, tenant)
+    with services.db_manager.session_scope(tenant) as db:
+        yield db
+
+
+async def get_token_payload(
+    token: str = Depends(oauth2_scheme),
+    logger: LoggerManager = Depends(get_logger),
+) -> dict:
+    """
+    Dépendance décodant le token JWT de la requête.
+
+    Returns:
+        dict: Payload du token.
+
+    Raises:
+        HTTPException: Si le token est invalide ou expiré.
+    """
+    return decode_token(token, logger)
+
+
+async def resolve_user(
+    nom: str,
+    db: Session,
+    user_cache: UserCache,
+    flights: SingleFlight,
+    tenant: Optional[str] = None,
+) -> UserProjection:
+    """
+    Résout la projection d'un utilisateur.
+
+    La projection est lue dans le cache des utilisateurs. En cas de
+    défaut, la base est interrogée dans un thread, une seule fois pour
+    toutes les requêtes concurrentes visant le même utilisateur, et la
+    connexion est rendue au pool dès la lecture.
+
+    Args:
+        nom (str): Nom de l'utilisateur.
+        db (Session): Session de la requête.
+        user_cache (UserCache): Cache des utilisateurs.
+        flights (SingleFlight): Regroupement des lectures concurrentes.
+        tenant (Optional[str]): Organisation de la requête.
+
+    Returns:
+        UserProjection: L'utilisateur.
+
+    Raises:
+        HTTPException: Si l'utilisateur n'existe pas.
+    """
+    user = user_cache.get_local(nom)
+    if user is MISSING:
+
+        def load():
+            try:
+                return user_cache.get(
+                    nom, lambda: get_user_projection(db, nom)
+                )
+            finally:
+                db.release()
+
+        user = await flights.run(
+            "user", (tenant, nom), lambda: asyncio.to_thread(load)
+        )
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Utilisateur non trouvé",
+        )
+    return user
+
+
+async def get_current_user(
+    payload: dict = Depends(get_token_payload),
+    db: Session = Depends(get_db),
+    user_cache: UserCache = Depends(get_user_cache),
+    flights: SingleFlight = Depends(get_single_flight),
+    tenant: Optional[str] = Depends(get_tenant),
+) -> UserProjection:
+    """
+    Dépendance résolvant l'utilisateur authentifié (voir `resolve_user`).
+
+    Returns:
+        UserProjection: L'utilisateur correspondant au token.
+
+    Raises:
+        HTTPException: Si l'utilisateur n'existe plus.
+    """
+    return await resolve_user(
+        payload.get("nom", ""), db, user_cache, flights, tenant
+    )
+
+
+async def require_admin(
+    x_admin_token: Optional[str] = Header(None),
+    services: ApplicationServices = Depends(get_services),
+) -> None:
+    """
+    Dépendance protégeant les routes d'administration par le jeton
+    `AdminConfig.api_token`, transmis dans l'en-tête X-Admin-Token.
+
+    Raises:
+        HTTPException: 403 si aucun jeton n'est configuré,
+            401 si le jeton fourni est absent ou incorrect.
+    """
+    expected = services.config.admin_config.api_token
+    if not expected:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Erreur : routes d'administration désactivées",
+        )
+    if not x_admin_token or not secrets.compare_digest(
+        x_admin_token, expected
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Erreur : jeton d'administration invalide",
+        )
@@ -0,0 +1,67 @@
+"""
+Outils JWT de l'application FastAPI XTREM.
+
+Ce module regroupe la configuration JWT ainsi que la création
+et la validation des tokens d'accès.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import jwt
+from fastapi import HTTPException, status
+from jwt.exceptions import InvalidTokenError
+
+# Configuration JWT
+SECRET_KEY = (
+    "votre-cle-secrete"  # À remplacer par une variable d'environnement
+)
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = 30
+
+
+def create_access_token(
+    data: dict, expires_delta: Optional[timedelta] = None
+) -> str:
+    """
+    Crée un token JWT d'accès.
+
+    Args:
+        data (dict): Données à encoder dans le token
+        expires_delta (Optional[timedelta]): Durée de validité du token
+
+    Returns:
+        str: Token JWT encodé
+    """
+    to_encode = data.copy()
+    expire = datetime.now(timezone.utc) + (
+        expires_delta or timedelta(minutes=15)
+    )
+    to_encode.update({"exp": expire})
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def decode_token(token: str, logger=None) -> dict:
+    """
+    Décode et valide un token JWT.
+
+    Args:
+        token (str): Token JWT à décoder
+        logger: Logger pour le suivi des erreurs (optionnel)
+
+    Returns:
+        dict: Payload décodé
+
+    Raises:
+        HTTPException: Si le token est invalide ou expiré
+    """
+    try:
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except InvalidTokenError as exc:
+        if logger is not None:
+            logger.error("Token non valide")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token invalide",
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from exc
@@ -0,0 +1,60 @@
+"""
+Résolution de l'organisation (tenant) d'une requête.
+
+L'organisation est lue dans la revendication `tenant_claim` du token JWT,
+à défaut dans l'en-tête `tenant_header` (connexion, création de compte).
+Un token valide l'emporte toujours sur l'en-tête, même sans revendication
+(base principale) : un client authentifié ne peut pas lire la base d'une
+autre organisation. Une organisation non déclarée dans
+`DatabaseConfig.tenants` est refusée.
+"""
+
+from typing import Optional
+
+from fastapi import HTTPException
+
+from fast_api_xtrem.app.config import DatabaseConfig
+from fast_api_xtrem.db.tenancy import check_tenant
+from fast_api_xtrem.routes.security import decode_token
+
+
+def resolve_tenant(
+    authorization: Optional[str],
+    header_value: Optional[str],
+    config: DatabaseConfig,
+) -> Optional[str]:
+    """
+    Retourne l'organisation de la requête.
+
+    Args:
+        authorization (Optional[str]): En-tête `Authorization`.
+        header_value (Optional[str]): En-tête `tenant_header`.
+        config (DatabaseConfig): Configuration de la base.
+
+    Returns:
+        Optional[str]: L'organisation, ou None (base principale) si le
+            mode multi-organisation est désactivé ou si aucune n'est
+            indiquée.
+
+    Raises:
+        InvalidTenantError: Si le nom d'organisation est invalide.
+        UnknownTenantError: Si l'organisation n'est pas déclarée.
+    """
+    if not config.tenancy_enabled:
+        return None
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            payload = decode_token(token)
+        except HTTPException:
+            # Token rejeté plus loin par l'authentification
+            payload = None
+        if payload is not None:
+            # Token sans revendication : base principale, en-tête ignoré
+            claim = payload.get(config.tenant_claim)
+            if claim is None:
+                return None
+            return check_tenant(claim, config.tenants)
+    if header_value:
+        return check_tenant(header_value.strip(), config.tenants)
+    return None
@@ -1,10 +1,16 @@
-import requests
 from email_validator import validate_email, EmailNotValidError
 import streamlit as st
 
+from fast_api_xtrem.client.base import ApiError, ClientConfig
+from fast_api_xtrem.client.sync_client import ApiClient
+
 
 URL_API = "http://127.0.0.1:8000"
 
+# Client partagé par toutes les exécutions du script : connexions
+# conservées (keep-alive) et nouvelles tentatives sur erreur réseau
+api = ApiClient(ClientConfig(base_url=URL_API))
+
 
 def check_email_valid(mail):
     try:
@@ -16,51 +22,43 @@ def check_email_valid(mail):
 
 
 def check_authentity(nom, pswd):
-    json = {"username": nom, "password": pswd}
-    response = requests.post(URL_API + "/users/token", data=json).json()
-
-    return response.get("access_token")
+    # Requête sans mémorisation : le client est partagé par toutes les
+    # sessions, il ne doit conserver ni token ni identifiants
+    try:
+        body = api.request(
+            "POST",
+            "/users/token",
+            data={"username": nom, "password": pswd},
+        )
+    except ApiError:
+        return None
+    return body["access_token"]
 
 
 def user_exist(nom):
-    response = requests.get(URL_API + "/users")
-    data = response.json()
-    users = data.get("data", [])
-    if not users:
-        return False
-    for user in users:
-        if user.get("nom") == nom:
-            return True
-    return False
+    return any(user.get("nom") == nom for user in api.list_users())
 
 
 def create_user(nom, pswd, mail):
-    json = {"nom": nom, "email": mail, "pswd": pswd}
-    requests.post(URL_API + "/users", json=json)
+    try:
+        api.create_user(nom, mail, pswd)
+    except ApiError:
+        pass
 
 
 def email_exist(mail):
-    response = requests.get(URL_API + "/users")
-    data = response.json()
-    users = data.get("data", [])
-    if not users:
-        return False
-    for user in users:
-        if user.get("email") == mail:
-            return True
-    return False
+    return any(user.get("email") == mail for user in api.list_users())
 
 
 def update_pswd(pswd, mail):
-    response = requests.get(URL_API + "/users")
-    data = response.json()
-    users = data.get("data", [])
     nom = ""
-    for user in users:
+    for user in api.list_users():
         if user.get("email") == mail:
             nom = user.get("nom")
-    json = {"nom": nom, "email": mail, "pswd": pswd}
-    requests.put(URL_API + "/users" + nom, json=json)
+    try:
+        api.update_user(nom, nom, mail, pswd)
+    except ApiError:
+        pass
 
 
 def check_pswd_security_level(mdp):
@@ -97,31 +95,20 @@ def check_pswd_security_level(mdp):
 
 
 def get_user_data(headers):
-    response = requests.get(URL_API + "/users/me", headers=headers)
-    data = response.json()
-
-    if data:
-        user = data
-        return user
-
-    return None
+    try:
+        return api.request("GET", "/users/me", headers=headers)
+    except ApiError:
+        return None
 
 
 def update_user(nom, email, pswd):
-    json = {"nom": nom, "email": email, "pswd": pswd}
-
-    response = requests.put(URL_API + f"/users/{st.session_state.nom}",
-                            json=json)
-
-    if response:
-        return response.json()
-
-    return None
+    try:
+        return api.update_user(st.session_state.nom, nom, email, pswd)
+    except ApiError:
+        return None
 
 
 def check_if_valid_token(token):
-    headers = {"Authorization": f"Bearer {token}"}
-    if requests.get(URL_API + "/users/me", headers=headers):
-        return True
-
-    return False
+    if not token:
+        return False
+    return get_user_data({"Authorization": f"Bearer {token}"}) is not None
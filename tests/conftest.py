@@ -0,0 +1,37 @@
+"""
+Fixtures partagées des tests de l'application FastAPI Xtrem.
+
+Fournit une application complète dont la base SQLite est isolée
+dans un répertoire temporaire.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from fast_api_xtrem.app import services as services_module
+from fast_api_xtrem.app.application import Application
+from fast_api_xtrem.app.config import AppConfig
+from fast_api_xtrem.db.db_manager import DBManager
+
+
+@pytest.fixture
+def app_config():
+    """Configuration de l'application utilisée par `client`."""
+    return AppConfig()
+
+
+@pytest.fixture
+def application(monkeypatch, tmp_path, app_config):
+    """Application dont les fichiers de données sont dans tmp_path."""
+    monkeypatch.setattr(
+        DBManager, "_get_package_root", staticmethod(lambda: tmp_path)
+    )
+    monkeypatch.setattr(services_module, "DATA_DIR", tmp_path / "database")
+    return Application(app_config)
+
+
+@pytest.fixture
+def client(application):
+    """Client de test avec cycle de vie (démarrage/arrêt) exécuté."""
+    with TestClient(application.fast_api) as test_client:
+        yield test_client
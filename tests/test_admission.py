@@ -0,0 +1,118 @@
+"""
+Tests du contrôle d'admission par groupe de routes.
+"""
+
+import asyncio
+
+import pytest
+
+from fast_api_xtrem.app.config import AdmissionConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.middleware.admission import AdmissionController
+
+
+def _controller(**config):
+    return AdmissionController(AdmissionConfig(**config), MetricsRegistry())
+
+
+def test_routes_are_assigned_to_groups():
+    """Routes de groupe, route par défaut et routes exemptées."""
+    controller = _controller()
+    assert controller.group_for("POST", "/users/token").name == "auth"
+    assert controller.group_for("GET", "/users").name == "heavy"
+    assert controller.group_for("PUT", "/users/alice").name == "default"
+    assert controller.group_for("GET", "/health/ready") is None
+
+    with pytest.raises(ValueError):
+        _controller(groups=("auth:x:1",))
+    with pytest.raises(ValueError):
+        _controller(routes=("unknown=GET /users",))
+
+
+def test_queue_is_bounded_and_slots_are_handed_over():
+    """File bornée, rejet immédiat au-delà, place transmise à la libération."""
+    controller = _controller(groups=("default:1:1",), routes=())
+    group = controller.groups["default"]
+    metrics = controller.metrics
+
+    async def scenario():
+        assert await controller.acquire(group)
+        waiter = asyncio.create_task(controller.acquire(group))
+        await asyncio.sleep(0)
+        assert metrics.get("admission_queue_depth", group="default") == 1
+        assert not await controller.acquire(group)
+        controller.release(group)
+        assert await waiter
+        assert group.active == 1 and not group.waiters
+        controller.release(group)
+
+    asyncio.run(scenario())
+    assert group.active == 0
+    assert metrics.get("admission_admitted_total", group="default") == 2
+    assert (
+        metrics.get(
+            "admission_shed_total", group="default", reason="queue_full"
+        )
+        == 1
+    )
+
+
+def test_waiting_request_times_out():
+    """Une requête en attente est rejetée faute de place à temps."""
+    controller = _controller(
+        groups=("default:1:4",), routes=(), queue_timeout_seconds=0.01
+    )
+    group = controller.groups["default"]
+
+    async def scenario():
+        assert await controller.acquire(group)
+        assert not await controller.acquire(group)
+
+    asyncio.run(scenario())
+    assert not group.waiters
+    assert (
+        controller.metrics.get("admission_queue_depth", group="default") == 0
+    )
+    assert (
+        controller.metrics.get(
+            "admission_shed_total", group="default", reason="timeout"
+        )
+        == 1
+    )
+
+
+def test_slot_handed_over_at_timeout_is_returned(monkeypatch):
+    """Une place transmise au moment de l'expiration n'est pas perdue."""
+    controller = _controller(groups=("default:1:4",), routes=())
+    group = controller.groups["default"]
+
+    async def handed_over_then_timeout(future, _timeout):
+        # `release` et l'expiration dans la même itération de la boucle
+        controller.release(group)
+        assert future.done()
+        raise asyncio.TimeoutError
+
+    async def scenario():
+        assert await controller.acquire(group)
+        monkeypatch.setattr(asyncio, "wait_for", handed_over_then_timeout)
+        assert not await controller.acquire(group)
+
+    asyncio.run(scenario())
+    assert group.active == 0 and not group.waiters
+
+
+def test_saturated_group_returns_503(client, application):
+    """Un groupe saturé répond 503 sans pénaliser les autres routes."""
+    controller = application.services.admission
+    controller.config = AdmissionConfig(queue_timeout_seconds=0.01)
+    auth = controller.groups["auth"]
+    auth.active = auth.limit
+
+    response = client.post(
+        "/users/token", data={"username": "alice", "password": "x"}
+    )
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert client.get("/health/live").status_code == 200
+    assert client.get("/").status_code == 200
+    assert controller.groups["default"].active == 0
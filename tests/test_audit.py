@@ -0,0 +1,103 @@
+"""
+Tests du journal d'audit à écriture différée.
+"""
+
+import time
+
+import pytest
+
+from fast_api_xtrem.app.audit import AuditLog
+from fast_api_xtrem.app.config import AdminConfig, AppConfig, AuditConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+
+ADMIN = {"X-Admin-Token": "secret"}
+USER = {"nom": "alice", "email": "alice@example.com", "pswd": "motdepasse1"}
+
+
+@pytest.fixture
+def app_config():
+    """Lots de trois événements, sans échéance rapprochée."""
+    return AppConfig(
+        admin_config=AdminConfig(api_token="secret"),
+        audit_config=AuditConfig(batch_size=3, flush_interval_seconds=60),
+    )
+
+
+def _audit(client, **params):
+    response = client.get("/admin/audit", headers=ADMIN, params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_events_written_by_batch_size(client, application):
+    """Un lot complet est écrit sans attendre l'échéance."""
+    client.post("/users", json=USER)
+    client.post("/users/login", json=USER)
+    client.post("/users/login", json={**USER, "pswd": "mauvaismdp"})
+    assert _audit(client)["events"] == []
+
+    client.post("/users/login", json={**USER, "nom": "inconnu"})
+    deadline = time.monotonic() + 2
+    while application.services.audit.depth and time.monotonic() < deadline:
+        time.sleep(0.01)
+    events = _audit(client)["events"]
+    assert [e["event_type"] for e in events] == [
+        "login_failed",
+        "login_failed",
+        "login_succeeded",
+    ]
+    assert events[0]["details"] == {"reason": "unknown_user"}
+
+
+def test_flush_and_keyset_pagination(client, application):
+    """Les événements forcés sont paginés du plus récent au plus ancien."""
+    client.post("/users", json=USER)
+    client.put("/users/alice", json={**USER, "nom": "alicia"})
+    client.delete("/users/alicia")
+    assert application.services.audit.flush()
+
+    first = _audit(client, limit=1)
+    assert first["events"][0]["event_type"] == "user_deleted"
+    second = _audit(client, limit=1, before_id=first["next_before_id"])
+    assert second["events"][0]["subject"] == "alice"
+    assert second["next_before_id"] is None
+    assert _audit(client, subject="alicia")["events"][0]["subject"] == (
+        "alicia"
+    )
+
+
+def test_full_queue_drops_events(mocker):
+    """File pleine : l'événement est abandonné et compté."""
+    metrics = MetricsRegistry()
+    audit = AuditLog(AuditConfig(queue_size=2), None, metrics, mocker.Mock())
+    assert audit.record("login_succeeded", actor="alice")
+    assert audit.record("login_succeeded", actor="bob")
+    assert not audit.record("login_succeeded", actor="carol")
+    assert metrics.get("audit_events_dropped_total") == 1
+
+
+def test_failed_write_applies_backpressure(mocker):
+    """Base indisponible : la file n'est plus consommée et se remplit."""
+    metrics = MetricsRegistry()
+    db_manager = mocker.Mock()
+    db_manager.engine.begin.side_effect = RuntimeError("base indisponible")
+    audit = AuditLog(
+        AuditConfig(queue_size=3, batch_size=1, flush_interval_seconds=60),
+        db_manager,
+        metrics,
+        mocker.Mock(),
+    )
+    audit.start()
+    assert audit.record("login_succeeded", actor="alice")
+    deadline = time.monotonic() + 2
+    while not audit._queue.empty() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # Le lot en échec reste en attente, hors de la file
+    assert all(audit.record("login_failed", actor="bob") for _ in range(3))
+    assert not audit.record("login_failed", actor="bob")
+    assert metrics.get("audit_events_dropped_total") == 1
+    assert audit.depth == 4
+
+    assert not audit.close(timeout=0.2)
+    assert metrics.get("audit_events_dropped_total") == 2
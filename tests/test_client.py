@@ -0,0 +1,115 @@
+"""
+Tests des clients de l'API (synchrone et asynchrone).
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from fast_api_xtrem.client.async_client import AsyncApiClient
+from fast_api_xtrem.client.base import ApiError, ClientConfig, TokenCache
+from fast_api_xtrem.client.sync_client import ApiClient
+from fast_api_xtrem.routes.security import create_access_token
+
+CONFIG = ClientConfig(
+    base_url="http://api", backoff_seconds=0.001, tenant="acme"
+)
+
+
+def test_retries_keep_idempotency_key_and_refresh_token():
+    """Reprise sur 503 avec la même clé, token renouvelé sur 401."""
+    seen = []
+    issued = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.path == "/users/token":
+            issued.append(create_access_token({"nom": "alice"}))
+            return httpx.Response(
+                200, json={"access_token": issued[-1], "token_type": "bearer"}
+            )
+        if request.url.path == "/users" and len(seen) == 1:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        if request.url.path == "/users/me":
+            # Premier token refusé (révoqué côté serveur)
+            if len(issued) == 1:
+                return httpx.Response(401, json={"detail": "Token invalide"})
+            return httpx.Response(200, json={"nom": "alice", "email": ""})
+        return httpx.Response(201, json={"data": {"nom": "alice"}})
+
+    with ApiClient(CONFIG, httpx.MockTransport(handler)) as api:
+        assert api.create_user("alice", "a@example.com", "x" * 8) == {
+            "nom": "alice"
+        }
+        first, second = seen
+        key = first.headers["idempotency-key"]
+        assert key and second.headers["idempotency-key"] == key
+        assert first.headers["x-tenant"] == "acme"
+
+        api.login("alice", "x" * 8)
+        assert api.get_me()["nom"] == "alice"
+        assert len(issued) == 2
+
+
+def test_bulk_returns_transport_errors():
+    """Un élément injoignable n'interrompt pas l'opération groupée."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/users/bob":
+            raise httpx.ConnectError("injoignable", request=request)
+        if request.url.path == "/users/carol":
+            return httpx.Response(404, json={"detail": "non trouvé"})
+        return httpx.Response(200, json={"message": "ok"})
+
+    config = ClientConfig(base_url="http://api", max_retries=0)
+    with ApiClient(config, httpx.MockTransport(handler)) as api:
+        results = api.delete_users(["alice", "bob", "carol"])
+    assert results[0] is None
+    assert isinstance(results[1], httpx.ConnectError)
+    assert isinstance(results[2], ApiError) and results[2].status_code == 404
+
+    async def run():
+        transport = httpx.MockTransport(handler)
+        async with AsyncApiClient(config, transport) as api:
+            return await api.delete_users(["alice", "bob"])
+
+    results = asyncio.run(run())
+    assert results[0] is None
+    assert isinstance(results[1], httpx.ConnectError)
+
+
+def test_token_cache_refreshes_before_expiry():
+    """Le token est renouvelé dans la marge précédant son expiration."""
+    now = [time.time()]
+    cache = TokenCache(60, clock=lambda: now[0])
+    token = create_access_token({"nom": "alice"})
+    cache.set(token)
+    assert cache.get() == token
+    now[0] += 15 * 60 - 30
+    assert cache.get() is None
+
+
+def test_async_client_against_application(client, application):
+    """Client asynchrone : opérations groupées sur l'application."""
+    users = [
+        {"nom": f"user{i}", "email": f"user{i}@example.com", "pswd": "x" * 8}
+        for i in range(5)
+    ]
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=application.fast_api)
+        async with AsyncApiClient(
+            ClientConfig(base_url="http://api"), transport
+        ) as api:
+            created = await api.create_users(users + users[:1])
+            await api.login("user1", "x" * 8)
+            me = await api.get_me()
+            listing = await api.list_users()
+            return created, me, listing
+
+    created, me, listing = asyncio.run(scenario())
+    assert [u["nom"] for u in created[:5]] == [u["nom"] for u in users]
+    assert isinstance(created[5], ApiError) and created[5].status_code == 409
+    assert me == {"nom": "user1", "email": "user1@example.com"}
+    assert len(listing) == 5
@@ -0,0 +1,76 @@
+"""
+Tests du chargement de la configuration et du rechargement à chaud.
+"""
+
+import pytest
+
+from fast_api_xtrem.app.config_loader import ConfigError, load_config
+
+TOML = """
+title = "API de test"
+
+[database]
+pool_size = 7
+
+[rate_limit]
+max_attempts_per_user = 3
+protected_paths = ["/users/token"]
+"""
+
+
+def test_toml_and_environment_override(tmp_path):
+    """Le fichier TOML surcharge les défauts, l'environnement le TOML."""
+    path = tmp_path / "app.toml"
+    path.write_text(TOML, encoding="utf-8")
+    environ = {
+        "FAST_API_XTREM__RATE_LIMIT__MAX_ATTEMPTS_PER_USER": "4",
+        "FAST_API_XTREM__LOGGER__LOG_LEVEL": "DEBUG",
+        "FAST_API_XTREM__RATE_LIMIT__ENABLED": "false",
+    }
+    config = load_config(str(path), environ)
+
+    assert config.title == "API de test"
+    assert config.database_config.pool_size == 7
+    assert config.rate_limit_config.max_attempts_per_user == 4
+    assert config.rate_limit_config.enabled is False
+    assert config.rate_limit_config.protected_paths == ("/users/token",)
+    assert config.logger_config.log_level == "DEBUG"
+    assert config.config_file == str(path)
+
+
+@pytest.mark.parametrize(
+    "environ",
+    [
+        {"FAST_API_XTREM__DATABASE__POOL_SIZE": "beaucoup"},
+        {"FAST_API_XTREM__DATABASE__INCONNU": "1"},
+        {"FAST_API_XTREM__LOGGER__LOG_LEVEL": "BAVARD"},
+    ],
+)
+def test_invalid_values_rejected(environ):
+    """Types, clés et valeurs invalides lèvent ConfigError."""
+    with pytest.raises(ConfigError):
+        load_config(environ=environ)
+
+
+def test_reload_applies_only_runtime_tunables(client, application, tmp_path):
+    """Le rechargement applique les réglages à chaud, ignore les autres."""
+    services = application.services
+    path = tmp_path / "app.toml"
+    path.write_text("[rate_limit]\nmax_attempts_per_user = 10\n", "utf-8")
+    services.config.config_file = str(path)
+    limiter_config = services.rate_limiter.config
+
+    path.write_text(
+        "[rate_limit]\nmax_attempts_per_user = 2\n"
+        "[database]\npool_size = 50\n",
+        "utf-8",
+    )
+    result = services.reload_config()
+
+    assert result == {
+        "applied": ["rate_limit_config"],
+        "ignored": ["database.pool_size"],
+    }
+    assert services.rate_limiter.config.max_attempts_per_user == 2
+    assert services.rate_limiter.config is not limiter_config
+    assert services.config.database_config.pool_size == 5
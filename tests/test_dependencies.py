@@ -0,0 +1,49 @@
+"""
+Tests des dépendances partagées des routes.
+
+Vérifie la résolution de l'utilisateur courant et la mise en cache
+de la session SQLAlchemy pour la durée d'une requête.
+"""
+
+USER = {"nom": "alice", "email": "alice@example.com", "pswd": "motdepasse1"}
+
+
+def _token(client):
+    """Crée l'utilisateur de test et retourne un token d'accès."""
+    client.post("/users", json=USER)
+    response = client.post(
+        "/users/token",
+        data={"username": USER["nom"], "password": USER["pswd"]},
+    )
+    return response.json()["access_token"]
+
+
+def test_me_returns_current_user(client):
+    """La route /users/me résout l'utilisateur du token."""
+    headers = {"Authorization": f"Bearer {_token(client)}"}
+    response = client.get("/users/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"nom": "alice", "email": "alice@example.com"}
+
+
+def test_invalid_token_is_rejected(client):
+    """Un token invalide produit une erreur 401."""
+    response = client.get(
+        "/users/me", headers={"Authorization": "Bearer invalide"}
+    )
+    assert response.status_code == 401
+    assert (
+        client.get(
+            "/users/is_connected", headers={"Authorization": "Bearer invalide"}
+        ).json()
+        is False
+    )
+
+
+def test_session_opened_once_per_request(client, application, mocker):
+    """Route et utilisateur courant partagent une seule session."""
+    headers = {"Authorization": f"Bearer {_token(client)}"}
+    db_manager = application.services.db_manager
+    spy = mocker.spy(db_manager, "session_scope")
+    client.get("/users/me", headers=headers)
+    assert spy.call_count == 1
@@ -0,0 +1,34 @@
+"""
+Tests des sondes de santé (liveness et readiness).
+"""
+
+
+def test_liveness(client):
+    """Les sondes de vie répondent sans dépendance."""
+    assert client.get("/health").json() == {"status": "ok"}
+    assert client.get("/health/live").json() == {"status": "ok"}
+
+
+def test_readiness_checks_and_cache(client, application, mocker):
+    """La readiness vérifie la base et sert ensuite son cache."""
+    health = application.services.health
+    health._expires_at = 0.0  # pylint: disable=protected-access
+    spy = mocker.spy(health, "_check_database")
+
+    first = client.get("/health/ready")
+    second = client.get("/health/ready")
+
+    assert first.status_code == 200
+    body = first.json()
+    assert body["status"] == "ready"
+    assert body["checks"]["database"]["ok"]
+    assert second.json() == body
+    assert spy.call_count == 1
+
+
+def test_readiness_not_ready_when_draining(client, application):
+    """Pendant l'arrêt progressif, la readiness renvoie 503."""
+    application.services.begin_drain()
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "not_ready"
@@ -0,0 +1,153 @@
+"""
+Tests des clés d'idempotence des routes d'écriture.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from fast_api_xtrem.app.config import IdempotencyConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.middleware.idempotency import (
+    IdempotencyMiddleware,
+    IdempotencyStore,
+)
+from fast_api_xtrem.routes.db import users as users_routes
+
+USER = {"nom": "alice", "email": "alice@example.com", "pswd": "motdepasse1"}
+
+
+def test_replayed_creation_skips_hashing(client, mocker):
+    """Un doublon reçoit la réponse d'origine sans nouvelle exécution."""
+    spy = mocker.spy(users_routes, "hash_password")
+    headers = {"Idempotency-Key": "creation-1"}
+    first = client.post("/users", json=USER, headers=headers)
+    second = client.post("/users", json=USER, headers=headers)
+
+    assert first.status_code == second.status_code == 201
+    assert second.json() == first.json()
+    assert second.headers["idempotent-replayed"] == "true"
+    assert spy.call_count == 1
+    # Sans clé, le doublon est une nouvelle exécution
+    assert client.post("/users", json=USER).status_code == 409
+
+
+def test_key_reused_with_another_body_is_rejected(client):
+    """Une clé ne peut pas servir à deux requêtes différentes."""
+    headers = {"Idempotency-Key": "creation-2"}
+    client.post("/users", json=USER, headers=headers)
+    other = {**USER, "nom": "bob"}
+    response = client.post("/users", json=other, headers=headers)
+    assert response.status_code == 422
+    assert client.post("/users", json=other).status_code == 201
+
+
+def test_oversized_body_is_rejected(client, application):
+    """Un corps dépassant `max_request_bytes` est refusé (413)."""
+    application.services.idempotency.config.max_request_bytes = 16
+    headers = {"Idempotency-Key": "creation-3"}
+    response = client.post("/users", json=USER, headers=headers)
+    assert response.status_code == 413
+
+
+def test_key_scope_includes_client(client):
+    """La même clé, envoyée par deux clients, désigne deux requêtes."""
+    client.post("/users", json=USER)
+    update = {**USER, "email": "alice@example.org"}
+
+    def put(authorization):
+        return client.put(
+            "/users/alice",
+            json=update,
+            headers={"Idempotency-Key": "k", "Authorization": authorization},
+        )
+
+    assert put("Bearer a").status_code == 200
+    assert "idempotent-replayed" not in put("Bearer b").headers
+    assert put("Bearer a").headers["idempotent-replayed"] == "true"
+
+
+def test_anonymous_key_scope_includes_client_address(client, application):
+    """Sans `Authorization`, deux adresses ne partagent pas une clé."""
+    other = TestClient(application.fast_api, client=("10.0.0.2", 50000))
+    headers = {"Idempotency-Key": "creation-4"}
+
+    assert client.post("/users", json=USER, headers=headers).status_code == 201
+    response = other.post("/users", json=USER, headers=headers)
+    assert response.status_code == 409
+    assert "idempotent-replayed" not in response.headers
+    replayed = client.post("/users", json=USER, headers=headers)
+    assert replayed.headers["idempotent-replayed"] == "true"
+
+
+def _scope(store, path="/users", method="POST"):
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [(b"idempotency-key", b"k1")],
+        "app": SimpleNamespace(
+            state=SimpleNamespace(services=SimpleNamespace(idempotency=store))
+        ),
+    }
+
+
+def _run_concurrently(status, count):
+    """Exécute `count` requêtes identiques simultanées."""
+    store = IdempotencyStore(IdempotencyConfig(), MetricsRegistry())
+    executions = []
+
+    async def app(_scope, receive, send):
+        await receive()
+        executions.append(1)
+        await asyncio.sleep(0.05)
+        await send({"type": "http.response.start", "status": status})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    middleware = IdempotencyMiddleware(app)
+
+    async def request():
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"{}"}
+
+        async def send(message):
+            sent.append(message)
+
+        await middleware(_scope(store), receive, send)
+        return sent[0]["status"]
+
+    async def scenario():
+        return await asyncio.gather(*(request() for _ in range(count)))
+
+    return store, executions, asyncio.run(scenario())
+
+
+def test_concurrent_duplicates_are_coalesced():
+    """Des doublons simultanés donnent lieu à une seule exécution."""
+    store, executions, statuses = _run_concurrently(201, 5)
+    assert len(executions) == 1
+    assert statuses == [201] * 5
+    assert (
+        store.metrics.get("idempotency_requests_total", result="coalesced")
+        == 4
+    )
+
+
+def test_server_errors_are_not_stored():
+    """Une erreur serveur n'est pas conservée : le doublon réessaie."""
+    store, executions, statuses = _run_concurrently(500, 2)
+    assert len(executions) == 2
+    assert statuses == [500, 500]
+
+
+def test_route_patterns():
+    """`*` remplace exactement un segment de chemin."""
+    store = IdempotencyStore(IdempotencyConfig(), MetricsRegistry())
+    assert store.matches("POST", "/users")
+    assert store.matches("PUT", "/users/alice")
+    assert not store.matches("PUT", "/users/")
+    assert not store.matches("PUT", "/users/alice/roles")
+    assert not store.matches("POST", "/users/login")
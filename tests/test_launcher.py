@@ -0,0 +1,80 @@
+"""
+Tests du lancement du serveur ASGI selon `NetworkConfig`.
+"""
+
+import random
+
+import pytest
+
+from fast_api_xtrem.app import launcher
+from fast_api_xtrem.app.config import AppConfig, NetworkConfig
+
+
+def test_worker_request_limit_is_jittered():
+    """Chaque worker tire sa limite dans l'intervalle de gigue."""
+    assert launcher.worker_request_limit(NetworkConfig()) is None
+    network = NetworkConfig(
+        max_requests_per_worker=1000, max_requests_jitter=50
+    )
+    rng = random.Random(0)
+    limits = {launcher.worker_request_limit(network, rng) for _ in range(200)}
+    assert min(limits) >= 1000 and max(limits) <= 1050
+    assert len(limits) > 1
+
+
+def test_uvicorn_options_follow_network_config():
+    """Les réglages réseau sont transmis à uvicorn."""
+    config = AppConfig(
+        network_config=NetworkConfig(
+            loop="asyncio",
+            http="h11",
+            keep_alive_seconds=30,
+            backlog=512,
+            max_requests_per_worker=100,
+        )
+    )
+    options = launcher.uvicorn_options(config)
+    assert options["loop"] == "asyncio" and options["http"] == "h11"
+    assert options["timeout_keep_alive"] == 30
+    assert options["backlog"] == 512
+    assert options["limit_concurrency"] is None
+
+    server_config = launcher.WorkerConfig(
+        launcher.ASGI_APP, network=config.network_config, **options
+    )
+    server_config.load()
+    assert server_config.limit_max_requests == 100
+
+
+def test_invalid_or_missing_server_options(monkeypatch):
+    """Valeurs inconnues refusées, dépendances optionnelles vérifiées."""
+    with pytest.raises(ValueError):
+        AppConfig(network_config=NetworkConfig(server="gunicorn"))
+    with pytest.raises(ValueError):
+        AppConfig(network_config=NetworkConfig(http="h2"))
+
+    monkeypatch.setattr(launcher, "find_spec", lambda name: None)
+    config = AppConfig(network_config=NetworkConfig(loop="uvloop"))
+    with pytest.raises(RuntimeError, match="uvloop"):
+        launcher.uvicorn_options(config)
+    monkeypatch.setattr(launcher, "HypercornConfig", None)
+    with pytest.raises(RuntimeError, match="hypercorn"):
+        launcher.hypercorn_config(NetworkConfig(server="hypercorn"))
+
+
+@pytest.mark.parametrize(
+    "network, supervised",
+    [
+        (NetworkConfig(), False),
+        (NetworkConfig(workers=2), True),
+        (NetworkConfig(max_requests_per_worker=100), True),
+    ],
+)
+def test_recycled_worker_is_supervised(mocker, network, supervised):
+    """Un worker unique recyclé tourne sous le superviseur qui le relance."""
+    supervisor = mocker.patch.object(launcher, "Multiprocess")
+    mocker.patch.object(launcher.WorkerConfig, "bind_socket")
+    run = mocker.patch.object(launcher.uvicorn.Server, "run")
+    launcher._serve_uvicorn(AppConfig(network_config=network))
+    assert supervisor.return_value.run.called is supervised
+    assert run.called is not supervised
@@ -0,0 +1,40 @@
+"""
+Tests de la session paresseuse et de l'occupation du pool.
+
+Vérifie qu'aucune connexion n'est empruntée pour les requêtes qui ne
+touchent pas la base, et que les connexions sont rendues après usage.
+"""
+
+from fast_api_xtrem.db.lazy_session import LazySession
+
+
+def test_lazy_session_created_on_first_use(mocker):
+    """La session réelle n'est créée qu'au premier accès."""
+    factory = mocker.Mock()
+    db = LazySession(factory)
+    db.commit()
+    db.close()
+    assert not factory.called
+
+    db.query("User")
+    assert db.started
+    factory.return_value.query.assert_called_once_with("User")
+
+
+def test_invalid_request_borrows_no_connection(client, application):
+    """Une requête rejetée à la validation n'emprunte aucune connexion."""
+    metrics = application.services.metrics
+    before = metrics.get("db_pool_checkouts_total")
+    response = client.post("/users", json={"nom": "bob"})
+    assert response.status_code == 422
+    assert metrics.get("db_pool_checkouts_total") == before
+
+
+def test_connections_returned_after_requests(client, application):
+    """Le pool est entièrement libéré après écritures et lectures."""
+    user = {"nom": "carol", "email": "carol@example.com", "pswd": "secret123"}
+    assert client.post("/users", json=user).status_code == 201
+    assert client.get("/users").status_code == 200
+    status = application.services.db_manager.pool_status()
+    assert status["checked_out"] == 0
+    assert application.services.metrics.get("db_pool_checkouts_total") > 0
@@ -0,0 +1,146 @@
+"""
+Tests de l'index binaire des logs et de sa route d'interrogation.
+"""
+
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from fast_api_xtrem.app.config import AdminConfig, AppConfig, LoggerConfig
+from fast_api_xtrem.logger.log_index import (
+    SYMBOLS_FILE,
+    LogIndexSink,
+    prune_segments,
+    query_index,
+)
+from fast_api_xtrem.logger.logger_manager import LoggerManager
+
+ADMIN = {"X-Admin-Token": "secret"}
+INDEX_CONFIG = LoggerConfig(
+    log_index_enabled=True, log_index_segment_records=4
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_logger(monkeypatch, tmp_path):
+    """Logger neuf, dont les fichiers sont dans tmp_path."""
+    LoggerManager.reset_instance()
+    monkeypatch.setattr(
+        "fast_api_xtrem.logger.logger_manager.__file__",
+        str(tmp_path / "logger" / "logger_manager.py"),
+    )
+    yield
+    LoggerManager.reset_instance()
+
+
+@pytest.fixture
+def app_config():
+    return AppConfig(
+        logger_config=INDEX_CONFIG,
+        admin_config=AdminConfig(api_token="secret"),
+    )
+
+
+def test_index_is_queried_by_time_and_field():
+    """Recherche par intervalle, niveau, événement et utilisateur."""
+    manager = LoggerManager(INDEX_CONFIG)
+    start = time.time()
+    for i in range(10):
+        user = "alice" if i % 2 else "bob"
+        manager.error("échec", event="login_failed", user=user)
+    manager.info("sans champs")
+    end = time.time()
+
+    # Segments de 4 enregistrements : rotation effectuée
+    segments = list(manager.index_dir.glob("*/*.idx"))
+    assert len(segments) >= 3
+
+    result = query_index(
+        manager.index_dir, start, end, event="login_failed", user="alice"
+    )
+    records = result["records"]
+    assert len(records) == 5 and not result["truncated"]
+    assert {(r.level, r.event, r.user) for r in records} == {
+        ("ERROR", "login_failed", "alice")
+    }
+    assert records == sorted(records, key=lambda r: -r.timestamp)
+
+    errors = query_index(manager.index_dir, start, end, level=40, limit=3)
+    assert len(errors["records"]) == 3 and errors["truncated"]
+    assert query_index(manager.index_dir, end + 1, end + 2)["records"] == []
+    assert query_index(manager.index_dir, start, end, user="eve") == {
+        "records": [],
+        "truncated": False,
+    }
+
+
+def test_user_names_are_not_stored():
+    """Seule l'empreinte des noms d'utilisateur est écrite sur disque."""
+    manager = LoggerManager(INDEX_CONFIG)
+    start = time.time()
+    for i in range(50):
+        manager.error("échec", event="login_failed", user=f"inconnu{i}")
+    manager.flush()
+
+    symbols = [
+        path.read_text(encoding="utf-8")
+        for path in manager.index_dir.glob(f"*/{SYMBOLS_FILE}")
+    ]
+    assert symbols == ["login_failed\n"]
+    result = query_index(
+        manager.index_dir, start, time.time(), user="inconnu7"
+    )
+    assert [(r.event, r.user) for r in result["records"]] == [
+        ("login_failed", "inconnu7")
+    ]
+
+
+def test_prune_spares_active_segments(tmp_path):
+    """Un segment incomplet d'un processus en vie n'est pas supprimé ;
+    le répertoire vide d'un processus terminé est retiré."""
+    index_dir = tmp_path / "index"
+    sink = LogIndexSink(index_dir, segment_records=4)
+    record = {
+        "extra": {"event": "login_failed"},
+        "time": datetime.now(timezone.utc),
+        "level": SimpleNamespace(no=40),
+    }
+    for _ in range(5):
+        sink(SimpleNamespace(record=record))
+    dead = index_dir / "99999999"
+    dead.mkdir()
+    (dead / SYMBOLS_FILE).write_text("login_failed\n", encoding="utf-8")
+    (dead / f"{1:020d}.idx").write_bytes(b"")
+
+    # Segment plein du processus courant et segment du processus terminé
+    assert prune_segments(index_dir, time.time() + 60) == 2
+    remaining = {path.name for path in sink.directory.iterdir()}
+    assert remaining == {SYMBOLS_FILE, sink.active_path.name}
+    assert not dead.exists()
+    sink.close()
+
+
+def test_admin_route_queries_index(client):
+    """La route d'administration expose l'index des connexions."""
+    user = {"nom": "alice", "email": "alice@example.com", "pswd": "x" * 8}
+    client.post("/users", json=user)
+    client.post("/users/login", json={**user, "pswd": "mauvais1"})
+    client.post("/users/login", json=user)
+
+    response = client.get(
+        "/admin/logs/index",
+        params={"event": "login_failed", "user": "alice"},
+        headers=ADMIN,
+    )
+    assert response.status_code == 200
+    records = response.json()["records"]
+    assert [(r["level"], r["event"]) for r in records] == [
+        ("ERROR", "login_failed")
+    ]
+
+    invalid = client.get(
+        "/admin/logs/index", params={"level": "LOUD"}, headers=ADMIN
+    )
+    assert invalid.status_code == 400
@@ -0,0 +1,85 @@
+"""
+Tests du profilage à la demande des requêtes.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from fast_api_xtrem.app.config import AdminConfig, AppConfig, ProfilingConfig
+
+ADMIN = {"X-Admin-Token": "admin-secret"}
+
+
+@pytest.fixture
+def app_config():
+    """Configuration avec profilage et routes d'admin activés."""
+    return AppConfig(
+        profiling_config=ProfilingConfig(enabled=True, header_token="go"),
+        admin_config=AdminConfig(api_token="admin-secret"),
+    )
+
+
+@pytest.fixture
+def profiles_dir(application, tmp_path):
+    """Redirige l'écriture des profils vers tmp_path."""
+    application.services.profiler.output_dir = tmp_path / "profiles"
+    return tmp_path / "profiles"
+
+
+def test_header_triggers_profile(client, profiles_dir):
+    """L'en-tête porteur du jeton déclenche un profil."""
+    response = client.get("/", headers={"X-Profile": "go"})
+    profile_id = response.headers["X-Profile-Id"]
+
+    speedscope = profiles_dir / f"{profile_id}.speedscope.json"
+    assert speedscope.exists()
+    assert (profiles_dir / f"{profile_id}.collapsed").exists()
+    document = json.loads(speedscope.read_text(encoding="utf-8"))
+    assert document["profiles"][0]["type"] == "sampled"
+
+
+def test_requests_not_profiled_without_trigger(client, profiles_dir):
+    """Sans déclencheur, aucune requête n'est profilée."""
+    response = client.get("/", headers={"X-Profile": "mauvais"})
+    assert "X-Profile-Id" not in response.headers
+    assert not profiles_dir.exists()
+
+
+def test_admin_endpoint_arms_profiler(client, profiles_dir):
+    """L'endpoint d'admin arme le profilage des prochaines requêtes."""
+    assert client.post("/admin/profiling", json={"count": 1}).status_code == (
+        401
+    )
+    response = client.post(
+        "/admin/profiling",
+        json={"count": 1, "path_prefix": "/health"},
+        headers=ADMIN,
+    )
+    assert response.json()["armed"] == 1
+
+    assert "X-Profile-Id" not in client.get("/").headers
+    assert "X-Profile-Id" in client.get("/health/live").headers
+    assert "X-Profile-Id" not in client.get("/health/live").headers
+
+
+def _slow_lookup():
+    time.sleep(0.2)
+
+
+def test_worker_threads_are_sampled(client, application, profiles_dir):
+    """Les appels `asyncio.to_thread` de la requête sont échantillonnés."""
+
+    @application.fast_api.get("/test/slow")
+    async def slow():
+        await asyncio.to_thread(_slow_lookup)
+        return {}
+
+    response = client.get("/test/slow", headers={"X-Profile": "go"})
+    profile_id = response.headers["X-Profile-Id"]
+    collapsed = (profiles_dir / f"{profile_id}.collapsed").read_text(
+        encoding="utf-8"
+    )
+    assert "_slow_lookup (test_profiling.py" in collapsed
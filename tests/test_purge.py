@@ -0,0 +1,66 @@
+"""
+Tests de la suppression logique et de la purge par lots.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from fast_api_xtrem.app.config import AppConfig, PurgeConfig
+
+
+@pytest.fixture
+def app_config():
+    """Purge par lots de deux, sans pause."""
+    return AppConfig(
+        purge_config=PurgeConfig(batch_size=2, batch_pause_seconds=0)
+    )
+
+
+def _user(nom):
+    return {"nom": nom, "email": f"{nom}@example.com", "pswd": "motdepasse1"}
+
+
+def _rows(application):
+    with application.services.db_manager.engine.connect() as connection:
+        return connection.execute(
+            text("SELECT nom, deleted_at IS NOT NULL FROM users ORDER BY id")
+        ).all()
+
+
+def test_soft_deleted_user_is_hidden(client, application):
+    """Un utilisateur supprimé disparaît de toutes les lectures."""
+    client.post("/users", json=_user("alice"))
+    client.post("/users", json=_user("bob"))
+    assert client.delete("/users/alice").status_code == 200
+
+    assert client.post("/users/login", json=_user("alice")).status_code == 404
+    assert [u["nom"] for u in client.get("/users").json()["data"]] == ["bob"]
+    search = client.get("/users/search", params={"q": "alice"}).json()
+    assert search["data"]["results"] == []
+    assert client.delete("/users/alice").status_code == 404
+    assert _rows(application) == [("alice", 1), ("bob", 0)]
+
+    # Le nom est de nouveau disponible
+    assert client.post("/users", json=_user("alice")).status_code == 201
+    search = client.get("/users/search", params={"q": "alice"}).json()
+    assert len(search["data"]["results"]) == 1
+
+
+def test_purge_deletes_in_batches(client, application):
+    """La purge efface les lignes supprimées par lots bornés."""
+    for index in range(5):
+        client.post("/users", json=_user(f"user{index}"))
+        client.delete(f"/users/user{index}")
+    client.post("/users", json=_user("alice"))
+    services = application.services
+
+    with services.requests.track(), services.requests.track():
+        with services.requests.track():
+            assert services.purger.run() == 0
+    assert services.metrics.get("users_purge_deferred_total") == 1
+
+    assert services.purger.run() == 5
+    assert _rows(application) == [("alice", 0)]
+    assert services.metrics.get("users_purged_total") == 5
+    search = client.get("/users/search", params={"q": "alice"}).json()
+    assert len(search["data"]["results"]) == 1
@@ -0,0 +1,70 @@
+"""
+Tests de l'instrumentation SQL par requête HTTP.
+"""
+
+import pytest
+from fastapi import Depends
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from fast_api_xtrem.app.config import AppConfig, DatabaseConfig
+from fast_api_xtrem.routes.db.users import hash_password
+from fast_api_xtrem.routes.dependencies import get_db
+
+USER = {"nom": "dave", "email": "dave@example.com", "pswd": "secret123"}
+
+
+@pytest.fixture
+def app_config():
+    """Seuils abaissés pour déclencher les avertissements."""
+    return AppConfig(
+        database_config=DatabaseConfig(
+            slow_query_ms=0.0, repeated_statement_threshold=2
+        )
+    )
+
+
+def test_query_count_headers(client):
+    """Les en-têtes X-DB-* reflètent les requêtes SQL exécutées."""
+    client.post("/users", json=USER)
+    response = client.get("/users")
+    assert response.headers["X-DB-Query-Count"] == "1"
+    assert float(response.headers["X-DB-Time-Ms"]) >= 0
+    assert "X-DB-Query-Count" not in client.get("/").headers
+
+
+def test_slow_and_repeated_queries_logged(client, application, mocker):
+    """Requêtes lentes (avec plan) et répétitions sont signalées."""
+    warning = mocker.spy(application.services.logger, "warning")
+    client.post("/users", json=USER)
+    renamed = {**USER, "nom": "david"}
+    assert client.put("/users/dave", json=renamed).status_code == 200
+
+    # Route exécutant deux fois la même instruction (N+1)
+    @application.fast_api.get("/test/repeated")
+    def repeated(db: Session = Depends(get_db)):
+        for nom in ("dave", "david"):
+            db.execute(
+                text("SELECT email FROM users WHERE nom = :nom"), {"nom": nom}
+            )
+        return {}
+
+    response = client.get("/test/repeated")
+    assert response.headers["X-DB-Query-Count"] == "2"
+
+    messages = [call.args[0] for call in warning.call_args_list]
+    assert any("Requête lente" in m and "plan :" in m for m in messages)
+    assert any("N+1 probable" in m for m in messages)
+    assert application.services.metrics.get("db_slow_queries_total") > 0
+    # Paramètres masqués : ni email ni empreinte de mot de passe
+    digest = hash_password(USER["pswd"])
+    assert not any("dave@" in m or digest in m for m in messages)
+
+
+def test_failed_statement_releases_timer(client, application):
+    """Une instruction en échec ne laisse pas de mesure en attente."""
+    engine = application.services.db_manager.engine
+    with engine.connect() as connection:
+        with pytest.raises(Exception):
+            connection.execute(text("SELECT * FROM table_absente"))
+        assert connection.info["query_started_at"] == []
@@ -0,0 +1,98 @@
+"""
+Tests de la limitation de débit des routes de connexion.
+
+Vérifie l'algorithme de fenêtre glissante, les deux stockages de compteurs
+et le rejet des tentatives en excès par le middleware.
+"""
+
+import pytest
+
+from fast_api_xtrem.app.config import AppConfig, RateLimitConfig
+from fast_api_xtrem.middleware.counter_store import (
+    MemoryCounterStore,
+    SQLiteCounterStore,
+    evaluate_hit,
+)
+
+
+def test_sliding_window_blocks_after_limit():
+    """Au-delà de la limite, la tentative est refusée et non comptée."""
+    state = None
+    for _ in range(3):
+        state, result = evaluate_hit(state, 10.0, 60.0, 3)
+        assert result.allowed
+    new_state, result = evaluate_hit(state, 10.0, 60.0, 3)
+    assert not result.allowed
+    assert new_state == state
+    assert result.retry_after >= 50
+
+
+def test_sliding_window_weights_previous_window():
+    """Le compteur de la fenêtre précédente s'estompe progressivement."""
+    state = (0, 4, 0)
+    # Début de la fenêtre suivante : 4 tentatives encore presque entières
+    _, result = evaluate_hit(state, 61.0, 60.0, 4)
+    assert not result.allowed
+    # Aux trois quarts : il ne reste qu'une tentative pondérée
+    _, result = evaluate_hit(state, 105.0, 60.0, 4)
+    assert result.allowed
+
+
+def test_memory_store_evicts_oldest_keys():
+    """Le stockage mémoire reste borné en nombre de clés."""
+    store = MemoryCounterStore(max_keys=2)
+    for key in ("a", "b", "c"):
+        store.hit(key, 0.0, 60.0, 5)
+    assert len(store) == 2
+
+
+def test_sqlite_store_is_shared(tmp_path):
+    """Deux instances sur le même fichier partagent les compteurs."""
+    path = str(tmp_path / "counters.db")
+    first, second = SQLiteCounterStore(path), SQLiteCounterStore(path)
+    assert first.hit("ip:1", 0.0, 60.0, 1).allowed
+    assert not second.hit("ip:1", 1.0, 60.0, 1).allowed
+    first.close()
+    second.close()
+
+
+@pytest.fixture
+def app_config():
+    """Configuration avec une limite basse par utilisateur."""
+    return AppConfig(
+        rate_limit_config=RateLimitConfig(max_attempts_per_user=2)
+    )
+
+
+def test_login_throttled_before_db(client, mocker):
+    """Les tentatives en excès sont rejetées sans requête en base."""
+    lookup = mocker.patch(
+        "fast_api_xtrem.routes.db.users.get_user_projection", return_value=None
+    )
+    form = {"username": "alice", "password": "mauvais-mdp"}
+    for _ in range(2):
+        assert client.post("/users/token", data=form).status_code == 404
+    response = client.post("/users/token", data=form)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert lookup.call_count == 2
+    metrics = client.get("/metrics").text
+    assert 'rate_limit_rejected_total{path="/users/token",scope="user"}' in (
+        metrics
+    )
+
+
+def test_oversized_body_is_rejected(client, application):
+    """Un corps dépassant `max_body_bytes` est refusé (413) sans être lu."""
+    application.services.rate_limiter.config.max_body_bytes = 64
+    form = {"username": "alice", "password": "x" * 100}
+    assert client.post("/users/token", data=form).status_code == 413
+    # Corps transmis par morceaux, sans Content-Length
+    chunks = (b"username=alice&password=" + b"x" * 40 for _ in range(3))
+    response = client.post(
+        "/users/token",
+        content=chunks,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert response.status_code == 413
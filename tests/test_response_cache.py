@@ -0,0 +1,113 @@
+"""
+Tests du cache des réponses GET et de son invalidation par étiquette.
+"""
+
+from fast_api_xtrem.app.config import ResponseCacheConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.middleware.response_cache import (
+    ResponseCache,
+    normalize_query,
+)
+from fast_api_xtrem.routes.db import users as users_routes
+
+
+def _user(nom):
+    return {"nom": nom, "email": f"{nom}@example.com", "pswd": "motdepasse1"}
+
+
+def _token(client, nom):
+    return client.post(
+        "/users/token", data={"username": nom, "password": "motdepasse1"}
+    ).json()["access_token"]
+
+
+def test_listing_is_served_from_cache_until_a_write(client, mocker):
+    """La liste est servie depuis le cache, puis invalidée à l'écriture."""
+    client.post("/users", json=_user("alice"))
+    spy = mocker.spy(users_routes, "get_active_users")
+
+    first = client.get("/users")
+    second = client.get("/users")
+    assert first.headers["x-cache"] == "miss"
+    assert second.headers["x-cache"] == "hit"
+    assert second.content == first.content
+    assert spy.call_count == 1
+
+    client.post("/users", json=_user("bob"))
+    third = client.get("/users")
+    assert third.headers["x-cache"] == "miss"
+    assert [u["nom"] for u in third.json()["data"]] == ["alice", "bob"]
+
+
+def test_me_is_cached_per_user(client):
+    """`/users/me` est propre à l'utilisateur et invalidé à la mise à jour."""
+    for nom in ("alice", "bob"):
+        client.post("/users", json=_user(nom))
+    headers = {
+        nom: {"Authorization": f"Bearer {_token(client, nom)}"}
+        for nom in ("alice", "bob")
+    }
+
+    for _ in range(2):
+        alice = client.get("/users/me", headers=headers["alice"])
+        bob = client.get("/users/me", headers=headers["bob"])
+    assert alice.headers["x-cache"] == bob.headers["x-cache"] == "hit"
+    assert alice.json()["nom"] == "alice" and bob.json()["nom"] == "bob"
+
+    # Token invalide : pas de cache, la route répond 401
+    invalid = client.get("/users/me", headers={"Authorization": "Bearer x"})
+    assert invalid.status_code == 401
+    assert "x-cache" not in invalid.headers
+
+    client.put("/users/alice", json=_user("alicia"))
+    assert client.get("/users/me", headers=headers["alice"]).status_code == 404
+    bob = client.get("/users/me", headers=headers["bob"])
+    assert bob.headers["x-cache"] == "hit"
+
+
+def test_query_string_is_normalized():
+    """L'ordre des paramètres ne change pas la clé."""
+    assert normalize_query(b"b=2&a=1") == normalize_query(b"a=1&b=2")
+    assert normalize_query(b"") == ""
+
+
+def _cache(clock, **config):
+    return ResponseCache(
+        ResponseCacheConfig(**config),
+        MetricsRegistry(),
+        clock=lambda: clock[0],
+    )
+
+
+def test_memory_cap_ttl_and_stale_epoch():
+    """Mémoire bornée, expiration et refus d'une réponse périmée."""
+    clock = [0.0]
+    cache = _cache(clock, ttl_seconds=10.0, max_bytes=250, max_entry_bytes=200)
+    for index in range(3):
+        assert cache.set(("/a", "", str(index)), 200, [], b"x" * 100, (), 0)
+    assert cache.get(("/a", "", "0")) is None
+    assert cache.get(("/a", "", "2")) is not None
+    assert cache.size <= 250
+    # Réponse trop volumineuse
+    assert not cache.set(("/b", "", ""), 200, [], b"x" * 300, (), 0)
+
+    clock[0] = 11.0
+    assert cache.get(("/a", "", "2")) is None
+
+    epoch = cache.epoch
+    cache.invalidate("users:*")
+    assert not cache.set(("/a", "", ""), 200, [], b"x", (), epoch)
+
+
+def test_tag_invalidation():
+    """Une étiquette `préfixe:*` invalide toutes celles du préfixe."""
+    cache = _cache([0.0])
+    cache.set(("/users", "", ""), 200, [], b"l", ("users:list",), 0)
+    cache.set(("/users/me", "", "a"), 200, [], b"a", ("user:a",), 0)
+    cache.set(("/users/me", "", "b"), 200, [], b"b", ("user:b",), 0)
+
+    assert cache.invalidate("user:a") == 1
+    assert cache.get(("/users/me", "", "b")) is not None
+    assert cache.invalidate("users:*") == 1
+    assert cache.get(("/users", "", "")) is None
+    assert cache.get(("/users/me", "", "b")) is not None
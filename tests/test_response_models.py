@@ -0,0 +1,56 @@
+"""
+Tests des modèles de réponse des routes utilisateurs.
+"""
+
+from starlette.responses import JSONResponse
+
+from fast_api_xtrem.db.models.user import UserSearchOut, UserStatsOut
+from fast_api_xtrem.routes.db.users import TrustedJSONResponse
+
+
+def _response_schema(openapi, method, path, status="200"):
+    content = openapi["paths"][path][method]["responses"][status]["content"]
+    return content["application/json"]["schema"]
+
+
+def test_openapi_documents_response_models(client):
+    """Le schéma OpenAPI décrit les réponses typées."""
+    openapi = client.get("/openapi.json").json()
+    assert _response_schema(openapi, "get", "/users") == {
+        "$ref": "#/components/schemas/UserList"
+    }
+    assert _response_schema(openapi, "get", "/users/me") == {
+        "$ref": "#/components/schemas/UserOut"
+    }
+    assert _response_schema(openapi, "post", "/users/token") == {
+        "$ref": "#/components/schemas/TokenOut"
+    }
+    assert _response_schema(openapi, "get", "/users/stats") == {
+        "$ref": "#/components/schemas/UserStatsOut"
+    }
+    assert _response_schema(openapi, "get", "/users/search") == {
+        "$ref": "#/components/schemas/UserSearchOut"
+    }
+    user_list = openapi["components"]["schemas"]["UserList"]
+    assert user_list["properties"]["data"]["items"] == {
+        "$ref": "#/components/schemas/UserOut"
+    }
+
+
+def test_documented_models_match_responses(client):
+    """Les réponses de /stats et /search respectent leur modèle."""
+    client.post(
+        "/users",
+        json={"nom": "alice", "email": "alice@example.com", "pswd": "x" * 8},
+    )
+    stats = client.get("/users/stats").json()
+    assert UserStatsOut.model_validate(stats).data.total == 1
+    found = client.get("/users/search", params={"q": "ali"}).json()
+    page = UserSearchOut.model_validate(found).data
+    assert [u.nom for u in page.results] == ["alice"] and not page.has_more
+
+
+def test_trusted_response_matches_json_response():
+    """La sérialisation directe produit le même corps que JSONResponse."""
+    content = {"message": "Succès", "data": [{"nom": 'é"<>', "email": ""}]}
+    assert TrustedJSONResponse(content).body == JSONResponse(content).body
@@ -0,0 +1,172 @@
+"""
+Tests de l'ordonnanceur des tâches de maintenance.
+"""
+
+import asyncio
+import os
+import time
+
+from fast_api_xtrem.app.config import SchedulerConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.app.scheduler import LeaderLock, Scheduler
+
+
+class _Logger:
+    def __init__(self):
+        self.errors = []
+
+    def error(self, message):
+        self.errors.append(message)
+
+
+def _scheduler(tmp_path, **config):
+    return Scheduler(
+        SchedulerConfig(**config),
+        metrics=MetricsRegistry(),
+        logger=_Logger(),
+        lock_path=tmp_path / "scheduler.lock",
+    )
+
+
+def test_delay_is_jittered_within_bounds(tmp_path):
+    """L'intervalle est perturbé de ±jitter_ratio."""
+    scheduler = _scheduler(tmp_path, jitter_ratio=0.2)
+    delays = [scheduler._delay(10.0) for _ in range(200)]
+    assert all(8.0 <= delay <= 12.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_leader_lock_is_exclusive(tmp_path):
+    """Un seul détenteur du verrou ; il est repris après libération."""
+    first = LeaderLock(tmp_path / "leader.lock")
+    second = LeaderLock(tmp_path / "leader.lock")
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    first.release()
+    assert second.try_acquire()
+    second.release()
+
+
+def test_run_job_records_timing_and_errors(tmp_path):
+    """Chaque exécution publie sa durée et son issue."""
+    scheduler = _scheduler(tmp_path)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    scheduler.add_job("ok", lambda: time.sleep(0.01), lambda: 1.0)
+    scheduler.add_job("ko", fail, lambda: 1.0)
+    for job in scheduler.jobs.values():
+        asyncio.run(scheduler.run_job(job))
+
+    metrics = scheduler.metrics
+    assert metrics.get("scheduler_job_runs_total", job="ok", status="ok") == 1
+    assert metrics.get("scheduler_job_last_seconds", job="ok") >= 0.01
+    assert (
+        metrics.get("scheduler_job_runs_total", job="ko", status="error") == 1
+    )
+    assert scheduler.status()["jobs"]["ko"]["last_status"] == "error"
+    assert scheduler.logger.errors
+
+
+def test_leader_only_jobs_run_on_a_single_worker(tmp_path):
+    """Seul le détenteur du verrou exécute les tâches partagées."""
+    runs = {"a": 0, "b": 0}
+    workers = {}
+    for name in runs:
+        worker = _scheduler(tmp_path, jitter_ratio=0.0)
+        worker.add_job(
+            "shared",
+            lambda name=name: runs.__setitem__(name, runs[name] + 1),
+            lambda: 0.01,
+            leader_only=True,
+        )
+        workers[name] = worker
+
+    async def scenario():
+        for worker in workers.values():
+            worker.start()
+        await asyncio.sleep(0.1)
+        for worker in workers.values():
+            await worker.stop()
+
+    asyncio.run(scenario())
+    assert runs["a"] > 0 and runs["b"] == 0
+    skipped = workers["b"].metrics.get(
+        "scheduler_job_runs_total", job="shared", status="skipped"
+    )
+    assert skipped > 0
+    # Le verrou est libéré à l'arrêt
+    assert LeaderLock(tmp_path / "scheduler.lock").try_acquire()
+
+
+def test_stop_cancels_pending_jobs(tmp_path):
+    """L'arrêt annule les attentes ; un intervalle nul suspend la tâche."""
+    runs = []
+    scheduler = _scheduler(tmp_path)
+    scheduler.add_job("slow", lambda: runs.append(1), lambda: 3600.0)
+    scheduler.add_job("off", lambda: runs.append(2), lambda: 0.0)
+
+    async def scenario():
+        scheduler.start()
+        await asyncio.sleep(0.01)
+        tasks = list(scheduler._tasks.values())
+        await asyncio.wait_for(scheduler.stop(), timeout=1.0)
+        return tasks
+
+    tasks = asyncio.run(scenario())
+    assert runs == []
+    assert all(task.cancelled() for task in tasks)
+
+
+def test_maintenance_jobs_run(client, application, monkeypatch, tmp_path):
+    """Les tâches enregistrées par les services s'exécutent sans erreur."""
+    user = {
+        "nom": "alice",
+        "email": "alice@example.com",
+        "pswd": "motdepasse1",
+    }
+    client.post("/users", json=user)
+    assert client.post("/users/login", json=user).status_code == 200
+
+    services = application.services
+    monkeypatch.setattr(services.logger, "_logs_dir", tmp_path / "logs")
+    assert services._refresh_user_cache() == 1
+
+    scheduler = services.scheduler
+    for job in scheduler.jobs.values():
+        asyncio.run(scheduler.run_job(job))
+    statuses = {
+        name: job["last_status"]
+        for name, job in scheduler.status()["jobs"].items()
+    }
+    assert set(statuses.values()) == {"ok"}, statuses
+
+    # Le point de contrôle porte sur un journal WAL actif
+    with services.db_manager.engine.connect() as connection:
+        mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+    assert mode == "wal"
+
+
+def test_prune_archives_keeps_active_log(
+    client, application, monkeypatch, tmp_path
+):
+    """Seules les archives anciennes sont supprimées."""
+    logger = application.services.logger
+    logs_dir = tmp_path / "logs"
+    (logs_dir / "profiles").mkdir(parents=True)
+    monkeypatch.setattr(logger, "_logs_dir", logs_dir)
+    monkeypatch.setattr(logger, "_log_file_name", "app.log")
+    old_files = [
+        logs_dir / "app.2020-01-01.log.zip",
+        logs_dir / "profiles" / "20200101_GET_users.collapsed",
+    ]
+    kept_files = [logs_dir / "app.log", logs_dir / "app.recent.log.zip"]
+    for path in old_files + kept_files:
+        path.write_text("x", encoding="utf-8")
+    for path in old_files + kept_files[:1]:
+        os.utime(path, (0, 0))
+
+    assert logger.prune_archives(86400) == 2
+    assert not any(path.exists() for path in old_files)
+    assert all(path.exists() for path in kept_files)
@@ -0,0 +1,40 @@
+"""
+Tests de l'arrêt progressif (drain) de l'application.
+"""
+
+import asyncio
+
+import pytest
+
+from fast_api_xtrem.app.config import AppConfig, ShutdownConfig
+
+
+@pytest.fixture
+def app_config():
+    """Configuration avec un délai de drain court."""
+    return AppConfig(shutdown_config=ShutdownConfig(drain_timeout_seconds=0.2))
+
+
+def test_new_requests_rejected_while_draining(client, application):
+    """Pendant le drain, seules les sondes de santé sont servies."""
+    application.services.begin_drain()
+    response = client.get("/")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert client.get("/health/live").status_code == 200
+
+
+def test_drain_waits_then_reports_dropped(client, application):
+    """Le drain attend les travaux en cours et compte les abandons."""
+    services = application.services
+
+    async def scenario():
+        with services.requests.track():
+            slow = asyncio.create_task(services.drain())
+            await asyncio.sleep(0)
+            assert not slow.done()
+            return await slow
+
+    assert asyncio.run(scenario()) == 1
+    assert services.metrics.get("shutdown_dropped_requests") == 1
+    assert asyncio.run(services.drain()) == 0
@@ -0,0 +1,95 @@
+"""
+Tests du regroupement des lectures concurrentes (single-flight).
+"""
+
+import asyncio
+
+import pytest
+
+from fast_api_xtrem.app.config import SingleFlightConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.cache.single_flight import SingleFlight
+
+
+def _burst(flights, func, count=5):
+    async def scenario():
+        return await asyncio.gather(
+            *(flights.run("group", "key", func) for _ in range(count)),
+            return_exceptions=True,
+        )
+
+    return asyncio.run(scenario())
+
+
+def _slow(calls, result):
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return func
+
+
+def test_concurrent_calls_share_one_execution():
+    """Les appels simultanés reçoivent le résultat d'une seule exécution."""
+    flights = SingleFlight(SingleFlightConfig(), MetricsRegistry())
+    calls = []
+    assert _burst(flights, _slow(calls, b"body")) == [b"body"] * 5
+    assert len(calls) == 1
+    metrics = flights.metrics
+    assert metrics.get(
+        "single_flight_requests_total", group="group", result="shared"
+    ) == pytest.approx(4)
+    assert metrics.get(
+        "single_flight_coalescing_ratio", group="group"
+    ) == pytest.approx(0.8)
+    # Exécution terminée : l'appel suivant relit
+    _burst(flights, _slow(calls, b"body"), count=1)
+    assert len(calls) == 2
+
+
+def test_errors_are_shared():
+    """Une erreur de l'exécution est transmise à tous les appelants."""
+    flights = SingleFlight(SingleFlightConfig(), MetricsRegistry())
+    calls = []
+    results = _burst(flights, _slow(calls, ValueError("boom")))
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_disabled_runs_every_call():
+    """Désactivé, chaque appel exécute sa propre lecture."""
+    flights = SingleFlight(
+        SingleFlightConfig(enabled=False), MetricsRegistry()
+    )
+    calls = []
+    _burst(flights, _slow(calls, b"body"))
+    assert len(calls) == 5
+
+
+def test_me_and_listing_responses(client):
+    """Les routes regroupées renvoient le même contenu qu'auparavant."""
+    user = {
+        "nom": "alice",
+        "email": "alice@example.com",
+        "pswd": "motdepasse1",
+    }
+    client.post("/users", json=user)
+    token = client.post(
+        "/users/token", data={"username": "alice", "password": "motdepasse1"}
+    ).json()["access_token"]
+
+    me = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+    assert me.json() == {"nom": "alice", "email": "alice@example.com"}
+    listing = client.get("/users").json()
+    assert listing == {
+        "message": "Succès",
+        "data": [{"nom": "alice", "email": "alice@example.com"}],
+    }
+
+    client.delete("/users/alice")
+    me = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+    assert me.status_code == 404
+    assert client.get("/users").status_code == 404
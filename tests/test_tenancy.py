@@ -0,0 +1,169 @@
+"""
+Tests du routage des sessions vers la base de chaque organisation.
+"""
+
+import pytest
+
+from fast_api_xtrem.app.config import AdminConfig, AppConfig, DatabaseConfig
+from fast_api_xtrem.db.tenancy import InvalidTenantError, validate_tenant
+
+
+@pytest.fixture
+def app_config():
+    return AppConfig(
+        admin_config=AdminConfig(api_token="secret"),
+        database_config=DatabaseConfig(
+            tenancy_enabled=True, max_open_tenants=2, tenants=("a", "b", "c")
+        ),
+    )
+
+
+def _create(client, tenant, nom, email):
+    return client.post(
+        "/users",
+        json={"nom": nom, "email": email, "pswd": "motdepasse1"},
+        headers={"X-Tenant": tenant},
+    )
+
+
+def _token(client, tenant, nom):
+    return client.post(
+        "/users/token",
+        data={"username": nom, "password": "motdepasse1"},
+        headers={"X-Tenant": tenant},
+    ).json()["access_token"]
+
+
+def test_tenants_are_isolated(client, tmp_path):
+    """Un même nom peut exister dans deux organisations distinctes."""
+    assert _create(client, "a", "alice", "alice@a.com").status_code == 201
+    assert _create(client, "b", "alice", "alice@b.com").status_code == 201
+    assert _create(client, "a", "bob", "bob@a.com").status_code == 201
+
+    listing = client.get("/users", headers={"X-Tenant": "a"}).json()["data"]
+    assert [u["nom"] for u in listing] == ["alice", "bob"]
+    listing = client.get("/users", headers={"X-Tenant": "b"}).json()["data"]
+    assert listing == [{"nom": "alice", "email": "alice@b.com"}]
+    # Base principale inchangée
+    assert client.get("/users").status_code == 404
+
+    tenants_dir = tmp_path / "database" / "tenants"
+    assert (tenants_dir / "a.db").exists() and (tenants_dir / "b.db").exists()
+
+
+def test_token_claim_wins_over_header(client):
+    """Un client authentifié reste dans l'organisation de son token."""
+    _create(client, "a", "alice", "alice@a.com")
+    _create(client, "b", "alice", "alice@b.com")
+    token = _token(client, "b", "alice")
+
+    me = client.get(
+        "/users/me",
+        headers={"Authorization": f"Bearer {token}", "X-Tenant": "a"},
+    )
+    assert me.json() == {"nom": "alice", "email": "alice@b.com"}
+
+
+def test_invalid_tenant_is_rejected(client, tmp_path):
+    """Nom invalide refusé (400), organisation non déclarée (404), sans
+    création de base."""
+    for tenant in ("../etc", "A", "x" * 64):
+        response = client.get("/users", headers={"X-Tenant": tenant})
+        assert response.status_code == 400
+    with pytest.raises(InvalidTenantError):
+        validate_tenant("a/b")
+
+    response = _create(client, "inconnue", "alice", "alice@x.com")
+    assert response.status_code == 404
+    assert not (tmp_path / "database" / "tenants" / "inconnue.db").exists()
+
+
+def test_open_tenants_are_bounded(client, application):
+    """Au-delà de `max_open_tenants`, la base la moins utilisée est fermée."""
+    for tenant in ("a", "b", "c"):
+        _create(client, tenant, "alice", f"alice@{tenant}.com")
+    db_manager = application.services.db_manager
+    assert db_manager.open_tenants() == ["b", "c"]
+    assert application.services.metrics.get("db_open_tenants") == 2
+
+    # Réouverture transparente, données conservées
+    listing = client.get("/users", headers={"X-Tenant": "a"}).json()["data"]
+    assert listing == [{"nom": "alice", "email": "alice@a.com"}]
+    assert db_manager.open_tenants() == ["c", "a"]
+
+
+def test_pool_capacity_covers_open_tenants(client, application):
+    """La capacité publiée porte sur les mêmes pools que l'occupation."""
+    db_manager = application.services.db_manager
+    per_engine = db_manager.config.pool_size + db_manager.config.max_overflow
+    metrics = application.services.metrics
+    assert metrics.get("db_pool_capacity") == per_engine
+    for tenant in ("a", "b", "c"):
+        _create(client, tenant, "alice", f"alice@{tenant}.com")
+    assert metrics.get("db_pool_capacity") == 3 * per_engine
+    assert db_manager.pool_status()["capacity"] == 3 * per_engine
+
+
+def test_failed_opening_releases_lock(client, application, mocker):
+    """Un échec d'ouverture ne laisse pas de verrou d'organisation."""
+    db_manager = application.services.db_manager
+    mocker.patch.object(db_manager, "_open_tenant", side_effect=OSError)
+    with pytest.raises(OSError):
+        db_manager.open_tenant("a")
+    assert db_manager._opening == {}
+
+
+def test_stats_and_purge_cover_tenants(client, application):
+    """Statistiques et purge portent aussi sur les bases d'organisation."""
+    _create(client, "a", "alice", "alice@a.com")
+    _create(client, "a", "bob", "bob@a.com")
+    assert client.delete("/users/bob", headers={"X-Tenant": "a"}).json()
+
+    stats = client.get("/users/stats", headers={"X-Tenant": "a"}).json()
+    assert stats["data"]["total"] == 1
+    assert client.get("/users/stats").json()["data"]["total"] == 0
+
+    services = application.services
+    assert services.db_manager.existing_tenants() == ["a"]
+    assert services.purger.run() == 1
+    assert services.metrics.get("users_total", tenant="a") == 1
+
+
+def test_maintenance_covers_tenants(client, application):
+    """Les tâches de maintenance parcourent chaque base existante."""
+    _create(client, "a", "alice", "alice@a.com")
+    _create(client, "c", "alice", "alice@c.com")
+    databases = []
+
+    def operation(engine, _logger):
+        databases.append(engine.url.database.rsplit("/", 1)[-1])
+        return True
+
+    assert application.services._maintain(operation) == 3
+    assert databases[1:] == ["a.db", "c.db"]
+
+
+def test_audit_records_tenant(client, application):
+    """Le journal d'audit, en base principale, trace l'organisation."""
+    _create(client, "a", "alice", "alice@a.com")
+    _token(client, "a", "alice")
+    _create(client, "b", "alice", "alice@b.com")
+    client.delete("/users/alice", headers={"X-Tenant": "b"})
+    assert application.services.audit.flush()
+
+    response = client.get(
+        "/admin/audit",
+        headers={"X-Admin-Token": "secret", "X-Tenant": "c"},
+        params={"tenant": "b"},
+    )
+    events = response.json()["events"]
+    assert [(e["event_type"], e["tenant"]) for e in events] == [
+        ("user_deleted", "b")
+    ]
+    events = client.get(
+        "/admin/audit", headers={"X-Admin-Token": "secret"}
+    ).json()["events"]
+    assert [(e["event_type"], e["tenant"]) for e in events] == [
+        ("user_deleted", "b"),
+        ("login_succeeded", "a"),
+    ]
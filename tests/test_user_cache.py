@@ -0,0 +1,156 @@
+"""
+Tests du cache des projections utilisateur.
+
+Vérifie l'expiration et l'éviction du cache LRU, le regroupement des
+défauts concurrents, le second niveau partagé et l'invalidation par les
+routes d'écriture.
+"""
+
+import asyncio
+import threading
+import time
+
+from fast_api_xtrem.app.config import CacheConfig
+from fast_api_xtrem.app.metrics import MetricsRegistry
+from fast_api_xtrem.cache.lru import MISSING, TTLCache
+from fast_api_xtrem.cache.shared import SQLiteSharedCache
+from fast_api_xtrem.cache.user_cache import UserCache
+from fast_api_xtrem.db.models.user import UserProjection
+from fast_api_xtrem.routes.db import users
+
+ALICE = UserProjection(1, "alice", "alice@example.com", "empreinte")
+
+
+def test_ttl_cache_expires_and_evicts():
+    """Les entrées expirent et la moins récemment utilisée est évincée."""
+    now = [0.0]
+    cache = TTLCache(max_size=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is MISSING
+    assert cache.evictions == 1
+    now[0] = 11
+    assert cache.get("a") is MISSING
+
+
+def test_concurrent_misses_load_once():
+    """Des défauts simultanés sur une clé ne déclenchent qu'un chargement."""
+    cache = UserCache(CacheConfig(), MetricsRegistry())
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return ALICE
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("a", loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == [ALICE] * 8
+
+
+def test_shared_tier_and_invalidation(tmp_path):
+    """Le second niveau sert les autres workers jusqu'à invalidation."""
+    path = str(tmp_path / "shared.db")
+    metrics = MetricsRegistry()
+    first = UserCache(CacheConfig(), metrics, shared=SQLiteSharedCache(path))
+    second = UserCache(CacheConfig(), metrics, shared=SQLiteSharedCache(path))
+    assert first.get("alice", lambda: ALICE) == ALICE
+    assert second.get("alice", lambda: None) == ALICE
+    assert metrics.get("user_cache_requests_total", result="shared_hit") == 1
+
+    first.invalidate("alice")
+    second.local.clear()
+    assert second.get("alice", lambda: None) is None
+    first.close()
+    second.close()
+
+
+def test_stale_load_is_not_published(tmp_path):
+    """Une lecture antérieure à l'invalidation d'un autre worker n'est pas
+    republiée dans le second niveau."""
+    path = str(tmp_path / "shared.db")
+    metrics = MetricsRegistry()
+    reader = UserCache(CacheConfig(), metrics, shared=SQLiteSharedCache(path))
+    writer = UserCache(CacheConfig(), metrics, shared=SQLiteSharedCache(path))
+
+    def stale_loader():
+        # Un autre worker valide un changement de mot de passe
+        writer.invalidate("alice")
+        return ALICE
+
+    assert reader.get("alice", stale_loader) == ALICE
+    fresh = ALICE._replace(pswd="nouvelle")
+    assert writer.get("alice", lambda: fresh) == fresh
+    reader.local.clear()
+    assert reader.get("alice", lambda: None) == fresh
+    assert metrics.get("user_cache_stale_writes_total") == 1
+    reader.close()
+    writer.close()
+
+
+def test_write_routes_invalidate_cache(client):
+    """Un changement de mot de passe est pris en compte immédiatement."""
+    user = {
+        "nom": "alice",
+        "email": "alice@example.com",
+        "pswd": "motdepasse1",
+    }
+    client.post("/users", json=user)
+    assert client.post("/users/login", json=user).status_code == 200
+
+    client.put("/users/alice", json={**user, "pswd": "nouveaumdp1"})
+    assert client.post("/users/login", json=user).status_code == 401
+    assert (
+        client.post(
+            "/users/login", json={**user, "pswd": "nouveaumdp1"}
+        ).status_code
+        == 200
+    )
+    client.delete("/users/alice")
+    assert client.post("/users/login", json=user).status_code == 404
+
+
+def test_write_routes_run_off_the_event_loop(client, mocker):
+    """Vérification, écriture et invalidation s'exécutent dans un thread."""
+    loops = []
+
+    def off_loop(func):
+        def spy(*args, **kwargs):
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+            return func(*args, **kwargs)
+
+        return spy
+
+    mocker.patch.object(
+        UserCache, "invalidate", off_loop(UserCache.invalidate)
+    )
+    for name in ("user_exists", "get_user_by_name"):
+        mocker.patch(
+            f"fast_api_xtrem.routes.db.users.{name}",
+            off_loop(getattr(users, name)),
+        )
+    user = {
+        "nom": "alice",
+        "email": "alice@example.com",
+        "pswd": "motdepasse1",
+    }
+    assert client.post("/users", json=user).status_code == 201
+    assert client.post("/users", json=user).status_code == 409
+    assert client.put("/users/alice", json=user).status_code == 200
+    assert client.delete("/users/alice").status_code == 200
+    assert client.delete("/users/alice").status_code == 404
+    assert len(loops) == 8
+    assert set(loops) == {None}
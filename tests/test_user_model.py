@@ -10,7 +10,8 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from fast_api_xtrem.db.base import Base
-from fast_api_xtrem.db.models.user import User
+from fast_api_xtrem.db.models.user import User, UserSummary, utc_now
+from fast_api_xtrem.db.utils.queries import get_active_users, user_exists
 
 
 @pytest.fixture(scope="function")
@@ -71,3 +72,24 @@ def test_user_fields():
     assert "pswd" in columns
     assert columns["nom"].nullable is False
     assert columns["email"].nullable is False
+
+
+def test_read_projections(db_session):
+    """
+    Vérifie que les lectures renvoient des projections, sans charger
+    d'objet ORM dans la session.
+    """
+    db_session.add_all([
+        User(nom="Alice", email="alice@example.com", pswd="secret"),
+        User(nom="Bob", email="bob@example.com", pswd="secret",
+             deleted_at=utc_now()),
+    ])
+    db_session.commit()
+    db_session.expunge_all()
+
+    assert get_active_users(db_session) == [
+        UserSummary("Alice", "alice@example.com")
+    ]
+    assert user_exists(db_session, "Alice")
+    assert not user_exists(db_session, "Bob")
+    assert len(db_session.identity_map) == 0
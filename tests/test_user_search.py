@@ -0,0 +1,116 @@
+"""
+Tests de la recherche des utilisateurs (index FTS5 et triggers).
+"""
+
+import asyncio
+
+from loguru import logger
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+
+from fast_api_xtrem.db.base import Base
+from fast_api_xtrem.db.models.user import User
+from fast_api_xtrem.db.utils.search import install_search_index, search_users
+
+
+def _create(client, nom, email=None):
+    client.post(
+        "/users",
+        json={
+            "nom": nom,
+            "email": email or f"{nom}@example.com",
+            "pswd": "motdepasse1",
+        },
+    )
+
+
+def _search(client, **params):
+    response = client.get("/users/search", params=params)
+    assert response.status_code == 200
+    return response.json()["data"]
+
+
+def test_search_ranks_name_matches_first(client):
+    """Une correspondance sur le nom précède une correspondance d'email."""
+    _create(client, "bob", "alice.fan@example.com")
+    _create(client, "alice")
+    _create(client, "charlie")
+
+    names = [r["nom"] for r in _search(client, q="alice")["results"]]
+    assert names == ["alice", "bob"]
+    assert [r["nom"] for r in _search(client, q="ch")["results"]] == [
+        "charlie"
+    ]
+
+
+def test_index_follows_updates_and_deletes(client):
+    """Les triggers répercutent renommages et suppressions."""
+    _create(client, "alice")
+    client.put(
+        "/users/alice",
+        json={
+            "nom": "alicia",
+            "email": "alicia@example.com",
+            "pswd": "motdepasse1",
+        },
+    )
+    assert _search(client, q="alice")["results"] == []
+    assert len(_search(client, q="licia")["results"]) == 1
+
+    client.delete("/users/alicia")
+    assert _search(client, q="licia")["results"] == []
+
+
+def test_search_is_paginated(client):
+    """Les pages sont bornées et signalent l'existence d'une suite."""
+    for index in range(5):
+        _create(client, f"user{index}")
+    first = _search(client, q="user", limit=2)
+    assert len(first["results"]) == 2 and first["has_more"]
+    last = _search(client, q="user", limit=2, offset=4)
+    assert len(last["results"]) == 1 and not last["has_more"]
+    # La syntaxe FTS5 fournie par l'utilisateur n'est pas interprétée
+    assert _search(client, q='user" OR "x')["results"] == []
+
+
+def test_search_falls_back_without_trigram(tmp_path):
+    """Sans tokenizer trigram (SQLite < 3.34), repli sur LIKE."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+
+    @event.listens_for(engine, "before_cursor_execute", retval=True)
+    def without_trigram(_conn, _cursor, statement, params, _context, _many):
+        return statement.replace("'trigram'", "'absent'"), params
+
+    Base.metadata.create_all(engine)
+    install_search_index(engine, logger)
+    with Session(engine) as db:
+        db.execute(
+            insert(User),
+            [
+                {"nom": "alice", "email": "a@example.com", "pswd": ""},
+                {"nom": "bob", "email": "malice@example.com", "pswd": ""},
+            ],
+        )
+        db.commit()
+        assert search_users(db, "lice", 10) == [
+            ("alice", "a@example.com"),
+            ("bob", "malice@example.com"),
+        ]
+    engine.dispose()
+
+
+def test_search_runs_off_the_event_loop(client, mocker):
+    """La recherche en base s'exécute hors de la boucle d'événements."""
+    _create(client, "alice")
+    loops = []
+
+    def spy(*args):
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return search_users(*args)
+
+    mocker.patch("fast_api_xtrem.routes.db.users.search_users", spy)
+    assert len(_search(client, q="alice")["results"]) == 1
+    assert loops == [None]
@@ -0,0 +1,65 @@
+"""
+Tests des statistiques agrégées des utilisateurs et de la mise à niveau
+du schéma.
+"""
+
+from sqlalchemy import create_engine, inspect, text
+
+from fast_api_xtrem.db.models.user import utc_now
+from fast_api_xtrem.db.utils.schema import upgrade_schema
+
+
+def _user(nom):
+    return {"nom": nom, "email": f"{nom}@example.com", "pswd": "motdepasse1"}
+
+
+def test_stats_follow_writes(client):
+    """Les créations et suppressions sont comptées sans relecture."""
+    client.post("/users", json=_user("alice"))
+    client.post("/users", json=_user("bob"))
+    client.delete("/users/bob")
+
+    data = client.get("/users/stats").json()["data"]
+    today = utc_now().date().isoformat()
+    assert data["total"] == 1
+    assert data["signups_per_day"][today] == 1
+    assert data["users_per_role"] == {"aucun": 1}
+
+
+def test_reconcile_corrects_drift(client, application):
+    """La réconciliation rattrape une écriture faite hors de l'API."""
+    services = application.services
+    with services.db_manager.engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO users (nom, email, pswd, role_id) "
+                "VALUES ('root', 'root@example.com', 'x', 1)"
+            )
+        )
+    assert client.get("/users/stats").json()["data"]["total"] == 0
+
+    assert services.user_stats.reconcile(services.db_manager, services.logger)
+    data = client.get("/users/stats").json()["data"]
+    assert data["total"] == 1
+    assert data["users_per_role"] == {"admin": 1}
+    assert services.metrics.get("user_stats_drift_total") == 1
+
+
+def test_upgrade_schema_adds_missing_columns(tmp_path, mocker):
+    """Les colonnes nullables absentes d'une base existante sont ajoutées."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE users (id INTEGER PRIMARY KEY, "
+                "nom VARCHAR(50), email VARCHAR(100), pswd VARCHAR(100))"
+            )
+        )
+    added = upgrade_schema(engine, mocker.Mock())
+    assert added == ["users.role_id", "users.created_at", "users.deleted_at"]
+    inspector = inspect(engine)
+    columns = {c["name"] for c in inspector.get_columns("users")}
+    assert {"role_id", "created_at", "deleted_at"} <= columns
+    assert "ix_users_deleted_at" in {
+        index["name"] for index in inspector.get_indexes("users")
+    }
@@ -0,0 +1,58 @@
+"""
+Tests du préchauffage au démarrage.
+"""
+
+import time
+
+import pytest
+
+from fast_api_xtrem.app.config import AppConfig, WarmupConfig
+from fast_api_xtrem.cache.lru import MISSING
+
+USER = {"nom": "alice", "email": "alice@example.com", "pswd": "motdepasse1"}
+
+
+def test_warmup_preloads_recent_users(client, application):
+    """Les derniers utilisateurs connectés sont rechargés en cache."""
+    client.post("/users", json=USER)
+    assert client.post("/users/login", json=USER).status_code == 200
+    services = application.services
+    assert services.audit.flush(1.0)
+    services.user_cache.clear()
+
+    report = services.warmup()
+
+    assert report["connections"]["result"] == 2
+    assert report["security"]["result"] is True
+    assert report["users"]["result"] == 1
+    assert report["indexes"]["result"] > 0
+    assert services.user_cache.local.get("alice") is not MISSING
+    assert services.metrics.get("warmup_seconds", step="indexes") > 0
+
+
+def test_readiness_withheld_while_warming(client, application):
+    """La readiness renvoie 503 tant que le préchauffage n'est pas fini."""
+    health = application.services.health
+    health.mark_warming()
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["checks"] == {"warmup": True}
+
+    health.mark_warm()
+    assert client.get("/health/ready").status_code == 200
+
+
+@pytest.mark.parametrize(
+    "app_config", [AppConfig(warmup_config=WarmupConfig(background=True))]
+)
+def test_background_warmup_ends_with_readiness(client, application):
+    """En tâche de fond, le serveur répond puis devient prêt."""
+    assert client.get("/health/live").status_code == 200
+    deadline = time.monotonic() + 5.0
+    while (
+        client.get("/health/ready").status_code != 200
+        and time.monotonic() < deadline
+    ):
+        time.sleep(0.01)
+    assert not application.services.health.warming
+    assert client.get("/health/ready").status_code == 200